@@ -35,6 +35,18 @@ config_path = os.path.join(current_dir, 'config.yaml')
 # Load configuration
 container.config.from_yaml(config_path, required=True)
 
+# Optionally overlay a configuration profile - e.g. config.synthetic.yaml - whose values replace those in config.yaml
+config_overlay_file = os.getenv("CONFIG_OVERLAY_FILE")
+if config_overlay_file:
+    container.config.from_yaml(os.path.join(current_dir, config_overlay_file), required=True)
+    print(f"Overlaid configuration profile: {config_overlay_file}")
+
+# The native async Firestore repository writes to Firestore directly, so a non-Firestore synchronous repository would never see its writes
+async_repository_type = container.config.repository.async_repository_type()
+repository_type = container.config.repository.repository_type()
+if async_repository_type == "firestore" and repository_type != "firestore":
+    raise ValueError(f"repository.async_repository_type 'firestore' requires repository.repository_type 'firestore', not '{repository_type}'")
+
 artifact_storage_type = container.config.genai.adk.agent_1.artifact_storage_type()
 if artifact_storage_type == "gcs":
     if container.config.genai.adk.agent_1.artifact_storage_gcs_bucket_name() is not None:
@@ -20,13 +20,18 @@ from marketing_image_agent.application.services.remove_marketing_image_driven_se
 from marketing_image_agent.application.services.change_marketing_image_metadata_driving_service import ChangeMarketingImageMetadataDrivingService
 from marketing_image_agent.application.services.change_marketing_image_metadata_core_service import ChangeMarketingImageMetadataCoreService
 from marketing_image_agent.application.services.change_marketing_image_metadata_driven_service import ChangeMarketingImageMetadataDrivenService
+from marketing_image_agent.application.services.marketing_image_object_cache_control_policy import MarketingImageObjectCacheControlPolicy
+from marketing_image_agent.application.services.marketing_image_object_cache_control_driven_service import MarketingImageObjectCacheControlDrivenService
+from marketing_image_agent.application.services.marketing_image_concurrency_conflict_retry_policy import MarketingImageConcurrencyConflictRetryPolicy
 
 
 # Command Handlers (Application)
 from marketing_image_agent.application.command_handlers.generate_marketing_image_command_handler import GenerateMarketingImageCommandHandler
+from marketing_image_agent.application.command_handlers.generate_marketing_image_batch_command_handler import GenerateMarketingImageBatchCommandHandler
 from marketing_image_agent.application.command_handlers.approve_marketing_image_command_handler import ApproveMarketingImageCommandHandler
 from marketing_image_agent.application.command_handlers.reject_marketing_image_command_handler import RejectMarketingImageCommandHandler
 from marketing_image_agent.application.command_handlers.remove_marketing_image_command_handler import RemoveMarketingImageCommandHandler
+from marketing_image_agent.application.command_handlers.remove_marketing_image_batch_command_handler import RemoveMarketingImageBatchCommandHandler
 from marketing_image_agent.application.command_handlers.change_marketing_image_metadata_command_handler import ChangeMarketingImageMetadataCommandHandler
 
 # Domain Event Handlers (Application)
@@ -42,10 +47,32 @@ from marketing_image_agent.infrastructure.adapters.dispatching.in_memory_domain_
 # from marketing_image_agent.infrastructure.adapters.dispatching.eventarc_standard_command_dispatcher impventarcStandardCommandDispatcher  # Placeholder for future adapter
 # from marketing_image_agent.infrastructure.adapters.dispatching.eventarc_standard_domain_event_dispatcheort EventarcStandardDomainEventDispatcher  # Placeholder for future adapter
 from marketing_image_agent.infrastructure.adapters.repository.marketing_image_aggregate_firestore_repository import MarketingImageAggregateFirestoreRepository
+from marketing_image_agent.infrastructure.adapters.repository.marketing_image_aggregate_in_memory_repository import MarketingImageAggregateInMemoryRepository
+from marketing_image_agent.infrastructure.adapters.repository.marketing_image_aggregate_repository_caching_adapter import MarketingImageAggregateRepositoryCachingAdapter
+from marketing_image_agent.infrastructure.adapters.repository.async_marketing_image_aggregate_repository_thread_offload_adapter import AsyncMarketingImageAggregateRepositoryThreadOffloadAdapter
+from marketing_image_agent.infrastructure.adapters.repository.async_marketing_image_aggregate_firestore_repository import AsyncMarketingImageAggregateFirestoreRepository
 from marketing_image_agent.infrastructure.adapters.object_storage.marketing_image_google_cloud_storage_object_storage_adapter import MarketingImageGoogleCloudStorageObjectStorageAdapter
+from marketing_image_agent.infrastructure.adapters.object_storage.marketing_image_in_memory_object_storage_adapter import MarketingImageInMemoryObjectStorageAdapter
+from marketing_image_agent.infrastructure.adapters.object_storage.marketing_image_filesystem_object_storage_adapter import MarketingImageFilesystemObjectStorageAdapter
+from marketing_image_agent.infrastructure.adapters.image_similarity.bk_tree_marketing_image_near_duplicate_index import BKTreeMarketingImageNearDuplicateIndex
+from marketing_image_agent.infrastructure.adapters.object_storage.async_marketing_image_object_storage_thread_offload_adapter import AsyncMarketingImageObjectStorageThreadOffloadAdapter
+from marketing_image_agent.infrastructure.adapters.object_deletion.in_memory_marketing_image_object_tombstone_store import InMemoryMarketingImageObjectTombstoneStore
+from marketing_image_agent.infrastructure.adapters.object_deletion.marketing_image_object_tombstone_firestore_store import MarketingImageObjectTombstoneFirestoreStore
+from marketing_image_agent.infrastructure.adapters.object_deletion.batched_marketing_image_object_deletion_sweeper import BatchedMarketingImageObjectDeletionSweeper
+from marketing_image_agent.infrastructure.adapters.image_processing.process_pool_image_post_processing_adapter import ProcessPoolImagePostProcessingAdapter
+from marketing_image_agent.infrastructure.adapters.image_processing.thread_pool_image_post_processing_adapter import ThreadPoolImagePostProcessingAdapter
 from marketing_image_agent.infrastructure.adapters.generative_ai.marketing_image_google_cloud_vertex_ai_imagen_adapter import MarketingImageGoogleImagenGenAIAdapter
 from marketing_image_agent.infrastructure.adapters.generative_ai.marketing_image_google_cloud_vertex_ai_gemini_flash_2dot5_adapter import MarketingImageGoogleGeminiFlash2dot5ImageGenAIAdapter
+from marketing_image_agent.infrastructure.adapters.generative_ai.marketing_image_generation_caching_adapter import MarketingImageImageGenerationCachingAdapter
+from marketing_image_agent.infrastructure.adapters.generative_ai.marketing_image_generation_rate_limiting_adapter import MarketingImageImageGenerationRateLimitingAdapter
+from marketing_image_agent.infrastructure.adapters.generative_ai.vertex_ai_image_model_quota_governor_registry import VertexAIImageModelQuotaGovernorRegistry
+from marketing_image_agent.infrastructure.adapters.generative_ai.marketing_image_generation_latency_aware_routing_adapter import MarketingImageImageGenerationLatencyAwareRoutingAdapter
+from marketing_image_agent.infrastructure.adapters.generative_ai.marketing_image_synthetic_genai_adapter import MarketingImageSyntheticGenAIAdapter
+from marketing_image_agent.infrastructure.adapters.cache.in_memory_lru_marketing_image_generation_cache import InMemoryLRUMarketingImageGenerationCache
+from marketing_image_agent.infrastructure.adapters.cache.marketing_image_generation_firestore_cache import MarketingImageGenerationFirestoreCache
+from marketing_image_agent.infrastructure.adapters.cache.tiered_marketing_image_generation_cache import TieredMarketingImageGenerationCache
 from marketing_image_agent.infrastructure.adapters.messaging.marketing_image_integration_event_messaging_google_cloud_eventarc_standard_adapter import MarketingImageIntegrationEventMessagingGoogleCloudEventarcStandardAdapter
+from marketing_image_agent.infrastructure.adapters.messaging.marketing_image_integration_event_messaging_in_memory_adapter import MarketingImageIntegrationEventMessagingInMemoryAdapter
 
 # Factories (Domain)
 from marketing_image_agent.domain.factories.marketing_image_aggregate_factory import MarketingImageAggregateFactory
@@ -70,20 +97,65 @@ class Container(containers.DeclarativeContainer):
     
     config.dispatcher.command.prefix.from_env("COMMAND_PREFIX")
     config.dispatcher.command.type.from_env("COMMAND_DISPATCHER_TYPE")
+    config.dispatcher.command.conflict_retry.max_retries.from_env("COMMAND_CONFLICT_RETRY_MAX_RETRIES")
+    config.dispatcher.command.conflict_retry.backoff_base_seconds.from_env("COMMAND_CONFLICT_RETRY_BACKOFF_BASE_SECONDS")
+    config.dispatcher.command.conflict_retry.backoff_max_seconds.from_env("COMMAND_CONFLICT_RETRY_BACKOFF_MAX_SECONDS")
     config.dispatcher.domain_event.prefix.from_env("DOMAIN_EVENT_PREFIX")
     config.dispatcher.domain_event.type.from_env("DOMAIN_EVENT_DISPATCHER_TYPE")
+    config.dispatcher.domain_event.background_max_workers.from_env("DOMAIN_EVENT_DISPATCHER_BACKGROUND_MAX_WORKERS")
     config.dispatcher.integration_event.prefix.from_env("INTEGRATION_EVENT_PREFIX")
 
+    config.repository.repository_type.from_env("MARKETING_IMAGE_REPOSITORY_TYPE")
     config.repository.firestore.project_id.from_env("GOOGLE_CLOUD_REPOSITORY_ADAPTER_PROJECT")
     config.repository.firestore.location.from_env("GOOGLE_CLOUD_REPOSITORY_ADAPTER_LOCATION")
     config.repository.firestore.database.from_env("GOOGLE_CLOUD_FIRESTORE_REPOSITORY_ADAPTER_DATABASE")
     config.repository.firestore.marketing_images_collection.from_env("GOOGLE_CLOUD_FIRESTORE_REPOSITORY_ADAPTER_COLLECTION_MARKETING_IMAGES")
     config.repository.firestore.domain_events_collection.from_env("GOOGLE_CLOUD_FIRESTORE_REPOSITORY_ADAPTER_COLLECTION_MARKETING_IMAGE_EVENTS")
+    config.repository.aggregate_cache.mode.from_env("MARKETING_IMAGE_REPOSITORY_AGGREGATE_CACHE_MODE")
+    config.repository.aggregate_cache.max_entries.from_env("MARKETING_IMAGE_REPOSITORY_AGGREGATE_CACHE_MAX_ENTRIES")
+    config.repository.aggregate_cache.ttl_seconds.from_env("MARKETING_IMAGE_REPOSITORY_AGGREGATE_CACHE_TTL_SECONDS")
+    config.repository.async_repository_type.from_env("MARKETING_IMAGE_ASYNC_REPOSITORY_TYPE")
+    config.repository.thread_offload_max_workers.from_env("REPOSITORY_THREAD_OFFLOAD_MAX_WORKERS")
 
     config.object_storage.storage_type.from_env("MARKETING_IMAGE_ADAPTER_STORAGE_TYPE")
     config.object_storage.gcs.project_id.from_env("GOOGLE_CLOUD_MARKETING_IMAGE_OBJECT_STORAGE_ADAPTER_PROJECT")
     config.object_storage.gcs.location.from_env("GOOGLE_CLOUD_STORAGE_MARKETING_IMAGE_ADAPTER_LOCATION")
     config.object_storage.gcs.bucket.from_env("GOOGLE_CLOUD_STORAGE_MARKETING_IMAGE_ADAPTER_BUCKET")
+    config.object_storage.gcs.upload_chunk_size_bytes.from_env("GOOGLE_CLOUD_STORAGE_MARKETING_IMAGE_ADAPTER_UPLOAD_CHUNK_SIZE_BYTES")
+    config.object_storage.gcs.resumable_upload_threshold_bytes.from_env("GOOGLE_CLOUD_STORAGE_MARKETING_IMAGE_ADAPTER_RESUMABLE_UPLOAD_THRESHOLD_BYTES")
+    config.object_storage.gcs.parallel_composite_upload_threshold_bytes.from_env("GOOGLE_CLOUD_STORAGE_MARKETING_IMAGE_ADAPTER_PARALLEL_COMPOSITE_UPLOAD_THRESHOLD_BYTES")
+    config.object_storage.gcs.parallel_composite_upload_max_parts.from_env("GOOGLE_CLOUD_STORAGE_MARKETING_IMAGE_ADAPTER_PARALLEL_COMPOSITE_UPLOAD_MAX_PARTS")
+    config.object_storage.gcs.upload_retry_deadline_seconds.from_env("GOOGLE_CLOUD_STORAGE_MARKETING_IMAGE_ADAPTER_UPLOAD_RETRY_DEADLINE_SECONDS")
+    config.object_storage.gcs.metadata_cache_max_entries.from_env("GOOGLE_CLOUD_STORAGE_MARKETING_IMAGE_ADAPTER_METADATA_CACHE_MAX_ENTRIES")
+    config.object_storage.gcs.metadata_cache_ttl_seconds.from_env("GOOGLE_CLOUD_STORAGE_MARKETING_IMAGE_ADAPTER_METADATA_CACHE_TTL_SECONDS")
+    config.object_storage.filesystem.root_directory.from_env("MARKETING_IMAGE_OBJECT_STORAGE_FILESYSTEM_ROOT_DIRECTORY")
+    config.object_storage.filesystem.base_url.from_env("MARKETING_IMAGE_OBJECT_STORAGE_FILESYSTEM_BASE_URL")
+    config.object_storage.deletion.mode.from_env("MARKETING_IMAGE_OBJECT_DELETION_MODE")
+    config.object_storage.deletion.tombstone_store_type.from_env("MARKETING_IMAGE_OBJECT_DELETION_TOMBSTONE_STORE_TYPE")
+    config.object_storage.deletion.firestore_collection.from_env("GOOGLE_CLOUD_FIRESTORE_OBJECT_TOMBSTONE_COLLECTION")
+    config.object_storage.deletion.batch_size.from_env("MARKETING_IMAGE_OBJECT_DELETION_BATCH_SIZE")
+    config.object_storage.deletion.sweep_interval_seconds.from_env("MARKETING_IMAGE_OBJECT_DELETION_SWEEP_INTERVAL_SECONDS")
+    config.object_storage.deletion.retry_backoff_seconds.from_env("MARKETING_IMAGE_OBJECT_DELETION_RETRY_BACKOFF_SECONDS")
+    config.object_storage.deletion.max_retry_backoff_seconds.from_env("MARKETING_IMAGE_OBJECT_DELETION_MAX_RETRY_BACKOFF_SECONDS")
+    config.object_storage.deletion.lease_seconds.from_env("MARKETING_IMAGE_OBJECT_DELETION_LEASE_SECONDS")
+    config.object_storage.cache_control.generated.from_env("MARKETING_IMAGE_OBJECT_CACHE_CONTROL_GENERATED")
+    config.object_storage.cache_control.reviewing.from_env("MARKETING_IMAGE_OBJECT_CACHE_CONTROL_REVIEWING")
+    config.object_storage.cache_control.approved.from_env("MARKETING_IMAGE_OBJECT_CACHE_CONTROL_APPROVED")
+    config.object_storage.cache_control.rejected.from_env("MARKETING_IMAGE_OBJECT_CACHE_CONTROL_REJECTED")
+    config.object_storage.thread_offload_max_workers.from_env("MARKETING_IMAGE_OBJECT_STORAGE_THREAD_OFFLOAD_MAX_WORKERS")
+
+    config.image_post_processing.executor_type.from_env("IMAGE_POST_PROCESSING_EXECUTOR_TYPE")
+    config.image_post_processing.max_workers.from_env("IMAGE_POST_PROCESSING_MAX_WORKERS")
+    config.image_post_processing.max_queue_depth.from_env("IMAGE_POST_PROCESSING_MAX_QUEUE_DEPTH")
+    config.image_post_processing.admission_timeout_seconds.from_env("IMAGE_POST_PROCESSING_ADMISSION_TIMEOUT_SECONDS")
+
+    config.near_duplicate_detection.mode.from_env("NEAR_DUPLICATE_DETECTION_MODE")
+    config.near_duplicate_detection.max_hamming_distance.from_env("NEAR_DUPLICATE_DETECTION_MAX_HAMMING_DISTANCE")
+
+    config.generation_cache.mode.from_env("GENERATION_CACHE_MODE")
+    config.generation_cache.ttl_seconds.from_env("GENERATION_CACHE_TTL_SECONDS")
+    config.generation_cache.in_memory_max_entries.from_env("GENERATION_CACHE_IN_MEMORY_MAX_ENTRIES")
+    config.generation_cache.firestore.collection.from_env("GOOGLE_CLOUD_FIRESTORE_GENERATION_CACHE_COLLECTION")
 
     config.genai.adk.model_1.name.from_env("ADK_MODEL_1_NAME")
     config.genai.adk.model_2.name.from_env("ADK_MODEL_2_NAME")
@@ -105,12 +177,35 @@ class Container(containers.DeclarativeContainer):
     config.genai.vertex_ai.image.project_id.from_env("GOOGLE_CLOUD_GENAI_IMAGE_ADAPTER_PROJECT")
     config.genai.vertex_ai.image.imagen_model_location.from_env("GOOGLE_CLOUD_GENAI_IMAGEN_IMAGE_ADAPTER_MODEL_LOCATION")
     config.genai.vertex_ai.image.imagen_model_name.from_env("GOOGLE_CLOUD_GENAI_IMAGEN_IMAGE_ADAPTER_MODEL_NAME")
+    config.genai.vertex_ai.image.imagen_model_locations.from_env("GOOGLE_CLOUD_GENAI_IMAGEN_IMAGE_ADAPTER_MODEL_LOCATIONS")
+    config.genai.vertex_ai.image.imagen_hedge_delay_seconds.from_env("GOOGLE_CLOUD_GENAI_IMAGEN_IMAGE_ADAPTER_HEDGE_DELAY_SECONDS")
+    config.genai.vertex_ai.image.imagen_location_failure_threshold.from_env("GOOGLE_CLOUD_GENAI_IMAGEN_IMAGE_ADAPTER_LOCATION_FAILURE_THRESHOLD")
+    config.genai.vertex_ai.image.imagen_location_cooldown_seconds.from_env("GOOGLE_CLOUD_GENAI_IMAGEN_IMAGE_ADAPTER_LOCATION_COOLDOWN_SECONDS")
     config.genai.vertex_ai.image.gemini_model_location.from_env("GOOGLE_CLOUD_GENAI_GEMINI_IMAGE_ADAPTER_MODEL_LOCATION")
     config.genai.vertex_ai.image.gemini_model_name.from_env("GOOGLE_CLOUD_GENAI_GEMINI_IMAGE_ADAPTER_MODEL_NAME")
+    config.genai.vertex_ai.image.imagen_requests_per_minute.from_env("GOOGLE_CLOUD_GENAI_IMAGEN_IMAGE_ADAPTER_REQUESTS_PER_MINUTE")
+    config.genai.vertex_ai.image.imagen_max_concurrent_requests.from_env("GOOGLE_CLOUD_GENAI_IMAGEN_IMAGE_ADAPTER_MAX_CONCURRENT_REQUESTS")
+    config.genai.vertex_ai.image.gemini_requests_per_minute.from_env("GOOGLE_CLOUD_GENAI_GEMINI_IMAGE_ADAPTER_REQUESTS_PER_MINUTE")
+    config.genai.vertex_ai.image.gemini_max_concurrent_requests.from_env("GOOGLE_CLOUD_GENAI_GEMINI_IMAGE_ADAPTER_MAX_CONCURRENT_REQUESTS")
+    config.genai.vertex_ai.image.max_queue_depth.from_env("GOOGLE_CLOUD_GENAI_IMAGE_ADAPTER_MAX_QUEUE_DEPTH")
+    config.genai.vertex_ai.image.max_wait_seconds.from_env("GOOGLE_CLOUD_GENAI_IMAGE_ADAPTER_MAX_WAIT_SECONDS")
+    config.genai.vertex_ai.image.routing_ewma_alpha.from_env("GOOGLE_CLOUD_GENAI_IMAGE_ROUTING_ADAPTER_EWMA_ALPHA")
+    config.genai.vertex_ai.image.routing_max_error_rate.from_env("GOOGLE_CLOUD_GENAI_IMAGE_ROUTING_ADAPTER_MAX_ERROR_RATE")
+    config.genai.vertex_ai.image.routing_failure_threshold.from_env("GOOGLE_CLOUD_GENAI_IMAGE_ROUTING_ADAPTER_FAILURE_THRESHOLD")
+    config.genai.vertex_ai.image.routing_cooldown_seconds.from_env("GOOGLE_CLOUD_GENAI_IMAGE_ROUTING_ADAPTER_COOLDOWN_SECONDS")
+    config.genai.synthetic.image.model_name.from_env("SYNTHETIC_IMAGE_ADAPTER_MODEL_NAME")
+    config.genai.synthetic.image.latency_median_ms.from_env("SYNTHETIC_IMAGE_ADAPTER_LATENCY_MEDIAN_MS")
+    config.genai.synthetic.image.latency_p95_ms.from_env("SYNTHETIC_IMAGE_ADAPTER_LATENCY_P95_MS")
+    config.genai.synthetic.image.error_rate.from_env("SYNTHETIC_IMAGE_ADAPTER_ERROR_RATE")
+    config.genai.synthetic.image.random_seed.from_env("SYNTHETIC_IMAGE_ADAPTER_RANDOM_SEED")
+    config.genai.synthetic.image.requests_per_minute.from_env("SYNTHETIC_IMAGE_ADAPTER_REQUESTS_PER_MINUTE")
+    config.genai.synthetic.image.max_concurrent_requests.from_env("SYNTHETIC_IMAGE_ADAPTER_MAX_CONCURRENT_REQUESTS")
     config.genai.vertex_ai.multimodal.project_id.from_env("GOOGLE_CLOUD_GENAI_MULTIMODAL_ADAPTER_PROJECT")
     config.genai.vertex_ai.multimodal.model_location.from_env("GOOGLE_CLOUD_GENAI_MULTIMODAL_ADAPTER_MODEL_LOCATION")
     config.genai.vertex_ai.multimodal.model_name.from_env("GOOGLE_CLOUD_GENAI_MULTIMODAL_ADAPTER_MODEL_NAME")
 
+    config.messaging.type.from_env("INTEGRATION_EVENT_MESSAGING_TYPE")
+    config.messaging.in_memory.max_events.from_env("INTEGRATION_EVENT_MESSAGING_IN_MEMORY_MAX_EVENTS")
     config.messaging.eventarc_standard.project_id.from_env("GOOGLE_CLOUD_INTEGRATION_EVENT_MESSAGING_ADAPTER_PROJECT")
     config.messaging.eventarc_standard.location.from_env("GOOGLE_CLOUD_EVENTARC_STANDARD_INTEGRATION_EVENT_MESSAGING_ADAPTER_LOCATION")
     config.messaging.eventarc_standard.topic.from_env("GOOGLE_CLOUD_EVENTARC_STANDARD_INTEGRATION_EVENT_MESSAGING_ADAPTER_TOPIC")
@@ -138,47 +233,247 @@ class Container(containers.DeclarativeContainer):
     )
     domain_event_dispatcher = providers.Selector(
         config.dispatcher.domain_event.type,
-        in_memory=providers.Singleton(InMemoryDomainEventDispatcher),
+        in_memory=providers.Singleton(InMemoryDomainEventDispatcher, background_max_workers=config.dispatcher.domain_event.background_max_workers),
         # pubsub=providers.Singleton(
         #     PubSubDomainEventDispatcher,
         #     project_id=config.gcp.project_id,  # Example of further config needed
         # ),
     )
-    marketing_image_repository = providers.Factory(
-        MarketingImageAggregateFirestoreRepository,
-        google_cloud_project=config.repository.firestore.project_id,
-        db_location=config.repository.firestore.location,
-        db_name=config.repository.firestore.database,
-        aggregate_collection_name=config.repository.firestore.marketing_images_collection,
-        domain_event_collection_name=config.repository.firestore.domain_events_collection,
+    marketing_image_aggregate_repository = providers.Selector(
+        config.repository.repository_type,
+        firestore=providers.Factory(
+            MarketingImageAggregateFirestoreRepository,
+            google_cloud_project=config.repository.firestore.project_id,
+            db_location=config.repository.firestore.location,
+            db_name=config.repository.firestore.database,
+            aggregate_collection_name=config.repository.firestore.marketing_images_collection,
+            domain_event_collection_name=config.repository.firestore.domain_events_collection,
+        ),
+        in_memory=providers.Singleton(MarketingImageAggregateInMemoryRepository),
+    )
+    marketing_image_aggregate_cache = providers.Selector(
+        config.repository.aggregate_cache.mode,
+        enabled=providers.Singleton(
+            MarketingImageAggregateRepositoryCachingAdapter,
+            marketing_image_repository=marketing_image_aggregate_repository,
+            max_entries=config.repository.aggregate_cache.max_entries,
+            ttl_seconds=config.repository.aggregate_cache.ttl_seconds,
+        ),
+        disabled=providers.Object(None),
     )
-    marketing_image_object_storage = providers.Factory(
-        MarketingImageGoogleCloudStorageObjectStorageAdapter,
-        google_cloud_project=config.object_storage.gcs.project_id,
-        bucket_location=config.object_storage.gcs.location,
-        bucket_name=config.object_storage.gcs.bucket,
+    marketing_image_repository = providers.Selector(
+        config.repository.aggregate_cache.mode,
+        enabled=marketing_image_aggregate_cache,
+        disabled=marketing_image_aggregate_repository,
     )
-    marketing_image_genai_adapter = providers.Selector(
-        config.gcp.image_generation_model_family,
-        imagen=providers.Factory(
+    async_marketing_image_repository = providers.Selector(
+        config.repository.async_repository_type,
+        thread_offload=providers.Singleton(
+            AsyncMarketingImageAggregateRepositoryThreadOffloadAdapter,
+            marketing_image_repository=marketing_image_repository,
+            max_workers=config.repository.thread_offload_max_workers,
+        ),
+        firestore=providers.Singleton( # Native AsyncClient; shares the synchronous repository's Firestore collections
+            AsyncMarketingImageAggregateFirestoreRepository,
+            google_cloud_project=config.repository.firestore.project_id,
+            db_location=config.repository.firestore.location,
+            db_name=config.repository.firestore.database,
+            aggregate_collection_name=config.repository.firestore.marketing_images_collection,
+            domain_event_collection_name=config.repository.firestore.domain_events_collection,
+            aggregate_cache=marketing_image_aggregate_cache, # Evicts what it writes from the command handlers' aggregate cache
+        ),
+    )
+    marketing_image_object_storage = providers.Selector(
+        config.object_storage.storage_type,
+        gcs=providers.Singleton( # Shared, so that its metadata cache sees every write and remove
+            MarketingImageGoogleCloudStorageObjectStorageAdapter,
+            google_cloud_project=config.object_storage.gcs.project_id,
+            bucket_location=config.object_storage.gcs.location,
+            bucket_name=config.object_storage.gcs.bucket,
+            upload_chunk_size_bytes=config.object_storage.gcs.upload_chunk_size_bytes,
+            resumable_upload_threshold_bytes=config.object_storage.gcs.resumable_upload_threshold_bytes,
+            parallel_composite_upload_threshold_bytes=config.object_storage.gcs.parallel_composite_upload_threshold_bytes,
+            parallel_composite_upload_max_parts=config.object_storage.gcs.parallel_composite_upload_max_parts,
+            upload_retry_deadline_seconds=config.object_storage.gcs.upload_retry_deadline_seconds,
+            metadata_cache_max_entries=config.object_storage.gcs.metadata_cache_max_entries,
+            metadata_cache_ttl_seconds=config.object_storage.gcs.metadata_cache_ttl_seconds,
+        ),
+        in_memory=providers.Singleton(
+            MarketingImageInMemoryObjectStorageAdapter,
+            bucket_name=config.object_storage.gcs.bucket,
+        ),
+        filesystem=providers.Singleton(
+            MarketingImageFilesystemObjectStorageAdapter,
+            root_directory=config.object_storage.filesystem.root_directory,
+            base_url=config.object_storage.filesystem.base_url,
+        ),
+    )
+    marketing_image_object_tombstone_store = providers.Selector(
+        config.object_storage.deletion.tombstone_store_type,
+        firestore=providers.Singleton(
+            MarketingImageObjectTombstoneFirestoreStore,
+            google_cloud_project=config.repository.firestore.project_id,
+            db_name=config.repository.firestore.database,
+            collection_name=config.object_storage.deletion.firestore_collection,
+        ),
+        in_memory=providers.Singleton(InMemoryMarketingImageObjectTombstoneStore),
+    )
+    marketing_image_object_deletion = providers.Selector(
+        config.object_storage.deletion.mode,
+        deferred=providers.Singleton(
+            BatchedMarketingImageObjectDeletionSweeper,
+            marketing_image_object_storage=marketing_image_object_storage,
+            tombstone_store=marketing_image_object_tombstone_store,
+            marketing_image_repository=marketing_image_repository, # References are re-checked before each deletion
+            batch_size=config.object_storage.deletion.batch_size,
+            sweep_interval_seconds=config.object_storage.deletion.sweep_interval_seconds,
+            retry_backoff_seconds=config.object_storage.deletion.retry_backoff_seconds,
+            max_retry_backoff_seconds=config.object_storage.deletion.max_retry_backoff_seconds,
+            lease_seconds=config.object_storage.deletion.lease_seconds,
+        ),
+        synchronous=providers.Object(None),
+    )
+    marketing_image_object_cache_control_policy = providers.Singleton(
+        MarketingImageObjectCacheControlPolicy,
+        cache_control_by_status=config.object_storage.cache_control,
+    )
+    async_marketing_image_object_storage = providers.Singleton(
+        AsyncMarketingImageObjectStorageThreadOffloadAdapter,
+        marketing_image_object_storage=marketing_image_object_storage,
+        max_workers=config.object_storage.thread_offload_max_workers,
+    )
+    image_post_processor = providers.Selector(
+        config.image_post_processing.executor_type,
+        process_pool=providers.Singleton(
+            ProcessPoolImagePostProcessingAdapter,
+            max_workers=config.image_post_processing.max_workers,
+            max_queue_depth=config.image_post_processing.max_queue_depth,
+            admission_timeout_seconds=config.image_post_processing.admission_timeout_seconds,
+        ),
+        thread_pool=providers.Singleton(
+            ThreadPoolImagePostProcessingAdapter,
+            max_workers=config.image_post_processing.max_workers,
+            max_queue_depth=config.image_post_processing.max_queue_depth,
+            admission_timeout_seconds=config.image_post_processing.admission_timeout_seconds,
+        ),
+    )
+    marketing_image_near_duplicate_index = providers.Singleton(
+        BKTreeMarketingImageNearDuplicateIndex,
+        marketing_image_repository=async_marketing_image_repository,
+    )
+    vertex_ai_image_model_quota_governors = providers.Singleton(VertexAIImageModelQuotaGovernorRegistry)
+    marketing_image_imagen_adapter = providers.Singleton(
+        MarketingImageImageGenerationRateLimitingAdapter,
+        marketing_image_genai_generator=providers.Factory(
             MarketingImageGoogleImagenGenAIAdapter,
             google_cloud_project=config.genai.vertex_ai.image.project_id,
             ai_model_location=config.genai.vertex_ai.image.imagen_model_location,
             ai_model_name=config.genai.vertex_ai.image.imagen_model_name,
+            image_post_processor=image_post_processor,
+            ai_model_locations=config.genai.vertex_ai.image.imagen_model_locations,
+            hedge_delay_seconds=config.genai.vertex_ai.image.imagen_hedge_delay_seconds,
+            location_failure_threshold=config.genai.vertex_ai.image.imagen_location_failure_threshold,
+            location_cooldown_seconds=config.genai.vertex_ai.image.imagen_location_cooldown_seconds,
         ),
-        gemini=providers.Factory(
+        requests_per_minute=config.genai.vertex_ai.image.imagen_requests_per_minute,
+        max_concurrent_requests=config.genai.vertex_ai.image.imagen_max_concurrent_requests,
+        max_queue_depth=config.genai.vertex_ai.image.max_queue_depth,
+        max_wait_seconds=config.genai.vertex_ai.image.max_wait_seconds,
+        quota_governors=vertex_ai_image_model_quota_governors,
+    )
+    marketing_image_gemini_adapter = providers.Singleton(
+        MarketingImageImageGenerationRateLimitingAdapter,
+        marketing_image_genai_generator=providers.Factory(
             MarketingImageGoogleGeminiFlash2dot5ImageGenAIAdapter,
             google_cloud_project=config.genai.vertex_ai.image.project_id,
             ai_model_location=config.genai.vertex_ai.image.gemini_model_location,
             ai_model_name=config.genai.vertex_ai.image.gemini_model_name,
+            image_post_processor=image_post_processor,
         ),
+        requests_per_minute=config.genai.vertex_ai.image.gemini_requests_per_minute,
+        max_concurrent_requests=config.genai.vertex_ai.image.gemini_max_concurrent_requests,
+        max_queue_depth=config.genai.vertex_ai.image.max_queue_depth,
+        max_wait_seconds=config.genai.vertex_ai.image.max_wait_seconds,
+        quota_governors=vertex_ai_image_model_quota_governors,
     )
-    marketing_image_integration_event_messaging = providers.Factory(
-        MarketingImageIntegrationEventMessagingGoogleCloudEventarcStandardAdapter,
-        google_cloud_project=config.messaging.eventarc_standard.project_id,
-        topic_location=config.messaging.eventarc_standard.location,
-        topic_name=config.messaging.eventarc_standard.topic,
-        marketing_image_integration_events_factory=marketing_image_integration_events_factory,
+    marketing_image_genai_model_adapter = providers.Selector(
+        config.gcp.image_generation_model_family,
+        imagen=marketing_image_imagen_adapter,
+        gemini=marketing_image_gemini_adapter,
+        synthetic=providers.Singleton(
+            MarketingImageImageGenerationRateLimitingAdapter,
+            marketing_image_genai_generator=providers.Factory(
+                MarketingImageSyntheticGenAIAdapter,
+                ai_model_name=config.genai.synthetic.image.model_name,
+                image_post_processor=image_post_processor,
+                latency_median_ms=config.genai.synthetic.image.latency_median_ms,
+                latency_p95_ms=config.genai.synthetic.image.latency_p95_ms,
+                error_rate=config.genai.synthetic.image.error_rate,
+                random_seed=config.genai.synthetic.image.random_seed,
+            ),
+            requests_per_minute=config.genai.synthetic.image.requests_per_minute,
+            max_concurrent_requests=config.genai.synthetic.image.max_concurrent_requests,
+            max_queue_depth=config.genai.vertex_ai.image.max_queue_depth,
+            max_wait_seconds=config.genai.vertex_ai.image.max_wait_seconds,
+            quota_governors=vertex_ai_image_model_quota_governors,
+        ),
+        routed=providers.Singleton(
+            MarketingImageImageGenerationLatencyAwareRoutingAdapter,
+            marketing_image_genai_generators=providers.Dict(
+                imagen=marketing_image_imagen_adapter,
+                gemini=marketing_image_gemini_adapter,
+            ),
+            ewma_alpha=config.genai.vertex_ai.image.routing_ewma_alpha,
+            max_error_rate=config.genai.vertex_ai.image.routing_max_error_rate,
+            failure_threshold=config.genai.vertex_ai.image.routing_failure_threshold,
+            cooldown_seconds=config.genai.vertex_ai.image.routing_cooldown_seconds,
+        ),
+    )
+    marketing_image_generation_in_memory_cache = providers.Singleton(
+        InMemoryLRUMarketingImageGenerationCache,
+        max_entries=config.generation_cache.in_memory_max_entries,
+        ttl_seconds=config.generation_cache.ttl_seconds,
+    )
+    marketing_image_generation_firestore_cache = providers.Singleton(
+        MarketingImageGenerationFirestoreCache,
+        google_cloud_project=config.repository.firestore.project_id,
+        db_name=config.repository.firestore.database,
+        collection_name=config.generation_cache.firestore.collection,
+        ttl_seconds=config.generation_cache.ttl_seconds,
+    )
+    marketing_image_genai_adapter = providers.Selector(
+        config.generation_cache.mode,
+        tiered=providers.Singleton(
+            MarketingImageImageGenerationCachingAdapter,
+            marketing_image_genai_generator=marketing_image_genai_model_adapter,
+            generation_cache=providers.Singleton(
+                TieredMarketingImageGenerationCache,
+                tiers=providers.List(marketing_image_generation_in_memory_cache, marketing_image_generation_firestore_cache),
+            ),
+            marketing_image_repository=async_marketing_image_repository,
+        ),
+        in_memory=providers.Singleton(
+            MarketingImageImageGenerationCachingAdapter,
+            marketing_image_genai_generator=marketing_image_genai_model_adapter,
+            generation_cache=marketing_image_generation_in_memory_cache,
+            marketing_image_repository=async_marketing_image_repository,
+        ),
+        disabled=marketing_image_genai_model_adapter,
+    )
+    marketing_image_integration_event_messaging = providers.Selector(
+        config.messaging.type,
+        eventarc_standard=providers.Factory(
+            MarketingImageIntegrationEventMessagingGoogleCloudEventarcStandardAdapter,
+            google_cloud_project=config.messaging.eventarc_standard.project_id,
+            topic_location=config.messaging.eventarc_standard.location,
+            topic_name=config.messaging.eventarc_standard.topic,
+            marketing_image_integration_events_factory=marketing_image_integration_events_factory,
+        ),
+        in_memory=providers.Singleton( # Shared, so that every published event can be inspected in one place
+            MarketingImageIntegrationEventMessagingInMemoryAdapter,
+            marketing_image_integration_events_factory=marketing_image_integration_events_factory,
+            max_events=config.messaging.in_memory.max_events,
+        ),
     )
 
     # Driving Services (Application)
@@ -207,11 +502,17 @@ class Container(containers.DeclarativeContainer):
     # Core Services (Application)
     generate_marketing_image_core_service = providers.Factory(
         GenerateMarketingImageCoreService,
-        marketing_image_repository=marketing_image_repository,
-        marketing_image_object_storage=marketing_image_object_storage,
+        marketing_image_repository=async_marketing_image_repository,
+        marketing_image_object_storage=async_marketing_image_object_storage,
         marketing_image_genai_generator=marketing_image_genai_adapter,
         domain_event_prefix=config.dispatcher.domain_event.prefix,
         domain_event_dispatcher=domain_event_dispatcher,
+        image_post_processor=image_post_processor,
+        image_renditions=config.image_post_processing.renditions,
+        near_duplicate_index=marketing_image_near_duplicate_index,
+        near_duplicate_detection_mode=config.near_duplicate_detection.mode,
+        near_duplicate_max_distance=config.near_duplicate_detection.max_hamming_distance,
+        object_cache_control_policy=marketing_image_object_cache_control_policy,
     )
     approve_marketing_image_core_service = providers.Factory(  
         ApproveMarketingImageCoreService,
@@ -231,6 +532,8 @@ class Container(containers.DeclarativeContainer):
         marketing_image_object_storage=marketing_image_object_storage,
         domain_event_prefix=config.dispatcher.domain_event.prefix,
         domain_event_dispatcher=domain_event_dispatcher,
+        near_duplicate_index=marketing_image_near_duplicate_index,
+        object_deletion=marketing_image_object_deletion,
     )
     change_marketing_image_metadata_core_service = providers.Factory(
         ChangeMarketingImageMetadataCoreService,
@@ -240,6 +543,12 @@ class Container(containers.DeclarativeContainer):
     )
 
     # Driven Services (Application)
+    marketing_image_object_cache_control_driven_service = providers.Factory(
+        MarketingImageObjectCacheControlDrivenService,
+        marketing_image_repository=marketing_image_repository,
+        marketing_image_object_storage=marketing_image_object_storage,
+        object_cache_control_policy=marketing_image_object_cache_control_policy,
+    )
     generate_marketing_image_driven_service = providers.Factory(
         GenerateMarketingImageDrivenService,
         integration_event_prefix=config.dispatcher.integration_event.prefix,
@@ -251,12 +560,14 @@ class Container(containers.DeclarativeContainer):
         integration_event_prefix=config.dispatcher.integration_event.prefix,
         marketing_image_integration_events_factory=marketing_image_integration_events_factory,
         marketing_image_integration_event_messaging=marketing_image_integration_event_messaging,
+        object_cache_control=marketing_image_object_cache_control_driven_service,
     )
     reject_marketing_image_driven_service = providers.Factory(
         RejectMarketingImageDrivenService,
         integration_event_prefix=config.dispatcher.integration_event.prefix,
         marketing_image_integration_events_factory=marketing_image_integration_events_factory,
         marketing_image_integration_event_messaging=marketing_image_integration_event_messaging,
+        object_cache_control=marketing_image_object_cache_control_driven_service,
     )
     remove_marketing_image_driven_service = providers.Factory(
         RemoveMarketingImageDrivenService,
@@ -272,30 +583,51 @@ class Container(containers.DeclarativeContainer):
     )
 
     # Command Handlers (Application) - Eagerly instantiated in main.py to register themselves
+    marketing_image_concurrency_conflict_retry_policy = providers.Singleton(
+        MarketingImageConcurrencyConflictRetryPolicy,
+        max_retries=config.dispatcher.command.conflict_retry.max_retries,
+        backoff_base_seconds=config.dispatcher.command.conflict_retry.backoff_base_seconds,
+        backoff_max_seconds=config.dispatcher.command.conflict_retry.backoff_max_seconds,
+    )
     generate_marketing_image_command_handler = providers.Singleton(
         GenerateMarketingImageCommandHandler,
         core_service=generate_marketing_image_core_service,
         command_dispatcher=command_dispatcher,
     )
+    generate_marketing_image_batch_command_handler = providers.Singleton(
+        GenerateMarketingImageBatchCommandHandler,
+        core_service=generate_marketing_image_core_service,
+        command_dispatcher=command_dispatcher,
+    )
     approve_marketing_image_command_handler = providers.Singleton(
         ApproveMarketingImageCommandHandler,
         core_service=approve_marketing_image_core_service,
         command_dispatcher=command_dispatcher,
+        concurrency_conflict_retry_policy=marketing_image_concurrency_conflict_retry_policy,
     )
     reject_marketing_image_command_handler = providers.Singleton(
         RejectMarketingImageCommandHandler,
         core_service=reject_marketing_image_core_service,
         command_dispatcher=command_dispatcher,
+        concurrency_conflict_retry_policy=marketing_image_concurrency_conflict_retry_policy,
     )
     remove_marketing_image_command_handler = providers.Singleton(
         RemoveMarketingImageCommandHandler,
         core_service=remove_marketing_image_core_service,
         command_dispatcher=command_dispatcher,
+        concurrency_conflict_retry_policy=marketing_image_concurrency_conflict_retry_policy,
+    )
+    remove_marketing_image_batch_command_handler = providers.Singleton(
+        RemoveMarketingImageBatchCommandHandler,
+        core_service=remove_marketing_image_core_service,
+        command_dispatcher=command_dispatcher,
+        concurrency_conflict_retry_policy=marketing_image_concurrency_conflict_retry_policy,
     )
     change_marketing_image_metadata_command_handler = providers.Singleton(
         ChangeMarketingImageMetadataCommandHandler,
         core_service=change_marketing_image_metadata_core_service,
         command_dispatcher=command_dispatcher,
+        concurrency_conflict_retry_policy=marketing_image_concurrency_conflict_retry_policy,
     )
 
     # Domain Event Handlers (Application) - Eagerly instantiated in main.py to register themselves
@@ -7,21 +7,37 @@ from config import Container
 from marketing_image_agent.tools import MarketingImageTools
 
 
-def generate_image_tool(request_text: str) -> dict:
+async def generate_image_tool(request_text: str, use_generation_cache: bool = True) -> dict:
     """Generates a marketing image from a text prompt.
 
     This tool handles the end-to-end process of image generation.
 
     Args:
         request_text: The text prompt to generate the image from.
+        use_generation_cache: Whether an identical, previously generated image may be reused. Set to False if the user asks for a new or different variation of the same prompt.
 
     Returns:
         A dictionary containing details of the generated image, such as its ID and URL.
     """
-    response = marketing_image_tools.generate_image(request_text)
+    response = await marketing_image_tools.generate_image(request_text, use_generation_cache)
     return response
 
-def change_image_approval_status_request_tool(image_id: str, status_request: str) -> dict:
+async def generate_images_tool(request_text: str, number_of_images: int) -> dict:
+    """Generates several variants of a marketing image from one text prompt in a single request.
+
+    Use this instead of calling generate_image_tool repeatedly when the user asks for more than one image or for options/variants.
+
+    Args:
+        request_text: The text prompt to generate the images from.
+        number_of_images: The number of variants to generate (1 to 8).
+
+    Returns:
+        A dictionary containing details of the generated images, such as their IDs and URLs.
+    """
+    response = await marketing_image_tools.generate_images(request_text, number_of_images)
+    return response
+
+async def change_image_approval_status_request_tool(image_id: str, status_request: str) -> dict:
     """Sends a request to change the approval status of a marketing image.
 
     Args:
@@ -33,9 +49,9 @@ def change_image_approval_status_request_tool(image_id: str, status_request: str
     """
     if status_request not in ["approve", "reject"]:
         return {"error": "Invalid status. Must be 'approve' or 'reject'."}
-    return marketing_image_tools.change_image_approval_status_request(image_id, status_request)
+    return await marketing_image_tools.change_image_approval_status_request(image_id, status_request)
 
-def remove_image_tool(image_id: str) -> dict:
+async def remove_image_tool(image_id: str) -> dict:
     """Removes a marketing image.
 
     Args:
@@ -44,9 +60,20 @@ def remove_image_tool(image_id: str) -> dict:
     Returns:
         A dictionary confirming the removal.
     """
-    return marketing_image_tools.remove_image(image_id)
+    return await marketing_image_tools.remove_image(image_id)
+
+async def remove_images_tool(image_ids: List[str]) -> dict:
+    """Removes several marketing images at once.
+
+    Args:
+        image_ids: The unique identifiers of the images to remove (up to 100).
+
+    Returns:
+        A dictionary confirming the removals, listing any images that were not found.
+    """
+    return await marketing_image_tools.remove_images(image_ids)
 
-def change_image_attributes_tool(
+async def change_image_attributes_tool(
     image_id: str,
     new_description: Optional[str] = None,
     new_keywords: Optional[List[str]] = None,
@@ -67,7 +94,7 @@ def change_image_attributes_tool(
     Returns:
         A dictionary confirming that the request to change an attribute/attributes  was received.
     """
-    return marketing_image_tools.change_image_attributes(image_id, new_description, new_keywords, new_dimensions, new_url, new_size)
+    return await marketing_image_tools.change_image_attributes(image_id, new_description, new_keywords, new_dimensions, new_url, new_size)
 
 
 marketing_image_tools: MarketingImageTools
@@ -79,7 +106,7 @@ def create_agent(container: Container) -> Agent:
         model=container.config.genai.adk.model_1.name(),
         description=container.config.genai.adk.agent_1.description(),
         instruction=container.config.genai.adk.agent_1.instruction(),
-        tools=[generate_image_tool, change_image_approval_status_request_tool, remove_image_tool, change_image_attributes_tool],
+        tools=[generate_image_tool, generate_images_tool, change_image_approval_status_request_tool, remove_image_tool, remove_images_tool, change_image_attributes_tool],
     )
     global marketing_image_tools
     marketing_image_tools = MarketingImageTools(container)
@@ -0,0 +1,21 @@
+from ..ports.command_input_port import CommandInputPort
+from ..ports.command_output_port import CommandOutputPort
+from ..services.generate_marketing_image_core_service import GenerateMarketingImageCoreService
+from ..command_objects.generate_marketing_image_batch_command import GenerateMarketingImageBatchCommand
+
+
+class GenerateMarketingImageBatchCommandHandler(
+    CommandInputPort[GenerateMarketingImageBatchCommand]
+):
+    def __init__(
+        self,
+        core_service: GenerateMarketingImageCoreService,
+        command_dispatcher: CommandOutputPort,
+    ):
+        self.core_service = core_service
+        command_dispatcher.register(GenerateMarketingImageBatchCommand, self)
+
+    async def handle(self, command: GenerateMarketingImageBatchCommand):
+        """Handles the GenerateMarketingImageBatchCommand by awaiting the core service."""
+        core_service_response = await self.core_service.generate_marketing_image_batch(command)
+        return core_service_response
@@ -15,7 +15,7 @@ class GenerateMarketingImageCommandHandler(
         self.core_service = core_service
         command_dispatcher.register(GenerateMarketingImageCommand, self)
 
-    def handle(self, command: GenerateMarketingImageCommand):
-        """Handles the GenerateMarketingImageCommand by calling the core service."""
-        core_service_response = self.core_service.generate_marketing_image(command)
+    async def handle(self, command: GenerateMarketingImageCommand):
+        """Handles the GenerateMarketingImageCommand by awaiting the core service."""
+        core_service_response = await self.core_service.generate_marketing_image(command)
         return core_service_response
\ No newline at end of file
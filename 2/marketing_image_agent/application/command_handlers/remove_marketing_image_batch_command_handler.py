@@ -0,0 +1,27 @@
+from ..ports.command_input_port import CommandInputPort
+from ..ports.command_output_port import CommandOutputPort
+from ..services.remove_marketing_image_core_service import RemoveMarketingImageCoreService
+from ..services.marketing_image_concurrency_conflict_retry_policy import MarketingImageConcurrencyConflictRetryPolicy
+from ..command_objects.remove_marketing_image_batch_command import RemoveMarketingImageBatchCommand
+
+
+class RemoveMarketingImageBatchCommandHandler(
+    CommandInputPort[RemoveMarketingImageBatchCommand]
+):
+    def __init__(
+        self,
+        core_service: RemoveMarketingImageCoreService,
+        command_dispatcher: CommandOutputPort,
+        concurrency_conflict_retry_policy: MarketingImageConcurrencyConflictRetryPolicy = None,
+    ):
+        self.core_service = core_service
+        self.concurrency_conflict_retry_policy = concurrency_conflict_retry_policy or MarketingImageConcurrencyConflictRetryPolicy()
+        command_dispatcher.register(RemoveMarketingImageBatchCommand, self)
+
+    def handle(self, command: RemoveMarketingImageBatchCommand):
+        """
+        Handles the RemoveMarketingImageBatchCommand by calling the core service - again, from a fresh read of the images,
+        if their save conflicts with a concurrent change to any of them.
+        """
+        core_service_response = self.concurrency_conflict_retry_policy.run(self.core_service.remove_marketing_image_batch, command)
+        return core_service_response
@@ -1,6 +1,7 @@
 from ..ports.command_input_port import CommandInputPort
 from ..ports.command_output_port import CommandOutputPort
 from ..services.remove_marketing_image_core_service import RemoveMarketingImageCoreService
+from ..services.marketing_image_concurrency_conflict_retry_policy import MarketingImageConcurrencyConflictRetryPolicy
 from ..command_objects.remove_marketing_image_command import RemoveMarketingImageCommand
 
 
@@ -11,11 +12,16 @@ class RemoveMarketingImageCommandHandler(
         self,
         core_service: RemoveMarketingImageCoreService,
         command_dispatcher: CommandOutputPort,
+        concurrency_conflict_retry_policy: MarketingImageConcurrencyConflictRetryPolicy = None,
     ):
         self.core_service = core_service
+        self.concurrency_conflict_retry_policy = concurrency_conflict_retry_policy or MarketingImageConcurrencyConflictRetryPolicy()
         command_dispatcher.register(RemoveMarketingImageCommand, self)
 
     def handle(self, command: RemoveMarketingImageCommand):
-        """Handles the RemoveMarketingImageCommand by calling the core service."""
-        core_service_response = self.core_service.remove_marketing_image(command)
+        """
+        Handles the RemoveMarketingImageCommand by calling the core service - again, from a fresh read of the image,
+        if its save conflicts with a concurrent change.
+        """
+        core_service_response = self.concurrency_conflict_retry_policy.run(self.core_service.remove_marketing_image, command)
         return core_service_response
\ No newline at end of file
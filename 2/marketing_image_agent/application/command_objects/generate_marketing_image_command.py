@@ -26,6 +26,8 @@ class GenerateMarketingImageData:
         image_min_dimensions: Optional[Dict[str, int]] = None,
         image_max_dimensions: Optional[Dict[str, int]] = None,
         mime_type: Optional[str] = None,
+        use_generation_cache: Optional[bool] = None,
+        latency_budget_ms: Optional[int] = None,
         **kwargs: Any,  # To ignore extra fields from the input dict
     ):
         self.request_id = request_id
@@ -38,6 +40,8 @@ class GenerateMarketingImageData:
             ImageDimensions(**image_max_dimensions) if isinstance(image_max_dimensions, dict) else image_max_dimensions
         )
         self.mime_type = mime_type
+        self.use_generation_cache = use_generation_cache
+        self.latency_budget_ms = latency_budget_ms
 
     def to_dict(self) -> Dict[str, Any]:
         """Converts the object to a dictionary for serialisation."""
@@ -48,6 +52,8 @@ class GenerateMarketingImageData:
             "image_min_dimensions": self.image_min_dimensions.to_dict() if self.image_min_dimensions else None,
             "image_max_dimensions": self.image_max_dimensions.to_dict() if self.image_max_dimensions else None,
             "mime_type": self.mime_type,
+            "use_generation_cache": self.use_generation_cache,
+            "latency_budget_ms": self.latency_budget_ms,
         }
         return {k: v for k, v in data.items() if v is not None}
 
@@ -0,0 +1,53 @@
+from typing import Dict, Any, List
+from .base_command_object import Command
+
+
+class RemoveMarketingImageBatchData:
+    """Represents the data payload for a RemoveMarketingImageBatchCommand."""
+    def __init__(
+        self,
+        request_id: str,
+        request_time: str,
+        requestor: str,
+        image_ids: List[str],
+        **kwargs: Any,  # To ignore extra fields from the input dict
+    ):
+        self.request_id = request_id
+        self.request_time = request_time
+        self.requestor = requestor
+        self.image_ids = list(image_ids)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Converts the object to a dictionary for serialisation."""
+        data = {
+            "request_id": self.request_id,
+            "request_time": self.request_time,
+            "requestor": self.requestor,
+            "image_ids": self.image_ids,
+        }
+        return {k: v for k, v in data.items() if v is not None}
+
+class RemoveMarketingImageBatchCommand(Command):
+    """Command to remove several marketing images at once."""
+
+    def __init__(
+        self,
+        data: Dict[str, Any],
+        source: str,
+        command_prefix: str,
+        version: str = "1.0",
+        
+    ):
+        super().__init__(
+            type=f"{command_prefix}.remove-batch",
+            data=data,
+            source=source,
+            version=version,
+        )
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "RemoveMarketingImageBatchCommand":
+        command_data = data.copy()
+        command_data.pop("type", None)
+        command_data["data"] = RemoveMarketingImageBatchData(**command_data["data"])
+        return cls(**command_data)
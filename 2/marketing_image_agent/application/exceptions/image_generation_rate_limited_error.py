@@ -0,0 +1,17 @@
+class ImageGenerationRateLimitedError(RuntimeError):
+    """
+    Raised when an image generation request is shed rather than sent to the model - i.e. the model's request queue is full,
+    or the request could not be admitted within its deadline without exceeding the model's quota.
+    """
+
+    def __init__(self, message: str, quota_key: tuple = None, retry_after_seconds: float = None):
+        super().__init__(message)
+        self.quota_key = quota_key
+        self.retry_after_seconds = retry_after_seconds
+
+    def to_dict(self) -> dict:
+        return {
+            "status": "rate_limited",
+            "error": str(self),
+            "retry_after_seconds": round(self.retry_after_seconds, 1) if self.retry_after_seconds is not None else None,
+        }
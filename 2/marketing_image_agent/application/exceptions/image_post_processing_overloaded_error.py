@@ -0,0 +1,17 @@
+class ImagePostProcessingOverloadedError(RuntimeError):
+    """
+    Raised when an image is shed rather than queued for post-processing - i.e. max_queue_depth images are already
+    submitted to the workers and no slot became free within the admission timeout.
+    """
+
+    def __init__(self, message: str, max_queue_depth: int = None, retry_after_seconds: float = None):
+        super().__init__(message)
+        self.max_queue_depth = max_queue_depth
+        self.retry_after_seconds = retry_after_seconds
+
+    def to_dict(self) -> dict:
+        return {
+            "status": "overloaded",
+            "error": str(self),
+            "retry_after_seconds": round(self.retry_after_seconds, 1) if self.retry_after_seconds is not None else None,
+        }
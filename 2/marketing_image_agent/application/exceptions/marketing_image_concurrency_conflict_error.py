@@ -0,0 +1,19 @@
+class MarketingImageConcurrencyConflictError(RuntimeError):
+    """
+    Raised by a repository when a marketing image aggregate is saved from a version that is no longer the stored one -
+    i.e. another command changed (or removed) the image after this one retrieved it. Nothing is written, so the command
+    can be retried from a fresh read of the aggregate.
+    """
+
+    def __init__(self, message: str, image_id: str = None, expected_version: int = None, actual_version: int = None):
+        super().__init__(message)
+        self.image_id = image_id
+        self.expected_version = expected_version
+        self.actual_version = actual_version # None if the aggregate no longer exists
+
+    def to_dict(self) -> dict:
+        return {
+            "status": "conflict",
+            "error": str(self),
+            "image_id": self.image_id,
+        }
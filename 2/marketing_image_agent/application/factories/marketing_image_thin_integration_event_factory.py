@@ -37,6 +37,23 @@ class MarketingImageIntegrationEventsFactory(IntegrationEventFactory):
         filename = parsed_url.path.split('/', 2)[-1]
         return f"{self.storage_provider}:{self.gcs_project_id}:{self.gcs_bucket_location}:{self.gcs_bucket_name}:{filename}:{checksum}"
 
+    def _create_renditions_with_claim_check_tokens(self, renditions: list) -> list:
+        """Adds a claim check token to each rendition so consumers can fetch the smallest one that fits."""
+        if not renditions:
+            return []
+        return [
+            {
+                "name": rendition["name"],
+                "url": rendition["url"],
+                "dimensions": rendition["dimensions"],
+                "size": rendition["size"],
+                "mime_type": rendition["mime_type"],
+                "checksum": rendition["checksum"],
+                "claim_check_token": self._create_claim_check_token(rendition["url"], rendition["checksum"]),
+            }
+            for rendition in renditions
+        ]
+
 
     def _to_dict_recursive(self, data: Any) -> Any:
         """
@@ -68,6 +85,7 @@ class MarketingImageIntegrationEventsFactory(IntegrationEventFactory):
             created_by=event_data["created_by"],
             created_at=event_data["created_at"],
             claim_check_token=claim_check_token,
+            renditions=self._create_renditions_with_claim_check_tokens(event_data.get("renditions")),
         )
 
         return marketing_image_generated_thin_integration_event
@@ -17,6 +17,7 @@ class MarketingImageGeneratedThinIntegrationEvent(IntegrationEvent):
         created_by: str,
         created_at: str,
         claim_check_token: str,
+        renditions: list = None,
         event_id: str = None,
         event_type: str = None,
         event_source: str = None,
@@ -34,6 +35,7 @@ class MarketingImageGeneratedThinIntegrationEvent(IntegrationEvent):
             "created_by": created_by,
             "created_at": created_at,
             "claim_check_token": claim_check_token,
+            "renditions": renditions,
         }
 
         super().__init__(
@@ -0,0 +1,85 @@
+from abc import ABC, abstractmethod
+from typing import Any, AsyncIterator, Mapping, Optional, TypeVar, Tuple
+
+from .base_output_port import BaseOutputPort
+
+T = TypeVar("T")
+
+
+class AsyncMarketingImageObjectStorageOutputPort(BaseOutputPort[T], ABC):
+    """
+    This class defines the asynchronous interface for storing marketing images.
+    It is the awaitable counterpart of MarketingImageObjectStorageOutputPort for use on the event loop.
+    """
+
+    @abstractmethod
+    async def save_marketing_image_object(self, image_data: Any, file_name: str, content_type: str, fixed_key_metadata: Optional[Mapping[str, str]] = None, custom_metadata: Optional[Mapping[str, str]] = None) -> Tuple[str, str]:
+        """
+        Saves the marketing image data to the object storage.
+
+        Args:
+            image_data: The image data to be saved.
+            file_name: The name of the file to save the image as.
+            content_type: The content type of the image.
+            fixed_key_metadata: Optional fixed-key metadata - e.g. cache control.
+            custom_metadata: Optional custom metadata key-value pairs.
+
+        Returns:
+            A tuple containing the URL to the saved image and its checksum.
+        """
+        pass
+
+    @abstractmethod
+    async def retrieve_marketing_image_object(self, file_name: str) -> Any:
+        """
+        Retrieves the marketing image data from the object storage.
+
+        Args:
+            file_name: The name of the file to retrieve the image from.
+
+        Returns:
+            The image data.
+        """
+        pass
+
+    @abstractmethod
+    async def retrieve_marketing_image_object_range(self, file_name: str, start: int, end: Optional[int] = None) -> Optional[bytes]:
+        """
+        Retrieves a byte range of the marketing image data from the object storage.
+
+        Args:
+            file_name: The name of the file to retrieve the image from.
+            start: The offset of the first byte to retrieve.
+            end: The offset of the last byte to retrieve (inclusive), or None to read to the end of the object.
+
+        Returns:
+            The bytes in the range, or None if the object does not exist.
+        """
+        pass
+
+    @abstractmethod
+    def iterate_marketing_image_object_chunks(self, file_name: str, chunk_size: int = 1024 * 1024, start: int = 0, end: Optional[int] = None) -> AsyncIterator[bytes]:
+        """
+        Streams the marketing image data from the object storage as an asynchronous iterator of chunks.
+        The iterator yields nothing if the object does not exist.
+
+        Args:
+            file_name: The name of the file to retrieve the image from.
+            chunk_size: The maximum size of each chunk in bytes.
+            start: The offset of the first byte to retrieve.
+            end: The offset of the last byte to retrieve (inclusive), or None to read to the end of the object.
+
+        Returns:
+            An asynchronous iterator of chunks.
+        """
+        pass
+
+    @abstractmethod
+    async def remove_marketing_image_object(self, file_name: str) -> None:
+        """
+        Removes the marketing image data from the object storage.
+
+        Args:
+            file_name: The name of the file to delete the image from.
+        """
+        pass
@@ -0,0 +1,155 @@
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import AsyncIterator, Optional, List, Tuple, TypeVar, Union
+import uuid
+
+from .base_output_port import BaseOutputPort
+
+from .marketing_image_repository_output_port import MarketingImageRepositoryOutputPort
+from ...domain.entities.marketing_image_aggregate import MarketingImage
+
+T = TypeVar("T")
+
+
+class AsyncMarketingImageRepositoryOutputPort(BaseOutputPort[T], ABC):
+    """
+    Abstract base class for the asynchronous marketing image repository output port.
+    This is the awaitable counterpart of MarketingImageRepositoryOutputPort for use on the event loop.
+    """
+
+    ORDERABLE_FIELDS = MarketingImageRepositoryOutputPort.ORDERABLE_FIELDS
+    PROJECTABLE_FIELDS = MarketingImageRepositoryOutputPort.PROJECTABLE_FIELDS
+    DEFAULT_QUERY_PAGE_SIZE = MarketingImageRepositoryOutputPort.DEFAULT_QUERY_PAGE_SIZE
+    MAX_QUERY_PAGE_SIZE = MarketingImageRepositoryOutputPort.MAX_QUERY_PAGE_SIZE
+
+    # Shared with the synchronous port, so that native asynchronous repositories validate and version-check identically
+    _validate_query = MarketingImageRepositoryOutputPort._validate_query
+    _check_version = MarketingImageRepositoryOutputPort._check_version
+
+    @abstractmethod
+    async def save(self, marketing_image: MarketingImage) -> None:
+        """
+        Saves a marketing image aggregate, if the stored aggregate is still at the version it was retrieved with
+        (or does not exist yet, for a new aggregate), and increments its version.
+
+        Args:
+            marketing_image: The MarketingImage aggregate to persist.
+
+        Raises:
+            MarketingImageConcurrencyConflictError: If the aggregate was changed or removed since it was retrieved.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def save_all(self, marketing_images: List[MarketingImage]) -> None:
+        """
+        Saves several marketing image aggregates atomically - i.e. either all of them are persisted or none are.
+        Each is version-checked as by save, and a conflict on any of them saves none.
+
+        Args:
+            marketing_images: The MarketingImage aggregates to persist.
+
+        Raises:
+            MarketingImageConcurrencyConflictError: If any of the aggregates was changed or removed since it was retrieved.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def retrieve_by_id(self, id: uuid.UUID) -> Optional[MarketingImage]:
+        """
+        Retrieves a marketing image aggregate by its ID.
+
+        Args:
+            id: The ID of the marketing image to retrieve.
+
+        Returns:
+            The MarketingImage aggregate, or None if not found.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def retrieve_by_ids(self, ids: List[uuid.UUID]) -> Tuple[List[MarketingImage], List[str]]:
+        """
+        Retrieves several marketing image aggregates by their IDs.
+        The result is as for MarketingImageRepositoryOutputPort.retrieve_by_ids.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def retrieve_all(self) -> List[MarketingImage]:
+        """
+        Retrieves all marketing image aggregates.
+
+        Returns:
+            A list of MarketingImage aggregates.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def remove(self, id: uuid.UUID) -> None:
+        """
+        Removes a marketing image aggregate by its ID.
+
+        Args:
+            id: The ID of the marketing image to remove.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def retrieve_ids_by_url(self, url: str) -> List[str]:
+        """
+        Retrieves the IDs of the marketing image aggregates that reference an image object URL.
+
+        Args:
+            url: The URL of the image object.
+
+        Returns:
+            A list of marketing image IDs (empty if no aggregate references the URL).
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def query_page(
+        self,
+        status: Optional[str] = None,
+        created_by: Optional[str] = None,
+        created_from: Optional[datetime] = None,
+        created_before: Optional[datetime] = None,
+        mime_type: Optional[str] = None,
+        order_by: str = "created_at",
+        descending: bool = True,
+        page_size: int = DEFAULT_QUERY_PAGE_SIZE,
+        cursor: Optional[str] = None,
+        fields: Optional[List[str]] = None,
+    ) -> Tuple[List[Union[MarketingImage, dict]], Optional[str]]:
+        """
+        Retrieves one page of the marketing image aggregates that match the filters.
+        The arguments and result are as for MarketingImageRepositoryOutputPort.query_page.
+        """
+        raise NotImplementedError
+
+    async def query(
+        self,
+        status: Optional[str] = None,
+        created_by: Optional[str] = None,
+        created_from: Optional[datetime] = None,
+        created_before: Optional[datetime] = None,
+        mime_type: Optional[str] = None,
+        order_by: str = "created_at",
+        descending: bool = True,
+        page_size: int = DEFAULT_QUERY_PAGE_SIZE,
+        fields: Optional[List[str]] = None,
+    ) -> AsyncIterator[Union[MarketingImage, dict]]:
+        """
+        Lazily iterates over every marketing image aggregate that matches the filters, reading one page at a time.
+        """
+        cursor = None
+        while True:
+            items, cursor = await self.query_page(
+                status=status, created_by=created_by, created_from=created_from, created_before=created_before,
+                mime_type=mime_type, order_by=order_by, descending=descending, page_size=page_size, cursor=cursor, fields=fields,
+            )
+            for item in items:
+                yield item
+            if cursor is None:
+                return
@@ -16,7 +16,7 @@ class ChangeMarketingImageApprovalStatusInputPort(BaseInputPort[T], ABC, Generic
     """
  
     @abstractmethod
-    def handle(self, request_data: Dict[str, Any]) -> Dict[str, Any]:
+    async def handle(self, request_data: Dict[str, Any]) -> Dict[str, Any]:
         """
         Handles an incoming request by passing it to the driving service.
 
@@ -16,7 +16,7 @@ class ChangeMarketingImageMetadataInputPort(BaseInputPort[T], ABC, Generic[T]):
     """
  
     @abstractmethod
-    def handle(self, request_data: Dict[str, Any]) -> Dict[str, Any]:
+    async def handle(self, request_data: Dict[str, Any]) -> Dict[str, Any]:
         """
         Handles an incoming request by passing it to the driving service.
 
@@ -18,9 +18,9 @@ class CommandOutputPort(BaseOutputPort[T], ABC, Generic[T]):
         """
     
     @abstractmethod  # Used by the dispatcher
-    def dispatch(self, command: T):
+    async def dispatch(self, command: T):
         """
-        Dispatch a command.
+        Dispatch a command without blocking the event loop.
 
         Args:
             command (T): The command to dispatch.
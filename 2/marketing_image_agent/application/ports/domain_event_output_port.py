@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from concurrent.futures import Future
 from typing import Generic, TypeVar, Type, Any
 
 from .base_output_port import BaseOutputPort
@@ -24,4 +25,24 @@ class DomainEventOutputPort(BaseOutputPort[T], ABC, Generic[T]):
 
         Args:
             domain_event (T): The domain event to dispatch.
-        """
\ No newline at end of file
+        """
+
+    def dispatch_in_background(self, domain_event: T) -> Future:
+        """
+        Dispatch a domain event without waiting for its handlers, in order with the other domain events of the same
+        aggregate - a later dispatch or dispatch_in_background for that aggregate runs only once this one has completed.
+
+        This default dispatches the domain event before returning. Adapters that can run handlers in the background override it.
+
+        Args:
+            domain_event (T): The domain event to dispatch.
+
+        Returns:
+            A future that holds the handler's response, or the exception it raised.
+        """
+        future = Future()
+        try:
+            future.set_result(self.dispatch(domain_event))
+        except Exception as e:
+            future.set_exception(e)
+        return future
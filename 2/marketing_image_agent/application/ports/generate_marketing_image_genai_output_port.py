@@ -1,5 +1,6 @@
+import asyncio
 from abc import ABC, abstractmethod
-from typing import TypeVar
+from typing import List, TypeVar
 
 from .base_output_port import BaseOutputPort
 
@@ -9,9 +10,10 @@ T = TypeVar("T")
 class MarketingImageImageGenerationOutputPort(BaseOutputPort[T], ABC):
     """
     This class defines the interface for generating marketing images (the actual bytes) using GenAI models.
+    Implementations must not block the event loop - i.e. use asynchronous clients and offload CPU-bound work.
     """
     @abstractmethod
-    def generate_marketing_image(self, prompt: str, min_dimensions: dict = None, max_dimensions: dict = None, mime_type: str = None) -> dict:
+    async def generate_marketing_image(self, prompt: str, min_dimensions: dict = None, max_dimensions: dict = None, mime_type: str = None, use_cache: bool = True, latency_budget_ms: int = None) -> dict:
         """
         Generates a marketing image using AI.
 
@@ -20,12 +22,60 @@ class MarketingImageImageGenerationOutputPort(BaseOutputPort[T], ABC):
             min_dimensions: The minimum dimensions of the generated image.
             max_dimensions: The maximum dimensions of the generated image.
             mime_type: The MIME type of the generated image.
+            use_cache: Whether a previously generated and stored result may be reused (honoured by caching decorators, ignored by model adapters).
+            latency_budget_ms: (Optional) How long the caller is prepared to wait for the image (honoured by routing decorators, ignored by model adapters).
 
         Returns:
-            image_data: The data/bytes of the generated marketing image.
+            image_data: The data/bytes of the generated marketing image (None when a stored object is being reused).
             mime_type: The MIME type of the generated marketing image.
             generation_model: The name of the model used to generate the marketing image.
             image_dimensions: A dictionary containing the dimensions of the generated marketing image (height, width).
             generation_parameters: A dictionary containing the parameters used to generate the marketing image.
+            stored_object: (Optional) A dictionary containing the url, checksum, and size of an already stored object to reuse instead of uploading image_data.
         """
-        pass
\ No newline at end of file
+        pass
+
+    async def generate_marketing_images(self, prompt: str, number_of_images: int, min_dimensions: dict = None, max_dimensions: dict = None, mime_type: str = None) -> List[dict]:
+        """
+        Generates several variants of a marketing image from one prompt.
+        The default implementation runs generate_marketing_image concurrently; adapters whose model can return
+        several images from one request - e.g. Imagen - override this to make a single round trip.
+
+        Args:
+            prompt: The prompt to generate the marketing images.
+            number_of_images: The number of images to generate.
+            min_dimensions: The minimum dimensions of the generated images.
+            max_dimensions: The maximum dimensions of the generated images.
+            mime_type: The MIME type of the generated images.
+
+        Returns:
+            A list of dictionaries, one per image, in the same form as generate_marketing_image (without stored_object).
+        """
+        generator_kwargs = {"min_dimensions": min_dimensions, "max_dimensions": max_dimensions, "use_cache": False}
+        if mime_type:
+            generator_kwargs["mime_type"] = mime_type
+        return list(await asyncio.gather(*[self.generate_marketing_image(prompt=prompt, **generator_kwargs) for _ in range(number_of_images)]))
+
+    @abstractmethod
+    def describe_generation(self, prompt: str, min_dimensions: dict = None, max_dimensions: dict = None, mime_type: str = None) -> dict:
+        """
+        Describes the generation that generate_marketing_image would perform for the same arguments, without calling the model.
+
+        Returns:
+            generation_model: The name of the model that would be used.
+            generation_parameters: A dictionary containing the parameters that would be used.
+        """
+        pass
+
+    async def register_stored_marketing_image(self, generation_result: dict, url: str, checksum: str, renditions: list = None) -> None:
+        """
+        Notifies the generator that the result of a generation has been stored and persisted.
+        Model adapters ignore this; decorators - e.g. caches - use it to record the stored object for reuse.
+
+        Args:
+            generation_result: The dictionary returned by generate_marketing_image.
+            url: The URL of the stored image object.
+            checksum: The checksum of the stored image object.
+            renditions: (Optional) The stored renditions of the image (name, url, dimensions, size, mime_type, checksum).
+        """
+        return None
@@ -0,0 +1,60 @@
+from abc import ABC, abstractmethod
+from typing import List, Optional, TypeVar
+
+from .base_output_port import BaseOutputPort
+
+T = TypeVar("T")
+
+
+class ImagePostProcessingOutputPort(BaseOutputPort[T], ABC):
+    """
+    This class defines the interface for the image post-processing stage - i.e. resizing and re-encoding generated images.
+    Implementations must not block the event loop.
+    """
+
+    @abstractmethod
+    async def process_image(self, image_data: bytes, transform_spec: dict) -> dict:
+        """
+        Applies a transform to an image.
+
+        Args:
+            image_data: The encoded image bytes.
+            transform_spec: A dictionary describing the transform:
+                mime_type: The MIME type to encode the result as - e.g. "image/png".
+                max_dimensions: (Optional) A dictionary (width, height) the result must fit within, preserving aspect ratio.
+
+        Returns:
+            image_data: The encoded result (the original bytes if no transform was needed).
+            mime_type: The MIME type of the result.
+            width: The width of the result.
+            height: The height of the result.
+            transformed: Whether the image was decoded and re-encoded.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def process_image_renditions(self, image_data: bytes, transform_specs: List[dict]) -> List[dict]:
+        """
+        Produces several renditions of an image in one pass - i.e. the image is decoded at most once.
+
+        Args:
+            image_data: The encoded image bytes.
+            transform_specs: A list of transform specs, as accepted by process_image.
+
+        Returns:
+            A list of results, as returned by process_image, in the same order as transform_specs.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def compute_perceptual_hash(self, image_data: bytes) -> Optional[str]:
+        """
+        Computes a perceptual hash of an image, so that near-duplicate images can be found.
+
+        Args:
+            image_data: The encoded image bytes.
+
+        Returns:
+            The perceptual hash - e.g. "dhash:8f373714acfcf4d0" - or None if it cannot be computed.
+        """
+        raise NotImplementedError
@@ -0,0 +1,48 @@
+from abc import ABC, abstractmethod
+from typing import Any, Dict, Optional, TypeVar
+
+from .base_output_port import BaseOutputPort
+
+T = TypeVar("T")
+
+
+class MarketingImageGenerationCacheOutputPort(BaseOutputPort[T], ABC):
+    """
+    Abstract base class for the marketing image generation result cache output port.
+    Entries are keyed by a content-addressed generation key (model, normalised prompt, and generation parameters)
+    and describe an already generated and stored image object that can be reused instead of generating a new one.
+    """
+
+    @abstractmethod
+    async def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Retrieves a cache entry by its generation key.
+
+        Args:
+            key: The generation key.
+
+        Returns:
+            The cache entry, or None if not found or expired.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def put(self, key: str, entry: Dict[str, Any]) -> None:
+        """
+        Stores a cache entry under its generation key.
+
+        Args:
+            key: The generation key.
+            entry: The cache entry - i.e. url, checksum, size, mime_type, generation_model, image_dimensions, and generation_parameters.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def invalidate(self, key: str) -> None:
+        """
+        Removes a cache entry by its generation key.
+
+        Args:
+            key: The generation key.
+        """
+        raise NotImplementedError
@@ -0,0 +1,55 @@
+from abc import ABC, abstractmethod
+from typing import List, TypeVar
+
+from .base_output_port import BaseOutputPort
+
+T = TypeVar("T")
+
+
+class MarketingImageNearDuplicateIndexOutputPort(BaseOutputPort[T], ABC):
+    """
+    This class defines the interface for an index of marketing images' perceptual hashes,
+    used to find stored images that are near-duplicates of a newly generated one.
+    """
+
+    @abstractmethod
+    async def ensure_loaded(self) -> None:
+        """
+        Loads the index from the persisted marketing image aggregates, if it has not been loaded yet.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def add(self, image_id: str, perceptual_hash: str) -> None:
+        """
+        Adds a marketing image's perceptual hash to the index (adding an image that is already indexed has no effect).
+
+        Args:
+            image_id: The ID of the marketing image.
+            perceptual_hash: The perceptual hash of the image - e.g. "dhash:8f373714acfcf4d0".
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def remove(self, image_id: str) -> None:
+        """
+        Removes a marketing image from the index (removing an image that is not indexed has no effect).
+
+        Args:
+            image_id: The ID of the marketing image.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def find_near_duplicates(self, perceptual_hash: str, max_distance: int) -> List[dict]:
+        """
+        Finds the indexed marketing images whose perceptual hash is within a Hamming distance of the given one.
+
+        Args:
+            perceptual_hash: The perceptual hash to search for.
+            max_distance: The maximum Hamming distance (number of differing bits) of a near-duplicate.
+
+        Returns:
+            A list of dictionaries (image_id, perceptual_hash, distance), nearest first.
+        """
+        raise NotImplementedError
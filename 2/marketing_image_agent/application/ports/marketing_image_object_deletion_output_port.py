@@ -0,0 +1,25 @@
+from abc import ABC, abstractmethod
+from typing import Dict, List, Optional, TypeVar
+
+from .base_output_port import BaseOutputPort
+
+T = TypeVar("T")
+
+
+class MarketingImageObjectDeletionOutputPort(BaseOutputPort[T], ABC):
+    """
+    This class defines the interface for deleting image objects from object storage in the background,
+    so that removing a marketing image does not wait for - or fail because of - the deletion of its objects.
+    """
+
+    @abstractmethod
+    def schedule_deletion(self, file_names: List[str], image_urls_by_file_name: Optional[Dict[str, str]] = None) -> None:
+        """
+        Durably schedules objects for deletion and returns without waiting for them to be deleted.
+
+        Args:
+            file_names: The names of the files to delete.
+            image_urls_by_file_name: The URL of the image each object belongs to (the original image's URL, for its renditions).
+                An object is only deleted if, when its deletion is due, no marketing image references that URL any more.
+        """
+        raise NotImplementedError
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Any, TypeVar, Tuple
+from typing import Any, BinaryIO, Dict, Iterator, List, Mapping, Optional, TypeVar, Tuple
 
 from .base_output_port import BaseOutputPort
 
@@ -11,6 +11,17 @@ class MarketingImageObjectStorageOutputPort(BaseOutputPort[T], ABC):
     This class defines the interface for storing marketing images.
     """
 
+    DEFAULT_CHUNK_SIZE = 1024 * 1024
+
+    DEFAULT_CACHE_CONTROL = "private, max-age=0"
+    FIXED_METADATA_KEYS = ("cache_control", "content_disposition", "content_encoding", "content_language", "content_type", "custom_time")
+
+    # Results of removing and updating objects in bulk
+    REMOVED = "removed"
+    UPDATED = "updated"
+    NOT_FOUND = "not_found"
+    FAILED = "failed"
+
     @abstractmethod
     def save_marketing_image_object(self, image_data: Any, file_name: str, content_type: str) -> Tuple[str, str]:
         """
@@ -39,6 +50,51 @@ class MarketingImageObjectStorageOutputPort(BaseOutputPort[T], ABC):
         """
         pass
 
+    @abstractmethod
+    def retrieve_marketing_image_object_range(self, file_name: str, start: int, end: Optional[int] = None) -> Optional[bytes]:
+        """
+        Retrieves a byte range of the marketing image data from the object storage.
+
+        Args:
+            file_name: The name of the file to retrieve the image from.
+            start: The offset of the first byte to retrieve.
+            end: The offset of the last byte to retrieve (inclusive, as in an HTTP Range header), or None to read to the end of the object.
+
+        Returns:
+            The bytes in the range, or None if the object does not exist.
+        """
+        pass
+
+    @abstractmethod
+    def retrieve_marketing_image_object_chunks(self, file_name: str, chunk_size: int = DEFAULT_CHUNK_SIZE, start: int = 0, end: Optional[int] = None) -> Optional[Iterator[bytes]]:
+        """
+        Retrieves the marketing image data from the object storage as an iterator of chunks, so that the object is never held in memory as a whole.
+
+        Args:
+            file_name: The name of the file to retrieve the image from.
+            chunk_size: The maximum size of each chunk in bytes.
+            start: The offset of the first byte to retrieve.
+            end: The offset of the last byte to retrieve (inclusive), or None to read to the end of the object.
+
+        Returns:
+            An iterator of chunks, or None if the object does not exist.
+        """
+        pass
+
+    @abstractmethod
+    def open_marketing_image_object(self, file_name: str, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Optional[BinaryIO]:
+        """
+        Opens the marketing image data in the object storage as a read-only, seekable file-like object that is read on demand - e.g. to pass to Pillow.
+
+        Args:
+            file_name: The name of the file to open.
+            chunk_size: The size of the reads made from the object storage in bytes.
+
+        Returns:
+            A file-like object (the caller closes it), or None if the object does not exist.
+        """
+        pass
+
     @abstractmethod
     def remove_marketing_image_object(self, file_name: str) -> None:
         """
@@ -47,4 +103,33 @@ class MarketingImageObjectStorageOutputPort(BaseOutputPort[T], ABC):
         Args:
             file_name: The name of the file to delete the image from.
         """
-        pass
\ No newline at end of file
+        pass
+
+    @abstractmethod
+    def remove_marketing_image_objects(self, file_names: List[str]) -> Dict[str, str]:
+        """
+        Removes several marketing image objects from the object storage, in as few requests as the object storage allows.
+        A failure to remove one object does not prevent the others from being removed.
+
+        Args:
+            file_names: The names of the files to remove.
+
+        Returns:
+            A dictionary mapping each file name to REMOVED, NOT_FOUND, or FAILED (which is worth retrying).
+        """
+        pass
+
+    @abstractmethod
+    def update_marketing_image_objects_metadata(self, file_names: List[str], fixed_key_metadata: Mapping[str, str]) -> Dict[str, str]:
+        """
+        Updates the fixed-key metadata (e.g. cache control) of several marketing image objects without re-uploading them,
+        in as few requests as the object storage allows. A failure to update one object does not prevent the others from being updated.
+
+        Args:
+            file_names: The names of the files to update.
+            fixed_key_metadata: The fixed-key metadata to set, with snake_case keys - e.g. {"cache_control": "no-store"}.
+
+        Returns:
+            A dictionary mapping each file name to UPDATED, NOT_FOUND, or FAILED.
+        """
+        pass
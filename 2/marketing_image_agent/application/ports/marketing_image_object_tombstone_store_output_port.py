@@ -0,0 +1,81 @@
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import Dict, List, Optional, TypeVar
+
+from .base_output_port import BaseOutputPort
+
+T = TypeVar("T")
+
+
+class MarketingImageObjectTombstoneStoreOutputPort(BaseOutputPort[T], ABC):
+    """
+    This class defines the interface for storing tombstones - i.e. records of image objects that are due to be
+    deleted from object storage - so that a removal can return before its objects are deleted, without losing them.
+    """
+
+    @abstractmethod
+    def record(self, file_names: List[str], image_urls_by_file_name: Optional[Dict[str, str]] = None) -> None:
+        """
+        Records tombstones for objects, due to be deleted straight away.
+
+        Args:
+            file_names: The names of the files to delete.
+            image_urls_by_file_name: The URL of the image each object belongs to, stored on its tombstone so that
+                references to it can be re-checked before the object is deleted.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def claim_due(self, limit: int, owner: str, lease_seconds: float) -> List[dict]:
+        """
+        Claims the tombstones whose next deletion attempt is due, earliest first, for one sweeper. Each claimed tombstone's
+        next attempt is atomically moved lease_seconds into the future, so no other sweeper claims it while this one
+        deletes its object - and if this one stops before completing or rescheduling it, it is due again once the lease expires.
+
+        Args:
+            limit: The maximum number of tombstones to claim.
+            owner: An identifier of the claiming sweeper, recorded on the tombstones.
+            lease_seconds: How long the tombstones are held for the claiming sweeper.
+
+        Returns:
+            A list of dictionaries (file_name, image_url, recorded_at, attempts, next_attempt_at).
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def complete(self, file_names: List[str]) -> None:
+        """
+        Removes the tombstones of objects that have been deleted (or were already gone). Tombstones that no longer exist are ignored.
+
+        Args:
+            file_names: The names of the deleted files.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def reschedule(self, file_name: str, attempts: int, next_attempt_at: datetime, last_error: str = None) -> None:
+        """
+        Records a failed deletion attempt and when the next attempt is due, releasing the tombstone's claim.
+        Does nothing if the tombstone no longer exists - e.g. another sweeper has completed it since its lease expired.
+
+        Args:
+            file_name: The name of the file that could not be deleted.
+            attempts: The number of attempts made so far.
+            next_attempt_at: When to attempt the deletion again.
+            last_error: A description of the failure.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def count_pending(self) -> int:
+        """
+        Returns the number of tombstones - i.e. objects still to be deleted.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def retrieve_oldest_recorded_at(self) -> Optional[datetime]:
+        """
+        Returns when the oldest tombstone was recorded, or None if there are none - the age of which is the sweeper's lag.
+        """
+        raise NotImplementedError
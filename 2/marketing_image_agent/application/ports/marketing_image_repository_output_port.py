@@ -1,10 +1,13 @@
 from abc import ABC, abstractmethod
-from typing import Optional, List, TypeVar
+from datetime import datetime
+from typing import Iterator, Optional, List, Tuple, TypeVar, Union
 import uuid
 
 from .base_output_port import BaseOutputPort
+from ..exceptions.marketing_image_concurrency_conflict_error import MarketingImageConcurrencyConflictError
 
 from ...domain.entities.marketing_image_aggregate import MarketingImage
+from ...domain.value_objects.status import Status
 
 T = TypeVar("T")
 
@@ -14,13 +17,39 @@ class MarketingImageRepositoryOutputPort(BaseOutputPort[T], ABC):
     Abstract base class for the marketing image repository output port.
     """
 
+    ORDERABLE_FIELDS = ("created_at", "last_modified_at")
+    PROJECTABLE_FIELDS = (
+        "url", "description", "keywords", "generation_model", "generation_parameters", "dimensions", "status", "size",
+        "mime_type", "checksum", "renditions", "perceptual_hash", "created_by", "created_at", "last_modified_at",
+    )
+    DEFAULT_QUERY_PAGE_SIZE = 100
+    MAX_QUERY_PAGE_SIZE = 1000
+
     @abstractmethod
     def save(self, marketing_image: MarketingImage) -> None:
         """
-        Saves a marketing image aggregate.
+        Saves a marketing image aggregate, if the stored aggregate is still at the version it was retrieved with
+        (or does not exist yet, for a new aggregate), and increments its version.
 
         Args:
             marketing_image: The MarketingImage aggregate to persist.
+
+        Raises:
+            MarketingImageConcurrencyConflictError: If the aggregate was changed or removed since it was retrieved.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def save_all(self, marketing_images: List[MarketingImage]) -> None:
+        """
+        Saves several marketing image aggregates atomically - i.e. either all of them are persisted or none are.
+        Each is version-checked as by save, and a conflict on any of them saves none.
+
+        Args:
+            marketing_images: The MarketingImage aggregates to persist.
+
+        Raises:
+            MarketingImageConcurrencyConflictError: If any of the aggregates was changed or removed since it was retrieved.
         """
         raise NotImplementedError
 
@@ -37,6 +66,19 @@ class MarketingImageRepositoryOutputPort(BaseOutputPort[T], ABC):
         """
         raise NotImplementedError
 
+    @abstractmethod
+    def retrieve_by_ids(self, ids: List[uuid.UUID]) -> Tuple[List[MarketingImage], List[str]]:
+        """
+        Retrieves several marketing image aggregates by their IDs, in as few round trips as the repository allows.
+
+        Args:
+            ids: The IDs of the marketing images to retrieve. Repeated IDs are retrieved once.
+
+        Returns:
+            A tuple of the aggregates that were found, in the order their IDs were given, and the IDs that were not found.
+        """
+        raise NotImplementedError
+
     @abstractmethod
     def retrieve_all(self) -> List[MarketingImage]:
         """
@@ -56,3 +98,109 @@ class MarketingImageRepositoryOutputPort(BaseOutputPort[T], ABC):
             id: The ID of the marketing image to remove.
         """
         raise NotImplementedError
+
+    @abstractmethod
+    def retrieve_ids_by_url(self, url: str) -> List[str]:
+        """
+        Retrieves the IDs of the marketing image aggregates that reference an image object URL.
+
+        Args:
+            url: The URL of the image object.
+
+        Returns:
+            A list of marketing image IDs (empty if no aggregate references the URL).
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def query_page(
+        self,
+        status: Optional[str] = None,
+        created_by: Optional[str] = None,
+        created_from: Optional[datetime] = None,
+        created_before: Optional[datetime] = None,
+        mime_type: Optional[str] = None,
+        order_by: str = "created_at",
+        descending: bool = True,
+        page_size: int = DEFAULT_QUERY_PAGE_SIZE,
+        cursor: Optional[str] = None,
+        fields: Optional[List[str]] = None,
+    ) -> Tuple[List[Union[MarketingImage, dict]], Optional[str]]:
+        """
+        Retrieves one page of the marketing image aggregates that match the filters.
+
+        Args:
+            status: Only images with this status - e.g. "APPROVED".
+            created_by: Only images created by this user ID.
+            created_from: Only images created at or after this time.
+            created_before: Only images created before this time.
+            mime_type: Only images with this MIME type.
+            order_by: One of ORDERABLE_FIELDS. Ties are ordered by ID. With a creation time range, it must be "created_at".
+            descending: Whether the newest images come first.
+            page_size: The maximum number of images in the page (at most MAX_QUERY_PAGE_SIZE).
+            cursor: The cursor returned with the previous page, or None for the first page.
+            fields: If given, only these fields (from PROJECTABLE_FIELDS) are read, and each image is returned as a
+                lightweight dictionary of its ID and these fields rather than as an aggregate.
+
+        Returns:
+            A tuple of the page's aggregates (or dictionaries) and the cursor of the next page, which is None on the last page.
+        """
+        raise NotImplementedError
+
+    def query(
+        self,
+        status: Optional[str] = None,
+        created_by: Optional[str] = None,
+        created_from: Optional[datetime] = None,
+        created_before: Optional[datetime] = None,
+        mime_type: Optional[str] = None,
+        order_by: str = "created_at",
+        descending: bool = True,
+        page_size: int = DEFAULT_QUERY_PAGE_SIZE,
+        fields: Optional[List[str]] = None,
+    ) -> Iterator[Union[MarketingImage, dict]]:
+        """
+        Lazily iterates over every marketing image aggregate that matches the filters, reading one page at a time,
+        so that only a page is ever held in memory. The arguments are as for query_page.
+        """
+        cursor = None
+        while True:
+            items, cursor = self.query_page(
+                status=status, created_by=created_by, created_from=created_from, created_before=created_before,
+                mime_type=mime_type, order_by=order_by, descending=descending, page_size=page_size, cursor=cursor, fields=fields,
+            )
+            yield from items
+            if cursor is None:
+                return None
+
+    def _validate_query(self, status: Optional[str], created_from: Optional[datetime], created_before: Optional[datetime], order_by: str, page_size: int, fields: Optional[List[str]]) -> Optional[str]:
+        """
+        Validates query_page's arguments. Returns the status filter as a status value - e.g. "APPROVED" - or None.
+        """
+        if order_by not in self.ORDERABLE_FIELDS:
+            raise ValueError(f"order_by must be one of {', '.join(self.ORDERABLE_FIELDS)}, got '{order_by}'.")
+        if (created_from is not None or created_before is not None) and order_by != "created_at":
+            raise ValueError("A creation time range can only be used when ordering by 'created_at'.")
+        if not 1 <= int(page_size) <= self.MAX_QUERY_PAGE_SIZE:
+            raise ValueError(f"page_size must be between 1 and {self.MAX_QUERY_PAGE_SIZE}, got {page_size}.")
+        unknown_fields = [field for field in (fields or []) if field not in self.PROJECTABLE_FIELDS]
+        if unknown_fields:
+            raise ValueError(f"Unknown fields: {', '.join(unknown_fields)}. Must be from {', '.join(self.PROJECTABLE_FIELDS)}.")
+        return Status.from_string(status.upper()).to_string() if status else None
+
+    def _check_version(self, marketing_image: MarketingImage, stored_version: Optional[int]) -> None:
+        """
+        Raises a MarketingImageConcurrencyConflictError unless the stored version of an aggregate - None if it is not
+        stored - is the version the aggregate was retrieved with. A new aggregate (version 0) must not be stored yet,
+        except that aggregates saved before versioning was introduced are stored without a version, i.e. at version 0.
+        """
+        if stored_version is None and marketing_image.version == 0:
+            return
+        if stored_version != marketing_image.version:
+            raise MarketingImageConcurrencyConflictError(
+                f"Marketing image {marketing_image.id} was retrieved at version {marketing_image.version}, but is "
+                + (f"now at version {stored_version}." if stored_version is not None else "no longer stored."),
+                image_id=str(marketing_image.id),
+                expected_version=marketing_image.version,
+                actual_version=stored_version,
+            )
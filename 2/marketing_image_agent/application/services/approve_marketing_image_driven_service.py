@@ -1,6 +1,7 @@
 from ...domain.events.marketing_image_approved_event import MarketingImageApprovedEvent
 from ..ports.marketing_image_integration_event_messaging_output_port import MarketingImageIntegrationEventMessagingOutputPort
 from ..factories.marketing_image_thin_integration_event_factory import MarketingImageIntegrationEventsFactory
+from .marketing_image_object_cache_control_driven_service import MarketingImageObjectCacheControlDrivenService
 
 
 class ApproveMarketingImageDrivenService:
@@ -9,12 +10,17 @@ class ApproveMarketingImageDrivenService:
         integration_event_prefix: str,
         marketing_image_integration_events_factory: MarketingImageIntegrationEventsFactory,
         marketing_image_integration_event_messaging: MarketingImageIntegrationEventMessagingOutputPort,
+        object_cache_control: MarketingImageObjectCacheControlDrivenService = None,
     ):
         self.integration_event_prefix = integration_event_prefix
         self.marketing_image_integration_events_factory = marketing_image_integration_events_factory
         self.marketing_image_integration_event_messaging = marketing_image_integration_event_messaging
+        self.object_cache_control = object_cache_control # None if object headers are not kept in step with the status
 
     def marketing_image_approved(self, marketing_image_approved_domain_event: MarketingImageApprovedEvent) -> dict:
-        self.marketing_image_approved_thin_integration_event = self.marketing_image_integration_events_factory.create_from_domain_event(marketing_image_approved_domain_event)
-        self.publish_marketing_image_approved_thin_integration_event_response = self.marketing_image_integration_event_messaging.publish(self.marketing_image_approved_thin_integration_event)
-        return self.publish_marketing_image_approved_thin_integration_event_response
\ No newline at end of file
+        marketing_image_approved_thin_integration_event = self.marketing_image_integration_events_factory.create_from_domain_event(marketing_image_approved_domain_event)
+        # Updated before the integration event is published, so that consumers fetching the image get the new header
+        if self.object_cache_control is not None:
+            self.object_cache_control.update_object_cache_control(marketing_image_approved_domain_event.data["id"])
+        publish_marketing_image_approved_thin_integration_event_response = self.marketing_image_integration_event_messaging.publish(marketing_image_approved_thin_integration_event)
+        return publish_marketing_image_approved_thin_integration_event_response
\ No newline at end of file
@@ -4,6 +4,7 @@ from ..ports.change_marketing_image_approval_status_input_port import ChangeMark
 from ..command_objects.base_command_object import Command
 from ..command_objects.approve_marketing_image_command import ApproveMarketingImageCommand
 from ..command_objects.reject_marketing_image_command import RejectMarketingImageCommand
+from ..exceptions.marketing_image_concurrency_conflict_error import MarketingImageConcurrencyConflictError
 
 
 class ChangeMarketingImageApprovalStatusDrivingService(
@@ -25,7 +26,7 @@ class ChangeMarketingImageApprovalStatusDrivingService(
         self.command_prefix = command_prefix
         self.source = "change-marketing-image-approval-status-driving-side-service"
 
-    def handle(self, request_data: Dict[str, Any]) -> Dict[str, Any]:
+    async def handle(self, request_data: Dict[str, Any]) -> Dict[str, Any]:
         """
         Handles an incoming request by mapping it to commands and dispatching them.
 
@@ -62,6 +63,10 @@ class ChangeMarketingImageApprovalStatusDrivingService(
             case _:
                 raise ValueError(f"Invalid request type: {request_type}")
 
-        command_handler_response = self.command_dispatcher.dispatch(command)
+        try:
+            command_handler_response = await self.command_dispatcher.dispatch(command)
+        except MarketingImageConcurrencyConflictError as e:
+            print(f"Request {request_data.get('request_id')} conflicted with concurrent changes: {e}")
+            return {"request_id": request_data.get("request_id"), "requestor": request_data.get("requestor"), **e.to_dict()}
 
         return command_handler_response
\ No newline at end of file
@@ -15,6 +15,6 @@ class ChangeMarketingImageMetadataDrivenService:
         self.marketing_image_integration_event_messaging = marketing_image_integration_event_messaging
 
     def marketing_image_metadata_changed(self, marketing_image_metadata_changed_domain_event: MarketingImageMetadataChangedEvent) -> dict:
-        self.marketing_image_metadata_changed_thin_integration_event = self.marketing_image_integration_events_factory.create_from_domain_event(marketing_image_metadata_changed_domain_event)
-        self.publish_marketing_image_metadata_changed_thin_integration_event_response = self.marketing_image_integration_event_messaging.publish(self.marketing_image_metadata_changed_thin_integration_event)
-        return self.publish_marketing_image_metadata_changed_thin_integration_event_response
\ No newline at end of file
+        marketing_image_metadata_changed_thin_integration_event = self.marketing_image_integration_events_factory.create_from_domain_event(marketing_image_metadata_changed_domain_event)
+        publish_marketing_image_metadata_changed_thin_integration_event_response = self.marketing_image_integration_event_messaging.publish(marketing_image_metadata_changed_thin_integration_event)
+        return publish_marketing_image_metadata_changed_thin_integration_event_response
\ No newline at end of file
@@ -3,6 +3,7 @@ from typing import Dict, Any
 from ..ports.change_marketing_image_metadata_input_port import ChangeMarketingImageMetadataInputPort
 from ..command_objects.base_command_object import Command
 from ..command_objects.change_marketing_image_metadata_command import ChangeMarketingImageMetadataCommand
+from ..exceptions.marketing_image_concurrency_conflict_error import MarketingImageConcurrencyConflictError
 
 
 class ChangeMarketingImageMetadataDrivingService(
@@ -24,7 +25,7 @@ class ChangeMarketingImageMetadataDrivingService(
         self.command_prefix = command_prefix
         self.source = "change-marketing-image-metadata-driving-side-service"
 
-    def handle(self, request_data: Dict[str, Any]) -> Dict[str, Any]:
+    async def handle(self, request_data: Dict[str, Any]) -> Dict[str, Any]:
         """
         Handles an incoming request by mapping it to a command and dispatching it.
 
@@ -48,6 +49,10 @@ class ChangeMarketingImageMetadataDrivingService(
             case _:
                 raise ValueError(f"Invalid request type: {request_type}")
 
-        command_handler_response = self.command_dispatcher.dispatch(command)
+        try:
+            command_handler_response = await self.command_dispatcher.dispatch(command)
+        except MarketingImageConcurrencyConflictError as e:
+            print(f"Request {request_data.get('request_id')} conflicted with concurrent changes: {e}")
+            return {"request_id": request_data.get("request_id"), "requestor": request_data.get("requestor"), **e.to_dict()}
 
         return command_handler_response
\ No newline at end of file
@@ -1,23 +1,44 @@
+import asyncio
+import time
 import uuid
 from datetime import datetime
+from typing import Awaitable, Dict, List, Optional, Tuple
 
+from ...shared.generation_key_utils import GenerationKeyUtils
 from ...domain.entities.marketing_image_aggregate import MarketingImage
+from ...domain.events.base_domain_event import DomainEvent
+from ...domain.value_objects.status import StatusEnum
 from ...domain.factories.marketing_image_aggregate_factory import MarketingImageAggregateFactory
 from ..command_objects.generate_marketing_image_command import GenerateMarketingImageCommand
-from ..ports.marketing_image_repository_output_port import MarketingImageRepositoryOutputPort
-from ..ports.marketing_image_object_storage_output_port import MarketingImageObjectStorageOutputPort
+from ..command_objects.generate_marketing_image_batch_command import GenerateMarketingImageBatchCommand
+from ..ports.async_marketing_image_repository_output_port import AsyncMarketingImageRepositoryOutputPort
+from ..ports.async_marketing_image_object_storage_output_port import AsyncMarketingImageObjectStorageOutputPort
 from ..ports.generate_marketing_image_genai_output_port import MarketingImageImageGenerationOutputPort
 from ..ports.domain_event_output_port import DomainEventOutputPort
+from ..ports.image_post_processing_output_port import ImagePostProcessingOutputPort
+from ..ports.marketing_image_near_duplicate_index_output_port import MarketingImageNearDuplicateIndexOutputPort
+from .marketing_image_object_cache_control_policy import MarketingImageObjectCacheControlPolicy
 
 
 class GenerateMarketingImageCoreService:
+    MAX_NUMBER_OF_IMAGES_PER_BATCH = 8
+    ORIGINAL_RENDITION_NAME = "original"
+    FILE_EXTENSIONS = {"image/jpeg": "jpg", "image/jpg": "jpg"}
+    NEAR_DUPLICATE_DETECTION_MODES = ("disabled", "index", "reuse")
+
     def __init__(
         self,
-        marketing_image_repository: MarketingImageRepositoryOutputPort,
-        marketing_image_object_storage: MarketingImageObjectStorageOutputPort,
+        marketing_image_repository: AsyncMarketingImageRepositoryOutputPort,
+        marketing_image_object_storage: AsyncMarketingImageObjectStorageOutputPort,
         marketing_image_genai_generator: MarketingImageImageGenerationOutputPort,
         domain_event_prefix: str,
         domain_event_dispatcher: DomainEventOutputPort,
+        image_post_processor: ImagePostProcessingOutputPort = None,
+        image_renditions: List[dict] = None,
+        near_duplicate_index: MarketingImageNearDuplicateIndexOutputPort = None,
+        near_duplicate_detection_mode: str = "disabled",
+        near_duplicate_max_distance: int = 4,
+        object_cache_control_policy: MarketingImageObjectCacheControlPolicy = None,
     ):
         self.aggregate_factory = MarketingImageAggregateFactory()
         self.aggregate_repository = marketing_image_repository
@@ -25,8 +46,33 @@ class GenerateMarketingImageCoreService:
         self.genai_image_generator = marketing_image_genai_generator
         self.domain_event_prefix = domain_event_prefix
         self.domain_event_dispatcher = domain_event_dispatcher
+        self.image_post_processor = image_post_processor
+        self.image_renditions = list(image_renditions or [])
+        for image_rendition in self.image_renditions:
+            if image_rendition.get("name") in (None, "", self.ORIGINAL_RENDITION_NAME):
+                raise ValueError(f"Each image rendition needs a name other than '{self.ORIGINAL_RENDITION_NAME}', got {image_rendition}.")
+        if self.image_renditions and self.image_post_processor is None:
+            raise ValueError("An image post-processor is required to produce image renditions.")
+        # "index" hashes and indexes every generated image; "reuse" also stores a reference to a near-duplicate instead of a new copy
+        self.near_duplicate_detection_mode = near_duplicate_detection_mode or "disabled"
+        if self.near_duplicate_detection_mode not in self.NEAR_DUPLICATE_DETECTION_MODES:
+            raise ValueError(f"near_duplicate_detection_mode must be one of {', '.join(self.NEAR_DUPLICATE_DETECTION_MODES)}, got '{near_duplicate_detection_mode}'.")
+        if self.near_duplicate_detection_mode != "disabled" and (near_duplicate_index is None or self.image_post_processor is None):
+            raise ValueError("A near-duplicate index and an image post-processor are required for near-duplicate detection.")
+        self.near_duplicate_index = near_duplicate_index if self.near_duplicate_detection_mode != "disabled" else None
+        self.near_duplicate_max_distance = int(near_duplicate_max_distance) if near_duplicate_max_distance is not None else 4
+        self.reused_near_duplicates = 0
+        self.object_cache_control_policy = object_cache_control_policy or MarketingImageObjectCacheControlPolicy()
+        self._in_flight_generations: Dict[str, asyncio.Future] = {}
+        self._in_flight_generation_waiters: Dict[str, int] = {}
+        self.upstream_generations = 0
+        self.coalesced_waiters = 0
+        self.max_waiters_per_generation = 0
+        # Post-response work (cache registration, domain event dispatch and integration event publication)
+        self._background_tasks: set = set()
+        self._stage_timings: Dict[str, dict] = {}
 
-    def generate_marketing_image(self, command: GenerateMarketingImageCommand) -> MarketingImage:
+    async def generate_marketing_image(self, command: GenerateMarketingImageCommand) -> MarketingImage:
         command_data = command.data
 
         request_id = command_data["request_id"]
@@ -40,56 +86,66 @@ class GenerateMarketingImageCoreService:
         image_generation_prompt = f"{request_text}"
         print(f"Image generation prompt: {image_generation_prompt}")
 
-        generated_marketing_image = self.genai_image_generator.generate_marketing_image(prompt=image_generation_prompt, min_dimensions=image_min_dimensions, max_dimensions=image_max_dimensions, mime_type=mime_type)
-        
-        generated_image_bytes = generated_marketing_image["image_data"]
-        generated_image_dimensions = generated_marketing_image["image_dimensions"]
-        generated_image_mime_type = generated_marketing_image["mime_type"]
-        generated_image_model = generated_marketing_image["generation_model"]
-        generated_image_height = generated_image_dimensions["height"]
-        generated_image_width = generated_image_dimensions["width"]
-        generated_image_generation_parameters = generated_marketing_image["generation_parameters"]
-        generated_image_size = len(generated_image_bytes)
+        use_generation_cache = command_data.get("use_generation_cache", True)
+        latency_budget_ms = command_data.get("latency_budget_ms")
 
         image_id = uuid.uuid4()
-        image_file_name = f"marketing-{image_id}.png"
+        request_started_at = time.perf_counter()
 
-        storage_saved_image_url, storage_saved_image_checksum = self.object_storage.save_marketing_image_object(image_data=generated_image_bytes, file_name=image_file_name, content_type=generated_image_mime_type, fixed_key_metadata={"content_type":generated_image_mime_type}, custom_metadata={"key1":"value1"})
+        # The aggregate's identity and authorship do not depend on the generated image, so they are set up front
+        prepared_marketing_image_dict = self._prepare_marketing_image_dict(image_id, image_generation_prompt)
 
-        created_by = str(uuid.uuid4()) # This needs implementing properly
-        created_at = str(datetime.now().isoformat())
-        last_modified_at = created_at
-        
-        marketing_image_dict = self.aggregate_factory.generate(
-            {
-                "id": str(image_id),
-                "url": storage_saved_image_url,
-                "description": image_generation_prompt,
-                "keywords": ["retail"],
-                "generation_model": generated_image_model,
-                "generation_parameters": generated_image_generation_parameters,
-                "dimensions": {"width": generated_image_width, "height": generated_image_height},
-                "status": "GENERATED",
-                "size": generated_image_size,
-                "mime_type": generated_image_mime_type,
-                "checksum": storage_saved_image_checksum,
-                "created_by": created_by,
-                "created_at": created_at,
-                "last_modified_at": last_modified_at,
-            }
-        )
+        generate_and_store_kwargs = {
+            "prompt": image_generation_prompt,
+            "min_dimensions": image_min_dimensions,
+            "max_dimensions": image_max_dimensions,
+            "mime_type": mime_type,
+            "use_cache": use_generation_cache,
+            "latency_budget_ms": latency_budget_ms,
+            "image_id": image_id,
+        }
+
+        stage_started_at = time.perf_counter()
+        if use_generation_cache:
+            # Identical in-flight commands share one upstream generation and upload (single-flight)
+            generation_key, generation_model = self._build_generation_key(image_generation_prompt, image_min_dimensions, image_max_dimensions, mime_type)
+            generated_marketing_image, stored_object, is_generation_leader = await self._generate_and_store_single_flight(generation_key, generation_model, generate_and_store_kwargs)
+        else:
+            self.upstream_generations += 1
+            generated_marketing_image, stored_object = await self._generate_and_store_marketing_image(**generate_and_store_kwargs)
+            is_generation_leader = True
+        stage_timings = {"generate_and_upload": self._record_stage_timing("generate_and_upload", stage_started_at)}
+
+        storage_saved_image_url = stored_object["url"]
+        storage_saved_image_checksum = stored_object["checksum"]
+        newly_stored = stored_object["newly_stored"] and is_generation_leader
+
+        stage_started_at = time.perf_counter()
+        marketing_image_dict = self._generate_marketing_image_dict(prepared_marketing_image_dict, generated_marketing_image, stored_object)
 
         marketing_image = self.aggregate_factory.from_dict(marketing_image_dict)
 
         # Get the most recent domain event before it's cleared by the save method.
         marketing_image_generated_most_recent_domain_event = marketing_image.events_list[-1]
+        stage_timings["build_aggregate"] = self._record_stage_timing("build_aggregate", stage_started_at)
 
-        self.aggregate_repository.save(marketing_image)
+        # The object upload has completed by now, so the aggregate never becomes visible before its object exists
+        stage_started_at = time.perf_counter()
+        await self.aggregate_repository.save(marketing_image)
+        stage_timings["persist"] = self._record_stage_timing("persist", stage_started_at)
         print(f"Successfully generated and saved marketing image with ID: {marketing_image.id}")
 
-        # Dispatch the most recent domain event using the dispatcher
-        self.domain_event_dispatcher.dispatch(domain_event=marketing_image_generated_most_recent_domain_event)
-        
+        # Everything after the save is taken off the response path. The domain event is queued for dispatch before the
+        # response is returned, so it is dispatched - and its integration event published - before the event of any later
+        # command for this image (e.g. its approval). A failed dispatch is logged, and is not republished.
+        if newly_stored:
+            # Only register once the aggregate referencing the stored object has been persisted
+            self._run_in_background("register", self.genai_image_generator.register_stored_marketing_image(generation_result=generated_marketing_image, url=storage_saved_image_url, checksum=storage_saved_image_checksum, renditions=stored_object.get("renditions")))
+
+        self._index_perceptual_hash(marketing_image_dict)
+
+        self._dispatch_in_background(marketing_image_generated_most_recent_domain_event)
+
         response = {
             "request_id": request_id,
             "requestor": marketing_image_dict.get("created_by"),
@@ -97,5 +153,405 @@ class GenerateMarketingImageCoreService:
             "url": marketing_image_dict.get("url"),
             "status": marketing_image_dict.get("status"),
         }
-        
-        return response
\ No newline at end of file
+        if stored_object.get("near_duplicate_of"):
+            response["near_duplicate_of"] = stored_object["near_duplicate_of"]
+
+        stage_timings["response"] = self._record_stage_timing("response", request_started_at)
+        print(f"Stage timings for Request ID {request_id}: {', '.join(f'{stage}={elapsed_ms:.1f}ms' for stage, elapsed_ms in stage_timings.items())} (publication continues in the background)")
+
+        return response
+
+    async def generate_marketing_image_batch(self, command: GenerateMarketingImageBatchCommand) -> dict:
+        command_data = command.data
+
+        request_id = command_data["request_id"]
+        print(f"Handling batch command with Request ID: {request_id}")
+        request_text = command_data["request_text"]
+        number_of_images = int(command_data["number_of_images"])
+
+        if number_of_images < 1 or number_of_images > self.MAX_NUMBER_OF_IMAGES_PER_BATCH:
+            raise ValueError(f"number_of_images must be between 1 and {self.MAX_NUMBER_OF_IMAGES_PER_BATCH}, got {number_of_images}.")
+
+        image_min_dimensions = command_data.get("image_min_dimensions")
+        image_max_dimensions = command_data.get("image_max_dimensions")
+        mime_type = command_data.get("mime_type")
+
+        image_generation_prompt = f"{request_text}"
+        print(f"Image generation prompt: {image_generation_prompt} ({number_of_images} images)")
+
+        request_started_at = time.perf_counter()
+        stage_timings = {}
+
+        # One generation request for all of the images where the model supports it
+        stage_started_at = time.perf_counter()
+        generated_marketing_images = await self.genai_image_generator.generate_marketing_images(prompt=image_generation_prompt, number_of_images=number_of_images, min_dimensions=image_min_dimensions, max_dimensions=image_max_dimensions, mime_type=mime_type)
+        stage_timings["generate"] = self._record_stage_timing("generate", stage_started_at)
+
+        # Upload all of the images concurrently, preparing each aggregate as soon as its own upload completes
+        stage_started_at = time.perf_counter()
+        image_ids = [uuid.uuid4() for _ in generated_marketing_images]
+
+        async def _store_and_prepare_marketing_image(generated_marketing_image: dict, image_id: uuid.UUID) -> dict:
+            prepared_marketing_image_dict = self._prepare_marketing_image_dict(image_id, image_generation_prompt)
+            # The variants of a batch are meant to differ, so they are hashed and indexed but never replaced by a near-duplicate
+            stored_object, perceptual_hash = await asyncio.gather(
+                self._store_generated_marketing_image(generated_marketing_image, image_id),
+                self._compute_perceptual_hash(generated_marketing_image["image_data"]),
+            )
+            return self._generate_marketing_image_dict(prepared_marketing_image_dict, generated_marketing_image, {**stored_object, "perceptual_hash": perceptual_hash})
+
+        marketing_image_dicts = await asyncio.gather(
+            *[_store_and_prepare_marketing_image(generated_marketing_image, image_id) for generated_marketing_image, image_id in zip(generated_marketing_images, image_ids)]
+        )
+        marketing_images = [self.aggregate_factory.from_dict(marketing_image_dict) for marketing_image_dict in marketing_image_dicts]
+        stage_timings["upload_and_prepare"] = self._record_stage_timing("upload_and_prepare", stage_started_at)
+
+        # Get the most recent domain events before they're cleared by the save method.
+        marketing_image_generated_most_recent_domain_events = [marketing_image.events_list[-1] for marketing_image in marketing_images]
+
+        # Persist every aggregate and its domain event in a single batch commit
+        stage_started_at = time.perf_counter()
+        await self.aggregate_repository.save_all(marketing_images)
+        stage_timings["persist"] = self._record_stage_timing("persist", stage_started_at)
+        print(f"Successfully generated and saved {len(marketing_images)} marketing images with IDs: {', '.join(str(marketing_image.id) for marketing_image in marketing_images)}")
+
+        for marketing_image_dict in marketing_image_dicts:
+            self._index_perceptual_hash(marketing_image_dict)
+
+        for marketing_image_generated_most_recent_domain_event in marketing_image_generated_most_recent_domain_events:
+            self._dispatch_in_background(marketing_image_generated_most_recent_domain_event)
+
+        response = {
+            "request_id": request_id,
+            "requestor": marketing_image_dicts[0].get("created_by"),
+            "images": [
+                {
+                    "image_id": marketing_image_dict.get("id"),
+                    "url": marketing_image_dict.get("url"),
+                    "status": marketing_image_dict.get("status"),
+                }
+                for marketing_image_dict in marketing_image_dicts
+            ],
+        }
+
+        stage_timings["response"] = self._record_stage_timing("response", request_started_at)
+        print(f"Stage timings for Request ID {request_id}: {', '.join(f'{stage}={elapsed_ms:.1f}ms' for stage, elapsed_ms in stage_timings.items())} (publication continues in the background)")
+
+        return response
+
+    def _build_generation_key(self, prompt: str, min_dimensions: dict = None, max_dimensions: dict = None, mime_type: str = None) -> Tuple[str, str]:
+        """
+        Returns the generation key of a request, and the model it describes.
+        """
+        generation_description = self.genai_image_generator.describe_generation(prompt, min_dimensions, max_dimensions, mime_type)
+        generation_key = GenerationKeyUtils.build_generation_key(
+            generation_model=generation_description["generation_model"],
+            prompt=prompt,
+            generation_parameters=generation_description["generation_parameters"],
+        )
+        return generation_key, generation_description["generation_model"]
+
+    async def _generate_and_store_marketing_image(self, prompt: str, min_dimensions: dict, max_dimensions: dict, mime_type: str, use_cache: bool, image_id: uuid.UUID, latency_budget_ms: int = None) -> Tuple[dict, dict]:
+        """
+        Generates a marketing image and stores it in object storage, unless the generator returned an already stored object.
+        Returns (generated_marketing_image, stored_object).
+        """
+        stage_started_at = time.perf_counter()
+        generated_marketing_image = await self.genai_image_generator.generate_marketing_image(prompt=prompt, min_dimensions=min_dimensions, max_dimensions=max_dimensions, mime_type=mime_type, use_cache=use_cache, latency_budget_ms=latency_budget_ms)
+
+        generated_image_stored_object = generated_marketing_image.get("stored_object")
+        if generated_image_stored_object:
+            # An identical image has already been generated and stored, so reuse the stored object rather than uploading a copy
+            self._record_stage_timing("generate_cache_hit", stage_started_at)
+            return generated_marketing_image, {**generated_image_stored_object, "newly_stored": False}
+        self._record_stage_timing("generate", stage_started_at)
+
+        stage_started_at = time.perf_counter()
+        perceptual_hash = await self._compute_perceptual_hash(generated_marketing_image["image_data"])
+        if perceptual_hash and self.near_duplicate_detection_mode == "reuse":
+            near_duplicate = await self._find_near_duplicate_stored_object(perceptual_hash)
+            if near_duplicate:
+                # A visually near-identical image is already stored, so reference it rather than uploading another copy
+                self._record_stage_timing("near_duplicate_hit", stage_started_at)
+                return {**generated_marketing_image, **near_duplicate["generated_marketing_image"]}, near_duplicate["stored_object"]
+        if perceptual_hash:
+            self._record_stage_timing("hash", stage_started_at)
+
+        stage_started_at = time.perf_counter()
+        stored_object = await self._store_generated_marketing_image(generated_marketing_image, image_id)
+        self._record_stage_timing("upload", stage_started_at)
+        return generated_marketing_image, {**stored_object, "perceptual_hash": perceptual_hash}
+
+    async def _compute_perceptual_hash(self, image_data: bytes) -> Optional[str]:
+        """
+        Computes the perceptual hash of a generated image if near-duplicate detection is enabled (otherwise returns None).
+        """
+        if self.near_duplicate_index is None:
+            return None
+        try:
+            return await self.image_post_processor.compute_perceptual_hash(image_data)
+        except Exception as e:
+            print(f"Warning: Could not compute a perceptual hash: {e}")
+            return None
+
+    async def _find_near_duplicate_stored_object(self, perceptual_hash: str) -> Optional[dict]:
+        """
+        Finds a stored marketing image that is a near-duplicate of a generated one.
+        Returns the generated marketing image fields and the stored object to reuse, or None if there is no near-duplicate.
+        """
+        await self.near_duplicate_index.ensure_loaded()
+        for near_duplicate in self.near_duplicate_index.find_near_duplicates(perceptual_hash, self.near_duplicate_max_distance):
+            existing_marketing_image = await self.aggregate_repository.retrieve_by_id(uuid.UUID(near_duplicate["image_id"]))
+            if existing_marketing_image is None or existing_marketing_image.url is None:
+                # Removed since it was indexed (e.g. by another instance)
+                self.near_duplicate_index.remove(near_duplicate["image_id"])
+                continue
+
+            self.reused_near_duplicates += 1
+            print(f"Reusing marketing image {near_duplicate['image_id']} as a near-duplicate (Hamming distance {near_duplicate['distance']}) of the generated image")
+            return {
+                "generated_marketing_image": {
+                    "mime_type": existing_marketing_image.mime_type.mime_type,
+                    "image_dimensions": existing_marketing_image.dimensions.to_dict(),
+                },
+                "stored_object": {
+                    "url": existing_marketing_image.url.url,
+                    "checksum": existing_marketing_image.checksum.checksum,
+                    "size": existing_marketing_image.size.size,
+                    "renditions": existing_marketing_image.renditions.renditions if existing_marketing_image.renditions else None,
+                    "perceptual_hash": existing_marketing_image.perceptual_hash.perceptual_hash if existing_marketing_image.perceptual_hash else perceptual_hash,
+                    "near_duplicate_of": near_duplicate["image_id"],
+                    "newly_stored": False,
+                },
+            }
+        return None
+
+    def _index_perceptual_hash(self, marketing_image_dict: dict) -> None:
+        """
+        Adds a persisted marketing image to the near-duplicate index, in the background if the index still needs loading.
+        """
+        if self.near_duplicate_index is None or not marketing_image_dict.get("perceptual_hash"):
+            return None
+
+        async def _index() -> None:
+            await self.near_duplicate_index.ensure_loaded()
+            self.near_duplicate_index.add(marketing_image_dict["id"], marketing_image_dict["perceptual_hash"])
+
+        self._run_in_background("index", _index())
+
+    async def _store_generated_marketing_image(self, generated_marketing_image: dict, image_id: uuid.UUID) -> dict:
+        """
+        Uploads a generated marketing image to object storage, producing and uploading its configured renditions concurrently.
+        Returns the stored object - i.e. url, checksum, size, renditions, and newly_stored.
+        """
+        generated_image_bytes = generated_marketing_image["image_data"]
+        generated_image_mime_type = generated_marketing_image["mime_type"]
+        image_file_name = f"marketing-{image_id}.png"
+        save_original = self.object_storage.save_marketing_image_object(image_data=generated_image_bytes, file_name=image_file_name, content_type=generated_image_mime_type, fixed_key_metadata={"content_type":generated_image_mime_type, "cache_control":self.object_cache_control_policy.cache_control_for(StatusEnum.GENERATED)}, custom_metadata={"key1":"value1"})
+
+        if self.image_renditions:
+            (storage_saved_image_url, storage_saved_image_checksum), renditions = await asyncio.gather(
+                save_original,
+                self._store_marketing_image_renditions(generated_image_bytes, image_id),
+            )
+        else:
+            storage_saved_image_url, storage_saved_image_checksum = await save_original
+            renditions = []
+
+        original_rendition = {
+            "name": self.ORIGINAL_RENDITION_NAME,
+            "url": storage_saved_image_url,
+            "dimensions": {"width": generated_marketing_image["image_dimensions"]["width"], "height": generated_marketing_image["image_dimensions"]["height"]},
+            "size": len(generated_image_bytes),
+            "mime_type": generated_image_mime_type,
+            "checksum": storage_saved_image_checksum,
+        }
+
+        return {
+            "url": storage_saved_image_url,
+            "checksum": storage_saved_image_checksum,
+            "size": len(generated_image_bytes),
+            "renditions": renditions + [original_rendition],
+            "newly_stored": True,
+        }
+
+    async def _store_marketing_image_renditions(self, image_data: bytes, image_id: uuid.UUID) -> List[dict]:
+        """
+        Produces the configured renditions of an image in one post-processing pass and uploads them concurrently.
+        Returns each rendition's name, url, dimensions, size, mime_type, and checksum.
+        """
+        transform_specs = [
+            {
+                "mime_type": image_rendition.get("mime_type"),
+                "max_dimensions": {"width": image_rendition.get("max_width"), "height": image_rendition.get("max_height") or image_rendition.get("max_width")},
+                "quality": image_rendition.get("quality"),
+            }
+            for image_rendition in self.image_renditions
+        ]
+        processed_images = await self.image_post_processor.process_image_renditions(image_data, transform_specs)
+
+        async def _save_rendition(image_rendition: dict, processed_image: dict) -> dict:
+            rendition_mime_type = processed_image["mime_type"]
+            file_extension = self.FILE_EXTENSIONS.get(rendition_mime_type, rendition_mime_type.split("/")[-1])
+            rendition_file_name = f"marketing-{image_id}-{image_rendition['name']}.{file_extension}"
+            rendition_url, rendition_checksum = await self.object_storage.save_marketing_image_object(image_data=processed_image["image_data"], file_name=rendition_file_name, content_type=rendition_mime_type, fixed_key_metadata={"content_type":rendition_mime_type, "cache_control":self.object_cache_control_policy.cache_control_for(StatusEnum.GENERATED)}, custom_metadata={"rendition":image_rendition["name"]})
+            return {
+                "name": image_rendition["name"],
+                "url": rendition_url,
+                "dimensions": {"width": processed_image["width"], "height": processed_image["height"]},
+                "size": len(processed_image["image_data"]),
+                "mime_type": rendition_mime_type,
+                "checksum": rendition_checksum,
+            }
+
+        return list(await asyncio.gather(
+            *[_save_rendition(image_rendition, processed_image) for image_rendition, processed_image in zip(self.image_renditions, processed_images)]
+        ))
+
+    def _prepare_marketing_image_dict(self, image_id: uuid.UUID, image_generation_prompt: str) -> dict:
+        """
+        Prepares the parts of a new marketing image aggregate that are known before the image is generated and stored.
+        """
+        created_by = str(uuid.uuid4()) # This needs implementing properly
+        created_at = str(datetime.now().isoformat())
+        last_modified_at = created_at
+
+        return {
+            "id": str(image_id),
+            "description": image_generation_prompt,
+            "keywords": ["retail"],
+            "status": "GENERATED",
+            "created_by": created_by,
+            "created_at": created_at,
+            "last_modified_at": last_modified_at,
+        }
+
+    def _generate_marketing_image_dict(self, prepared_marketing_image_dict: dict, generated_marketing_image: dict, stored_object: dict) -> dict:
+        """
+        Generates the dictionary representation of a new marketing image aggregate (including its generated domain event)
+        from its prepared parts, a generated marketing image, and the object it is stored in.
+        """
+        generated_image_dimensions = generated_marketing_image["image_dimensions"]
+        generated_image_mime_type = generated_marketing_image["mime_type"]
+
+        return self.aggregate_factory.generate(
+            {
+                **prepared_marketing_image_dict,
+                "url": stored_object["url"],
+                "generation_model": generated_marketing_image["generation_model"],
+                "generation_parameters": generated_marketing_image["generation_parameters"],
+                "dimensions": {"width": generated_image_dimensions["width"], "height": generated_image_dimensions["height"]},
+                "size": stored_object["size"],
+                "mime_type": generated_image_mime_type,
+                "checksum": stored_object["checksum"],
+                "renditions": stored_object.get("renditions"),
+                "perceptual_hash": stored_object.get("perceptual_hash"),
+            }
+        )
+
+    def _record_stage_timing(self, stage: str, stage_started_at: float) -> float:
+        """
+        Records the time elapsed since stage_started_at (a time.perf_counter() value) against a pipeline stage.
+        Returns the elapsed time in milliseconds.
+        """
+        elapsed_ms = (time.perf_counter() - stage_started_at) * 1000
+        stage_timing = self._stage_timings.setdefault(stage, {"count": 0, "total_ms": 0.0, "max_ms": 0.0})
+        stage_timing["count"] += 1
+        stage_timing["total_ms"] += elapsed_ms
+        stage_timing["max_ms"] = max(stage_timing["max_ms"], elapsed_ms)
+        return elapsed_ms
+
+    def _run_in_background(self, stage: str, awaitable: Awaitable) -> asyncio.Future:
+        """
+        Runs post-response work without holding up the response. Failures are logged rather than raised.
+        """
+        stage_started_at = time.perf_counter()
+        background_task = asyncio.ensure_future(awaitable)
+        # Hold a reference so the task isn't garbage collected before it completes
+        self._background_tasks.add(background_task)
+
+        def _on_background_task_done(task: asyncio.Future) -> None:
+            self._background_tasks.discard(task)
+            self._record_stage_timing(stage, stage_started_at)
+            if not task.cancelled() and task.exception() is not None:
+                print(f"Warning: Background '{stage}' stage failed: {task.exception()}")
+
+        background_task.add_done_callback(_on_background_task_done)
+        return background_task
+
+    def _dispatch_in_background(self, domain_event: DomainEvent) -> asyncio.Future:
+        """
+        Queues a domain event for dispatch, in order with the other domain events of its aggregate, without waiting for
+        its handlers - which are synchronous (e.g. Pub/Sub publish), so the dispatcher runs them on a worker thread.
+        """
+        return self._run_in_background("publish", asyncio.wrap_future(self.domain_event_dispatcher.dispatch_in_background(domain_event)))
+
+    async def wait_for_background_tasks(self) -> None:
+        """
+        Waits for all post-response work (e.g. event publication) to complete - e.g. before shutting down.
+        """
+        while self._background_tasks:
+            await asyncio.gather(*list(self._background_tasks), return_exceptions=True)
+
+    async def _generate_and_store_single_flight(self, generation_key: str, generation_model: str, generate_and_store_kwargs: dict) -> Tuple[dict, dict, bool]:
+        """
+        Runs at most one generation and upload per generation key at a time. Commands arriving while one is in flight
+        wait for it and share its stored object instead of calling the model again - unless another model than the
+        key's served it (e.g. a routing fallback), in which case each waiter generates its own image.
+        Returns (generated_marketing_image, stored_object, is_generation_leader).
+        """
+        in_flight_generation = self._in_flight_generations.get(generation_key)
+
+        if in_flight_generation is not None:
+            self.coalesced_waiters += 1
+            self._in_flight_generation_waiters[generation_key] += 1
+            self.max_waiters_per_generation = max(self.max_waiters_per_generation, self._in_flight_generation_waiters[generation_key])
+            print(f"Coalescing with in-flight generation {generation_key} ({self._in_flight_generation_waiters[generation_key]} waiter(s))")
+            # Shielded so that a cancelled waiter does not cancel the shared generation
+            generated_marketing_image, stored_object = await asyncio.shield(in_flight_generation)
+            if generated_marketing_image.get("generation_model") == generation_model:
+                return generated_marketing_image, stored_object, False
+            print(f"In-flight generation {generation_key} was served by model '{generated_marketing_image.get('generation_model')}' rather than '{generation_model}'. Generating separately.")
+            self.upstream_generations += 1
+            generated_marketing_image, stored_object = await self._generate_and_store_marketing_image(**generate_and_store_kwargs)
+            return generated_marketing_image, stored_object, True
+
+        self.upstream_generations += 1
+        in_flight_generation = asyncio.ensure_future(self._generate_and_store_marketing_image(**generate_and_store_kwargs))
+        self._in_flight_generations[generation_key] = in_flight_generation
+        self._in_flight_generation_waiters[generation_key] = 0
+
+        def _on_generation_done(_: asyncio.Future) -> None:
+            self._in_flight_generations.pop(generation_key, None)
+            self._in_flight_generation_waiters.pop(generation_key, None)
+
+        in_flight_generation.add_done_callback(_on_generation_done)
+
+        generated_marketing_image, stored_object = await asyncio.shield(in_flight_generation)
+        return generated_marketing_image, stored_object, True
+
+    def get_metrics(self) -> dict:
+        """
+        Returns single-flight coalescing metrics - i.e. upstream generations, coalesced waiters,
+        the coalescing ratio (share of generate commands served by another command's generation), and in-flight generations -
+        plus the number of pending background tasks, per-stage pipeline timings (count, average, and max in milliseconds),
+        and the number of generated images replaced by a stored near-duplicate.
+        """
+        generate_commands = self.upstream_generations + self.coalesced_waiters
+        return {
+            "upstream_generations": self.upstream_generations,
+            "coalesced_waiters": self.coalesced_waiters,
+            "coalescing_ratio": (self.coalesced_waiters / generate_commands) if generate_commands else 0.0,
+            "max_waiters_per_generation": self.max_waiters_per_generation,
+            "in_flight_generations": len(self._in_flight_generations),
+            "background_tasks": len(self._background_tasks),
+            "reused_near_duplicates": self.reused_near_duplicates,
+            "stage_timings": {
+                stage: {
+                    "count": stage_timing["count"],
+                    "average_ms": stage_timing["total_ms"] / stage_timing["count"],
+                    "max_ms": stage_timing["max_ms"],
+                }
+                for stage, stage_timing in self._stage_timings.items()
+            },
+        }
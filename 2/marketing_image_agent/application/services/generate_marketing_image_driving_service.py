@@ -3,6 +3,9 @@ from typing import Dict, Any
 from ..ports.generate_marketing_image_input_port import GenerateMarketingImageInputPort
 from ..command_objects.base_command_object import Command
 from ..command_objects.generate_marketing_image_command import GenerateMarketingImageCommand, GenerateMarketingImageData
+from ..command_objects.generate_marketing_image_batch_command import GenerateMarketingImageBatchCommand, GenerateMarketingImageBatchData
+from ..exceptions.image_generation_rate_limited_error import ImageGenerationRateLimitedError
+from ..exceptions.image_post_processing_overloaded_error import ImagePostProcessingOverloadedError
 
 
 class GenerateMarketingImageDrivingService(
@@ -24,13 +27,18 @@ class GenerateMarketingImageDrivingService(
         self.command_prefix = command_prefix
         self.source = "generate-marketing-image-driving-side-service"
 
-    def handle(self, request_data: Dict[str, Any]) -> Dict[str, Any]:
+    async def handle(self, request_data: Dict[str, Any]) -> Dict[str, Any]:
         """
         Handles an incoming request by mapping it to a command and dispatching it.
 
         Args:
             request_data: A dictionary containing the request data, including the request type.
 
+        Returns:
+            The command handler's response, or a 'rate_limited' response (with an error message and retry_after_seconds)
+            if the image model's capacity is exhausted and the request was shed, or an 'overloaded' response if image
+            post-processing is at capacity.
+
         Raises:
             ValueError: If the request type is invalid or missing, or if required data for a
                         specific request type is not present.
@@ -48,6 +56,8 @@ class GenerateMarketingImageDrivingService(
                     "image_min_dimensions": request_data.get("image_min_dimensions"),
                     "image_max_dimensions": request_data.get("image_max_dimensions"),
                     "mime_type": request_data.get("mime_type"),
+                    "use_generation_cache": request_data.get("use_generation_cache"),
+                    "latency_budget_ms": request_data.get("latency_budget_ms"),
                 }
 
                 command = GenerateMarketingImageCommand(
@@ -55,10 +65,35 @@ class GenerateMarketingImageDrivingService(
                     source=self.source,
                     command_prefix=self.command_prefix,
                 )
+
+            case "generate_batch":
+                data = {
+                    "request_id": request_data.get("request_id"),
+                    "request_time": request_data.get("request_time"),
+                    "requestor": request_data.get("requestor"),
+                    "request_text": request_data.get("request_text"),
+                    "number_of_images": request_data.get("number_of_images"),
+                    "image_min_dimensions": request_data.get("image_min_dimensions"),
+                    "image_max_dimensions": request_data.get("image_max_dimensions"),
+                    "mime_type": request_data.get("mime_type"),
+                }
+
+                command = GenerateMarketingImageBatchCommand(
+                    data=GenerateMarketingImageBatchData(**data),
+                    source=self.source,
+                    command_prefix=self.command_prefix,
+                )
             
             case _:
                 raise ValueError(f"Invalid request type: {request_type}")
 
-        command_handler_response = self.command_dispatcher.dispatch(command)
+        try:
+            command_handler_response = await self.command_dispatcher.dispatch(command)
+        except ImageGenerationRateLimitedError as e:
+            print(f"Request {request_data.get('request_id')} was shed: {e}")
+            return {"request_id": request_data.get("request_id"), "requestor": request_data.get("requestor"), **e.to_dict()}
+        except ImagePostProcessingOverloadedError as e:
+            print(f"Request {request_data.get('request_id')} was shed: {e}")
+            return {"request_id": request_data.get("request_id"), "requestor": request_data.get("requestor"), **e.to_dict()}
 
         return command_handler_response
\ No newline at end of file
@@ -0,0 +1,57 @@
+import random
+import threading
+import time
+from typing import Any, Callable, TypeVar
+
+from ..exceptions.marketing_image_concurrency_conflict_error import MarketingImageConcurrencyConflictError
+
+R = TypeVar("R")
+
+
+class MarketingImageConcurrencyConflictRetryPolicy:
+    """
+    Retries a command whose save conflicted with a concurrent change to the same marketing image, so that commands
+    can run fully in parallel without taking locks and without losing updates.
+
+    Each retry runs the whole core service operation again, so the aggregate is re-read at its current version and the
+    command is re-applied to it (and is rejected by the aggregate if it no longer applies - e.g. approving a removed image).
+    Retries wait a random time of up to backoff_base_seconds, doubled after each attempt and capped at backoff_max_seconds,
+    so that the conflicting commands do not collide again. After max_retries the conflict is raised to the caller.
+    """
+
+    def __init__(self, max_retries: int = 3, backoff_base_seconds: float = 0.02, backoff_max_seconds: float = 0.5):
+        self.max_retries = int(max_retries) if max_retries is not None else 3
+        self.backoff_base_seconds = float(backoff_base_seconds) if backoff_base_seconds is not None else 0.02
+        self.backoff_max_seconds = float(backoff_max_seconds) if backoff_max_seconds is not None else 0.5
+        self._lock = threading.Lock() # Called from command handler threads
+        self.counters = {"conflicts": 0, "retries": 0, "exhausted": 0}
+
+    def run(self, operation: Callable[..., R], *args: Any, **kwargs: Any) -> R:
+        """
+        Runs a blocking operation - e.g. a core service method - retrying it on a MarketingImageConcurrencyConflictError.
+        """
+        attempt = 0
+        while True:
+            try:
+                return operation(*args, **kwargs)
+            except MarketingImageConcurrencyConflictError as e:
+                with self._lock:
+                    self.counters["conflicts"] += 1
+                    if attempt >= self.max_retries:
+                        self.counters["exhausted"] += 1
+                    else:
+                        self.counters["retries"] += 1
+                if attempt >= self.max_retries:
+                    print(f"Giving up on marketing image {e.image_id} after {attempt + 1} conflicting attempts: {e}")
+                    raise
+                attempt += 1
+                backoff_seconds = random.uniform(0, min(self.backoff_max_seconds, self.backoff_base_seconds * 2 ** (attempt - 1)))
+                print(f"Concurrency conflict on marketing image {e.image_id}: {e} Retrying ({attempt}/{self.max_retries}) in {backoff_seconds * 1000:.0f}ms")
+                time.sleep(backoff_seconds)
+
+    def get_metrics(self) -> dict:
+        """
+        Returns the number of conflicts, the retries they caused, and the operations that failed after max_retries.
+        """
+        with self._lock:
+            return dict(self.counters)
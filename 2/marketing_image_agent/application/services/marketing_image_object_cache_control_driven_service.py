@@ -0,0 +1,59 @@
+from typing import Dict
+
+from ..ports.marketing_image_repository_output_port import MarketingImageRepositoryOutputPort
+from ..ports.marketing_image_object_storage_output_port import MarketingImageObjectStorageOutputPort
+from .marketing_image_object_cache_control_policy import MarketingImageObjectCacheControlPolicy
+
+
+class MarketingImageObjectCacheControlDrivenService:
+    """
+    Applies the MarketingImageObjectCacheControlPolicy to a marketing image's stored objects (the original and its renditions)
+    when its status changes. Objects that the generation cache shares with other images get the header of every image that
+    references them - the most restrictive one - so a rejected image's objects are never left cacheable by a sibling's status.
+    """
+
+    def __init__(
+        self,
+        marketing_image_repository: MarketingImageRepositoryOutputPort,
+        marketing_image_object_storage: MarketingImageObjectStorageOutputPort,
+        object_cache_control_policy: MarketingImageObjectCacheControlPolicy = None,
+    ):
+        self.aggregate_repository = marketing_image_repository
+        self.object_storage = marketing_image_object_storage
+        self.object_cache_control_policy = object_cache_control_policy or MarketingImageObjectCacheControlPolicy()
+
+    def update_object_cache_control(self, image_id: str) -> Dict[str, str]:
+        """
+        Sets the Cache-Control header of an image's objects from the saved statuses of all the images that reference them,
+        with one batched metadata update. A failure is logged rather than raised: the image's status has already changed,
+        and its objects keep their previous header.
+
+        Returns:
+            The metadata update result of each object, keyed by file name - empty if nothing was updated.
+        """
+        try:
+            marketing_image = self.aggregate_repository.retrieve_by_id(image_id)
+            if not marketing_image:
+                return {}
+            url = marketing_image.url.url
+            referencing_images = [marketing_image]
+            other_image_ids = [referencing_image_id for referencing_image_id in self.aggregate_repository.retrieve_ids_by_url(url) if referencing_image_id != str(marketing_image.id)]
+            if other_image_ids:
+                other_images, _ = self.aggregate_repository.retrieve_by_ids(other_image_ids)
+                referencing_images.extend(other_images)
+                print(f"Image with file name {url.split('/')[-1]} is shared with {len(other_images)} other marketing image(s). Using the most restrictive of their Cache-Control headers.")
+
+            cache_control = self.object_cache_control_policy.cache_control_for_shared(referencing_image.status for referencing_image in referencing_images)
+            if cache_control is None:
+                return {}
+            file_names = [url.split('/')[-1]]
+            for referencing_image in referencing_images:
+                file_names.extend(rendition["url"].split('/')[-1] for rendition in (referencing_image.renditions.renditions if referencing_image.renditions else []))
+            results = self.object_storage.update_marketing_image_objects_metadata(list(dict.fromkeys(file_names)), {"cache_control": cache_control})
+            unupdated_file_names = [file_name for file_name, result in results.items() if result != MarketingImageObjectStorageOutputPort.UPDATED]
+            if unupdated_file_names:
+                print(f"Warning: The Cache-Control header of {len(unupdated_file_names)} object(s) could not be updated: {', '.join(unupdated_file_names)}")
+            return results
+        except Exception as e:
+            print(f"Error updating the Cache-Control header of marketing image {image_id}'s objects: {e}")
+            return {}
@@ -0,0 +1,65 @@
+from typing import Iterable, Mapping, Optional, Union
+
+from ...domain.value_objects.status import Status, StatusEnum
+
+
+class MarketingImageObjectCacheControlPolicy:
+    """
+    Decides the Cache-Control header of a marketing image's objects (the original and its renditions) from the image's status,
+    so that browsers and CDNs cache approved images publicly but never keep rejected ones.
+
+    - Generated and reviewing images can still be rejected, so they are cached privately and briefly.
+    - Approved images are cached publicly for an hour, but not as immutable: an approved image can still be rejected,
+      so cached copies must expire and be revalidated to pick up its no-store header.
+    - Rejected images are never stored by a cache.
+
+    The policy only maps statuses to headers; MarketingImageObjectCacheControlDrivenService applies it to the stored objects.
+    """
+
+    DEFAULT_CACHE_CONTROL_BY_STATUS = {
+        StatusEnum.GENERATED.value: "private, max-age=60",
+        StatusEnum.REVIEWING.value: "private, max-age=60",
+        StatusEnum.APPROVED.value: "public, max-age=3600",
+        StatusEnum.REJECTED.value: "no-store",
+    }
+    STATUSES_BY_RESTRICTIVENESS = [StatusEnum.REJECTED.value, StatusEnum.REVIEWING.value, StatusEnum.GENERATED.value, StatusEnum.APPROVED.value]
+
+    def __init__(self, cache_control_by_status: Optional[Mapping[str, str]] = None):
+        """
+        Args:
+            cache_control_by_status: Overrides of the Cache-Control header for each status, keyed by status name (in any case).
+        """
+        self.cache_control_by_status = dict(self.DEFAULT_CACHE_CONTROL_BY_STATUS)
+        for status, cache_control in (cache_control_by_status or {}).items():
+            if cache_control:
+                self.cache_control_by_status[Status.from_string(status.upper()).to_string()] = cache_control
+
+    def cache_control_for(self, status: Union[Status, StatusEnum, str]) -> Optional[str]:
+        """
+        Returns the Cache-Control header for objects of an image with the given status,
+        or None if the status has no policy - e.g. removed images, whose objects are deleted.
+        """
+        if isinstance(status, Status):
+            status = status.status
+        if isinstance(status, StatusEnum):
+            status = status.value
+        return self.cache_control_by_status.get(status.upper())
+
+    def cache_control_for_shared(self, statuses: Iterable[Union[Status, StatusEnum, str]]) -> Optional[str]:
+        """
+        Returns the Cache-Control header for objects shared by several images - e.g. through the generation cache - with the
+        given statuses: the header of the most restrictive status among them, so that an object is only cached publicly
+        once every image that references it is approved, and is never stored once any of them is rejected.
+        Returns None if none of the statuses has a policy.
+        """
+        status_values = set()
+        for status in statuses:
+            if isinstance(status, Status):
+                status = status.status
+            if isinstance(status, StatusEnum):
+                status = status.value
+            status_values.add(status.upper())
+        for status in self.STATUSES_BY_RESTRICTIVENESS:
+            if status in status_values:
+                return self.cache_control_by_status.get(status)
+        return None
@@ -1,24 +1,77 @@
+from typing import Dict, List
+
 from ...domain.entities.marketing_image_aggregate import MarketingImage
 from ...domain.factories.marketing_image_aggregate_factory import MarketingImageAggregateFactory
 from ..command_objects.remove_marketing_image_command import RemoveMarketingImageCommand
+from ..command_objects.remove_marketing_image_batch_command import RemoveMarketingImageBatchCommand
 from ..ports.marketing_image_repository_output_port import MarketingImageRepositoryOutputPort
 from ..ports.marketing_image_object_storage_output_port import MarketingImageObjectStorageOutputPort
 from ..ports.domain_event_output_port import DomainEventOutputPort
+from ..ports.marketing_image_near_duplicate_index_output_port import MarketingImageNearDuplicateIndexOutputPort
+from ..ports.marketing_image_object_deletion_output_port import MarketingImageObjectDeletionOutputPort
 
 
 class RemoveMarketingImageCoreService:
+    """
+    Removes marketing images. With an object deletion port, a removal records tombstones for the image's objects and
+    returns straight away, leaving a background sweeper to delete them. Without one, the objects are deleted in bulk.
+    Either way, objects are only deleted once the removal is saved, so a save that fails - e.g. with a concurrency
+    conflict that the command handler retries - never deletes the objects of an image that still exists.
+    """
+
+    MAX_NUMBER_OF_IMAGES_PER_BATCH = 100
+
     def __init__(
         self,
         marketing_image_repository: MarketingImageRepositoryOutputPort,
         marketing_image_object_storage: MarketingImageObjectStorageOutputPort,
         domain_event_prefix: str,
         domain_event_dispatcher: DomainEventOutputPort,
+        near_duplicate_index: MarketingImageNearDuplicateIndexOutputPort = None,
+        object_deletion: MarketingImageObjectDeletionOutputPort = None,
     ):
         self.aggregate_factory = MarketingImageAggregateFactory()
         self.aggregate_repository = marketing_image_repository
         self.object_storage = marketing_image_object_storage
         self.domain_event_prefix = domain_event_prefix
         self.domain_event_dispatcher = domain_event_dispatcher
+        self.near_duplicate_index = near_duplicate_index
+        self.object_deletion = object_deletion
+
+    def _unreferenced_object_file_names(self, marketing_image: MarketingImage, removed_image_ids: set) -> List[str]:
+        """
+        Returns the file names of the image's objects (the original and its renditions), unless an image that is not
+        being removed still references them.
+        """
+        url = marketing_image.url.url
+        file_name = url.split('/')[-1]
+
+        # The generation cache can make several aggregates share one stored object, so only remove it once it is no longer referenced
+        other_referencing_image_ids = [referencing_image_id for referencing_image_id in self.aggregate_repository.retrieve_ids_by_url(url) if referencing_image_id not in removed_image_ids]
+        if other_referencing_image_ids:
+            print(f"Image with file name {file_name} is still referenced by {len(other_referencing_image_ids)} other marketing image(s). Keeping it in object storage.")
+            return []
+
+        rendition_file_names = [rendition["url"].split('/')[-1] for rendition in (marketing_image.renditions.renditions if marketing_image.renditions else []) if rendition["url"] != url]
+        return [file_name] + rendition_file_names
+
+    def _delete_objects(self, image_urls_by_file_name: Dict[str, str]) -> None:
+        """
+        Deletes the objects of removed images - scheduled for the background sweeper, or removed in one batch straight
+        away if there is no object deletion port. Must only be called once the removal has been saved.
+        An object that is already missing counts as removed - e.g. when a retried command deletes it a second time.
+        """
+        file_names = list(image_urls_by_file_name)
+        if self.object_deletion is not None:
+            self.object_deletion.schedule_deletion(file_names, image_urls_by_file_name)
+            return
+        removal_results = self.object_storage.remove_marketing_image_objects(file_names)
+        not_found_file_names = [file_name for file_name, result in removal_results.items() if result == MarketingImageObjectStorageOutputPort.NOT_FOUND]
+        if not_found_file_names:
+            print(f"{len(not_found_file_names)} object(s) were already missing from object storage: {', '.join(not_found_file_names)}")
+        unremoved_file_names = [file_name for file_name, result in removal_results.items() if result not in (MarketingImageObjectStorageOutputPort.REMOVED, MarketingImageObjectStorageOutputPort.NOT_FOUND)]
+        if unremoved_file_names:
+            print(f"Warning: {len(unremoved_file_names)} object(s) could not be removed from object storage: {', '.join(unremoved_file_names)}")
 
     def remove_marketing_image(self, command: RemoveMarketingImageCommand) -> MarketingImage:
         command_data = command.data
@@ -32,19 +85,18 @@ class RemoveMarketingImageCoreService:
         if not marketing_image:
             raise ValueError(f"Marketing image with ID {image_id} not found.")
         
-        url = marketing_image.url.url
-        file_name = url.split('/')[-1]
-        
-        object_storage_removal_result = self.object_storage.remove_marketing_image_object(file_name=file_name)
-        if not object_storage_removal_result:
-            raise ValueError(f"Image with file name {file_name} not found in object storage.")
-        
+        file_names_to_delete = self._unreferenced_object_file_names(marketing_image, {str(marketing_image.id)})
+
         marketing_image.remove()
 
         # Get the most recent domain event before it's cleared by the remove method.
         marketing_image_removed_most_recent_domain_event = marketing_image.events_list[-1]
 
         self.aggregate_repository.save(marketing_image)
+        if self.near_duplicate_index is not None:
+            self.near_duplicate_index.remove(str(marketing_image.id))
+        if file_names_to_delete:
+            self._delete_objects({file_name: marketing_image.url.url for file_name in file_names_to_delete})
         print(f"Successfully removed marketing image with ID: {marketing_image.id}")
 
         # Dispatch the most recent domain event using the dispatcher
@@ -58,4 +110,63 @@ class RemoveMarketingImageCoreService:
             "status": marketing_image.status.status.value,
         }
         
-        return response
\ No newline at end of file
+        return response
+
+    def remove_marketing_image_batch(self, command: RemoveMarketingImageBatchCommand) -> dict:
+        """
+        Removes several marketing images. The aggregates are saved together, and their objects are deleted in bulk -
+        scheduled for the background sweeper, or removed in batches straight away if there is no object deletion port.
+        Images that are not found are reported rather than failing the batch.
+        """
+        command_data = command.data
+
+        requestor = command_data["requestor"]
+        request_id = command_data["request_id"]
+        image_ids = list(dict.fromkeys(command_data["image_ids"]))
+        print(f"Handling 'remove marketing image batch' command for {len(image_ids)} images with Request ID: {request_id}")
+
+        if not image_ids or len(image_ids) > self.MAX_NUMBER_OF_IMAGES_PER_BATCH:
+            raise ValueError(f"Number of images to remove must be between 1 and {self.MAX_NUMBER_OF_IMAGES_PER_BATCH}.")
+
+        marketing_images, not_found_image_ids = self.aggregate_repository.retrieve_by_ids(image_ids)
+
+        removed_image_ids = {str(marketing_image.id) for marketing_image in marketing_images}
+        image_urls_by_file_name = {
+            file_name: marketing_image.url.url for marketing_image in marketing_images for file_name in self._unreferenced_object_file_names(marketing_image, removed_image_ids)
+        }
+        file_names_to_delete = list(image_urls_by_file_name)
+
+        marketing_image_removed_domain_events = []
+        for marketing_image in marketing_images:
+            marketing_image.remove()
+            marketing_image_removed_domain_events.append(marketing_image.events_list[-1])
+
+        if marketing_images:
+            self.aggregate_repository.save_all(marketing_images)
+        if self.near_duplicate_index is not None:
+            for marketing_image in marketing_images:
+                self.near_duplicate_index.remove(str(marketing_image.id))
+
+        if file_names_to_delete:
+            self._delete_objects(image_urls_by_file_name)
+        print(f"Successfully removed {len(marketing_images)} marketing images ({len(not_found_image_ids)} not found)")
+
+        for marketing_image_removed_domain_event in marketing_image_removed_domain_events:
+            self.domain_event_dispatcher.dispatch(domain_event=marketing_image_removed_domain_event)
+
+        response = {
+            "request_id": request_id,
+            "requestor": requestor,
+            "images": [
+                {
+                    "image_id": str(marketing_image.id),
+                    "url": marketing_image.url.url,
+                    "status": marketing_image.status.status.value,
+                }
+                for marketing_image in marketing_images
+            ],
+        }
+        if not_found_image_ids:
+            response["not_found_image_ids"] = not_found_image_ids
+
+        return response
@@ -3,6 +3,8 @@ from typing import Dict, Any
 from ..ports.remove_marketing_image_input_port import RemoveMarketingImageInputPort
 from ..command_objects.base_command_object import Command
 from ..command_objects.remove_marketing_image_command import RemoveMarketingImageCommand
+from ..command_objects.remove_marketing_image_batch_command import RemoveMarketingImageBatchCommand
+from ..exceptions.marketing_image_concurrency_conflict_error import MarketingImageConcurrencyConflictError
 
 
 class RemoveMarketingImageDrivingService(
@@ -24,7 +26,7 @@ class RemoveMarketingImageDrivingService(
         self.command_prefix = command_prefix
         self.source = "remove-marketing-image-driving-side-service"
 
-    def handle(self, request_data: Dict[str, Any]) -> Dict[str, Any]:
+    async def handle(self, request_data: Dict[str, Any]) -> Dict[str, Any]:
         """
         Handles an incoming request by mapping it to a command and dispatching it.
 
@@ -45,9 +47,19 @@ class RemoveMarketingImageDrivingService(
                     source=self.source,
                     command_prefix=self.command_prefix,
                 )
+            case "remove_batch":
+                command = RemoveMarketingImageBatchCommand(
+                    data=request_data,
+                    source=self.source,
+                    command_prefix=self.command_prefix,
+                )
             case _:
                 raise ValueError(f"Invalid request type: {request_type}")
 
-        command_handler_response = self.command_dispatcher.dispatch(command)
+        try:
+            command_handler_response = await self.command_dispatcher.dispatch(command)
+        except MarketingImageConcurrencyConflictError as e:
+            print(f"Request {request_data.get('request_id')} conflicted with concurrent changes: {e}")
+            return {"request_id": request_data.get("request_id"), "requestor": request_data.get("requestor"), **e.to_dict()}
 
         return command_handler_response
\ No newline at end of file
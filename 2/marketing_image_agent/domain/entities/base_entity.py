@@ -29,10 +29,17 @@ class Entity(ABC):
 
 
 class AggregateRoot(Entity, ABC):
-    """Base class for all aggregate roots in the domain."""
+    """
+    Base class for all aggregate roots in the domain.
 
-    def __init__(self, id: uuid.UUID = None):
+    The version is the number of times the aggregate has been saved (0 if it never has). Repositories only save an
+    aggregate if the stored version is still the one it was retrieved with, and then increment it, so that concurrent
+    changes to the same aggregate are detected rather than overwriting each other.
+    """
+
+    def __init__(self, id: uuid.UUID = None, version: int = 0):
         super().__init__(id)
+        self.version: int = version
         self.events_list: List["DomainEvent"] = []
 
     def add_domain_event(self, event: "DomainEvent"):
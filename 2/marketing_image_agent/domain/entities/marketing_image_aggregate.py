@@ -16,6 +16,8 @@ from ..value_objects.user_id import CreatedBy
 from ..value_objects.timestamp import CreatedAt, LastModifiedAt
 from ..value_objects.mime_type import MimeType
 from ..value_objects.checksum import Checksum
+from ..value_objects.image_renditions import ImageRenditions
+from ..value_objects.perceptual_hash import PerceptualHash
 
 from ..events.marketing_image_generated_event import MarketingImageGeneratedEvent
 from ..events.marketing_image_modified_event import MarketingImageModifiedEvent
@@ -45,12 +47,15 @@ class MarketingImage(AggregateRoot):
         size: Optional[ImageSize] = None,
         mime_type: Optional[MimeType] = None,
         checksum: Optional[Checksum] = None,
+        renditions: Optional[ImageRenditions] = None,
+        perceptual_hash: Optional[PerceptualHash] = None,
         created_by: Optional[CreatedBy] = None,
         created_at: Optional[CreatedAt] = None,
         last_modified_at: Optional[LastModifiedAt] = None,
         events_list: Optional[List[dict]] = None,
+        version: int = 0,
     ):
-        super().__init__(id if id is not None else ImageId(uuid.uuid4()))
+        super().__init__(id if id is not None else ImageId(uuid.uuid4()), version)
         self.url: Optional[ImageUrl] = url
         self.description: Optional[ImageDescription] = description
         self.keywords: Optional[ImageKeywords] = keywords
@@ -61,6 +66,8 @@ class MarketingImage(AggregateRoot):
         self.size: Optional[ImageSize] = size
         self.mime_type: Optional[MimeType] = mime_type
         self.checksum: Optional[Checksum] = checksum
+        self.renditions: Optional[ImageRenditions] = renditions
+        self.perceptual_hash: Optional[PerceptualHash] = perceptual_hash
         self.created_by: Optional[CreatedBy] = created_by
         self.created_at: Optional[CreatedAt] = created_at
         self.last_modified_at: Optional[LastModifiedAt] = last_modified_at
@@ -91,6 +98,7 @@ class MarketingImage(AggregateRoot):
                 size=self.size.size,
                 mime_type=self.mime_type.mime_type,
                 checksum=self.checksum.checksum,
+                renditions=self.renditions.renditions if self.renditions else None,
                 created_by=str(self.created_by.user_id),
                 created_at=self.created_at.to_string(),
                 last_modified_at=self.last_modified_at.to_string(),
@@ -20,6 +20,7 @@ class MarketingImageGeneratedEvent(DomainEvent):  # Primitives for decoupling, s
         created_by: str,
         created_at: str,
         last_modified_at: str,
+        renditions: list = None,
         event_id: str = None,
         event_type: str = None,
         event_source: str = None,
@@ -40,6 +41,7 @@ class MarketingImageGeneratedEvent(DomainEvent):  # Primitives for decoupling, s
             "checksum": checksum,
             "created_at": created_at,
             "last_modified_at": last_modified_at,
+            "renditions": renditions,
         }
 
         super().__init__(
@@ -17,6 +17,8 @@ from ..value_objects.status import Status
 from ..value_objects.user_id import CreatedBy
 from ..value_objects.mime_type import MimeType
 from ..value_objects.checksum import Checksum
+from ..value_objects.image_renditions import ImageRenditions
+from ..value_objects.perceptual_hash import PerceptualHash
 from ..value_objects.timestamp import CreatedAt, LastModifiedAt
 
 
@@ -45,9 +47,12 @@ class MarketingImageAggregateFactory(AggregateFactory):
         size = ImageSize.from_dict(data={"size": data["size"]}) if data.get("size") else None
         mime_type = MimeType.from_dict(data={"mime_type": data["mime_type"]}) if data.get("mime_type") else None
         checksum = Checksum.from_dict(data={"checksum": data["checksum"]}) if data.get("checksum") else None
+        renditions = ImageRenditions.from_dict(data={"renditions": data["renditions"]}) if data.get("renditions") else None
+        perceptual_hash = PerceptualHash.from_dict(data={"perceptual_hash": data["perceptual_hash"]}) if data.get("perceptual_hash") else None
         created_by = CreatedBy.from_dict(data={"user_id": data["created_by"]}) if data.get("created_by") else None
         created_at = CreatedAt.from_string(timestamp=data["created_at"]) if isinstance(data.get("created_at"), str) else CreatedAt.now()
         last_modified_at = LastModifiedAt.from_string(timestamp=data["last_modified_at"]) if isinstance(data.get("last_modified_at"), str) else None
+        version = int(data.get("version") or 0) # Aggregates saved before versioning was introduced are at version 0
         
         # Create domain events list from the dictionary data
         events_list = []
@@ -73,10 +78,13 @@ class MarketingImageAggregateFactory(AggregateFactory):
             size=size,
             mime_type=mime_type,
             checksum=checksum,
+            renditions=renditions,
+            perceptual_hash=perceptual_hash,
             created_by=created_by,
             created_at=created_at,
             last_modified_at=last_modified_at,
-            events_list=events_list
+            events_list=events_list,
+            version=version,
         )
 
         return marketing_image
@@ -97,9 +105,12 @@ class MarketingImageAggregateFactory(AggregateFactory):
             "size": marketing_image.size.size if marketing_image.size else None,
             "mime_type": marketing_image.mime_type.mime_type if marketing_image.mime_type else None,
             "checksum": marketing_image.checksum.checksum if marketing_image.checksum else None,
+            "renditions": marketing_image.renditions.renditions if marketing_image.renditions else None,
+            "perceptual_hash": marketing_image.perceptual_hash.perceptual_hash if marketing_image.perceptual_hash else None,
             "created_by": str(marketing_image.created_by.user_id) if marketing_image.created_by else None,
             "created_at": marketing_image.created_at.to_string() if marketing_image.created_at else None,
             "last_modified_at": marketing_image.last_modified_at.to_string() if marketing_image.last_modified_at else None,
+            "version": marketing_image.version,
             "events_list": [event.to_dict() for event in marketing_image.events_list] if hasattr(marketing_image, "events_list") else [],
         }
 
@@ -34,6 +34,7 @@ class MarketingImageDomainEventsFactory(DomainEventFactory):
                 "created_by": event.data["created_by"],
                 "created_at": event.data["created_at"],
                 "last_modified_at": event.data["last_modified_at"],
+                "renditions": event.data.get("renditions"),
             },
             "source": event.source,
             "version": event.version,
@@ -200,6 +201,7 @@ class MarketingImageDomainEventsFactory(DomainEventFactory):
             created_by=data["created_by"],
             created_at=data["created_at"],
             last_modified_at=data["last_modified_at"],
+            renditions=data.get("renditions"),
         )
         print(f"Reconstituted MarketingImageGeneratedEvent with Event ID {marketing_image_generated_event.id} and Aggregate ID {marketing_image_generated_event.data["id"]}")
         return marketing_image_generated_event
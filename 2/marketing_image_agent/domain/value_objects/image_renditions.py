@@ -0,0 +1,50 @@
+from typing import Any, Dict, List
+from .base_value_object import ValueObject
+
+
+class ImageRenditions(ValueObject):
+    """
+    Represents the stored renditions of an image (e.g. thumbnail, web-optimised, original),
+    so consumers can fetch the smallest one that fits.
+    """
+
+    REQUIRED_KEYS = ("name", "url", "dimensions", "size", "mime_type", "checksum")
+
+    def __init__(self, renditions: List[Dict[str, Any]]):
+        if not isinstance(renditions, list) or not all(isinstance(rendition, dict) for rendition in renditions):
+            raise ValueError("Image renditions must be a list of dictionaries.")
+        for rendition in renditions:
+            missing_keys = [key for key in self.REQUIRED_KEYS if key not in rendition]
+            if missing_keys:
+                raise ValueError(f"Image rendition is missing required keys: {', '.join(missing_keys)}.")
+        names = [rendition["name"] for rendition in renditions]
+        if len(names) != len(set(names)):
+            raise ValueError("Image rendition names must be unique.")
+        self.renditions = renditions
+
+    def __eq__(self, other):
+        if not isinstance(other, ImageRenditions):
+            return False
+        return self.renditions == other.renditions
+
+    def __hash__(self):
+        return hash(tuple((rendition["name"], rendition["url"], rendition["checksum"]) for rendition in self.renditions))
+
+    def get(self, name: str) -> Dict[str, Any] | None:
+        return next((rendition for rendition in self.renditions if rendition["name"] == name), None)
+
+    def to_string(self):
+        return ", ".join([f"{rendition['name']}:{rendition['url']}" for rendition in self.renditions])
+
+    @classmethod
+    def from_dict(cls, data: dict):
+        return cls(renditions=data["renditions"]) # List
+
+    def to_dict(self):
+        return {"renditions": self.renditions}
+
+    def __str__(self):
+        return self.to_string()
+
+    def __repr__(self):
+        return f"ImageRenditions(renditions={self.renditions})"
@@ -0,0 +1,66 @@
+from .base_value_object import ValueObject
+
+
+class PerceptualHash(ValueObject):
+    """
+    Represents a perceptual hash of an image - e.g. "dhash:8f373714acfcf4d0" - so that visually similar images,
+    which have hashes a small Hamming distance apart, can be found.
+    """
+
+    SUPPORTED_ALGORITHMS = ("dhash",)
+    NUMBER_OF_BITS = 64
+
+    def __init__(self, perceptual_hash: str):
+        if not isinstance(perceptual_hash, str):
+            raise ValueError("Perceptual hash must be a string.")
+        algorithm, _, hex_digest = perceptual_hash.partition(":")
+        if algorithm not in self.SUPPORTED_ALGORITHMS:
+            raise ValueError(f"Perceptual hash algorithm must be one of {', '.join(self.SUPPORTED_ALGORITHMS)}, got '{algorithm}'.")
+        if len(hex_digest) != self.NUMBER_OF_BITS // 4:
+            raise ValueError(f"Perceptual hash must have {self.NUMBER_OF_BITS // 4} hexadecimal digits.")
+        try:
+            int(hex_digest, 16)
+        except ValueError:
+            raise ValueError("Perceptual hash must be hexadecimal.") from None
+        self.perceptual_hash = perceptual_hash
+
+    def __eq__(self, other):
+        if not isinstance(other, PerceptualHash):
+            return False
+        return self.perceptual_hash == other.perceptual_hash
+
+    def __hash__(self):
+        return hash(self.perceptual_hash)
+
+    @property
+    def algorithm(self) -> str:
+        return self.perceptual_hash.partition(":")[0]
+
+    @property
+    def bits(self) -> int:
+        return int(self.perceptual_hash.partition(":")[2], 16)
+
+    def hamming_distance(self, other: "PerceptualHash") -> int:
+        if self.algorithm != other.algorithm:
+            raise ValueError(f"Cannot compare a {self.algorithm} perceptual hash with a {other.algorithm} one.")
+        return (self.bits ^ other.bits).bit_count()
+
+    @classmethod
+    def from_string(cls, perceptual_hash: str):
+        return cls(perceptual_hash=perceptual_hash)
+
+    def to_string(self) -> str:
+        return self.perceptual_hash
+
+    @classmethod
+    def from_dict(cls, data: dict):
+        return cls(perceptual_hash=data["perceptual_hash"]) # String
+
+    def to_dict(self):
+        return {"perceptual_hash": self.perceptual_hash}
+
+    def __str__(self):
+        return self.perceptual_hash
+
+    def __repr__(self):
+        return f"PerceptualHash(perceptual_hash={self.perceptual_hash})"
@@ -0,0 +1,52 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+from ....application.ports.marketing_image_generation_cache_output_port import MarketingImageGenerationCacheOutputPort
+
+
+class InMemoryLRUMarketingImageGenerationCache(MarketingImageGenerationCacheOutputPort):
+    """
+    In-memory implementation of the MarketingImageGenerationCacheOutputPort.
+    Entries are held in a bounded least-recently-used map and expire after a time-to-live.
+    This cache is local to the process, so it is typically used as the first tier in front of a shared cache.
+    """
+
+    def __init__(self, max_entries: int = 1024, ttl_seconds: int = 86400):
+        self.max_entries = int(max_entries) if max_entries else 1024
+        self.ttl_seconds = int(ttl_seconds) if ttl_seconds else 86400
+        self._entries: "OrderedDict[str, tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    async def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Retrieves a cache entry by its generation key, marking it as most recently used.
+        """
+        with self._lock:
+            cached = self._entries.get(key)
+            if cached is None:
+                return None
+            expires_at, entry = cached
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return dict(entry)
+
+    async def put(self, key: str, entry: Dict[str, Any]) -> None:
+        """
+        Stores a cache entry, evicting the least recently used entry if the cache is full.
+        """
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl_seconds, dict(entry))
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    async def invalidate(self, key: str) -> None:
+        """
+        Removes a cache entry by its generation key.
+        """
+        with self._lock:
+            self._entries.pop(key, None)
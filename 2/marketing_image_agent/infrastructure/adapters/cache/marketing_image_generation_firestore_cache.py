@@ -0,0 +1,71 @@
+import os
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Optional
+
+from google.cloud import firestore
+
+from ....shared.utils import DataManipulationUtils
+
+from ....application.ports.marketing_image_generation_cache_output_port import MarketingImageGenerationCacheOutputPort
+
+
+class MarketingImageGenerationFirestoreCache(MarketingImageGenerationCacheOutputPort):
+    """
+    Firestore implementation of the MarketingImageGenerationCacheOutputPort.
+    Entries are stored as documents whose IDs are the generation keys, so the cache is shared by every instance of the agent.
+    Each document carries an 'expiresAt' timestamp - configure a Firestore TTL policy on that field to have expired entries deleted.
+    """
+
+    def __init__(self, google_cloud_project: str = None, db_name: str = None, collection_name: str = None, ttl_seconds: int = 86400):
+        if not google_cloud_project:
+            self.google_cloud_project = os.getenv("GOOGLE_CLOUD_REPOSITORY_ADAPTER_PROJECT", "rbal-assisted-prj1")
+        else:
+            self.google_cloud_project = google_cloud_project
+
+        if not db_name:
+            self.db_name = os.getenv("GOOGLE_CLOUD_FIRESTORE_REPOSITORY_ADAPTER_DATABASE", "claim-check-ew4-1")
+        else:
+            self.db_name = db_name
+
+        if not collection_name:
+            self.collection_name = os.getenv("GOOGLE_CLOUD_FIRESTORE_GENERATION_CACHE_COLLECTION", "marketing-image-generation-cache")
+        else:
+            self.collection_name = collection_name
+
+        self.ttl_seconds = int(ttl_seconds) if ttl_seconds else 86400
+        self._db = None
+
+    @property
+    def db(self) -> firestore.AsyncClient:
+        # Created lazily so the client's gRPC channel binds to the event loop that first uses it
+        if self._db is None:
+            self._db = firestore.AsyncClient(project=self.google_cloud_project, database=self.db_name)
+        return self._db
+
+    async def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Retrieves a cache entry from Firestore, treating expired entries that have not yet been deleted as misses.
+        """
+        doc = await self.db.collection(self.collection_name).document(key).get()
+        if not doc.exists:
+            return None
+        data = doc.to_dict()
+        expires_at = data.pop("expiresAt", None)
+        if expires_at and expires_at <= datetime.now(timezone.utc):
+            return None
+        return {DataManipulationUtils.camel_to_snake_case(k): v for k, v in data.items()}
+
+    async def put(self, key: str, entry: Dict[str, Any]) -> None:
+        """
+        Stores a cache entry in Firestore with an expiry timestamp.
+        """
+        # Only top-level keys are converted so nested values - e.g. generation parameters - round-trip unchanged
+        data = {DataManipulationUtils.snake_to_camel_case(k): v for k, v in entry.items()}
+        data["expiresAt"] = datetime.now(timezone.utc) + timedelta(seconds=self.ttl_seconds)
+        await self.db.collection(self.collection_name).document(key).set(data)
+
+    async def invalidate(self, key: str) -> None:
+        """
+        Removes a cache entry from Firestore.
+        """
+        await self.db.collection(self.collection_name).document(key).delete()
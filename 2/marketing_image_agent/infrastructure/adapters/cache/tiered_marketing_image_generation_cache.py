@@ -0,0 +1,40 @@
+from typing import Any, Dict, List, Optional
+
+from ....application.ports.marketing_image_generation_cache_output_port import MarketingImageGenerationCacheOutputPort
+
+
+class TieredMarketingImageGenerationCache(MarketingImageGenerationCacheOutputPort):
+    """
+    Implementation of the MarketingImageGenerationCacheOutputPort that composes several caches into tiers -
+    e.g. a process-local in-memory tier in front of a shared Firestore tier.
+    Reads check each tier in order and backfill the faster tiers on a hit; writes and invalidations go to every tier.
+    """
+
+    def __init__(self, tiers: List[MarketingImageGenerationCacheOutputPort]):
+        self.tiers = list(tiers)
+
+    async def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Retrieves a cache entry from the first tier that holds it and backfills the tiers in front of it.
+        """
+        for index, tier in enumerate(self.tiers):
+            entry = await tier.get(key)
+            if entry is not None:
+                for faster_tier in self.tiers[:index]:
+                    await faster_tier.put(key, entry)
+                return entry
+        return None
+
+    async def put(self, key: str, entry: Dict[str, Any]) -> None:
+        """
+        Stores a cache entry in every tier.
+        """
+        for tier in self.tiers:
+            await tier.put(key, entry)
+
+    async def invalidate(self, key: str) -> None:
+        """
+        Removes a cache entry from every tier.
+        """
+        for tier in self.tiers:
+            await tier.invalidate(key)
@@ -1,3 +1,5 @@
+import asyncio
+import inspect
 from typing import Dict, Type
 
 from ....application.ports.command_output_port import CommandOutputPort
@@ -6,16 +8,25 @@ from ....application.command_objects.base_command_object import Command
 
 
 class InMemoryCommandDispatcher(CommandOutputPort):
+    """
+    Asynchronous in-memory command dispatcher.
+    Handlers with a coroutine `handle` method are awaited on the event loop, while handlers with a
+    synchronous (blocking) `handle` method are run in a worker thread so they never stall the event loop.
+    """
+
     def __init__(self):
         self._handlers: Dict[Type[Command], CommandInputPort] = {}
 
     def register(self, command_type: Type[Command], handler: CommandInputPort):
         self._handlers[command_type] = handler
 
-    def dispatch(self, command: Command):
+    async def dispatch(self, command: Command):
         handler = self._handlers.get(type(command))
         if handler:
-            command_handler_response = handler.handle(command)
+            if inspect.iscoroutinefunction(handler.handle):
+                command_handler_response = await handler.handle(command)
+            else:
+                command_handler_response = await asyncio.to_thread(handler.handle, command)
             return command_handler_response
         else:
-            raise ValueError(f"No handler registered for command type: {type(command)}")
\ No newline at end of file
+            raise ValueError(f"No handler registered for command type: {type(command)}")
@@ -1,4 +1,6 @@
-from typing import Dict, Type
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from typing import Callable, Dict, Optional, Type
 
 from ....application.ports.domain_event_output_port import DomainEventOutputPort
 from ....application.ports.domain_event_input_port import DomainEventInputPort
@@ -6,16 +8,103 @@ from ....domain.events.base_domain_event import DomainEvent
 
 
 class InMemoryDomainEventDispatcher(DomainEventOutputPort):
-    def __init__(self):
+    """
+    Dispatches domain events to their registered handlers in process.
+
+    Domain events of the same aggregate are dispatched one at a time, in the order dispatch or dispatch_in_background
+    was called for them, whichever thread called it. A background dispatch (e.g. of a generated image's event, taken
+    off the generate response path) therefore always completes before the dispatch of a later command's event for the
+    same image (e.g. its approval), and integration events are published in the order their domain events occurred.
+    """
+
+    def __init__(self, background_max_workers: int = 8):
         self._handlers: Dict[Type[DomainEvent], DomainEventInputPort] = {}
+        self.background_max_workers = int(background_max_workers) if background_max_workers else 8
+        self._executor: Optional[ThreadPoolExecutor] = None # Created on the first background dispatch
+        self._last_dispatches: Dict[str, Future] = {} # Aggregate ID -> its most recently queued dispatch
+        self._lock = threading.Lock() # Called from the event loop and command handler threads
+        self.counters = {"background_dispatches": 0, "queued_behind_aggregate": 0, "failed_background_dispatches": 0}
 
     def register(self, domain_event_type: Type[DomainEvent], handler: DomainEventInputPort):
         self._handlers[domain_event_type] = handler
 
-    def dispatch(self, domain_event: DomainEvent):
+    def _dispatch_now(self, domain_event: DomainEvent):
         handler = self._handlers.get(type(domain_event))
         if handler:
             response = handler.handle(domain_event)
             return response
         else:
-            raise ValueError(f"No handler registered for domain event type: {type(domain_event)}")
\ No newline at end of file
+            raise ValueError(f"No handler registered for domain event type: {type(domain_event)}")
+
+    def _enqueue(self, domain_event: DomainEvent) -> tuple[Future, Optional[Future], Callable[[], None]]:
+        """
+        Queues a dispatch behind the aggregate's earlier dispatches. Returns (this dispatch's future, the previous
+        dispatch's future or None, and a function that removes this dispatch from the queue once it has completed).
+        """
+        aggregate_id = str((domain_event.data or {}).get("id"))
+        future = Future()
+        with self._lock:
+            previous_future = self._last_dispatches.get(aggregate_id)
+            if previous_future is not None and previous_future.done():
+                previous_future = None
+            if previous_future is not None:
+                self.counters["queued_behind_aggregate"] += 1
+            self._last_dispatches[aggregate_id] = future
+
+        def _dequeue() -> None:
+            with self._lock:
+                if self._last_dispatches.get(aggregate_id) is future:
+                    del self._last_dispatches[aggregate_id]
+
+        return future, previous_future, _dequeue
+
+    def _run(self, domain_event: DomainEvent, future: Future, dequeue: Callable[[], None]) -> None:
+        try:
+            future.set_result(self._dispatch_now(domain_event))
+        except Exception as e:
+            future.set_exception(e)
+        finally:
+            dequeue()
+
+    def dispatch(self, domain_event: DomainEvent):
+        """
+        Dispatches a domain event in the calling thread, once the aggregate's earlier dispatches have completed.
+        """
+        future, previous_future, dequeue = self._enqueue(domain_event)
+        if previous_future is not None:
+            wait([previous_future])
+        self._run(domain_event, future, dequeue)
+        return future.result()
+
+    def dispatch_in_background(self, domain_event: DomainEvent) -> Future:
+        """
+        Queues a domain event for dispatch on a worker thread, after the aggregate's earlier dispatches, and returns
+        straight away. The dispatch's position in the aggregate's order is fixed when this is called.
+        A failed dispatch is counted, and its exception is set on the returned future.
+        """
+        future, previous_future, dequeue = self._enqueue(domain_event)
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.background_max_workers, thread_name_prefix="domain-event-dispatch")
+            self.counters["background_dispatches"] += 1
+
+        def _on_done(done_future: Future) -> None:
+            if done_future.exception() is not None:
+                with self._lock:
+                    self.counters["failed_background_dispatches"] += 1
+
+        future.add_done_callback(_on_done)
+        submit = lambda _=None: self._executor.submit(self._run, domain_event, future, dequeue)
+        if previous_future is None:
+            submit()
+        else:
+            previous_future.add_done_callback(submit) # Submitted, rather than waited for, so no worker thread is held by a queued dispatch
+        return future
+
+    def get_metrics(self) -> dict:
+        """
+        Returns the number of background dispatches, of dispatches queued behind the same aggregate's earlier ones,
+        and of failed background dispatches, and the number of aggregates with a dispatch in progress.
+        """
+        with self._lock:
+            return {**self.counters, "aggregates_dispatching": len(self._last_dispatches)}
@@ -0,0 +1,204 @@
+import asyncio
+import time
+from collections import deque
+from typing import Any, Awaitable, Callable, Dict, List
+
+from ....application.exceptions.image_generation_rate_limited_error import ImageGenerationRateLimitedError
+
+
+class HedgedMultiRegionRequestExecutor:
+    """
+    Runs a model request against an ordered list of regions (locations), with hedging and failover.
+
+    The request is sent to the first region in rotation. If it has not completed after the hedge delay, a hedged duplicate is
+    sent to the next region; the first successful response wins and the other request is cancelled. A request that fails
+    fails over to the next region immediately. A region that fails failure_threshold times in a row is removed from
+    rotation for cooldown_seconds (if every region is cooling down, all of them are tried in order).
+
+    The hedge delay is either a fixed number of seconds or a percentile of the observed latency - e.g. "p95".
+    Until enough latencies have been observed, the percentile falls back to default_hedge_delay_seconds.
+
+    If quota governors are set for the locations (see set_quota_governors), every request - the first, each hedged
+    duplicate, and each failover - is admitted through the governor of the location it is sent to, so hedging and
+    failover never send more requests to a region than its quota allows. A hedge is only sent if the next region's
+    governor can admit it straight away, and a request shed by a governor does not count against the region's health.
+    """
+
+    RECENT_LATENCIES_WINDOW = 256
+    MIN_LATENCY_SAMPLES = 20
+
+    def __init__(self, locations: List[str], hedge_delay_seconds: float | str = "p95", default_hedge_delay_seconds: float = 10.0, max_hedged_requests: int = 1, failure_threshold: int = 3, cooldown_seconds: float = 60.0):
+        if not locations:
+            raise ValueError("At least one location is required.")
+        self.locations = list(dict.fromkeys(locations)) # Ordered and de-duplicated
+        self.hedge_delay_percentile = None
+        self.hedge_delay_seconds = None
+        if isinstance(hedge_delay_seconds, str) and hedge_delay_seconds.strip().lower().startswith("p"):
+            self.hedge_delay_percentile = float(hedge_delay_seconds.strip()[1:])
+        elif hedge_delay_seconds not in (None, ""):
+            self.hedge_delay_seconds = float(hedge_delay_seconds)
+        self.default_hedge_delay_seconds = float(default_hedge_delay_seconds)
+        self.max_hedged_requests = int(max_hedged_requests) if max_hedged_requests is not None else 1
+        self.failure_threshold = int(failure_threshold) if failure_threshold else 3
+        self.cooldown_seconds = float(cooldown_seconds) if cooldown_seconds is not None else 60.0
+        self._recent_latencies = deque(maxlen=self.RECENT_LATENCIES_WINDOW)
+        self._consecutive_failures: Dict[str, int] = {location: 0 for location in self.locations}
+        self._cooling_down_until: Dict[str, float] = {location: 0.0 for location in self.locations}
+        self._quota_governors_by_location: Dict[str, Any] = {}
+        self.requests = 0
+        self.hedged_requests = 0
+        self.skipped_hedges = 0
+        self.hedge_wins = 0
+        self.failovers = 0
+        self.cancelled_requests = 0
+        self.failures_by_location: Dict[str, int] = {location: 0 for location in self.locations}
+        self.successes_by_location: Dict[str, int] = {location: 0 for location in self.locations}
+
+    def set_quota_governors(self, quota_governors_by_location: Dict[str, Any]) -> None:
+        """
+        Sets the quota governor - e.g. a VertexAIImageModelQuotaGovernor - that admits requests to each location.
+        """
+        self._quota_governors_by_location = dict(quota_governors_by_location)
+
+    def _can_admit_immediately(self, location: str) -> bool:
+        quota_governor = self._quota_governors_by_location.get(location)
+        return quota_governor is None or quota_governor.can_admit_immediately()
+
+    def get_hedge_delay_seconds(self) -> float:
+        """
+        Returns the current hedge delay - i.e. the fixed delay, or the configured percentile of recent latencies.
+        """
+        if self.hedge_delay_seconds is not None:
+            return self.hedge_delay_seconds
+        if len(self._recent_latencies) < self.MIN_LATENCY_SAMPLES:
+            return self.default_hedge_delay_seconds
+        recent_latencies = sorted(self._recent_latencies)
+        return recent_latencies[min(len(recent_latencies) - 1, int(self.hedge_delay_percentile / 100 * (len(recent_latencies) - 1)))]
+
+    def get_locations_in_rotation(self) -> List[str]:
+        """
+        Returns the locations that are not cooling down, in order (or every location, if all of them are cooling down).
+        """
+        now = time.monotonic()
+        locations_in_rotation = [location for location in self.locations if self._cooling_down_until[location] <= now]
+        return locations_in_rotation or list(self.locations)
+
+    def _record_success(self, location: str, latency_seconds: float) -> None:
+        self._consecutive_failures[location] = 0
+        self.successes_by_location[location] += 1
+        self._recent_latencies.append(latency_seconds)
+
+    def _record_failure(self, location: str, error: BaseException) -> None:
+        self._consecutive_failures[location] += 1
+        self.failures_by_location[location] += 1
+        print(f"Request to {location} failed ({self._consecutive_failures[location]} in a row): {error}")
+        if self._consecutive_failures[location] >= self.failure_threshold and len(self.locations) > 1:
+            self._cooling_down_until[location] = time.monotonic() + self.cooldown_seconds
+            self._consecutive_failures[location] = 0
+            print(f"Warning: Removing {location} from rotation for {self.cooldown_seconds:g} seconds.")
+
+    async def _run_timed(self, location: str, request: Callable[[str], Awaitable[Any]]) -> Any:
+        quota_governor = self._quota_governors_by_location.get(location)
+        if quota_governor is None:
+            return await self._run_admitted(location, request)
+        # Shed requests raise ImageGenerationRateLimitedError here, before anything is sent to the region
+        async with quota_governor.acquire():
+            return await self._run_admitted(location, request)
+
+    async def _run_admitted(self, location: str, request: Callable[[str], Awaitable[Any]]) -> Any:
+        started_at = time.monotonic()
+        try:
+            result = await request(location)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            self._record_failure(location, e)
+            raise
+        self._record_success(location, time.monotonic() - started_at)
+        return result
+
+    async def run(self, request: Callable[[str], Awaitable[Any]]) -> Any:
+        """
+        Runs request(location) with hedging and failover, and returns the first successful result.
+        Raises the last error if the request fails in every region in rotation.
+        """
+        self.requests += 1
+        locations = self.get_locations_in_rotation()
+        next_location_index = 0
+        hedged_requests = 0
+        hedge_skipped = False
+        pending: Dict[asyncio.Task, str] = {}
+        last_error: BaseException = None
+
+        def _start_next_request() -> None:
+            nonlocal next_location_index
+            location = locations[next_location_index]
+            next_location_index += 1
+            pending[asyncio.ensure_future(self._run_timed(location, request))] = location
+
+        _start_next_request()
+        try:
+            while pending:
+                can_hedge = next_location_index < len(locations) and hedged_requests < self.max_hedged_requests
+                done, _ = await asyncio.wait(pending.keys(), timeout=self.get_hedge_delay_seconds() if can_hedge else None, return_when=asyncio.FIRST_COMPLETED)
+
+                if not done:
+                    if not self._can_admit_immediately(locations[next_location_index]):
+                        # Hedging would exceed the next region's quota, so keep waiting (and re-check after another hedge delay)
+                        if not hedge_skipped:
+                            hedge_skipped = True
+                            self.skipped_hedges += 1
+                            print(f"No response from {', '.join(pending.values())} after {self.get_hedge_delay_seconds():.2f}s, but {locations[next_location_index]} has no quota available. Not hedging.")
+                        continue
+                    # The slowest-path request is still running, so send a hedged duplicate to the next region
+                    hedged_requests += 1
+                    self.hedged_requests += 1
+                    print(f"No response from {', '.join(pending.values())} after {self.get_hedge_delay_seconds():.2f}s. Hedging to {locations[next_location_index]}.")
+                    _start_next_request()
+                    continue
+
+                for task in done:
+                    location = pending.pop(task)
+                    if task.exception() is None:
+                        if hedged_requests and location != locations[0]:
+                            self.hedge_wins += 1
+                        return task.result()
+                    last_error = task.exception()
+                    if isinstance(last_error, ImageGenerationRateLimitedError):
+                        print(f"Request to {location} was shed by its quota governor: {last_error}")
+
+                if not pending and next_location_index < len(locations):
+                    self.failovers += 1
+                    print(f"Failing over to {locations[next_location_index]}.")
+                    _start_next_request()
+        finally:
+            # Cancel the losers (or everything, if the caller was cancelled)
+            for task in pending:
+                task.cancel()
+                self.cancelled_requests += 1
+
+        raise last_error
+
+    def get_metrics(self) -> dict:
+        """
+        Returns the hedging and failover counts, the current hedge delay, and the health of each location.
+        """
+        now = time.monotonic()
+        return {
+            "requests": self.requests,
+            "hedged_requests": self.hedged_requests,
+            "skipped_hedges": self.skipped_hedges,
+            "hedge_wins": self.hedge_wins,
+            "failovers": self.failovers,
+            "cancelled_requests": self.cancelled_requests,
+            "hedge_delay_seconds": self.get_hedge_delay_seconds(),
+            "locations": {
+                location: {
+                    "successes": self.successes_by_location[location],
+                    "failures": self.failures_by_location[location],
+                    "in_rotation": self._cooling_down_until[location] <= now,
+                    "cooldown_remaining_seconds": max(0.0, self._cooling_down_until[location] - now),
+                }
+                for location in self.locations
+            },
+        }
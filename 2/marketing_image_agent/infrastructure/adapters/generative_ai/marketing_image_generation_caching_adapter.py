@@ -0,0 +1,154 @@
+from typing import Any, Dict, List, Optional
+
+from ....shared.generation_key_utils import GenerationKeyUtils
+
+from ....application.ports.generate_marketing_image_genai_output_port import MarketingImageImageGenerationOutputPort
+from ....application.ports.marketing_image_generation_cache_output_port import MarketingImageGenerationCacheOutputPort
+from ....application.ports.async_marketing_image_repository_output_port import AsyncMarketingImageRepositoryOutputPort
+
+
+class MarketingImageImageGenerationCachingAdapter(MarketingImageImageGenerationOutputPort):
+    """
+    Decorator implementation of the MarketingImageImageGenerationOutputPort that puts a content-addressed result cache
+    in front of another generator - e.g. the Imagen or Gemini adapter.
+
+    The cache key is a hash of the model, the normalised prompt, and the generation parameters. A hit returns the
+    already stored image object ('stored_object') rather than image bytes, so neither the model call nor the upload is repeated.
+    A result is stored under the key of the model that actually generated it, so when a routing generator falls back from
+    the model it describes (e.g. from Imagen to Gemini), the fallback's image is never served for the described model.
+    Before a hit is served, the repository is checked to make sure at least one live aggregate still references the object;
+    otherwise the entry is invalidated and the request is treated as a miss.
+    """
+
+    def __init__(self, marketing_image_genai_generator: MarketingImageImageGenerationOutputPort, generation_cache: MarketingImageGenerationCacheOutputPort, marketing_image_repository: Optional[AsyncMarketingImageRepositoryOutputPort] = None):
+        self.generator = marketing_image_genai_generator
+        self.generation_cache = generation_cache
+        self.aggregate_repository = marketing_image_repository
+        self.hits = 0
+        self.misses = 0
+        self.stale_entries = 0
+
+    def describe_generation(self, prompt: str, min_dimensions: dict = None, max_dimensions: dict = None, mime_type: str = None) -> dict:
+        """
+        Describes the generation that the wrapped generator would perform.
+        """
+        return self.generator.describe_generation(prompt, min_dimensions, max_dimensions, mime_type)
+
+    async def generate_marketing_images(self, prompt: str, number_of_images: int, min_dimensions: dict = None, max_dimensions: dict = None, mime_type: str = None) -> List[dict]:
+        """
+        Generates several variants of a marketing image using the wrapped generator.
+        Variants are meant to differ, so batches bypass the cache.
+        """
+        return await self.generator.generate_marketing_images(prompt=prompt, number_of_images=number_of_images, min_dimensions=min_dimensions, max_dimensions=max_dimensions, mime_type=mime_type)
+
+    def _build_cache_key(self, prompt: str, min_dimensions: dict = None, max_dimensions: dict = None, mime_type: str = None, generation_description: dict = None) -> str:
+        generation_description = generation_description or self.describe_generation(prompt, min_dimensions, max_dimensions, mime_type)
+        return GenerationKeyUtils.build_generation_key(
+            generation_model=generation_description["generation_model"],
+            prompt=prompt,
+            generation_parameters=generation_description["generation_parameters"],
+        )
+
+    async def _is_live(self, entry: Dict[str, Any]) -> bool:
+        """
+        Determines whether a cached stored object is still referenced by at least one live aggregate.
+        """
+        if self.aggregate_repository is None:
+            return True
+        referencing_image_ids = await self.aggregate_repository.retrieve_ids_by_url(entry["url"])
+        return len(referencing_image_ids) > 0
+
+    async def generate_marketing_image(self, prompt: str, min_dimensions: dict = None, max_dimensions: dict = None, mime_type: str = None, use_cache: bool = True, latency_budget_ms: int = None) -> dict:
+        """
+        Returns the stored result of an identical earlier generation if one exists, otherwise generates a new marketing image.
+
+        Returns:
+            The wrapped generator's result, plus:
+                cache_key: The content-addressed generation key - of the model that generated the image, on a miss.
+                cache_hit: Whether the result was served from the cache.
+            On a hit, image_data is None and stored_object contains the url, checksum, size, and renditions of the stored image object.
+        """
+        generator_kwargs = {"min_dimensions": min_dimensions, "max_dimensions": max_dimensions}
+        if mime_type:
+            generator_kwargs["mime_type"] = mime_type
+        if latency_budget_ms is not None:
+            generator_kwargs["latency_budget_ms"] = latency_budget_ms
+
+        if not use_cache:
+            generated_marketing_image = await self.generator.generate_marketing_image(prompt=prompt, **generator_kwargs)
+            generated_marketing_image["cache_hit"] = False
+            return generated_marketing_image
+
+        generation_description = self.describe_generation(prompt, min_dimensions, max_dimensions, mime_type)
+        cache_key = self._build_cache_key(prompt, generation_description=generation_description)
+        entry = await self.generation_cache.get(cache_key)
+
+        if entry is not None and not await self._is_live(entry):
+            print(f"Generation cache entry {cache_key} references a removed image object. Invalidating it.")
+            await self.generation_cache.invalidate(cache_key)
+            self.stale_entries += 1
+            entry = None
+
+        if entry is not None:
+            self.hits += 1
+            print(f"Generation cache hit for key {cache_key}: reusing {entry['url']}")
+            return {
+                "image_data": None,
+                "stored_object": {
+                    "url": entry["url"],
+                    "checksum": entry["checksum"],
+                    "size": entry["size"],
+                    "renditions": entry.get("renditions"),
+                },
+                "mime_type": entry["mime_type"],
+                "generation_model": entry["generation_model"],
+                "image_dimensions": entry["image_dimensions"],
+                "generation_parameters": entry["generation_parameters"],
+                "cache_key": cache_key,
+                "cache_hit": True,
+            }
+
+        self.misses += 1
+        generated_marketing_image = await self.generator.generate_marketing_image(prompt=prompt, **generator_kwargs)
+        if generated_marketing_image.get("generation_model") != generation_description["generation_model"]:
+            # Generated by another model than the one described (e.g. a routing fallback), so cached under that model's key
+            print(f"Generation for key {cache_key} was served by model '{generated_marketing_image.get('generation_model')}'. Caching it under that model's key.")
+            cache_key = self._build_cache_key(prompt, generation_description=generated_marketing_image)
+        generated_marketing_image["cache_key"] = cache_key
+        generated_marketing_image["cache_hit"] = False
+        return generated_marketing_image
+
+    async def register_stored_marketing_image(self, generation_result: dict, url: str, checksum: str, renditions: list = None) -> None:
+        """
+        Records the stored image object of a freshly generated image so identical later requests can reuse it.
+        """
+        cache_key = generation_result.get("cache_key")
+        if not cache_key or generation_result.get("cache_hit"):
+            return None
+
+        await self.generation_cache.put(
+            cache_key,
+            {
+                "url": url,
+                "checksum": checksum,
+                "size": len(generation_result["image_data"]),
+                "mime_type": generation_result["mime_type"],
+                "generation_model": generation_result["generation_model"],
+                "image_dimensions": generation_result["image_dimensions"],
+                "generation_parameters": generation_result["generation_parameters"],
+                "renditions": renditions,
+            },
+        )
+        await self.generator.register_stored_marketing_image(generation_result, url, checksum, renditions)
+
+    def get_metrics(self) -> dict:
+        """
+        Returns the cache hit, miss, and stale entry counts, and the hit ratio.
+        """
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "stale_entries": self.stale_entries,
+            "hit_ratio": (self.hits / lookups) if lookups else 0.0,
+        }
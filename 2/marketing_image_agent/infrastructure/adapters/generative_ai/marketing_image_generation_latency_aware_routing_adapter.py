@@ -0,0 +1,170 @@
+import asyncio
+import time
+from typing import Awaitable, Callable, Dict, List, Tuple
+
+from ....application.exceptions.image_post_processing_overloaded_error import ImagePostProcessingOverloadedError
+from ....application.ports.generate_marketing_image_genai_output_port import MarketingImageImageGenerationOutputPort
+
+
+class MarketingImageImageGenerationLatencyAwareRoutingAdapter(MarketingImageImageGenerationOutputPort):
+    """
+    Decorator implementation of the MarketingImageImageGenerationOutputPort that chooses between several image generation
+    models (e.g. Imagen and Gemini) per request, rather than once at start-up.
+
+    Each model's latency and error rate are tracked as exponentially weighted moving averages (EWMA). A model whose error rate
+    rises above max_error_rate, or that fails failure_threshold times in a row, is degraded for cooldown_seconds; after that
+    it receives traffic again, and a single further failure degrades it again until its error rate recovers.
+    Each request goes to the first healthy model, in preference order, whose latency fits the request's latency budget
+    (a model with no observations yet is assumed to fit); failing that, to the fastest healthy model; and, if every model
+    is degraded, to the one with the lowest error rate. A request that fails is retried on the next candidate model.
+    """
+
+    DECISION_REASONS = ("preferred", "latency_budget", "fastest", "degraded_fallback", "error_fallback")
+
+    def __init__(self, marketing_image_genai_generators: Dict[str, MarketingImageImageGenerationOutputPort], ewma_alpha: float = 0.2, max_error_rate: float = 0.5, failure_threshold: int = 3, cooldown_seconds: float = 60.0):
+        if not marketing_image_genai_generators:
+            raise ValueError("At least one image generation model is required.")
+        self.generators = dict(marketing_image_genai_generators) # Ordered by preference
+        self.model_names = list(self.generators.keys())
+        self.ewma_alpha = float(ewma_alpha) if ewma_alpha else 0.2
+        self.max_error_rate = float(max_error_rate) if max_error_rate is not None else 0.5
+        self.failure_threshold = int(failure_threshold) if failure_threshold else 3
+        self.cooldown_seconds = float(cooldown_seconds) if cooldown_seconds is not None else 60.0
+        self._ewma_latency_ms: Dict[str, float] = {model_name: None for model_name in self.model_names}
+        self._ewma_error_rate: Dict[str, float] = {model_name: 0.0 for model_name in self.model_names}
+        self._consecutive_failures: Dict[str, int] = {model_name: 0 for model_name in self.model_names}
+        self._cooling_down_until: Dict[str, float] = {model_name: 0.0 for model_name in self.model_names}
+        self.in_flight_requests: Dict[str, int] = {model_name: 0 for model_name in self.model_names}
+        self.successes: Dict[str, int] = {model_name: 0 for model_name in self.model_names}
+        self.failures: Dict[str, int] = {model_name: 0 for model_name in self.model_names}
+        self.routing_decisions: Dict[str, Dict[str, int]] = {model_name: {reason: 0 for reason in self.DECISION_REASONS} for model_name in self.model_names}
+        self.budget_misses = 0
+
+    def is_degraded(self, model_name: str) -> bool:
+        """
+        Returns whether the model is cooling down after failing too often.
+        """
+        return self._cooling_down_until[model_name] > time.monotonic()
+
+    def _fits_latency_budget(self, model_name: str, latency_budget_ms: int) -> bool:
+        if latency_budget_ms is None or self._ewma_latency_ms[model_name] is None:
+            return True
+        return self._ewma_latency_ms[model_name] <= latency_budget_ms
+
+    def _rank_models(self, latency_budget_ms: int = None) -> List[Tuple[str, str]]:
+        """
+        Returns every model, with the reason it would be chosen, in the order they should be tried.
+        """
+        healthy_model_names = [model_name for model_name in self.model_names if not self.is_degraded(model_name)]
+        degraded_model_names = sorted((model_name for model_name in self.model_names if self.is_degraded(model_name)), key=lambda model_name: self._ewma_error_rate[model_name])
+
+        ranked_models = []
+        within_budget_model_names = [model_name for model_name in healthy_model_names if self._fits_latency_budget(model_name, latency_budget_ms)]
+        if within_budget_model_names:
+            first_model_name = within_budget_model_names[0]
+            reason = "preferred" if first_model_name == self.model_names[0] else "latency_budget"
+            ranked_models.append((first_model_name, reason))
+        # The remaining healthy models, fastest first (unobserved models sort last)
+        for model_name in sorted(healthy_model_names, key=lambda model_name: (self._ewma_latency_ms[model_name] is None, self._ewma_latency_ms[model_name] or 0.0)):
+            if model_name not in [ranked_model_name for ranked_model_name, _ in ranked_models]:
+                ranked_models.append((model_name, "fastest"))
+        for model_name in degraded_model_names:
+            ranked_models.append((model_name, "degraded_fallback"))
+        return ranked_models
+
+    def _record_success(self, model_name: str, latency_ms: float) -> None:
+        self.successes[model_name] += 1
+        self._consecutive_failures[model_name] = 0
+        previous_latency_ms = self._ewma_latency_ms[model_name]
+        self._ewma_latency_ms[model_name] = latency_ms if previous_latency_ms is None else self.ewma_alpha * latency_ms + (1 - self.ewma_alpha) * previous_latency_ms
+        self._ewma_error_rate[model_name] = (1 - self.ewma_alpha) * self._ewma_error_rate[model_name]
+
+    def _record_failure(self, model_name: str, error: BaseException) -> None:
+        self.failures[model_name] += 1
+        self._consecutive_failures[model_name] += 1
+        self._ewma_error_rate[model_name] = self.ewma_alpha + (1 - self.ewma_alpha) * self._ewma_error_rate[model_name]
+        print(f"Image generation with model '{model_name}' failed ({self._consecutive_failures[model_name]} in a row): {error}")
+        if (self._consecutive_failures[model_name] >= self.failure_threshold or self._ewma_error_rate[model_name] > self.max_error_rate) and len(self.model_names) > 1:
+            self._cooling_down_until[model_name] = time.monotonic() + self.cooldown_seconds
+            self._consecutive_failures[model_name] = 0
+            print(f"Warning: Routing image generation away from model '{model_name}' for {self.cooldown_seconds:g} seconds.")
+
+    async def _route(self, request: Callable[[MarketingImageImageGenerationOutputPort], Awaitable], latency_budget_ms: int = None):
+        """
+        Runs request(generator) against the best model for the latency budget, falling back to the next model on failure.
+        Raises the last error if the request fails with every model.
+        """
+        last_error: BaseException = None
+        for attempt, (model_name, reason) in enumerate(self._rank_models(latency_budget_ms)):
+            self.routing_decisions[model_name]["error_fallback" if attempt else reason] += 1
+            if attempt:
+                print(f"Falling back to image generation model '{model_name}'.")
+            started_at = time.monotonic()
+            self.in_flight_requests[model_name] += 1
+            try:
+                result = await request(self.generators[model_name])
+            except (asyncio.CancelledError, ImagePostProcessingOverloadedError):
+                raise # Post-processing capacity is not the model's fault, so it is neither recorded nor retried on another model
+            except Exception as e:
+                self._record_failure(model_name, e)
+                last_error = e
+                continue
+            finally:
+                self.in_flight_requests[model_name] -= 1
+            latency_ms = (time.monotonic() - started_at) * 1000
+            self._record_success(model_name, latency_ms)
+            if latency_budget_ms is not None and latency_ms > latency_budget_ms:
+                self.budget_misses += 1
+            return result
+        raise last_error
+
+    def describe_generation(self, prompt: str, min_dimensions: dict = None, max_dimensions: dict = None, mime_type: str = None) -> dict:
+        """
+        Describes the generation as the preferred model would perform it, so that generation cache lookups do not depend on routing.
+        A request served by another model returns that model's generation_model and generation_parameters, which the
+        generation cache and single-flight coalescing use instead, so one model's image is never reused for another.
+        """
+        return self.generators[self.model_names[0]].describe_generation(prompt, min_dimensions, max_dimensions, mime_type)
+
+    async def generate_marketing_image(self, prompt: str, min_dimensions: dict = None, max_dimensions: dict = None, mime_type: str = None, use_cache: bool = True, latency_budget_ms: int = None) -> dict:
+        """
+        Generates a marketing image with the model best able to meet the latency budget.
+        """
+        generator_kwargs = {"min_dimensions": min_dimensions, "max_dimensions": max_dimensions, "use_cache": use_cache}
+        if mime_type:
+            generator_kwargs["mime_type"] = mime_type
+
+        return await self._route(lambda generator: generator.generate_marketing_image(prompt=prompt, **generator_kwargs), latency_budget_ms)
+
+    async def generate_marketing_images(self, prompt: str, number_of_images: int, min_dimensions: dict = None, max_dimensions: dict = None, mime_type: str = None) -> List[dict]:
+        """
+        Generates several variants of a marketing image with a single model. Batches carry no latency budget, so they are
+        not routed by latency: they go to the first healthy model in preference order, falling back to the next on failure.
+        """
+        return await self._route(lambda generator: generator.generate_marketing_images(prompt=prompt, number_of_images=number_of_images, min_dimensions=min_dimensions, max_dimensions=max_dimensions, mime_type=mime_type))
+
+    async def register_stored_marketing_image(self, generation_result: dict, url: str, checksum: str, renditions: list = None) -> None:
+        await asyncio.gather(*[generator.register_stored_marketing_image(generation_result, url, checksum, renditions) for generator in self.generators.values()])
+
+    def get_metrics(self) -> dict:
+        """
+        Returns the routing decisions (per model and reason), and each model's EWMA latency, error rate and health.
+        """
+        now = time.monotonic()
+        return {
+            "budget_misses": self.budget_misses,
+            "models": {
+                model_name: {
+                    "routing_decisions": dict(self.routing_decisions[model_name]),
+                    "successes": self.successes[model_name],
+                    "failures": self.failures[model_name],
+                    "in_flight_requests": self.in_flight_requests[model_name],
+                    "ewma_latency_ms": round(self._ewma_latency_ms[model_name], 1) if self._ewma_latency_ms[model_name] is not None else None,
+                    "ewma_error_rate": round(self._ewma_error_rate[model_name], 3),
+                    "degraded": self.is_degraded(model_name),
+                    "cooldown_remaining_seconds": max(0.0, self._cooling_down_until[model_name] - now),
+                    "generator": self.generators[model_name].get_metrics() if hasattr(self.generators[model_name], "get_metrics") else None,
+                }
+                for model_name in self.model_names
+            },
+        }
@@ -0,0 +1,99 @@
+import asyncio
+from typing import List
+
+from .vertex_ai_image_model_quota_governor_registry import VertexAIImageModelQuotaGovernorRegistry
+
+from ....application.ports.generate_marketing_image_genai_output_port import MarketingImageImageGenerationOutputPort
+
+
+class MarketingImageImageGenerationRateLimitingAdapter(MarketingImageImageGenerationOutputPort):
+    """
+    Decorator implementation of the MarketingImageImageGenerationOutputPort that admits every upstream model request
+    through the quota governor for the wrapped generator's (project, location, model), so bursts queue briefly
+    or are shed with an ImageGenerationRateLimitedError rather than failing with a 429 from Vertex AI.
+
+    Governors come from the injected quota_governors registry, so every adapter given the same registry - the container
+    provides one - shares the governor of a (project, location, model), the granularity Vertex AI enforces its quotas at.
+    Without a registry, the adapter's governors are its own.
+
+    If the wrapped generator hedges and fails over across several locations (i.e. it has a multi_region_request_executor),
+    each location gets its own governor and the executor admits every attempt - the first request, each hedge, and each
+    failover - through the governor of the location it is sent to, instead of this adapter admitting the call as a whole.
+    """
+
+    def __init__(self, marketing_image_genai_generator: MarketingImageImageGenerationOutputPort, requests_per_minute: float, max_concurrent_requests: int = 4, max_queue_depth: int = 32, max_wait_seconds: float = 30.0, burst: int = None, quota_governors: VertexAIImageModelQuotaGovernorRegistry = None):
+        self.generator = marketing_image_genai_generator
+        self.quota_governors = quota_governors or VertexAIImageModelQuotaGovernorRegistry()
+        self.quota_key = (
+            str(getattr(marketing_image_genai_generator, "google_cloud_project", None)),
+            str(getattr(marketing_image_genai_generator, "ai_model_location", None)),
+            str(getattr(marketing_image_genai_generator, "ai_model_name", None)),
+        )
+        self.quota_governor = self.quota_governors.get_quota_governor(self.quota_key, requests_per_minute, max_concurrent_requests, max_queue_depth, max_wait_seconds, burst)
+        self.quota_governors_by_location = {self.quota_key[1]: self.quota_governor}
+        self.admits_each_location_request = False
+        multi_region_request_executor = getattr(marketing_image_genai_generator, "multi_region_request_executor", None)
+        if multi_region_request_executor is not None:
+            project, _, model = self.quota_key
+            for location in multi_region_request_executor.locations:
+                if location not in self.quota_governors_by_location:
+                    # Each region has its own quota, with the same limits as the primary's
+                    self.quota_governors_by_location[location] = self.quota_governors.get_quota_governor((project, location, model), requests_per_minute, max_concurrent_requests, max_queue_depth, max_wait_seconds, burst)
+            multi_region_request_executor.set_quota_governors(self.quota_governors_by_location)
+            self.admits_each_location_request = True
+        # Number of images the wrapped model returns from a single request (e.g. Imagen returns up to 4)
+        self.max_number_of_images_per_request = getattr(marketing_image_genai_generator, "MAX_NUMBER_OF_IMAGES_PER_REQUEST", 1)
+
+    def describe_generation(self, prompt: str, min_dimensions: dict = None, max_dimensions: dict = None, mime_type: str = None) -> dict:
+        """
+        Describes the generation that the wrapped generator would perform.
+        """
+        return self.generator.describe_generation(prompt, min_dimensions, max_dimensions, mime_type)
+
+    async def generate_marketing_image(self, prompt: str, min_dimensions: dict = None, max_dimensions: dict = None, mime_type: str = None, use_cache: bool = True, latency_budget_ms: int = None) -> dict:
+        """
+        Generates a marketing image using the wrapped generator once the model's quota governor admits the request.
+        Raises ImageGenerationRateLimitedError if the request is shed.
+        """
+        generator_kwargs = {"min_dimensions": min_dimensions, "max_dimensions": max_dimensions, "use_cache": use_cache}
+        if mime_type:
+            generator_kwargs["mime_type"] = mime_type
+        if latency_budget_ms is not None:
+            generator_kwargs["latency_budget_ms"] = latency_budget_ms
+
+        if self.admits_each_location_request:
+            return await self.generator.generate_marketing_image(prompt=prompt, **generator_kwargs)
+        async with self.quota_governor.acquire():
+            return await self.generator.generate_marketing_image(prompt=prompt, **generator_kwargs)
+
+    async def generate_marketing_images(self, prompt: str, number_of_images: int, min_dimensions: dict = None, max_dimensions: dict = None, mime_type: str = None) -> List[dict]:
+        """
+        Generates several variants of a marketing image, admitting each upstream model request separately.
+        Raises ImageGenerationRateLimitedError if any of the requests is shed.
+        """
+        if self.admits_each_location_request:
+            return await self.generator.generate_marketing_images(prompt=prompt, number_of_images=number_of_images, min_dimensions=min_dimensions, max_dimensions=max_dimensions, mime_type=mime_type)
+
+        request_sizes = [
+            min(self.max_number_of_images_per_request, number_of_images - offset)
+            for offset in range(0, number_of_images, self.max_number_of_images_per_request)
+        ]
+
+        async def _generate_admitted_marketing_images(request_size: int) -> List[dict]:
+            async with self.quota_governor.acquire():
+                return await self.generator.generate_marketing_images(prompt=prompt, number_of_images=request_size, min_dimensions=min_dimensions, max_dimensions=max_dimensions, mime_type=mime_type)
+
+        generated_marketing_image_lists = await asyncio.gather(*[_generate_admitted_marketing_images(request_size) for request_size in request_sizes])
+        return [generated_marketing_image for generated_marketing_image_list in generated_marketing_image_lists for generated_marketing_image in generated_marketing_image_list]
+
+    async def register_stored_marketing_image(self, generation_result: dict, url: str, checksum: str, renditions: list = None) -> None:
+        await self.generator.register_stored_marketing_image(generation_result, url, checksum, renditions)
+
+    def get_metrics(self) -> dict:
+        """
+        Returns the primary quota governor's queue depth and wait time metrics, and those of each location's governor.
+        """
+        return {
+            **self.quota_governor.get_metrics(),
+            "quota_governors_by_location": {location: quota_governor.get_metrics() for location, quota_governor in self.quota_governors_by_location.items()},
+        }
@@ -1,8 +1,9 @@
 import os
-import io
 from google import genai
 
 from ....application.ports.generate_marketing_image_genai_output_port import MarketingImageImageGenerationOutputPort
+from ....application.ports.image_post_processing_output_port import ImagePostProcessingOutputPort
+from ..image_processing.thread_pool_image_post_processing_adapter import ThreadPoolImagePostProcessingAdapter
 
 
 class MarketingImageGoogleGeminiFlash2dot5ImageGenAIAdapter(MarketingImageImageGenerationOutputPort):
@@ -17,7 +18,7 @@ class MarketingImageGoogleGeminiFlash2dot5ImageGenAIAdapter(MarketingImageImageG
     * Supported regions: global
     """
 
-    def __init__(self, google_cloud_project: str = None, ai_model_location: str = None, ai_model_name: str = None):
+    def __init__(self, google_cloud_project: str = None, ai_model_location: str = None, ai_model_name: str = None, image_post_processor: ImagePostProcessingOutputPort = None):
         if not google_cloud_project:
             self.google_cloud_project = os.getenv("GOOGLE_CLOUD_GENAI_IMAGE_ADAPTER_PROJECT", "rbal-assisted-prj1")
         else:
@@ -37,7 +38,22 @@ class MarketingImageGoogleGeminiFlash2dot5ImageGenAIAdapter(MarketingImageImageG
             vertexai=True, project=self.google_cloud_project, location=self.ai_model_location
         )
 
-    def generate_marketing_image(self, prompt: str, min_dimensions: dict = None, max_dimensions: dict = None, mime_type: str = "image/png") -> dict:
+        # Resizing and re-encoding are CPU-bound, so they are delegated to the image post-processing stage
+        self.image_post_processor = image_post_processor or ThreadPoolImagePostProcessingAdapter()
+
+    def describe_generation(self, prompt: str, min_dimensions: dict = None, max_dimensions: dict = None, mime_type: str = "image/png") -> dict:
+        """
+        Describes the generation that generate_marketing_image would perform for the same arguments, without calling the model.
+        """
+        return {
+            "generation_model": self.ai_model_name,
+            "generation_parameters": {
+                "number_of_images": 1,
+                "output_mime_type": mime_type or "image/png",
+            },
+        }
+
+    async def generate_marketing_image(self, prompt: str, min_dimensions: dict = None, max_dimensions: dict = None, mime_type: str = "image/png", use_cache: bool = True, latency_budget_ms: int = None) -> dict:
         """
         Generates a marketing image using AI.
 
@@ -46,6 +62,8 @@ class MarketingImageGoogleGeminiFlash2dot5ImageGenAIAdapter(MarketingImageImageG
             mime_type: The MIME type of the generated image - e.g. "image/png" "image/jpeg".
             min_dimensions: A dictionary containing the minimum dimensions of the generated image (height, width).
             max_dimensions: A dictionary containing the maximum dimensions of the generated image (height, width).
+            use_cache: Ignored by this adapter - caching is handled by decorators.
+            latency_budget_ms: Ignored by this adapter - routing is handled by decorators.
 
         Returns:
             A dictionary containing:
@@ -56,12 +74,9 @@ class MarketingImageGoogleGeminiFlash2dot5ImageGenAIAdapter(MarketingImageImageG
                 generation_parameters: A dictionary containing the parameters used for generation.
         """
 
-        generation_parameters = {
-            "number_of_images": 1,
-            "output_mime_type": mime_type,
-        }
-        
-        response = self.genai_client.models.generate_content(model=self.ai_model_name, contents=prompt)
+        generation_parameters = self.describe_generation(prompt, min_dimensions, max_dimensions, mime_type)["generation_parameters"]
+
+        response = await self.genai_client.aio.models.generate_content(model=self.ai_model_name, contents=prompt)
 
         image_parts = [
             part.inline_data.data
@@ -75,28 +90,16 @@ class MarketingImageGoogleGeminiFlash2dot5ImageGenAIAdapter(MarketingImageImageG
         generated_image_bytes = image_parts[0]
         print(f"Generated image with size {len(generated_image_bytes)} bytes")
 
-        img_width, img_height = 0, 0
-
-        try:
-            from PIL import Image as PILImage
-
-            with PILImage.open(io.BytesIO(generated_image_bytes)) as pil_image:
-                img_width, img_height = pil_image.size
-
-        except ImportError:
-            print("Warning: Pillow (PIL) is not installed. Cannot determine image dimensions. Returning raw image data.")
-            pass
-        except Exception as e:
-            print(f"Warning: Could not process image with Pillow: {e}. Returning raw image data.")
-            pass
+        # Resizing and re-encoding (only when max_dimensions or the MIME type require it) are delegated to the image post-processing stage
+        post_processed_image = await self.image_post_processor.process_image(generated_image_bytes, {"mime_type": mime_type, "max_dimensions": max_dimensions})
 
         return {
-            "image_data": generated_image_bytes,
-            "mime_type": "image/png",
+            "image_data": post_processed_image["image_data"],
+            "mime_type": post_processed_image["mime_type"],
             "generation_model": self.ai_model_name,
             "image_dimensions": {
-                "height": img_height,
-                "width": img_width,
+                "height": post_processed_image["height"],
+                "width": post_processed_image["width"],
             },
             "generation_parameters": generation_parameters,
-        }
\ No newline at end of file
+        }
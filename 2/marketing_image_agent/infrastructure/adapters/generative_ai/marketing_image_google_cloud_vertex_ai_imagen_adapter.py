@@ -1,9 +1,12 @@
 import os
-import io
+import asyncio
 from google import genai
 from google.genai import types as genai_types
 
 from ....application.ports.generate_marketing_image_genai_output_port import MarketingImageImageGenerationOutputPort
+from ....application.ports.image_post_processing_output_port import ImagePostProcessingOutputPort
+from ..image_processing.thread_pool_image_post_processing_adapter import ThreadPoolImagePostProcessingAdapter
+from .hedged_multi_region_request_executor import HedgedMultiRegionRequestExecutor
 
 
 class MarketingImageGoogleImagenGenAIAdapter(MarketingImageImageGenerationOutputPort):
@@ -21,9 +24,20 @@ class MarketingImageGoogleImagenGenAIAdapter(MarketingImageImageGenerationOutput
     DEFAULT_GENERATION_ASPECT_RATIO = "1:1"
     DEFAULT_GENERATION_WIDTH = 1024
     DEFAULT_GENERATION_HEIGHT = 1024
-
-
-    def __init__(self, google_cloud_project: str = None, ai_model_location: str = None, ai_model_name: str = None):
+    MAX_NUMBER_OF_IMAGES_PER_REQUEST = 4
+
+
+    def __init__(
+        self,
+        google_cloud_project: str = None,
+        ai_model_location: str = None,
+        ai_model_name: str = None,
+        image_post_processor: ImagePostProcessingOutputPort = None,
+        ai_model_locations: list | str = None,
+        hedge_delay_seconds: float | str = "p95",
+        location_failure_threshold: int = 3,
+        location_cooldown_seconds: float = 60.0,
+    ):
         if not google_cloud_project:
             self.google_cloud_project = os.getenv("GOOGLE_CLOUD_GENAI_IMAGE_ADAPTER_PROJECT", "rbal-assisted-prj1")
         else:
@@ -38,14 +52,32 @@ class MarketingImageGoogleImagenGenAIAdapter(MarketingImageImageGenerationOutput
             self.ai_model_name = os.getenv("GOOGLE_CLOUD_GENAI_IMAGEN_IMAGE_ADAPTER_MODEL_NAME", "imagen-4.0-fast-generate-001")
         else:
             self.ai_model_name = ai_model_name
-        
-        self.genai_images_client = genai.Client(
-            vertexai=True,
-            project=self.google_cloud_project,
-            location=self.ai_model_location,
-            http_options=genai_types.HttpOptions(api_version='v1')
+
+        # Ordered list of locations to hedge and fail over across - e.g. "europe-west4,europe-west1" - led by ai_model_location
+        if isinstance(ai_model_locations, str):
+            ai_model_locations = [location.strip() for location in ai_model_locations.split(",") if location.strip()]
+        self.ai_model_locations = list(dict.fromkeys([self.ai_model_location, *(ai_model_locations or [])]))
+
+        self.genai_images_clients = {
+            location: genai.Client(
+                vertexai=True,
+                project=self.google_cloud_project,
+                location=location,
+                http_options=genai_types.HttpOptions(api_version='v1')
+            )
+            for location in self.ai_model_locations
+        }
+        self.genai_images_client = self.genai_images_clients[self.ai_model_location]
+        self.multi_region_request_executor = HedgedMultiRegionRequestExecutor(
+            locations=self.ai_model_locations,
+            hedge_delay_seconds=hedge_delay_seconds,
+            failure_threshold=location_failure_threshold,
+            cooldown_seconds=location_cooldown_seconds,
         )
 
+        # Resizing and re-encoding are CPU-bound, so they are delegated to the image post-processing stage
+        self.image_post_processor = image_post_processor or ThreadPoolImagePostProcessingAdapter()
+
     def _get_closest_generation_aspect_ratio_and_dimensions(self, min_dimensions: dict = None, max_dimensions: dict = None) -> tuple[int, int, str]:
         """
         Determines the closest supported aspect ratio string and its corresponding "1K" dimensions
@@ -82,7 +114,33 @@ class MarketingImageGoogleImagenGenAIAdapter(MarketingImageImageGenerationOutput
         chosen_width, chosen_height = self.SUPPORTED_GENERATION_DIMENSIONS[closest_ar_str]
         return chosen_width, chosen_height, closest_ar_str
 
-    def generate_marketing_image(self, prompt: str, min_dimensions: dict = None, max_dimensions: dict = None, mime_type: str = "image/png") -> dict:
+    def _build_generation_parameters(self, min_dimensions: dict = None, max_dimensions: dict = None, mime_type: str = "image/png", number_of_images: int = 1) -> tuple[int, int, str, dict]:
+        """
+        Builds the Imagen generation parameters for the given dimensions and MIME type.
+        Returns (width, height, aspect_ratio_string, generation_parameters).
+        """
+        generated_width, generated_height, aspect_ratio_for_generation = self._get_closest_generation_aspect_ratio_and_dimensions(min_dimensions, max_dimensions)
+
+        generation_parameters = {
+            "number_of_images": number_of_images,
+            "image_size": "1K", # This implies the largest dimension will be 1024, and the other scaled by aspect_ratio
+            "aspect_ratio": aspect_ratio_for_generation,
+            "person_generation": "allow_adult",
+            "output_mime_type": mime_type,
+        }
+        return generated_width, generated_height, aspect_ratio_for_generation, generation_parameters
+
+    def describe_generation(self, prompt: str, min_dimensions: dict = None, max_dimensions: dict = None, mime_type: str = "image/png") -> dict:
+        """
+        Describes the generation that generate_marketing_image would perform for the same arguments, without calling the model.
+        """
+        _, _, _, generation_parameters = self._build_generation_parameters(min_dimensions, max_dimensions, mime_type or "image/png")
+        return {
+            "generation_model": self.ai_model_name,
+            "generation_parameters": generation_parameters,
+        }
+
+    async def generate_marketing_image(self, prompt: str, min_dimensions: dict = None, max_dimensions: dict = None, mime_type: str = "image/png", use_cache: bool = True, latency_budget_ms: int = None) -> dict:
         """
         Generates a marketing image using AI.
 
@@ -91,6 +149,8 @@ class MarketingImageGoogleImagenGenAIAdapter(MarketingImageImageGenerationOutput
             min_dimensions: The minimum dimensions of the generated image.
             max_dimensions: The maximum dimensions of the generated image.
             mime_type: The MIME type of the generated image - e.g. "image/png" "image/jpeg".
+            use_cache: Ignored by this adapter - caching is handled by decorators.
+            latency_budget_ms: Ignored by this adapter - routing is handled by decorators.
 
         Returns:
             A dictionary containing:
@@ -100,79 +160,73 @@ class MarketingImageGoogleImagenGenAIAdapter(MarketingImageImageGenerationOutput
                 image_dimensions: A dictionary containing the dimensions of th generated marketing image (height, width).
                 generation_parameters: A dictionary containing the parameters used for generation.
         """
-        # Determine the aspect ratio and actual dimensions for the AI generatin
-        generated_width, generated_height, aspect_ratio_for_generation = self._get_closest_generation_aspect_ratio_and_dimensions(min_dimensions, max_dimensions)
+        generated_marketing_images = await self._generate_marketing_images(prompt, 1, min_dimensions, max_dimensions, mime_type)
+        return generated_marketing_images[0]
 
-        generation_parameters = {
-            "number_of_images": 1,
-            "image_size": "1K", # This implies the largest dimension will be 1024, and the other scaled by aspect_ratio
-            "aspect_ratio": aspect_ratio_for_generation,
-            "person_generation": "allow_adult",
-            "output_mime_type": mime_type,
-        }
+    async def generate_marketing_images(self, prompt: str, number_of_images: int, min_dimensions: dict = None, max_dimensions: dict = None, mime_type: str = "image/png") -> list[dict]:
+        """
+        Generates several variants of a marketing image from one prompt.
+        Imagen returns up to MAX_NUMBER_OF_IMAGES_PER_REQUEST images per request, so larger batches are split into concurrent requests.
 
-        response = self.genai_images_client.models.generate_images(
-            model=self.ai_model_name,
-            prompt=prompt,
-            config=genai_types.GenerateImagesConfig(**generation_parameters),
+        Returns:
+            A list of dictionaries, one per image, in the same form as generate_marketing_image.
+        """
+        mime_type = mime_type or "image/png"
+        request_sizes = [
+            min(self.MAX_NUMBER_OF_IMAGES_PER_REQUEST, number_of_images - offset)
+            for offset in range(0, number_of_images, self.MAX_NUMBER_OF_IMAGES_PER_REQUEST)
+        ]
+        generated_marketing_image_lists = await asyncio.gather(
+            *[self._generate_marketing_images(prompt, request_size, min_dimensions, max_dimensions, mime_type) for request_size in request_sizes]
         )
+        return [generated_marketing_image for generated_marketing_image_list in generated_marketing_image_lists for generated_marketing_image in generated_marketing_image_list]
 
-        generated_image = response.generated_images[0]
-        generated_image_image_bytes = generated_image.image.image_bytes
-        generated_image_mime_type = generated_image.image.mime_type
-        print(f"Generated image with size {len(generated_image_image_bytes)} bytes and MIME type {generated_image_mime_type}")
-
-        # Get image dimensions from the generated image data
-        # The model should have generated an image with dimensions (generated_width, generated_height)
-        # based on the aspect_ratio_for_generation and image_size="1K".
-        img_width, img_height = generated_width, generated_height # Assume generated dimensions match our chosen ones
-        pil_image = None # Initialise pil_image
-        try:
-            from PIL import Image as PILImage
-            from PIL import ImageOps as PILImageOps
-            pil_image = PILImage.open(io.BytesIO(generated_image.image.image_bytes))
-            
-            # Verify actual generated dimensions
-            actual_gen_width, actual_gen_height = pil_image.size
-            if actual_gen_width != generated_width or actual_gen_height != generated_height:
-                print(f"Warning: Generated image dimensions ({actual_gen_width}x{actual_gen_height}) do not match expected ({generated_width}x{generated_height}) for aspect ratio {aspect_ratio_for_generation}. Using actual.")
-                img_width, img_height = actual_gen_width, actual_gen_height
-
-            # Apply post-generation resizing if max_dimensions are provided and the generated image exceeds them
-            if max_dimensions and max_dimensions.get("width") and max_dimensions.get("height"):
-                max_w = max_dimensions["width"]
-                max_h = max_dimensions["height"]
-                if img_width > max_w or img_height > max_h:
-                    pil_image = PILImageOps.contain(pil_image, (max_w, max_h))
-                    img_width, img_height = pil_image.size # Update dimensions after resize
-        except ImportError:
-            # PIL not installed, dimensions will remain as assumed generated_width, generated_height
-            pass
-
-        # Convert the final PIL image to bytes
-        image_data = None
-        if pil_image: # Only proceed if PIL image was successfully created
-            with io.BytesIO() as output:
-                format_str = mime_type.split('/')[-1].upper()
-                if format_str == "JPG": # PIL uses JPEG for image/jpeg
-                    format_str = "JPEG"
-                try:
-                    pil_image.save(output, format=format_str)
-                except KeyError: # Fallback if format_str is not directly supported by PIL save
-                    print(f"Warning: PIL does not directly support saving to format '{format_str}'. Attempting PNG.")
-                    pil_image.save(output, format="PNG") # Default to PNG
-                image_data = output.getvalue()
-        else:
-            # Fallback to raw data if PIL processing was skipped (e.g. due to ImportError or if PIL is not installed)
-            image_data = generated_image_image_bytes # Use the original generated bytes
+    async def _generate_marketing_images(self, prompt: str, number_of_images: int, min_dimensions: dict = None, max_dimensions: dict = None, mime_type: str = "image/png") -> list[dict]:
+        """
+        Makes a single Imagen request for number_of_images images and post-processes them concurrently.
+        """
+        # Determine the aspect ratio and actual dimensions for the AI generation
+        generated_width, generated_height, aspect_ratio_for_generation, generation_parameters = self._build_generation_parameters(min_dimensions, max_dimensions, mime_type, number_of_images)
+
+        async def _generate_images_in_location(location: str):
+            response = await self.genai_images_clients[location].aio.models.generate_images(
+                model=self.ai_model_name,
+                prompt=prompt,
+                config=genai_types.GenerateImagesConfig(**generation_parameters),
+            )
+            if not response.generated_images:
+                raise ValueError(f"Image generation failed, no image data received from the API in {location}.")
+            print(f"Generated {len(response.generated_images)} image(s) in {location} with sizes {[len(generated_image.image.image_bytes) for generated_image in response.generated_images]} bytes")
+            return response
+
+        # Hedged across, and failed over between, the configured locations (each attempt admitted by its location's quota governor, if set)
+        response = await self.multi_region_request_executor.run(_generate_images_in_location)
+
+        transform_spec = {"mime_type": mime_type, "max_dimensions": max_dimensions}
+        post_processed_images = await asyncio.gather(
+            *[self.image_post_processor.process_image(generated_image.image.image_bytes, transform_spec) for generated_image in response.generated_images]
+        )
 
-        return {
-            "image_data": image_data,
-            "mime_type": mime_type,
-            "generation_model": self.ai_model_name,
-            "image_dimensions": {
-                "height": img_height,
-                "width": img_width,
-            },
-            "generation_parameters": generation_parameters,
-        }
\ No newline at end of file
+        for post_processed_image in post_processed_images:
+            if not post_processed_image["transformed"] and (post_processed_image["width"] != generated_width or post_processed_image["height"] != generated_height):
+                print(f"Warning: Generated image dimensions ({post_processed_image['width']}x{post_processed_image['height']}) do not match expected ({generated_width}x{generated_height}) for aspect ratio {aspect_ratio_for_generation}. Using actual.")
+
+        return [
+            {
+                "image_data": post_processed_image["image_data"],
+                "mime_type": post_processed_image["mime_type"],
+                "generation_model": self.ai_model_name,
+                "image_dimensions": {
+                    "height": post_processed_image["height"],
+                    "width": post_processed_image["width"],
+                },
+                "generation_parameters": generation_parameters,
+            }
+            for post_processed_image in post_processed_images
+        ]
+
+    def get_metrics(self) -> dict:
+        """
+        Returns the hedging and failover metrics, including the health of each location.
+        """
+        return self.multi_region_request_executor.get_metrics()
@@ -0,0 +1,224 @@
+import asyncio
+import hashlib
+import io
+import math
+import random
+
+from ....application.ports.generate_marketing_image_genai_output_port import MarketingImageImageGenerationOutputPort
+from ....application.ports.image_post_processing_output_port import ImagePostProcessingOutputPort
+from ..image_processing.thread_pool_image_post_processing_adapter import ThreadPoolImagePostProcessingAdapter
+
+
+class MarketingImageSyntheticGenAIAdapter(MarketingImageImageGenerationOutputPort):
+    """
+    This class implements the interface for generating marketing images offline, for load testing and benchmarking.
+
+    Images are drawn procedurally from a hash of the prompt and generation parameters, so the same request always
+    produces the same image, at the dimensions Imagen would produce for the requested aspect ratio. Response latency
+    follows a log-normal distribution (set by its median and p95), and a fraction of requests can be failed on purpose,
+    so that timeouts, rate limiting, hedging and routing behave as they would against Vertex AI.
+    """
+
+    SUPPORTED_GENERATION_DIMENSIONS = {
+        "1:1": (1024, 1024),
+        "4:3": (1024, 768),
+        "3:4": (768, 1024),
+        "16:9": (1024, 576),
+        "9:16": (576, 1024),
+    }
+    DEFAULT_GENERATION_ASPECT_RATIO = "1:1"
+    MAX_NUMBER_OF_IMAGES_PER_REQUEST = 4
+    NUMBER_OF_SHAPES = 12
+    P95_Z_SCORE = 1.6449
+
+
+    def __init__(
+        self,
+        ai_model_name: str = None,
+        image_post_processor: ImagePostProcessingOutputPort = None,
+        latency_median_ms: float = 3000.0,
+        latency_p95_ms: float = 6000.0,
+        error_rate: float = 0.0,
+        random_seed: int = None,
+    ):
+        self.google_cloud_project = "local"
+        self.ai_model_location = "local"
+        self.ai_model_name = ai_model_name or "synthetic-image-001"
+
+        self.latency_median_ms = float(latency_median_ms) if latency_median_ms is not None else 3000.0
+        self.latency_p95_ms = max(self.latency_median_ms, float(latency_p95_ms) if latency_p95_ms is not None else 6000.0)
+        self.error_rate = float(error_rate) if error_rate else 0.0
+        if not 0.0 <= self.error_rate <= 1.0:
+            raise ValueError(f"error_rate must be between 0 and 1, got {error_rate}.")
+        # Latency and error injection are random (but repeatable given a seed); the images themselves depend only on the request
+        self.random = random.Random(random_seed)
+
+        # Resizing and re-encoding are CPU-bound, so they are delegated to the image post-processing stage
+        self.image_post_processor = image_post_processor or ThreadPoolImagePostProcessingAdapter()
+
+        self.requests = 0
+        self.injected_errors = 0
+
+    def _get_closest_generation_aspect_ratio_and_dimensions(self, min_dimensions: dict = None, max_dimensions: dict = None) -> tuple[int, int, str]:
+        """
+        Determines the closest supported aspect ratio string and its corresponding dimensions, as the Imagen adapter does.
+        Returns (width, height, aspect_ratio_string) for generation.
+        """
+        target_dimensions = max_dimensions if max_dimensions and max_dimensions.get("width") and max_dimensions.get("height") else min_dimensions
+        if not target_dimensions or not target_dimensions.get("width") or not target_dimensions.get("height"):
+            width, height = self.SUPPORTED_GENERATION_DIMENSIONS[self.DEFAULT_GENERATION_ASPECT_RATIO]
+            return width, height, self.DEFAULT_GENERATION_ASPECT_RATIO
+
+        input_ratio = target_dimensions["width"] / target_dimensions["height"]
+        closest_ar_str = min(self.SUPPORTED_GENERATION_DIMENSIONS, key=lambda ar_str: abs(input_ratio - self.SUPPORTED_GENERATION_DIMENSIONS[ar_str][0] / self.SUPPORTED_GENERATION_DIMENSIONS[ar_str][1]))
+        chosen_width, chosen_height = self.SUPPORTED_GENERATION_DIMENSIONS[closest_ar_str]
+        return chosen_width, chosen_height, closest_ar_str
+
+    def _build_generation_parameters(self, min_dimensions: dict = None, max_dimensions: dict = None, mime_type: str = "image/png", number_of_images: int = 1) -> tuple[int, int, str, dict]:
+        """
+        Builds the generation parameters for the given dimensions and MIME type.
+        Returns (width, height, aspect_ratio_string, generation_parameters).
+        """
+        generated_width, generated_height, aspect_ratio_for_generation = self._get_closest_generation_aspect_ratio_and_dimensions(min_dimensions, max_dimensions)
+
+        generation_parameters = {
+            "number_of_images": number_of_images,
+            "image_size": "1K",
+            "aspect_ratio": aspect_ratio_for_generation,
+            "output_mime_type": mime_type,
+        }
+        return generated_width, generated_height, aspect_ratio_for_generation, generation_parameters
+
+    def describe_generation(self, prompt: str, min_dimensions: dict = None, max_dimensions: dict = None, mime_type: str = "image/png") -> dict:
+        """
+        Describes the generation that generate_marketing_image would perform for the same arguments.
+        """
+        _, _, _, generation_parameters = self._build_generation_parameters(min_dimensions, max_dimensions, mime_type or "image/png")
+        return {
+            "generation_model": self.ai_model_name,
+            "generation_parameters": generation_parameters,
+        }
+
+    def _sample_latency_seconds(self) -> float:
+        """
+        Samples a response latency from a log-normal distribution with the configured median and p95.
+        """
+        if self.latency_median_ms <= 0:
+            return 0.0
+        sigma = math.log(self.latency_p95_ms / self.latency_median_ms) / self.P95_Z_SCORE
+        return self.random.lognormvariate(math.log(self.latency_median_ms), sigma) / 1000
+
+    @staticmethod
+    def _draw_image(seed: bytes, width: int, height: int) -> bytes:
+        """
+        Draws a gradient background with overlapping shapes, all derived from the seed, and returns it PNG-encoded.
+        """
+        from PIL import Image, ImageDraw
+
+        seeded_random = random.Random(seed)
+        start_colour = tuple(seeded_random.randrange(256) for _ in range(3))
+        end_colour = tuple(seeded_random.randrange(256) for _ in range(3))
+
+        # A vertical gradient, built from a 1-pixel-wide strip rather than pixel by pixel
+        gradient = Image.new("RGB", (1, height))
+        gradient.putdata([tuple(start_colour[channel] + (end_colour[channel] - start_colour[channel]) * y // max(1, height - 1) for channel in range(3)) for y in range(height)])
+        image = gradient.resize((width, height))
+
+        draw = ImageDraw.Draw(image, "RGBA")
+        for _ in range(MarketingImageSyntheticGenAIAdapter.NUMBER_OF_SHAPES):
+            x0, y0 = seeded_random.randrange(width), seeded_random.randrange(height)
+            x1, y1 = x0 + seeded_random.randrange(width // 8, width // 2), y0 + seeded_random.randrange(height // 8, height // 2)
+            fill = tuple(seeded_random.randrange(256) for _ in range(3)) + (seeded_random.randrange(96, 224),)
+            if seeded_random.random() < 0.5:
+                draw.ellipse((x0, y0, x1, y1), fill=fill)
+            else:
+                draw.rectangle((x0, y0, x1, y1), fill=fill)
+
+        output_buffer = io.BytesIO()
+        image.save(output_buffer, format="PNG")
+        return output_buffer.getvalue()
+
+    async def generate_marketing_image(self, prompt: str, min_dimensions: dict = None, max_dimensions: dict = None, mime_type: str = "image/png", use_cache: bool = True, latency_budget_ms: int = None) -> dict:
+        """
+        Generates a synthetic marketing image.
+
+        Args:
+            prompt: The prompt to generate the marketing image.
+            min_dimensions: The minimum dimensions of the generated image.
+            max_dimensions: The maximum dimensions of the generated image.
+            mime_type: The MIME type of the generated image - e.g. "image/png" "image/jpeg".
+            use_cache: Ignored by this adapter - caching is handled by decorators.
+            latency_budget_ms: Ignored by this adapter - routing is handled by decorators.
+
+        Returns:
+            A dictionary in the same form as the Vertex AI adapters return.
+        """
+        generated_marketing_images = await self._generate_marketing_images(prompt, 1, min_dimensions, max_dimensions, mime_type)
+        return generated_marketing_images[0]
+
+    async def generate_marketing_images(self, prompt: str, number_of_images: int, min_dimensions: dict = None, max_dimensions: dict = None, mime_type: str = "image/png") -> list[dict]:
+        """
+        Generates several distinct (but deterministic) variants of a synthetic marketing image from one prompt,
+        split into requests of at most MAX_NUMBER_OF_IMAGES_PER_REQUEST as for Imagen.
+        """
+        mime_type = mime_type or "image/png"
+        request_sizes = [
+            min(self.MAX_NUMBER_OF_IMAGES_PER_REQUEST, number_of_images - offset)
+            for offset in range(0, number_of_images, self.MAX_NUMBER_OF_IMAGES_PER_REQUEST)
+        ]
+        generated_marketing_image_lists = await asyncio.gather(
+            *[self._generate_marketing_images(prompt, request_size, min_dimensions, max_dimensions, mime_type, first_variant=offset)
+              for offset, request_size in zip(range(0, number_of_images, self.MAX_NUMBER_OF_IMAGES_PER_REQUEST), request_sizes)]
+        )
+        return [generated_marketing_image for generated_marketing_image_list in generated_marketing_image_lists for generated_marketing_image in generated_marketing_image_list]
+
+    async def _generate_marketing_images(self, prompt: str, number_of_images: int, min_dimensions: dict = None, max_dimensions: dict = None, mime_type: str = "image/png", first_variant: int = 0) -> list[dict]:
+        """
+        Simulates a single model request for number_of_images images and post-processes them concurrently.
+        """
+        mime_type = mime_type or "image/png"
+        generated_width, generated_height, aspect_ratio_for_generation, generation_parameters = self._build_generation_parameters(min_dimensions, max_dimensions, mime_type, number_of_images)
+
+        self.requests += 1
+        await asyncio.sleep(self._sample_latency_seconds())
+        if self.random.random() < self.error_rate:
+            self.injected_errors += 1
+            raise RuntimeError("503 UNAVAILABLE. Injected error from the synthetic image generation model.")
+
+        image_seeds = [
+            hashlib.sha256(f"{self.ai_model_name}|{prompt}|{aspect_ratio_for_generation}|{first_variant + variant}".encode("utf-8")).digest()
+            for variant in range(number_of_images)
+        ]
+        generated_images = await asyncio.gather(*[asyncio.to_thread(self._draw_image, image_seed, generated_width, generated_height) for image_seed in image_seeds])
+        print(f"Generated {len(generated_images)} synthetic image(s) with sizes {[len(generated_image) for generated_image in generated_images]} bytes")
+
+        transform_spec = {"mime_type": mime_type, "max_dimensions": max_dimensions}
+        post_processed_images = await asyncio.gather(
+            *[self.image_post_processor.process_image(generated_image, transform_spec) for generated_image in generated_images]
+        )
+
+        return [
+            {
+                "image_data": post_processed_image["image_data"],
+                "mime_type": post_processed_image["mime_type"],
+                "generation_model": self.ai_model_name,
+                "image_dimensions": {
+                    "height": post_processed_image["height"],
+                    "width": post_processed_image["width"],
+                },
+                "generation_parameters": generation_parameters,
+            }
+            for post_processed_image in post_processed_images
+        ]
+
+    def get_metrics(self) -> dict:
+        """
+        Returns the number of simulated requests and injected errors.
+        """
+        return {
+            "requests": self.requests,
+            "injected_errors": self.injected_errors,
+            "latency_median_ms": self.latency_median_ms,
+            "latency_p95_ms": self.latency_p95_ms,
+            "error_rate": self.error_rate,
+        }
@@ -0,0 +1,176 @@
+import asyncio
+import threading
+import time
+import weakref
+from collections import deque
+from contextlib import asynccontextmanager
+from typing import Tuple
+
+from ....application.exceptions.image_generation_rate_limited_error import ImageGenerationRateLimitedError
+
+
+class VertexAIImageModelQuotaGovernor:
+    """
+    Admission control for one Vertex AI image model quota - i.e. one (project, location, model).
+
+    Combines a semaphore (max_concurrent_requests) with a token bucket (requests_per_minute, refilled continuously,
+    holding at most burst tokens). Requests queue in arrival order for at most max_wait_seconds; a request that cannot be
+    admitted by its deadline, or that arrives when max_queue_depth requests are already queued, is shed with an
+    ImageGenerationRateLimitedError instead of being sent to the model and failing with a 429.
+
+    A request takes its concurrency slot first and a token last, in the same step that admits it, so a request that is
+    shed or cancelled while it waits never uses up quota. The token bucket is shared by every caller, but asyncio
+    primitives belong to one event loop, so the lock and semaphore are created in each running loop that uses the governor.
+    """
+
+    RECENT_WAIT_TIMES_WINDOW = 1024
+
+    def __init__(self, quota_key: tuple, requests_per_minute: float, max_concurrent_requests: int = 4, max_queue_depth: int = 32, max_wait_seconds: float = 30.0, burst: int = None):
+        if not requests_per_minute or float(requests_per_minute) <= 0:
+            raise ValueError(f"requests_per_minute must be positive, got {requests_per_minute}.")
+        self.quota_key = quota_key
+        self.requests_per_minute = float(requests_per_minute)
+        self.max_concurrent_requests = int(max_concurrent_requests) if max_concurrent_requests else 4
+        self.max_queue_depth = int(max_queue_depth) if max_queue_depth else 32
+        self.max_wait_seconds = float(max_wait_seconds) if max_wait_seconds else 30.0
+        self.burst = int(burst) if burst else self.max_concurrent_requests
+        self._tokens_per_second = self.requests_per_minute / 60.0
+        self._tokens = float(self.burst)
+        self._last_refill = time.monotonic()
+        self._lock = threading.Lock() # Guards the token bucket and the counters, which every event loop shares
+        self._primitives_by_loop: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Tuple[asyncio.Lock, asyncio.Semaphore]]" = weakref.WeakKeyDictionary()
+        self.queued_requests = 0
+        self.peak_queued_requests = 0
+        self.in_flight_requests = 0
+        self.admitted_requests = 0
+        self.shed_requests = 0
+        self.timed_out_requests = 0
+        self.total_wait_seconds = 0.0
+        self.max_wait_seconds_observed = 0.0
+        self._recent_wait_times = deque(maxlen=self.RECENT_WAIT_TIMES_WINDOW)
+
+    def _loop_primitives(self) -> Tuple[asyncio.Lock, asyncio.Semaphore]:
+        """
+        Returns the token lock and concurrency semaphore of the running event loop, creating them in it on first use.
+        """
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            primitives = self._primitives_by_loop.get(loop)
+            if primitives is None:
+                primitives = (asyncio.Lock(), asyncio.Semaphore(self.max_concurrent_requests))
+                self._primitives_by_loop[loop] = primitives
+            return primitives
+
+    def _refill_tokens(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(float(self.burst), self._tokens + (now - self._last_refill) * self._tokens_per_second)
+        self._last_refill = now
+
+    def _shed(self, reason: str, retry_after_seconds: float) -> ImageGenerationRateLimitedError:
+        project, location, model = self.quota_key
+        return ImageGenerationRateLimitedError(
+            f"Image generation capacity for model '{model}' in {project}/{location} is exhausted ({reason}). Please retry in about {max(1, round(retry_after_seconds))} second(s).",
+            quota_key=self.quota_key,
+            retry_after_seconds=retry_after_seconds,
+        )
+
+    async def _take_token(self, token_lock: asyncio.Lock, deadline: float) -> None:
+        """
+        Waits for a quota token and takes it. The token is only taken once it is available, so cancelling the wait costs nothing.
+        """
+        async with token_lock:
+            while True:
+                with self._lock:
+                    self._refill_tokens()
+                    if self._tokens >= 1.0:
+                        self._tokens -= 1.0
+                        return None
+                    refill_wait_seconds = (1.0 - self._tokens) / self._tokens_per_second
+                    if time.monotonic() + refill_wait_seconds > deadline:
+                        self.timed_out_requests += 1
+                        raise self._shed(f"the {self.requests_per_minute:g} requests per minute quota would be exceeded", refill_wait_seconds + (self.queued_requests - 1) / self._tokens_per_second)
+                await asyncio.sleep(refill_wait_seconds)
+
+    def can_admit_immediately(self) -> bool:
+        """
+        Returns whether a request would be admitted without waiting - i.e. no request is queued, and a quota token and
+        a concurrency slot are free. Used to decide whether an optional request, such as a hedge, is worth sending.
+        """
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            loop = None
+        with self._lock:
+            self._refill_tokens()
+            primitives = self._primitives_by_loop.get(loop) if loop is not None else None
+            concurrency_slot_free = primitives is None or not primitives[1].locked()
+            return self.queued_requests == 0 and self._tokens >= 1.0 and concurrency_slot_free
+
+    @asynccontextmanager
+    async def acquire(self):
+        """
+        Waits (without blocking the event loop) for a concurrency slot and then a quota token, and holds the slot for the duration of the block.
+        """
+        token_lock, concurrency_semaphore = self._loop_primitives()
+
+        with self._lock:
+            if self.queued_requests >= self.max_queue_depth:
+                self.shed_requests += 1
+                raise self._shed(f"{self.queued_requests} requests already queued", self.queued_requests / self._tokens_per_second)
+            self.queued_requests += 1
+            self.peak_queued_requests = max(self.peak_queued_requests, self.queued_requests)
+
+        queued_at = time.monotonic()
+        deadline = queued_at + self.max_wait_seconds
+        try:
+            try:
+                await asyncio.wait_for(concurrency_semaphore.acquire(), timeout=max(0.0, deadline - time.monotonic()))
+            except asyncio.TimeoutError:
+                with self._lock:
+                    self.timed_out_requests += 1
+                raise self._shed(f"all {self.max_concurrent_requests} concurrent request slots stayed busy", self.max_wait_seconds) from None
+            try:
+                await self._take_token(token_lock, deadline)
+            except BaseException:
+                # Shed or cancelled before it was admitted, so the slot goes to the next request
+                concurrency_semaphore.release()
+                raise
+        finally:
+            with self._lock:
+                self.queued_requests -= 1
+
+        wait_seconds = time.monotonic() - queued_at
+        with self._lock:
+            self.admitted_requests += 1
+            self.total_wait_seconds += wait_seconds
+            self.max_wait_seconds_observed = max(self.max_wait_seconds_observed, wait_seconds)
+            self._recent_wait_times.append(wait_seconds)
+            self.in_flight_requests += 1
+        try:
+            yield
+        finally:
+            with self._lock:
+                self.in_flight_requests -= 1
+            concurrency_semaphore.release()
+
+    def get_metrics(self) -> dict:
+        """
+        Returns the queue depth, in-flight, admitted, shed, and timed out request counts, and wait time statistics (in seconds).
+        """
+        with self._lock:
+            recent_wait_times = sorted(self._recent_wait_times)
+        return {
+            "quota_key": "/".join(self.quota_key),
+            "requests_per_minute": self.requests_per_minute,
+            "max_concurrent_requests": self.max_concurrent_requests,
+            "max_queue_depth": self.max_queue_depth,
+            "queued_requests": self.queued_requests,
+            "peak_queued_requests": self.peak_queued_requests,
+            "in_flight_requests": self.in_flight_requests,
+            "admitted_requests": self.admitted_requests,
+            "shed_requests": self.shed_requests,
+            "timed_out_requests": self.timed_out_requests,
+            "average_wait_seconds": (self.total_wait_seconds / self.admitted_requests) if self.admitted_requests else 0.0,
+            "p95_wait_seconds": recent_wait_times[int(0.95 * (len(recent_wait_times) - 1))] if recent_wait_times else 0.0,
+            "max_wait_seconds": self.max_wait_seconds_observed,
+        }
@@ -0,0 +1,42 @@
+import threading
+from typing import Dict, Tuple
+
+from .vertex_ai_image_model_quota_governor import VertexAIImageModelQuotaGovernor
+
+
+class VertexAIImageModelQuotaGovernorRegistry:
+    """
+    Holds one VertexAIImageModelQuotaGovernor per (project, location, model) - the granularity Vertex AI enforces its quotas at -
+    so that every rate-limiting adapter sharing the registry admits requests to the same model through the same governor.
+    Provided as a container-managed singleton, rather than held at class level, so its lifetime is the container's.
+    """
+
+    def __init__(self):
+        self._quota_governors: Dict[Tuple[str, str, str], VertexAIImageModelQuotaGovernor] = {}
+        self._lock = threading.Lock()
+
+    def get_quota_governor(self, quota_key: Tuple[str, str, str], requests_per_minute: float, max_concurrent_requests: int = 4, max_queue_depth: int = 32, max_wait_seconds: float = 30.0, burst: int = None) -> VertexAIImageModelQuotaGovernor:
+        """
+        Returns the governor of a quota, creating it with the given limits if it does not exist yet.
+        """
+        with self._lock:
+            quota_governor = self._quota_governors.get(quota_key)
+            if quota_governor is None:
+                quota_governor = VertexAIImageModelQuotaGovernor(
+                    quota_key=quota_key,
+                    requests_per_minute=requests_per_minute,
+                    max_concurrent_requests=max_concurrent_requests,
+                    max_queue_depth=max_queue_depth,
+                    max_wait_seconds=max_wait_seconds,
+                    burst=burst,
+                )
+                self._quota_governors[quota_key] = quota_governor
+            return quota_governor
+
+    def get_metrics(self) -> dict:
+        """
+        Returns each governor's metrics, keyed by project/location/model.
+        """
+        with self._lock:
+            quota_governors = list(self._quota_governors.values())
+        return {"/".join(quota_governor.quota_key): quota_governor.get_metrics() for quota_governor in quota_governors}
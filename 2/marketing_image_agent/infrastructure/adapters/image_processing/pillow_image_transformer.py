@@ -0,0 +1,136 @@
+import io
+from typing import List, Optional
+
+from ....shared.image_header_utils import ImageHeaderUtils
+
+
+class PillowImageTransformer:
+    """
+    Stateless image transforms used by the image post-processing adapters.
+    The methods are static so they can be pickled and run in worker processes.
+    """
+
+    MIME_TYPE_ALIASES = {"image/jpg": "image/jpeg"}
+
+    @staticmethod
+    def get_passthrough_image(image_data: bytes, transform_spec: dict) -> Optional[dict]:
+        """
+        Reads the dimensions and format of the image from its header (no decode).
+        Returns the result for the original bytes if they already satisfy the transform spec, otherwise None.
+        """
+        probed_image = ImageHeaderUtils.probe_image(image_data)
+        if probed_image is None:
+            return None
+
+        width, height, mime_type = probed_image
+        target_mime_type = transform_spec.get("mime_type") or mime_type
+        if mime_type != PillowImageTransformer.MIME_TYPE_ALIASES.get(target_mime_type, target_mime_type):
+            return None
+
+        max_dimensions = transform_spec.get("max_dimensions")
+        if max_dimensions and max_dimensions.get("width") and max_dimensions.get("height"):
+            if width > max_dimensions["width"] or height > max_dimensions["height"]:
+                return None
+
+        return {"image_data": image_data, "mime_type": mime_type, "width": width, "height": height, "transformed": False}
+
+    @staticmethod
+    def transform_image(image_data: bytes, transform_spec: dict) -> dict:
+        """
+        Decodes the image, resizes it to fit within max_dimensions if it exceeds them, and encodes it to the requested MIME type.
+        If Pillow is not installed, the original bytes are returned with their header dimensions (or 0 x 0).
+        """
+        return PillowImageTransformer.transform_image_renditions(image_data, [transform_spec], allow_passthrough=False)[0]
+
+    @staticmethod
+    def transform_image_renditions(image_data: bytes, transform_specs: List[dict], allow_passthrough: bool = True) -> List[dict]:
+        """
+        Decodes the image once and produces one result per transform spec. Specs the original bytes already satisfy
+        are passed through (unless allow_passthrough is False); the others are resized from the decoded image and encoded to their MIME type.
+        If Pillow is not installed, the original bytes are returned for every spec with their header dimensions (or 0 x 0).
+        """
+        results = [PillowImageTransformer.get_passthrough_image(image_data, transform_spec) if allow_passthrough else None for transform_spec in transform_specs]
+        if all(result is not None for result in results):
+            return results
+
+        try:
+            from PIL import Image as PILImage
+        except ImportError:
+            print("Warning: Pillow (PIL) is not installed. Returning the image unchanged.")
+            probed_image = ImageHeaderUtils.probe_image(image_data)
+            return [
+                result if result is not None else {
+                    "image_data": image_data,
+                    "mime_type": probed_image[2] if probed_image else (transform_spec.get("mime_type") or "image/png"),
+                    "width": probed_image[0] if probed_image else 0,
+                    "height": probed_image[1] if probed_image else 0,
+                    "transformed": False,
+                }
+                for result, transform_spec in zip(results, transform_specs)
+            ]
+
+        with PILImage.open(io.BytesIO(image_data)) as pil_image:
+            pil_image.load()
+            return [
+                result if result is not None else PillowImageTransformer._resize_and_encode(pil_image, transform_spec)
+                for result, transform_spec in zip(results, transform_specs)
+            ]
+
+    @staticmethod
+    def compute_difference_hash(image_data: bytes, hash_size: int = 8) -> Optional[str]:
+        """
+        Computes a difference hash (dHash) - i.e. whether each pixel of a hash_size x hash_size greyscale thumbnail
+        is brighter than its right-hand neighbour - formatted as "dhash:<hexadecimal>".
+        Visually similar images have hashes a small Hamming distance apart. Returns None if Pillow is not installed.
+        """
+        try:
+            from PIL import Image as PILImage
+        except ImportError:
+            print("Warning: Pillow (PIL) is not installed. Cannot compute a perceptual hash.")
+            return None
+
+        with PILImage.open(io.BytesIO(image_data)) as pil_image:
+            # draft() lets JPEG decoding skip straight to a reduced scale
+            pil_image.draft("L", (hash_size * 8, hash_size * 8))
+            thumbnail = pil_image.convert("L").resize((hash_size + 1, hash_size), PILImage.Resampling.LANCZOS)
+        pixels = thumbnail.tobytes()
+
+        difference_hash = 0
+        for row in range(hash_size):
+            row_offset = row * (hash_size + 1)
+            for column in range(hash_size):
+                difference_hash = (difference_hash << 1) | (pixels[row_offset + column] > pixels[row_offset + column + 1])
+        return f"dhash:{difference_hash:0{hash_size * hash_size // 4}x}"
+
+    @staticmethod
+    def _resize_and_encode(pil_image, transform_spec: dict) -> dict:
+        from PIL import ImageOps as PILImageOps
+
+        mime_type = transform_spec.get("mime_type") or "image/png"
+        max_dimensions = transform_spec.get("max_dimensions")
+
+        # Apply resizing if max_dimensions are provided and the image exceeds them
+        if max_dimensions and max_dimensions.get("width") and max_dimensions.get("height"):
+            max_w = max_dimensions["width"]
+            max_h = max_dimensions["height"]
+            if pil_image.width > max_w or pil_image.height > max_h:
+                pil_image = PILImageOps.contain(pil_image, (max_w, max_h))
+
+        width, height = pil_image.size
+
+        with io.BytesIO() as output:
+            format_str = mime_type.split('/')[-1].upper()
+            if format_str == "JPG": # PIL uses JPEG for image/jpeg
+                format_str = "JPEG"
+            if format_str == "JPEG" and pil_image.mode not in ("RGB", "L"):
+                pil_image = pil_image.convert("RGB")
+            save_kwargs = {"quality": transform_spec["quality"]} if transform_spec.get("quality") else {}
+            try:
+                pil_image.save(output, format=format_str, **save_kwargs)
+            except KeyError: # Fallback if format_str is not directly supported by PIL save
+                print(f"Warning: PIL does not directly support saving to format '{format_str}'. Attempting PNG.")
+                pil_image.save(output, format="PNG") # Default to PNG
+                format_str = "PNG"
+            encoded_image_data = output.getvalue()
+
+        return {"image_data": encoded_image_data, "mime_type": f"image/{format_str.lower()}", "width": width, "height": height, "transformed": True}
@@ -0,0 +1,155 @@
+import asyncio
+import multiprocessing
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import List, Optional
+
+from .pillow_image_transformer import PillowImageTransformer
+
+from ....application.exceptions.image_post_processing_overloaded_error import ImagePostProcessingOverloadedError
+from ....application.ports.image_post_processing_output_port import ImagePostProcessingOutputPort
+
+
+class ProcessPoolImagePostProcessingAdapter(ImagePostProcessingOutputPort):
+    """
+    Implementation of the ImagePostProcessingOutputPort that runs resize and re-encode work in a pool of worker processes,
+    so CPU-bound image work neither holds the GIL for the event loop nor serialises concurrent requests.
+
+    Images that already satisfy the transform spec are passed through in-process after a header probe, without touching the pool.
+    At most max_queue_depth images are submitted to the pool at once. When it is full, a further image waits (without blocking
+    the event loop) at most admission_timeout_seconds for a slot - by default not at all - and is otherwise shed with an
+    ImagePostProcessingOverloadedError, so a burst fails fast instead of building an unbounded backlog of waiters.
+    """
+
+    def __init__(self, max_workers: int = None, max_queue_depth: int = 64, admission_timeout_seconds: float = 0.0):
+        self.max_workers = int(max_workers) if max_workers else (os.cpu_count() or 1)
+        self.max_queue_depth = int(max_queue_depth) if max_queue_depth else 64
+        self.admission_timeout_seconds = float(admission_timeout_seconds) if admission_timeout_seconds else 0.0
+        self._executor = None
+        self._admission_semaphore = None
+        self.rejected_images = 0
+        self.passthrough_images = 0
+        self.transformed_images = 0
+        self.hashed_images = 0
+        self.waiting_images = 0
+        self.submitted_images = 0
+        self.peak_submitted_images = 0
+
+    def _create_executor(self) -> Executor:
+        # "spawn" avoids forking a process that holds gRPC and event loop threads
+        return ProcessPoolExecutor(max_workers=self.max_workers, mp_context=multiprocessing.get_context("spawn"))
+
+    @property
+    def executor(self) -> Executor:
+        # Created lazily so that no workers are started until an image actually needs transforming
+        if self._executor is None:
+            self._executor = self._create_executor()
+        return self._executor
+
+    async def process_image(self, image_data: bytes, transform_spec: dict) -> dict:
+        """
+        Applies a transform to an image, passing it through unchanged when possible.
+        """
+        passthrough_image = PillowImageTransformer.get_passthrough_image(image_data, transform_spec)
+        if passthrough_image is not None:
+            self.passthrough_images += 1
+            return passthrough_image
+
+        transformed_image = await self._run_in_executor(PillowImageTransformer.transform_image, image_data, transform_spec)
+        self.transformed_images += 1
+        return transformed_image
+
+    async def process_image_renditions(self, image_data: bytes, transform_specs: List[dict]) -> List[dict]:
+        """
+        Produces several renditions of an image, submitting a single task that decodes the image once for all of them.
+        """
+        passthrough_images = [PillowImageTransformer.get_passthrough_image(image_data, transform_spec) for transform_spec in transform_specs]
+        if all(passthrough_image is not None for passthrough_image in passthrough_images):
+            self.passthrough_images += len(passthrough_images)
+            return passthrough_images
+
+        renditions = await self._run_in_executor(PillowImageTransformer.transform_image_renditions, image_data, transform_specs)
+        for rendition in renditions:
+            if rendition["transformed"]:
+                self.transformed_images += 1
+            else:
+                self.passthrough_images += 1
+        return renditions
+
+    async def compute_perceptual_hash(self, image_data: bytes) -> Optional[str]:
+        """
+        Computes a perceptual (difference) hash of an image in the pool.
+        """
+        perceptual_hash = await self._run_in_executor(PillowImageTransformer.compute_difference_hash, image_data)
+        self.hashed_images += 1
+        return perceptual_hash
+
+    async def _admit(self) -> None:
+        """
+        Takes a submission slot, waiting at most admission_timeout_seconds for one.
+        Raises ImagePostProcessingOverloadedError if none becomes free.
+        """
+        if self._admission_semaphore is None:
+            self._admission_semaphore = asyncio.Semaphore(self.max_queue_depth)
+
+        if not self._admission_semaphore.locked():
+            await self._admission_semaphore.acquire() # A slot is free, so this returns without waiting
+            return None
+        if self.admission_timeout_seconds > 0:
+            self.waiting_images += 1
+            try:
+                await asyncio.wait_for(self._admission_semaphore.acquire(), timeout=self.admission_timeout_seconds)
+                return None
+            except asyncio.TimeoutError:
+                pass
+            finally:
+                self.waiting_images -= 1
+
+        self.rejected_images += 1
+        raise ImagePostProcessingOverloadedError(
+            f"Image post-processing is overloaded: {self.max_queue_depth} images are already queued for the workers.",
+            max_queue_depth=self.max_queue_depth,
+            retry_after_seconds=max(self.admission_timeout_seconds, 1.0),
+        )
+
+    def _replace_broken_executor(self, broken_executor: Executor) -> None:
+        # Concurrent failures of the same pool replace it once; a later pool is left alone
+        if self._executor is not broken_executor:
+            return None
+        print("Warning: Image post-processing pool is broken. Shutting it down and recreating it.")
+        self._executor = None
+        broken_executor.shutdown(wait=False, cancel_futures=True) # Fails its queued work now and reaps its processes
+
+    async def _run_in_executor(self, func, *args):
+        await self._admit()
+        self.submitted_images += 1
+        self.peak_submitted_images = max(self.peak_submitted_images, self.submitted_images)
+        executor = self.executor
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(executor, func, *args)
+        except BrokenProcessPool:
+            # A worker died (e.g. out of memory); replace the pool so later requests can succeed
+            self._replace_broken_executor(executor)
+            raise
+        finally:
+            self.submitted_images -= 1
+            self._admission_semaphore.release()
+
+    def get_metrics(self) -> dict:
+        """
+        Returns passthrough, transformed, hashed and rejected image counts, and the current and peak queue depth.
+        """
+        return {
+            "max_workers": self.max_workers,
+            "max_queue_depth": self.max_queue_depth,
+            "admission_timeout_seconds": self.admission_timeout_seconds,
+            "rejected_images": self.rejected_images,
+            "passthrough_images": self.passthrough_images,
+            "transformed_images": self.transformed_images,
+            "hashed_images": self.hashed_images,
+            "waiting_images": self.waiting_images,
+            "submitted_images": self.submitted_images,
+            "peak_submitted_images": self.peak_submitted_images,
+        }
@@ -0,0 +1,14 @@
+from concurrent.futures import Executor, ThreadPoolExecutor
+
+from .process_pool_image_post_processing_adapter import ProcessPoolImagePostProcessingAdapter
+
+
+class ThreadPoolImagePostProcessingAdapter(ProcessPoolImagePostProcessingAdapter):
+    """
+    Implementation of the ImagePostProcessingOutputPort that runs resize and re-encode work in a pool of worker threads.
+    Pillow releases the GIL for much of its decode and encode work, so this avoids inter-process copies at the cost of some contention.
+    It is suited to environments where worker processes are unavailable or the images are small.
+    """
+
+    def _create_executor(self) -> Executor:
+        return ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="image-post-processing")
@@ -0,0 +1,163 @@
+import asyncio
+import threading
+from typing import Dict, List, Optional, Set
+
+from ....application.ports.async_marketing_image_repository_output_port import AsyncMarketingImageRepositoryOutputPort
+from ....application.ports.marketing_image_near_duplicate_index_output_port import MarketingImageNearDuplicateIndexOutputPort
+from ....domain.value_objects.perceptual_hash import PerceptualHash
+
+
+class _BKTreeNode:
+    __slots__ = ("bits", "perceptual_hash", "image_ids", "children")
+
+    def __init__(self, bits: int, perceptual_hash: str):
+        self.bits = bits
+        self.perceptual_hash = perceptual_hash
+        self.image_ids: Set[str] = set()
+        self.children: Dict[int, "_BKTreeNode"] = {}
+
+
+class BKTreeMarketingImageNearDuplicateIndex(MarketingImageNearDuplicateIndexOutputPort):
+    """
+    In-process implementation of the MarketingImageNearDuplicateIndexOutputPort using a BK-tree - i.e. a tree keyed on
+    Hamming distance, so that a query within distance k only visits the subtrees that can hold a match.
+
+    The perceptual hashes are persisted on the marketing image aggregates, so the tree is rebuilt from the repository
+    the first time it is used, and kept up to date by add and remove. Removed images are dropped from their node
+    (the node stays, as it routes to its children) and the tree is rebuilt once most of its nodes are empty.
+    """
+
+    REBUILD_EMPTY_NODE_RATIO = 0.5
+
+    def __init__(self, marketing_image_repository: AsyncMarketingImageRepositoryOutputPort = None):
+        self.repository = marketing_image_repository
+        self._root: Optional[_BKTreeNode] = None
+        self._nodes_by_hash: Dict[str, _BKTreeNode] = {}
+        self._hashes_by_image_id: Dict[str, str] = {}
+        self._empty_nodes = 0
+        self._lock = threading.Lock() # Removal is called from synchronous core services
+        self._load_lock = None
+        self._loaded = marketing_image_repository is None
+        self.queries = 0
+        self.nodes_visited = 0
+        self.near_duplicates_found = 0
+        self.rebuilds = 0
+
+    async def ensure_loaded(self) -> None:
+        """
+        Indexes the perceptual hashes of every persisted marketing image, the first time it is called.
+        """
+        if self._loaded:
+            return None
+        if self._load_lock is None:
+            self._load_lock = asyncio.Lock()
+        async with self._load_lock:
+            if self._loaded:
+                return None
+            # Only the hashes are read, a page at a time, rather than every aggregate at once
+            number_of_images = 0
+            indexed_images = 0
+            async for row in self.repository.query(fields=["perceptual_hash"], page_size=self.repository.MAX_QUERY_PAGE_SIZE):
+                number_of_images += 1
+                if row.get("perceptual_hash"):
+                    self.add(row["id"], row["perceptual_hash"])
+                    indexed_images += 1
+            self._loaded = True
+            print(f"Loaded the near-duplicate index with {indexed_images} of {number_of_images} marketing images")
+
+    def _insert(self, image_id: str, perceptual_hash: str, bits: int) -> None:
+        node = self._nodes_by_hash.get(perceptual_hash)
+        if node is None:
+            node = _BKTreeNode(bits, perceptual_hash)
+            self._nodes_by_hash[perceptual_hash] = node
+            if self._root is None:
+                self._root = node
+            else:
+                parent = self._root
+                while True:
+                    distance = (parent.bits ^ bits).bit_count()
+                    child = parent.children.get(distance)
+                    if child is None:
+                        parent.children[distance] = node
+                        break
+                    parent = child
+        elif not node.image_ids:
+            self._empty_nodes -= 1
+        node.image_ids.add(image_id)
+
+    def add(self, image_id: str, perceptual_hash: str) -> None:
+        """
+        Adds a marketing image's perceptual hash to the tree.
+        """
+        bits = PerceptualHash(perceptual_hash).bits
+        with self._lock:
+            if self._hashes_by_image_id.get(image_id) == perceptual_hash:
+                return None
+            if image_id in self._hashes_by_image_id:
+                self._remove(image_id)
+            self._hashes_by_image_id[image_id] = perceptual_hash
+            self._insert(image_id, perceptual_hash, bits)
+
+    def _remove(self, image_id: str) -> None:
+        perceptual_hash = self._hashes_by_image_id.pop(image_id, None)
+        if perceptual_hash is None:
+            return None
+        node = self._nodes_by_hash[perceptual_hash]
+        node.image_ids.discard(image_id)
+        if not node.image_ids:
+            self._empty_nodes += 1
+        if self._empty_nodes > self.REBUILD_EMPTY_NODE_RATIO * len(self._nodes_by_hash):
+            self._rebuild()
+
+    def _rebuild(self) -> None:
+        self._root = None
+        self._nodes_by_hash = {}
+        self._empty_nodes = 0
+        for image_id, perceptual_hash in self._hashes_by_image_id.items():
+            self._insert(image_id, perceptual_hash, PerceptualHash(perceptual_hash).bits)
+        self.rebuilds += 1
+
+    def remove(self, image_id: str) -> None:
+        """
+        Removes a marketing image from the tree.
+        """
+        with self._lock:
+            self._remove(image_id)
+
+    def find_near_duplicates(self, perceptual_hash: str, max_distance: int) -> List[dict]:
+        """
+        Finds the marketing images within max_distance of the perceptual hash, nearest first. By the triangle inequality,
+        only the children whose edge distance is within max_distance of the query's distance to their parent can hold a match.
+        """
+        bits = PerceptualHash(perceptual_hash).bits
+        near_duplicates = []
+        nodes_visited = 0
+        with self._lock:
+            nodes_to_visit = [self._root] if self._root is not None else []
+            while nodes_to_visit:
+                node = nodes_to_visit.pop()
+                nodes_visited += 1
+                distance = (node.bits ^ bits).bit_count()
+                if distance <= max_distance:
+                    near_duplicates.extend({"image_id": image_id, "perceptual_hash": node.perceptual_hash, "distance": distance} for image_id in node.image_ids)
+                nodes_to_visit.extend(child for edge_distance, child in node.children.items() if distance - max_distance <= edge_distance <= distance + max_distance)
+
+        self.queries += 1
+        self.nodes_visited += nodes_visited
+        self.near_duplicates_found += len(near_duplicates)
+        return sorted(near_duplicates, key=lambda near_duplicate: (near_duplicate["distance"], near_duplicate["image_id"]))
+
+    def get_metrics(self) -> dict:
+        """
+        Returns the size of the tree, and the number of queries, nodes visited per query, and near-duplicates found.
+        """
+        return {
+            "loaded": self._loaded,
+            "indexed_images": len(self._hashes_by_image_id),
+            "nodes": len(self._nodes_by_hash),
+            "empty_nodes": self._empty_nodes,
+            "rebuilds": self.rebuilds,
+            "queries": self.queries,
+            "average_nodes_visited": (self.nodes_visited / self.queries) if self.queries else 0.0,
+            "near_duplicates_found": self.near_duplicates_found,
+        }
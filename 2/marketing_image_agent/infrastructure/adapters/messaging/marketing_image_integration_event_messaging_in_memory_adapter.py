@@ -0,0 +1,44 @@
+import threading
+import uuid
+from collections import deque
+from typing import List
+
+from ....application.ports.marketing_image_integration_event_messaging_output_port import MarketingImageIntegrationEventMessagingOutputPort
+from ....application.outbound_integration_events.base_outbound_integration_event import IntegrationEvent
+from ....application.factories.marketing_image_thin_integration_event_factory import MarketingImageIntegrationEventsFactory
+
+
+class MarketingImageIntegrationEventMessagingInMemoryAdapter(MarketingImageIntegrationEventMessagingOutputPort):
+    """
+    In-memory implementation of the MarketingImageIntegrationEventMessagingOutputPort, for load testing and local development.
+    Published integration events are kept in a bounded in-memory list instead of being sent to a broker, so no cloud
+    credentials are needed and a benchmark run never publishes to a real topic.
+    """
+
+    def __init__(self, marketing_image_integration_events_factory: MarketingImageIntegrationEventsFactory = None, max_events: int = 1000):
+        self.marketing_image_integration_events_factory = marketing_image_integration_events_factory
+        self.max_events = int(max_events) if max_events else 1000
+        self.published_events = deque(maxlen=self.max_events) # Oldest events are dropped once max_events is reached
+        self.published_count = 0
+        self._lock = threading.Lock() # Called from domain event handlers in command handler threads
+
+    def publish(self, integration_event: IntegrationEvent) -> dict:
+        """
+        Records an integration event in memory.
+
+        Returns:
+            A dictionary with the status of the operation and a generated message ID, as the Eventarc adapter returns.
+        """
+        message_id = str(uuid.uuid4())
+        integration_event_dict = self.marketing_image_integration_events_factory.to_dict(integration_event)
+        with self._lock:
+            self.published_events.append({"message_id": message_id, "event": integration_event_dict})
+            self.published_count += 1
+        return {"status": "success", "message_id": message_id}
+
+    def get_published_events(self) -> List[dict]:
+        """
+        Returns the most recently published integration events (at most max_events), oldest first.
+        """
+        with self._lock:
+            return list(self.published_events)
@@ -0,0 +1,188 @@
+import os
+import socket
+import threading
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Optional
+
+from ....application.ports.marketing_image_object_deletion_output_port import MarketingImageObjectDeletionOutputPort
+from ....application.ports.marketing_image_object_storage_output_port import MarketingImageObjectStorageOutputPort
+from ....application.ports.marketing_image_object_tombstone_store_output_port import MarketingImageObjectTombstoneStoreOutputPort
+from ....application.ports.marketing_image_repository_output_port import MarketingImageRepositoryOutputPort
+
+
+class BatchedMarketingImageObjectDeletionSweeper(MarketingImageObjectDeletionOutputPort):
+    """
+    Implementation of the MarketingImageObjectDeletionOutputPort that records a tombstone for each object to delete
+    and deletes the objects from a background thread, batch_size at a time, with the object storage's bulk removal
+    (for Google Cloud Storage, concurrent deletions with a result per object).
+
+    The sweeper is woken as soon as deletions are scheduled, and otherwise checks for due tombstones every
+    sweep_interval_seconds - e.g. those left by a previous process, or awaiting a retry. A failed deletion is retried
+    with exponential backoff, from retry_backoff_seconds up to max_retry_backoff_seconds, for as long as it fails: the
+    tombstone is only dropped once the object is gone, so a failure never leaves an object orphaned.
+
+    Whether an object is unreferenced is decided when its removal is saved, but until it is swept a generation cache hit
+    or a near-duplicate reuse can save a new image that references it again. So, given the repository, the sweeper
+    re-checks each tombstone's image URL just before deleting, and drops the tombstone of an object that is referenced
+    again instead of deleting it.
+
+    Every instance of the agent runs a sweeper over the same tombstones, so a sweeper claims each batch for
+    lease_seconds before deleting it; if it stops mid-batch, the batch is claimed again once the lease expires.
+    lease_seconds should comfortably exceed the time a batch takes to sweep.
+    """
+
+    def __init__(
+        self,
+        marketing_image_object_storage: MarketingImageObjectStorageOutputPort,
+        tombstone_store: MarketingImageObjectTombstoneStoreOutputPort,
+        batch_size: int = 100,
+        sweep_interval_seconds: float = 5.0,
+        retry_backoff_seconds: float = 2.0,
+        max_retry_backoff_seconds: float = 300.0,
+        autostart: bool = True,
+        marketing_image_repository: MarketingImageRepositoryOutputPort = None,
+        lease_seconds: float = 300.0,
+    ):
+        self.object_storage = marketing_image_object_storage
+        self.tombstone_store = tombstone_store
+        self.repository = marketing_image_repository
+        self.batch_size = min(max(int(batch_size or 100), 1), 100)
+        self.sweep_interval_seconds = float(sweep_interval_seconds or 5.0)
+        self.retry_backoff_seconds = float(retry_backoff_seconds or 2.0)
+        self.max_retry_backoff_seconds = float(max_retry_backoff_seconds or 300.0)
+        self.lease_seconds = float(lease_seconds or 300.0)
+        self.owner = f"{socket.gethostname()}-{os.getpid()}-{uuid.uuid4().hex[:8]}" # Identifies this sweeper's claims
+        self._wake = threading.Event()
+        self._stopping = threading.Event()
+        self._thread = None
+        self._lock = threading.Lock() # Counters are updated from command handler threads and the sweeper thread
+        self.counters = {"scheduled": 0, "removed": 0, "not_found": 0, "failed_attempts": 0, "batches": 0, "sweep_errors": 0, "still_referenced": 0}
+        self.last_sweep_at = None
+        if autostart:
+            self.start()
+
+    def start(self) -> None:
+        """
+        Starts the sweeper thread, if it is not already running.
+        """
+        if self._thread is not None and self._thread.is_alive():
+            return None
+        self._stopping.clear()
+        self._thread = threading.Thread(target=self._run, name="object-deletion-sweeper", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = None) -> None:
+        """
+        Stops the sweeper thread once its current batch is finished. Pending tombstones are swept when it is next started.
+        """
+        self._stopping.set()
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+    def schedule_deletion(self, file_names: List[str], image_urls_by_file_name: Optional[Dict[str, str]] = None) -> None:
+        """
+        Records tombstones for the objects (with the URLs of the images they belong to) and wakes the sweeper.
+        """
+        if not file_names:
+            return None
+        self.tombstone_store.record(list(file_names), image_urls_by_file_name)
+        self._count("scheduled", len(file_names))
+        self._wake.set()
+
+    def _run(self) -> None:
+        while not self._stopping.is_set():
+            self._wake.clear()
+            try:
+                # Keep sweeping while full batches are due, so a backlog drains without waiting for the interval
+                while not self._stopping.is_set() and self.sweep_once() >= self.batch_size:
+                    pass
+            except Exception as e:
+                self._count("sweep_errors")
+                print(f"Error sweeping object tombstones: {e}")
+            self._wake.wait(self.sweep_interval_seconds)
+
+    def _count(self, counter: str, increment: int = 1) -> None:
+        with self._lock:
+            self.counters[counter] += increment
+
+    def sweep_once(self) -> int:
+        """
+        Claims one batch of due tombstones and deletes their objects. Returns the number of tombstones processed.
+        """
+        tombstones = self.tombstone_store.claim_due(self.batch_size, self.owner, self.lease_seconds)
+        self.last_sweep_at = time.time()
+        if not tombstones:
+            return 0
+
+        # Re-check the references just before deleting - once per image URL, as an image's renditions share it
+        referenced_by_image_url = {}
+        for image_url in dict.fromkeys(tombstone.get("image_url") for tombstone in tombstones):
+            referenced_by_image_url[image_url] = self._is_referenced(image_url)
+        still_referenced_file_names = [tombstone["file_name"] for tombstone in tombstones if referenced_by_image_url[tombstone.get("image_url")] is True]
+        if still_referenced_file_names:
+            self.tombstone_store.complete(still_referenced_file_names)
+            self._count("still_referenced", len(still_referenced_file_names))
+            print(f"Kept {len(still_referenced_file_names)} objects scheduled for deletion, as a marketing image references them again")
+        tombstones = [tombstone for tombstone in tombstones if referenced_by_image_url[tombstone.get("image_url")] is not True]
+
+        # Objects whose references could not be checked are not deleted, and are retried like a failed deletion
+        file_names = [tombstone["file_name"] for tombstone in tombstones if referenced_by_image_url[tombstone.get("image_url")] is False]
+        results = {}
+        if file_names:
+            try:
+                results = self.object_storage.remove_marketing_image_objects(file_names)
+            except Exception as e:
+                print(f"Error removing a batch of {len(file_names)} objects: {e}")
+            self._count("batches")
+
+        completed_file_names = []
+        for tombstone in tombstones:
+            file_name = tombstone["file_name"]
+            result = results.get(file_name, MarketingImageObjectStorageOutputPort.FAILED)
+            if result == MarketingImageObjectStorageOutputPort.FAILED:
+                attempts = int(tombstone.get("attempts") or 0) + 1
+                backoff_seconds = min(self.retry_backoff_seconds * (2 ** (attempts - 1)), self.max_retry_backoff_seconds)
+                last_error = "Object storage removal failed" if file_name in results or referenced_by_image_url[tombstone.get("image_url")] is False else "Reference check failed"
+                self.tombstone_store.reschedule(file_name, attempts, datetime.now(timezone.utc) + timedelta(seconds=backoff_seconds), last_error=last_error)
+                self._count("failed_attempts")
+                print(f"Failed to remove {file_name} from object storage (attempt {attempts}); retrying in {backoff_seconds:.0f}s")
+            else:
+                completed_file_names.append(file_name)
+                self._count("removed" if result == MarketingImageObjectStorageOutputPort.REMOVED else "not_found")
+
+        if completed_file_names:
+            self.tombstone_store.complete(completed_file_names)
+        print(f"Swept {len(completed_file_names)} of {len(tombstones)} objects scheduled for deletion")
+        return len(tombstones) + len(still_referenced_file_names)
+
+    def _is_referenced(self, image_url: Optional[str]) -> Optional[bool]:
+        """
+        Returns whether a marketing image references the image URL, False if there is no URL (or no repository) to check,
+        or None if the repository could not be queried.
+        """
+        if not image_url or self.repository is None:
+            return False
+        try:
+            return bool(self.repository.retrieve_ids_by_url(image_url))
+        except Exception as e:
+            print(f"Error checking the references to {image_url}: {e}")
+            return None
+
+    def get_metrics(self) -> dict:
+        """
+        Returns the sweeper's counters, the number of objects still to be deleted, and its lag - the age in seconds
+        of the oldest tombstone.
+        """
+        oldest_recorded_at = self.tombstone_store.retrieve_oldest_recorded_at()
+        with self._lock:
+            counters = dict(self.counters)
+        return {
+            **counters,
+            "running": self._thread is not None and self._thread.is_alive(),
+            "pending": self.tombstone_store.count_pending(),
+            "lag_seconds": (datetime.now(timezone.utc) - oldest_recorded_at).total_seconds() if oldest_recorded_at else 0.0,
+            "last_sweep_at": self.last_sweep_at,
+        }
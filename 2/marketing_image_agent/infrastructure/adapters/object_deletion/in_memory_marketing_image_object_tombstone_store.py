@@ -0,0 +1,68 @@
+import threading
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Optional
+
+from ....application.ports.marketing_image_object_tombstone_store_output_port import MarketingImageObjectTombstoneStoreOutputPort
+
+
+class InMemoryMarketingImageObjectTombstoneStore(MarketingImageObjectTombstoneStoreOutputPort):
+    """
+    In-memory implementation of the MarketingImageObjectTombstoneStoreOutputPort, for load testing and local development.
+    Tombstones do not survive a restart, so objects scheduled for deletion when the process stops are left in object storage.
+    """
+
+    def __init__(self):
+        self._tombstones: Dict[str, dict] = {}
+        self._lock = threading.Lock() # Called from command handler threads and the sweeper thread
+
+    def record(self, file_names: List[str], image_urls_by_file_name: Optional[Dict[str, str]] = None) -> None:
+        """
+        Records tombstones for objects, due to be deleted straight away.
+        """
+        now = datetime.now(timezone.utc)
+        with self._lock:
+            for file_name in file_names:
+                self._tombstones.setdefault(file_name, {"file_name": file_name, "image_url": (image_urls_by_file_name or {}).get(file_name), "recorded_at": now, "attempts": 0, "next_attempt_at": now, "last_error": None})
+
+    def claim_due(self, limit: int, owner: str, lease_seconds: float) -> List[dict]:
+        """
+        Claims the tombstones whose next deletion attempt is due, earliest first, holding them for lease_seconds.
+        """
+        now = datetime.now(timezone.utc)
+        with self._lock:
+            due_tombstones = sorted((tombstone for tombstone in self._tombstones.values() if tombstone["next_attempt_at"] <= now), key=lambda tombstone: tombstone["next_attempt_at"])[:limit]
+            claimed_tombstones = [dict(tombstone) for tombstone in due_tombstones]
+            for tombstone in due_tombstones:
+                tombstone.update({"next_attempt_at": now + timedelta(seconds=lease_seconds), "lease_owner": owner})
+            return claimed_tombstones
+
+    def complete(self, file_names: List[str]) -> None:
+        """
+        Removes the tombstones of deleted objects.
+        """
+        with self._lock:
+            for file_name in file_names:
+                self._tombstones.pop(file_name, None)
+
+    def reschedule(self, file_name: str, attempts: int, next_attempt_at: datetime, last_error: str = None) -> None:
+        """
+        Records a failed deletion attempt and when the next attempt is due.
+        """
+        with self._lock:
+            tombstone = self._tombstones.get(file_name)
+            if tombstone is not None:
+                tombstone.update({"attempts": attempts, "next_attempt_at": next_attempt_at, "last_error": last_error, "lease_owner": None})
+
+    def count_pending(self) -> int:
+        """
+        Returns the number of objects still to be deleted.
+        """
+        with self._lock:
+            return len(self._tombstones)
+
+    def retrieve_oldest_recorded_at(self) -> Optional[datetime]:
+        """
+        Returns when the oldest tombstone was recorded, or None if there are none.
+        """
+        with self._lock:
+            return min((tombstone["recorded_at"] for tombstone in self._tombstones.values()), default=None)
@@ -0,0 +1,114 @@
+import os
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Optional
+
+from google.api_core.exceptions import NotFound
+from google.cloud import firestore
+
+from ....application.ports.marketing_image_object_tombstone_store_output_port import MarketingImageObjectTombstoneStoreOutputPort
+
+
+class MarketingImageObjectTombstoneFirestoreStore(MarketingImageObjectTombstoneStoreOutputPort):
+    """
+    Firestore implementation of the MarketingImageObjectTombstoneStoreOutputPort.
+    Each tombstone is a document whose ID is the object's file name, so tombstones survive restarts and are shared
+    by every instance of the agent. Due tombstones are queried on 'nextAttemptAt', which needs only Firestore's
+    automatic single-field index, and are claimed in the same transaction by moving 'nextAttemptAt' to the end of a lease
+    (and recording 'leaseOwner'), so the sweepers of several instances never delete the same objects at once.
+    """
+
+    MAX_WRITES_PER_BATCH = 500
+
+    def __init__(self, google_cloud_project: str = None, db_name: str = None, collection_name: str = None):
+        if not google_cloud_project:
+            self.google_cloud_project = os.getenv("GOOGLE_CLOUD_REPOSITORY_ADAPTER_PROJECT", "rbal-assisted-prj1")
+        else:
+            self.google_cloud_project = google_cloud_project
+
+        if not db_name:
+            self.db_name = os.getenv("GOOGLE_CLOUD_FIRESTORE_REPOSITORY_ADAPTER_DATABASE", "claim-check-ew4-1")
+        else:
+            self.db_name = db_name
+
+        if not collection_name:
+            self.collection_name = os.getenv("GOOGLE_CLOUD_FIRESTORE_OBJECT_TOMBSTONE_COLLECTION", "marketing-image-object-tombstones")
+        else:
+            self.collection_name = collection_name
+
+        self.db = firestore.Client(project=self.google_cloud_project, database=self.db_name)
+
+    def _commit_in_batches(self, file_names: List[str], write) -> None:
+        collection = self.db.collection(self.collection_name)
+        for index in range(0, len(file_names), self.MAX_WRITES_PER_BATCH):
+            batch = self.db.batch()
+            for file_name in file_names[index:index + self.MAX_WRITES_PER_BATCH]:
+                write(batch, collection.document(file_name))
+            batch.commit()
+
+    def record(self, file_names: List[str], image_urls_by_file_name: Optional[Dict[str, str]] = None) -> None:
+        """
+        Records tombstones for objects in Firestore, due to be deleted straight away.
+        """
+        now = datetime.now(timezone.utc)
+        image_urls_by_file_name = image_urls_by_file_name or {}
+        self._commit_in_batches(file_names, lambda batch, doc_ref: batch.set(doc_ref, {"fileName": doc_ref.id, "imageUrl": image_urls_by_file_name.get(doc_ref.id), "recordedAt": now, "attempts": 0, "nextAttemptAt": now, "lastError": None}))
+
+    def claim_due(self, limit: int, owner: str, lease_seconds: float) -> List[dict]:
+        """
+        Claims the tombstones whose next deletion attempt is due, earliest first, in a transaction - so that if another
+        sweeper claims one of them first, the transaction is retried and that tombstone is no longer due.
+        """
+
+        @firestore.transactional
+        def claim(transaction: firestore.Transaction) -> List[dict]:
+            now = datetime.now(timezone.utc)
+            query = (
+                self.db.collection(self.collection_name)
+                .where(filter=firestore.FieldFilter("nextAttemptAt", "<=", now))
+                .order_by("nextAttemptAt")
+                .limit(limit)
+            )
+            tombstones = []
+            for doc in query.stream(transaction=transaction):
+                data = doc.to_dict()
+                tombstones.append({
+                    "file_name": doc.id,
+                    "image_url": data.get("imageUrl"),
+                    "recorded_at": data.get("recordedAt"),
+                    "attempts": data.get("attempts", 0),
+                    "next_attempt_at": data.get("nextAttemptAt"),
+                })
+                transaction.update(doc.reference, {"nextAttemptAt": now + timedelta(seconds=lease_seconds), "leaseOwner": owner})
+            return tombstones
+
+        return claim(self.db.transaction())
+
+    def complete(self, file_names: List[str]) -> None:
+        """
+        Deletes the tombstones of deleted objects from Firestore. Deleting a tombstone that no longer exists succeeds.
+        """
+        self._commit_in_batches(file_names, lambda batch, doc_ref: batch.delete(doc_ref))
+
+    def reschedule(self, file_name: str, attempts: int, next_attempt_at: datetime, last_error: str = None) -> None:
+        """
+        Records a failed deletion attempt and when the next attempt is due, releasing the claim on the tombstone.
+        A tombstone that another sweeper has completed since is not recreated.
+        """
+        try:
+            self.db.collection(self.collection_name).document(file_name).update({"attempts": attempts, "nextAttemptAt": next_attempt_at, "lastError": last_error, "leaseOwner": None})
+        except NotFound:
+            print(f"Tombstone for {file_name} was completed by another sweeper. Not rescheduling it.")
+
+    def count_pending(self) -> int:
+        """
+        Returns the number of tombstones, using a count aggregation so no documents are transferred.
+        """
+        results = self.db.collection(self.collection_name).count().get()
+        return int(results[0][0].value) if results else 0
+
+    def retrieve_oldest_recorded_at(self) -> Optional[datetime]:
+        """
+        Returns when the oldest tombstone was recorded, or None if there are none.
+        """
+        docs = list(self.db.collection(self.collection_name).order_by("recordedAt").limit(1).select(["recordedAt"]).stream())
+        return docs[0].to_dict().get("recordedAt") if docs else None
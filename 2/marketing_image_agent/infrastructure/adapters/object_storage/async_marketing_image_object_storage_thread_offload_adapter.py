@@ -0,0 +1,83 @@
+import asyncio
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, AsyncIterator, Mapping, Optional, Tuple
+
+from ....application.ports.async_marketing_image_object_storage_output_port import AsyncMarketingImageObjectStorageOutputPort
+from ....application.ports.marketing_image_object_storage_output_port import MarketingImageObjectStorageOutputPort
+
+
+class AsyncMarketingImageObjectStorageThreadOffloadAdapter(AsyncMarketingImageObjectStorageOutputPort):
+    """
+    Asynchronous implementation of AsyncMarketingImageObjectStorageOutputPort that wraps a synchronous
+    MarketingImageObjectStorageOutputPort implementation - e.g. the Google Cloud Storage adapter - and runs its
+    blocking calls on a dedicated thread pool so that they never block the event loop.
+
+    The google-cloud-storage client library has no native asyncio client, so offloading to a bounded pool
+    of worker threads is how many uploads are kept in flight concurrently.
+    """
+
+    def __init__(self, marketing_image_object_storage: MarketingImageObjectStorageOutputPort, max_workers: int = 32):
+        self.object_storage = marketing_image_object_storage
+        self.max_workers = int(max_workers) if max_workers else 32
+        self.executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="object-storage")
+
+    async def _run(self, func, *args, **kwargs) -> Any:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, functools.partial(func, *args, **kwargs))
+
+    async def save_marketing_image_object(self, image_data: bytes, file_name: str, content_type: str, fixed_key_metadata: Optional[Mapping[str, str]] = None, custom_metadata: Optional[Mapping[str, str]] = None) -> Tuple[str, str]:
+        """
+        Saves image data to object storage without blocking the event loop.
+        """
+        return await self._run(
+            self.object_storage.save_marketing_image_object,
+            image_data=image_data,
+            file_name=file_name,
+            content_type=content_type,
+            fixed_key_metadata=fixed_key_metadata,
+            custom_metadata=custom_metadata,
+        )
+
+    async def retrieve_marketing_image_metadata(self, file_name: str) -> Optional[Mapping[str, str]]:
+        """
+        Retrieves marketing image metadata from object storage without blocking the event loop.
+        """
+        return await self._run(self.object_storage.retrieve_marketing_image_metadata, file_name=file_name)
+
+    async def retrieve_marketing_image_object(self, file_name: str) -> bytes:
+        """
+        Retrieves a marketing image object's data from object storage without blocking the event loop.
+        """
+        return await self._run(self.object_storage.retrieve_marketing_image_object, file_name=file_name)
+
+    async def retrieve_marketing_image_object_range(self, file_name: str, start: int, end: Optional[int] = None) -> Optional[bytes]:
+        """
+        Retrieves a byte range of a marketing image object's data from object storage without blocking the event loop.
+        """
+        return await self._run(self.object_storage.retrieve_marketing_image_object_range, file_name=file_name, start=start, end=end)
+
+    async def iterate_marketing_image_object_chunks(self, file_name: str, chunk_size: int = MarketingImageObjectStorageOutputPort.DEFAULT_CHUNK_SIZE, start: int = 0, end: Optional[int] = None) -> AsyncIterator[bytes]:
+        """
+        Streams a marketing image object's data from object storage, fetching each chunk on the thread pool
+        so that only one chunk at a time is held in memory and the event loop is never blocked.
+        """
+        chunks = await self._run(self.object_storage.retrieve_marketing_image_object_chunks, file_name=file_name, chunk_size=chunk_size, start=start, end=end)
+        if chunks is None:
+            return
+        try:
+            while True:
+                chunk = await self._run(next, chunks, None)
+                if chunk is None:
+                    break
+                yield chunk
+        finally:
+            close = getattr(chunks, "close", None)
+            if close is not None:
+                await self._run(close)
+
+    async def remove_marketing_image_object(self, file_name: str) -> bool:
+        """
+        Removes a marketing image from object storage without blocking the event loop.
+        """
+        return await self._run(self.object_storage.remove_marketing_image_object, file_name=file_name)
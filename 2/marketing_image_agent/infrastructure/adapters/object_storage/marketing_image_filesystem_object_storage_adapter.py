@@ -0,0 +1,270 @@
+import base64
+import hashlib
+import json
+import mmap
+import os
+import tempfile
+import threading
+from datetime import datetime, timezone
+from typing import BinaryIO, Dict, Iterator, List, Mapping, Optional, Tuple
+
+from ....shared.utils import DataManipulationUtils
+from ....application.ports.marketing_image_object_storage_output_port import MarketingImageObjectStorageOutputPort
+
+
+class MarketingImageFilesystemObjectStorageAdapter(MarketingImageObjectStorageOutputPort):
+    """
+    A local filesystem implementation of MarketingImageObjectStorageOutputPort, for edge deployments and for running
+    the whole agent (e.g. in benchmarks) without a cloud dependency.
+
+    The layout under the root directory is content-addressed:
+    - objects/<aa>/<bb>/<sha256> holds each distinct image once. These files are immutable.
+    - by-name/<file_name> is a hard link to the object's content, so that a file:// URL (or a static file server
+      pointed at by-name) resolves, and the link count tells when content is no longer referenced.
+    - metadata/<file_name>.json is a sidecar holding the fixed-key and custom metadata.
+
+    Every write goes to a temporary file in the destination directory and is renamed into place, so that readers
+    never see a partial object. Reads memory-map the content and return zero-copy memoryviews. Because content files
+    are never modified, a mapping stays consistent even if the name is overwritten or removed while it is in use.
+    """
+
+    def __init__(self, root_directory: str = None, base_url: str = None):
+        self.root_directory = os.path.abspath(root_directory or os.getenv("MARKETING_IMAGE_OBJECT_STORAGE_FILESYSTEM_ROOT_DIRECTORY", ".object_storage"))
+        self.objects_directory = os.path.join(self.root_directory, "objects")
+        self.names_directory = os.path.join(self.root_directory, "by-name")
+        self.metadata_directory = os.path.join(self.root_directory, "metadata")
+        for directory in (self.objects_directory, self.names_directory, self.metadata_directory):
+            os.makedirs(directory, exist_ok=True)
+        self.base_url = (base_url or f"file://{self.names_directory}").rstrip("/")
+        self._lock = threading.Lock() # Called from the object storage thread pool
+
+    def _name_path(self, file_name: str) -> str:
+        if not file_name or file_name in (".", "..") or os.path.basename(file_name) != file_name or file_name.startswith("."):
+            raise ValueError(f"Invalid object file name '{file_name}'.")
+        return os.path.join(self.names_directory, file_name)
+
+    def _metadata_path(self, file_name: str) -> str:
+        return os.path.join(self.metadata_directory, f"{file_name}.json")
+
+    def _object_path(self, sha256: str) -> str:
+        return os.path.join(self.objects_directory, sha256[:2], sha256[2:4], sha256)
+
+    @staticmethod
+    def _write_atomically(path: str, data: bytes) -> None:
+        """
+        Writes the data to a temporary file in the destination directory, flushes it to disk, and renames it into place.
+        """
+        directory = os.path.dirname(path)
+        os.makedirs(directory, exist_ok=True)
+        file_descriptor, temporary_path = tempfile.mkstemp(dir=directory, prefix=".tmp-")
+        try:
+            with os.fdopen(file_descriptor, "wb") as temporary_file:
+                temporary_file.write(data)
+                temporary_file.flush()
+                os.fsync(temporary_file.fileno())
+            os.replace(temporary_path, path)
+        except BaseException:
+            if os.path.exists(temporary_path):
+                os.remove(temporary_path)
+            raise
+
+    def _link_atomically(self, object_path: str, name_path: str) -> None:
+        """
+        Points a name at an object's content by creating a hard link under a temporary name and renaming it into place.
+        """
+        temporary_path = os.path.join(self.names_directory, f".tmp-link-{os.getpid()}-{threading.get_ident()}")
+        if os.path.lexists(temporary_path):
+            os.remove(temporary_path)
+        os.link(object_path, temporary_path)
+        os.replace(temporary_path, name_path)
+
+    def _remove_unreferenced_object(self, sha256: Optional[str]) -> None:
+        """
+        Deletes an object's content once no name links to it - i.e. the content-addressed path is its only link.
+        """
+        if not sha256:
+            return None
+        object_path = self._object_path(sha256)
+        try:
+            if os.stat(object_path).st_nlink <= 1:
+                os.remove(object_path)
+        except FileNotFoundError:
+            pass
+
+    def _read_metadata(self, file_name: str) -> Optional[dict]:
+        try:
+            with open(self._metadata_path(file_name), "r", encoding="utf-8") as metadata_file:
+                return json.load(metadata_file)
+        except FileNotFoundError:
+            return None
+
+    def save_marketing_image_object(self, image_data: bytes, file_name: str, content_type: str, fixed_key_metadata: Optional[Mapping[str, str]] = None, custom_metadata: Optional[Mapping[str, str]] = None) -> Tuple[str, str]:
+        """
+        Saves image data to the filesystem, storing its content once per distinct image and its metadata in a sidecar file.
+        Saving an object that is already stored with the same content is a no-op.
+
+        Returns:
+            A tuple containing the URL and the base64-encoded MD5 checksum of the saved image.
+        """
+        fixed_meta = {DataManipulationUtils.snake_case_to_hyphenated_compounds(k): v for k, v in (fixed_key_metadata or {}).items()}
+        custom_meta = {DataManipulationUtils.snake_case_to_hyphenated_compounds(k): v for k, v in (custom_metadata or {}).items()}
+        name_path = self._name_path(file_name)
+        sha256 = hashlib.sha256(image_data).hexdigest()
+        checksum = base64.b64encode(hashlib.md5(image_data).digest()).decode("utf-8")
+        url = f"{self.base_url}/{file_name}"
+        now = datetime.now(timezone.utc).isoformat()
+
+        with self._lock:
+            previous_metadata = self._read_metadata(file_name)
+            if previous_metadata and previous_metadata["sha256"] == sha256 and os.path.exists(name_path):
+                print(f"{file_name} is already stored in {self.root_directory} with the same content - skipping the save")
+                return url, checksum
+
+            object_path = self._object_path(sha256)
+            if not os.path.exists(object_path):
+                self._write_atomically(object_path, bytes(image_data))
+            self._link_atomically(object_path, name_path)
+            metadata = {
+                "cache_control": fixed_meta.get("Cache-Control", self.DEFAULT_CACHE_CONTROL),
+                "content_disposition": fixed_meta.get("Content-Disposition"),
+                "content_encoding": fixed_meta.get("Content-Encoding"),
+                "content_language": fixed_meta.get("Content-Language", "en"),
+                "content_type": fixed_meta.get("Content-Type", content_type),
+                "custom_time": fixed_meta.get("Custom-Time"),
+                "generation": (previous_metadata["generation"] + 1) if previous_metadata else 1,
+                "md5_hash": checksum,
+                "metadata": custom_meta,
+                "metageneration": 1,
+                "name": file_name,
+                "sha256": sha256,
+                "size": len(image_data),
+                "time_created": now,
+                "updated": now,
+            }
+            self._write_atomically(self._metadata_path(file_name), json.dumps(metadata, indent=2).encode("utf-8"))
+            if previous_metadata and previous_metadata["sha256"] != sha256:
+                self._remove_unreferenced_object(previous_metadata["sha256"])
+
+        print(f"Saved {file_name} to {object_path} at URL: {url}")
+        return url, checksum
+
+    def retrieve_marketing_image_metadata(self, file_name: str) -> Optional[Mapping[str, str]]:
+        """
+        Retrieves marketing image metadata from its sidecar file, or None if the object does not exist.
+        """
+        return self._read_metadata(file_name)
+
+    def _map_object(self, file_name: str) -> Optional[memoryview]:
+        """
+        Memory-maps an object's content read-only. The mapping is released once the last view of it is released.
+        """
+        try:
+            with open(self._name_path(file_name), "rb") as object_file:
+                if os.fstat(object_file.fileno()).st_size == 0:
+                    return memoryview(b"")
+                return memoryview(mmap.mmap(object_file.fileno(), 0, access=mmap.ACCESS_READ))
+        except FileNotFoundError:
+            return None
+
+    def retrieve_marketing_image_object(self, file_name: str) -> Optional[memoryview]:
+        """
+        Retrieves a marketing image object's data as a zero-copy, read-only memoryview of a memory-mapped file,
+        or None if the object does not exist. Use bytes() on it where an immutable copy is needed.
+        """
+        return self._map_object(file_name)
+
+    def retrieve_marketing_image_object_range(self, file_name: str, start: int, end: Optional[int] = None) -> Optional[memoryview]:
+        """
+        Retrieves a byte range of a marketing image object's data (end inclusive) as a zero-copy memoryview,
+        or None if the object does not exist.
+        """
+        view = self._map_object(file_name)
+        if view is None:
+            return None
+        return view[start:(end + 1) if end is not None else None]
+
+    def _read_chunks(self, view: memoryview, chunk_size: int, start: int, end: Optional[int]) -> Iterator[bytes]:
+        stop = min(end + 1, len(view)) if end is not None else len(view)
+        for offset in range(start, stop, chunk_size):
+            yield bytes(view[offset:min(offset + chunk_size, stop)])
+
+    def retrieve_marketing_image_object_chunks(self, file_name: str, chunk_size: int = MarketingImageObjectStorageOutputPort.DEFAULT_CHUNK_SIZE, start: int = 0, end: Optional[int] = None) -> Optional[Iterator[bytes]]:
+        """
+        Retrieves a marketing image object's data as an iterator of chunks copied from a memory-mapped file,
+        or None if the object does not exist.
+        """
+        view = self._map_object(file_name)
+        if view is None:
+            return None
+        return self._read_chunks(view, chunk_size, start, end)
+
+    def open_marketing_image_object(self, file_name: str, chunk_size: int = MarketingImageObjectStorageOutputPort.DEFAULT_CHUNK_SIZE) -> Optional[BinaryIO]:
+        """
+        Opens a marketing image object as a read-only, seekable file, or returns None if the object does not exist.
+        """
+        try:
+            return open(self._name_path(file_name), "rb", buffering=chunk_size)
+        except FileNotFoundError:
+            return None
+
+    def remove_marketing_image_object(self, file_name: str) -> bool:
+        """
+        Removes a marketing image object's name and sidecar, and its content if no other name links to it.
+        Returns False if the object does not exist.
+        """
+        name_path = self._name_path(file_name)
+        with self._lock:
+            metadata = self._read_metadata(file_name)
+            try:
+                os.remove(name_path)
+            except FileNotFoundError:
+                return False
+            try:
+                os.remove(self._metadata_path(file_name))
+            except FileNotFoundError:
+                pass
+            self._remove_unreferenced_object(metadata["sha256"] if metadata else None)
+        print(f"Removed {file_name} from {self.root_directory}")
+        return True
+
+    def remove_marketing_image_objects(self, file_names: List[str]) -> Dict[str, str]:
+        """
+        Removes several marketing image objects, returning REMOVED, NOT_FOUND, or FAILED for each.
+        """
+        results = {}
+        for file_name in file_names:
+            try:
+                results[file_name] = self.REMOVED if self.remove_marketing_image_object(file_name) else self.NOT_FOUND
+            except OSError as e:
+                print(f"Error removing {file_name} from {self.root_directory}: {e}")
+                results[file_name] = self.FAILED
+        return results
+
+    def update_marketing_image_objects_metadata(self, file_names: List[str], fixed_key_metadata: Mapping[str, str]) -> Dict[str, str]:
+        """
+        Updates the fixed-key metadata of several marketing image objects by rewriting their sidecar files,
+        returning UPDATED, NOT_FOUND, or FAILED for each. The content files are not touched.
+        """
+        fields = {key.lower().replace("-", "_"): value for key, value in fixed_key_metadata.items()}
+        unsupported_fields = [field for field in fields if field not in self.FIXED_METADATA_KEYS]
+        if unsupported_fields:
+            raise ValueError(f"Unsupported fixed-key metadata: {', '.join(unsupported_fields)}")
+
+        now = datetime.now(timezone.utc).isoformat()
+        results = {}
+        with self._lock:
+            for file_name in file_names:
+                try:
+                    metadata = self._read_metadata(file_name) if os.path.exists(self._name_path(file_name)) else None
+                    if metadata is None:
+                        results[file_name] = self.NOT_FOUND
+                        continue
+                    metadata.update(fields)
+                    metadata["metageneration"] += 1
+                    metadata["updated"] = now
+                    self._write_atomically(self._metadata_path(file_name), json.dumps(metadata, indent=2).encode("utf-8"))
+                    results[file_name] = self.UPDATED
+                except OSError as e:
+                    print(f"Error updating the metadata of {file_name} in {self.root_directory}: {e}")
+                    results[file_name] = self.FAILED
+        return results
@@ -1,6 +1,16 @@
+import base64
+import google_crc32c
+import hashlib
 import os
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from google.api_core.exceptions import NotFound, NotModified, PreconditionFailed
 from google.cloud import storage
-from typing import Mapping, Optional, Tuple
+from google.cloud.storage.retry import DEFAULT_RETRY
+from typing import BinaryIO, Dict, Iterator, List, Mapping, Optional, Tuple
 
 from ....shared.utils import DataManipulationUtils
 from ....application.ports.marketing_image_object_storage_output_port import MarketingImageObjectStorageOutputPort
@@ -9,8 +19,31 @@ from ....application.ports.marketing_image_object_storage_output_port import Mar
 class MarketingImageGoogleCloudStorageObjectStorageAdapter(MarketingImageObjectStorageOutputPort):
     """
     A concrete implementation of MarketingImageObjectStorageOutputPort that interacts with Google Cloud Storage.
+
+    Uploads are made in one of three ways depending on the size of the object:
+    - Below resumable_upload_threshold_bytes, a single multipart request (the fastest for small images).
+    - From that size, a resumable upload session sent in upload_chunk_size_bytes chunks. A failed chunk is
+      retried by resuming the session from the last byte the server committed, so the image is never re-sent as a whole.
+    - From parallel_composite_upload_threshold_bytes (0 disables it), a parallel composite upload: the image
+      is split into up to parallel_composite_upload_max_parts parts, uploaded concurrently as temporary objects
+      (each retried on its own), composed into the final object, and the parts are deleted.
+
+    Uploads are idempotent: the MD5 and CRC32C checksums are calculated locally (and verified by the server), and the
+    object is created with if_generation_match=0. If the object already exists with the same content - e.g. a retried
+    upload - the upload is a no-op. If it exists with different content, it is overwritten on the condition that it is
+    still the generation that was seen.
+
+    Object metadata is held in a bounded least-recently-used cache keyed by object name. It is populated from upload
+    responses and invalidated by this adapter's own writes and removes. An entry younger than metadata_cache_ttl_seconds
+    is served without a request. An older entry is revalidated with a conditional request on its generation and
+    metageneration, which returns no body unless the object has changed.
     """
-    def __init__(self, google_cloud_project: str = None, bucket_location: str = None, bucket_name: str = None):
+
+    RESUMABLE_CHUNK_SIZE_MULTIPLE = 256 * 1024 # Google Cloud Storage requires resumable chunks to be a multiple of 256 KiB
+    MAX_COMPOSE_COMPONENTS = 32
+    MAX_CONCURRENT_OBJECT_CALLS = 16 # Deletions and metadata patches of several objects run this many at a time
+
+    def __init__(self, google_cloud_project: str = None, bucket_location: str = None, bucket_name: str = None, upload_chunk_size_bytes: int = 8 * 1024 * 1024, resumable_upload_threshold_bytes: int = 8 * 1024 * 1024, parallel_composite_upload_threshold_bytes: int = 32 * 1024 * 1024, parallel_composite_upload_max_parts: int = 8, upload_retry_deadline_seconds: float = 120.0, metadata_cache_max_entries: int = 1024, metadata_cache_ttl_seconds: float = 30.0):
         if not google_cloud_project:
             self.google_cloud_project = os.getenv("GOOGLE_CLOUD_MARKETING_IMAGE_OBJECT_STORAGE_ADAPTER_PROJECT", "rbal-assisted-prj1")
         else:
@@ -26,9 +59,189 @@ class MarketingImageGoogleCloudStorageObjectStorageAdapter(MarketingImageObjectS
         else:
             self.bucket_name = bucket_name
 
+        chunk_size = int(upload_chunk_size_bytes) if upload_chunk_size_bytes else 8 * 1024 * 1024
+        self.upload_chunk_size_bytes = -(-chunk_size // self.RESUMABLE_CHUNK_SIZE_MULTIPLE) * self.RESUMABLE_CHUNK_SIZE_MULTIPLE # Rounded up
+        self.resumable_upload_threshold_bytes = int(resumable_upload_threshold_bytes) if resumable_upload_threshold_bytes is not None else 8 * 1024 * 1024
+        self.parallel_composite_upload_threshold_bytes = int(parallel_composite_upload_threshold_bytes) if parallel_composite_upload_threshold_bytes is not None else 0
+        self.parallel_composite_upload_max_parts = min(max(int(parallel_composite_upload_max_parts or 8), 2), self.MAX_COMPOSE_COMPONENTS)
+        self.upload_retry = DEFAULT_RETRY.with_deadline(float(upload_retry_deadline_seconds or 120.0))
+
         self.client = storage.Client(project=self.google_cloud_project)
         self.bucket = self.client.bucket(self.bucket_name)
 
+        self._part_upload_executor = None # Created on the first parallel composite upload
+        self._part_upload_executor_lock = threading.Lock()
+        self._object_call_executor = None # Created on the first bulk deletion or metadata update
+        self.uploads_by_strategy = {"single_request": 0, "resumable": 0, "parallel_composite": 0}
+        self.composite_parts_uploaded = 0
+        self.existing_object_counters = {"duplicates_skipped": 0, "overwritten": 0}
+
+        self.metadata_cache_max_entries = int(metadata_cache_max_entries) if metadata_cache_max_entries is not None else 1024 # 0 disables the cache
+        self.metadata_cache_ttl_seconds = float(metadata_cache_ttl_seconds) if metadata_cache_ttl_seconds is not None else 30.0
+        self._metadata_cache: "OrderedDict[str, tuple[float, dict]]" = OrderedDict() # Object name -> (time validated, metadata)
+        self._metadata_cache_lock = threading.Lock()
+        self.metadata_cache_counters = {"hits": 0, "revalidated": 0, "refreshed": 0, "misses": 0, "evictions": 0, "invalidations": 0}
+
+    def _get_cached_metadata(self, file_name: str) -> Optional[tuple]:
+        with self._metadata_cache_lock:
+            cached = self._metadata_cache.get(file_name)
+            if cached is not None:
+                self._metadata_cache.move_to_end(file_name)
+            return cached
+
+    def _cache_metadata(self, file_name: str, metadata: dict) -> None:
+        if self.metadata_cache_max_entries <= 0:
+            return None
+        with self._metadata_cache_lock:
+            self._metadata_cache[file_name] = (time.monotonic(), metadata)
+            self._metadata_cache.move_to_end(file_name)
+            while len(self._metadata_cache) > self.metadata_cache_max_entries:
+                self._metadata_cache.popitem(last=False)
+                self.metadata_cache_counters["evictions"] += 1
+
+    def _invalidate_metadata(self, file_name: str) -> None:
+        with self._metadata_cache_lock:
+            if self._metadata_cache.pop(file_name, None) is not None:
+                self.metadata_cache_counters["invalidations"] += 1
+
+    @staticmethod
+    def _blob_metadata(blob: storage.Blob) -> dict:
+        return {
+            "cache_control": blob.cache_control,
+            "content_disposition": blob.content_disposition,
+            "content_encoding": blob.content_encoding,
+            "content_language": blob.content_language,
+            "content_type": blob.content_type,
+            "custom_time": blob.custom_time.isoformat() if blob.custom_time else None,
+            "etag": blob.etag,
+            "generation": blob.generation,
+            "id": blob.id,
+            "md5_hash": blob.md5_hash,
+            "media_link": blob.media_link,
+            "metadata": dict(blob.metadata or {}),
+            "metageneration": blob.metageneration,
+            "name": blob.name,
+            "self_link": blob.self_link,
+            "size": blob.size,
+            "storage_class": blob.storage_class,
+            "time_created": blob.time_created.isoformat() if blob.time_created else None,
+            "time_deleted": blob.time_deleted.isoformat() if blob.time_deleted else None,
+            "updated": blob.updated.isoformat() if blob.updated else None,
+            "crc32c": blob.crc32c,
+            "retention_expiration_time": blob.retention_expiration_time.isoformat() if blob.retention_expiration_time else None,
+        }
+
+    def _get_part_upload_executor(self) -> ThreadPoolExecutor:
+        with self._part_upload_executor_lock:
+            if self._part_upload_executor is None:
+                self._part_upload_executor = ThreadPoolExecutor(max_workers=self.parallel_composite_upload_max_parts, thread_name_prefix="gcs-composite-part")
+            return self._part_upload_executor
+
+    def _get_object_call_executor(self) -> ThreadPoolExecutor:
+        with self._part_upload_executor_lock:
+            if self._object_call_executor is None:
+                self._object_call_executor = ThreadPoolExecutor(max_workers=self.MAX_CONCURRENT_OBJECT_CALLS, thread_name_prefix="gcs-object-call")
+            return self._object_call_executor
+
+    def _call_per_object(self, file_names: List[str], call, success_result: str, action: str) -> Dict[str, str]:
+        """
+        Runs call(file_name) for each object concurrently, with a future per request, and maps each outcome to
+        success_result, NOT_FOUND (if the call raised NotFound), or FAILED.
+        """
+        for file_name in file_names:
+            self._invalidate_metadata(file_name)
+        executor = self._get_object_call_executor()
+        futures = {file_name: executor.submit(call, file_name) for file_name in dict.fromkeys(file_names)}
+        results = {}
+        for file_name, future in futures.items():
+            try:
+                future.result()
+                results[file_name] = success_result
+            except NotFound:
+                results[file_name] = self.NOT_FOUND
+            except Exception as e:
+                print(f"Error {action} {file_name} in Google Cloud Storage: {e}")
+                results[file_name] = self.FAILED
+        return results
+
+    @staticmethod
+    def _compute_checksums(image_data: bytes) -> dict:
+        """
+        Calculates the base64-encoded MD5 and (big-endian) CRC32C checksums of the data, in the form Google Cloud Storage reports them.
+        """
+        return {
+            "md5_hash": base64.b64encode(hashlib.md5(image_data).digest()).decode("utf-8"),
+            "crc32c": base64.b64encode(google_crc32c.value(bytes(image_data)).to_bytes(4, "big")).decode("utf-8"),
+        }
+
+    def _upload_resumable(self, blob: storage.Blob, image_data: bytes, content_type: str, if_generation_match: int) -> None:
+        """
+        Uploads in a resumable session of upload_chunk_size_bytes chunks. Within a session, a retry resumes from the
+        last committed byte rather than starting again. The generation precondition is checked when the session is
+        created, so a duplicate is rejected before any data is sent.
+        """
+        blob.chunk_size = self.upload_chunk_size_bytes
+        blob.upload_from_string(image_data, content_type=content_type, if_generation_match=if_generation_match, retry=self.upload_retry)
+
+    def _upload_part(self, part_blob: storage.Blob, part_data: bytes, content_type: str) -> storage.Blob:
+        # if_generation_match=0 makes the part upload idempotent, so the retry can safely re-send just this part
+        part_blob.upload_from_string(part_data, content_type=content_type, if_generation_match=0, retry=self.upload_retry)
+        return part_blob
+
+    def _upload_parallel_composite(self, blob: storage.Blob, image_data: bytes, content_type: str, crc32c: str, if_generation_match: int) -> None:
+        """
+        Uploads the parts concurrently as temporary objects and composes them into a temporary object. Composite objects
+        have no MD5 hash, so the composed object's CRC32C is checked against the local one, and only when it matches is the
+        composed object rewritten into place as the destination blob (which carries the metadata set on it). The parts and
+        the composed object are deleted whether or not the upload succeeds, so a corrupt object never reaches the destination.
+        """
+        view = memoryview(image_data)
+        part_size = max(-(-len(view) // self.parallel_composite_upload_max_parts), self.RESUMABLE_CHUNK_SIZE_MULTIPLE)
+        part_prefix = f"{blob.name}.parts/{uuid.uuid4().hex}"
+        part_blobs = [self.bucket.blob(f"{part_prefix}/{index:02d}") for index in range(-(-len(view) // part_size))]
+        composed_blob = self.bucket.blob(f"{part_prefix}/composed")
+        composed_blob.content_type = content_type
+
+        executor = self._get_part_upload_executor()
+        try:
+            futures = [
+                executor.submit(self._upload_part, part_blob, bytes(view[index * part_size:(index + 1) * part_size]), content_type)
+                for index, part_blob in enumerate(part_blobs)
+            ]
+            uploaded_parts = [future.result() for future in futures]
+            self.composite_parts_uploaded += len(uploaded_parts)
+            composed_blob.compose(uploaded_parts, if_generation_match=0, retry=self.upload_retry)
+            if composed_blob.crc32c != crc32c:
+                raise ValueError(f"The CRC32C checksum of the composed object for {blob.name} ({composed_blob.crc32c}) does not match the local checksum ({crc32c}).")
+            # Within a bucket, the rewrite copies the object server-side, normally in a single call
+            rewrite_token, _, _ = blob.rewrite(composed_blob, if_generation_match=if_generation_match, retry=self.upload_retry)
+            while rewrite_token is not None:
+                rewrite_token, _, _ = blob.rewrite(composed_blob, token=rewrite_token, if_generation_match=if_generation_match, retry=self.upload_retry)
+        finally:
+            self.bucket.delete_blobs(part_blobs + [composed_blob], on_error=lambda temporary_blob: None)
+
+    def _upload(self, blob: storage.Blob, image_data: bytes, content_type: str, checksums: dict, if_generation_match: int) -> None:
+        """
+        Uploads the image with the strategy for its size, on the condition that the object's generation matches
+        if_generation_match (0 - i.e. the object does not exist yet - unless overwriting).
+        """
+        size = len(image_data)
+        if self.parallel_composite_upload_threshold_bytes and size >= self.parallel_composite_upload_threshold_bytes:
+            self._upload_parallel_composite(blob, image_data, content_type, checksums["crc32c"], if_generation_match)
+            self.uploads_by_strategy["parallel_composite"] += 1
+            return None
+
+        # Sent with the upload, so that the server rejects an object that does not match them
+        blob.md5_hash = checksums["md5_hash"]
+        blob.crc32c = checksums["crc32c"]
+        if size >= self.resumable_upload_threshold_bytes:
+            self._upload_resumable(blob, image_data, content_type, if_generation_match)
+            self.uploads_by_strategy["resumable"] += 1
+        else:
+            # The generation precondition makes the upload idempotent, so it can safely be retried
+            blob.upload_from_string(image_data, content_type=content_type, if_generation_match=if_generation_match, retry=self.upload_retry)
+            self.uploads_by_strategy["single_request"] += 1
+
     def save_marketing_image_object(self, image_data: bytes, file_name: str, content_type: str, fixed_key_metadata: Optional[Mapping[str, str]] = None, custom_metadata: Optional[Mapping[str, str]] = None) -> Tuple[str, str]:
         """
         Saves image data to Google Cloud Storage with specified metadata.
@@ -52,7 +265,7 @@ class MarketingImageGoogleCloudStorageObjectStorageAdapter(MarketingImageObjectS
 
         Returns:
             A tuple containing the public URL and the base64-encoded MD5 checksum
-            of the saved image.
+            of the saved image (calculated locally, so no metadata request is needed).
         """
         try:
             # Ensure metadata dictionaries are not None to simplify access        
@@ -79,7 +292,7 @@ class MarketingImageGoogleCloudStorageObjectStorageAdapter(MarketingImageObjectS
 
             # 2. Fixed-key metadata (direct attributes on the blob object)
             # Set default values as required
-            blob.cache_control = fixed_meta.get("Cache-Control", "private, max-age=0")
+            blob.cache_control = fixed_meta.get("Cache-Control", self.DEFAULT_CACHE_CONTROL)
             blob.content_language = fixed_meta.get("Content-Language", "en")
 
             # Use the value from the metadata dict if present, otherwise use the param
@@ -94,16 +307,31 @@ class MarketingImageGoogleCloudStorageObjectStorageAdapter(MarketingImageObjectS
                 blob.custom_time = fixed_meta["Custom-Time"]
 
             # Upload the data. The blob object's attributes (metadata, cache_control, etc.)
-            # are used in the upload request.
-            blob.upload_from_string(image_data, content_type=effective_content_type)
+            # are used in the upload (or compose) request.
+            checksums = self._compute_checksums(image_data)
+            checksum = checksums["md5_hash"]
+            try:
+                self._upload(blob, image_data, effective_content_type, checksums, if_generation_match=0)
+            except PreconditionFailed:
+                # The object already exists - one metadata request tells a duplicate from a different image
+                existing_blob = self.bucket.get_blob(file_name)
+                if existing_blob is not None and existing_blob.size == len(image_data) and existing_blob.crc32c == checksums["crc32c"] and existing_blob.md5_hash in (None, checksum):
+                    self.existing_object_counters["duplicates_skipped"] += 1
+                    print(f"{file_name} is already stored in {self.bucket_name} with the same content - skipping the upload")
+                    blob = existing_blob
+                else:
+                    self.existing_object_counters["overwritten"] += 1
+                    self._upload(blob, image_data, effective_content_type, checksums, if_generation_match=existing_blob.generation if existing_blob is not None else 0)
 
             public_url = blob.public_url
-            checksum = blob.md5_hash  # This is populated after the upload
+            self._cache_metadata(file_name, self._blob_metadata(blob)) # The upload response carries the new object's metadata
 
             print(f"Saved {file_name} at URL: {public_url}")
 
             return public_url, checksum
         except Exception as e:
+            # The object may or may not have been overwritten, so the cached metadata can no longer be trusted
+            self._invalidate_metadata(file_name)
             # You can log the exception here
             print(f"An error occurred while saving the image: {e}")
             raise # Re-raise the exception or handle it as per your application's error handling policy
@@ -113,7 +341,11 @@ class MarketingImageGoogleCloudStorageObjectStorageAdapter(MarketingImageObjectS
 
     def retrieve_marketing_image_metadata(self, file_name: str) -> Optional[Mapping[str, str]]:
         """
-        Retrieves marketing image metadata from Google Cloud Storage.
+        Retrieves marketing image metadata, from the metadata cache where possible, otherwise from Google Cloud Storage.
+
+        A cached entry within its time-to-live is returned as is. An older entry is revalidated with a metadata
+        request conditional on its generation (the object has not been overwritten) and metageneration (its
+        metadata has not changed): a 304 Not Modified response confirms the entry without transferring it.
 
         Args:
             file_name: The file name of the image in GCS.
@@ -123,34 +355,33 @@ class MarketingImageGoogleCloudStorageObjectStorageAdapter(MarketingImageObjectS
         """
         try:
             blob = self.bucket.blob(file_name)
-            blob.reload()  # Fetch the latest metadata
-            if blob.exists:
-                metadata = {
-                    "cache_control": blob.cache_control,
-                    "content_disposition": blob.content_disposition,
-                    "content_encoding": blob.content_encoding,
-                    "content_language": blob.content_language,
-                    "content_type": blob.content_type,
-                    "custom_time": blob.custom_time.isoformat() if blob.custom_time else None,
-                    "etag": blob.etag,
-                    "generation": blob.generation,
-                    "id": blob.id,
-                    "md5_hash": blob.md5_hash,
-                    "media_link": blob.media_link,
-                    "metageneration": blob.metageneration,
-                    "name": blob.name,
-                    "self_link": blob.self_link,
-                    "size": blob.size,
-                    "storage_class": blob.storage_class,
-                    "time_created": blob.time_created.isoformat() if blob.time_created else None,
-                    "time_deleted": blob.time_deleted.isoformat() if blob.time_deleted else None,
-                    "updated": blob.updated.isoformat() if blob.updated else None,
-                    "crc32c": blob.crc32c,
-                    "retention_expiration_time": blob.retention_expiration_time.isoformat() if blob.retention_expiration_time else None,
-                }
-                return metadata
+            cached = self._get_cached_metadata(file_name)
+            if cached is not None:
+                validated_at, metadata = cached
+                if time.monotonic() - validated_at < self.metadata_cache_ttl_seconds:
+                    self.metadata_cache_counters["hits"] += 1
+                    return dict(metadata)
+                try:
+                    blob.reload(if_generation_match=metadata["generation"], if_metageneration_not_match=metadata["metageneration"])
+                    self.metadata_cache_counters["refreshed"] += 1 # Same object, changed metadata
+                except NotModified:
+                    self.metadata_cache_counters["revalidated"] += 1
+                    self._cache_metadata(file_name, metadata)
+                    return dict(metadata)
+                except PreconditionFailed:
+                    self.metadata_cache_counters["refreshed"] += 1 # The object has been overwritten
+                    blob.reload()
             else:
-                return None
+                self.metadata_cache_counters["misses"] += 1
+                blob.reload()  # Fetch the latest metadata
+
+            metadata = self._blob_metadata(blob)
+            self._cache_metadata(file_name, metadata)
+            return dict(metadata)
+        except NotFound:
+            self._invalidate_metadata(file_name)
+            print(f"Metadata for {file_name} not found in Google Cloud Storage")
+            return None
         except Exception as e:
             print(f"Error retrieving metadata for {file_name} from Google Cloud Storage: {e}")
             return None
@@ -172,6 +403,82 @@ class MarketingImageGoogleCloudStorageObjectStorageAdapter(MarketingImageObjectS
             print(f"Error retrieving {file_name} from Google Cloud Storage: {e}")
             return None
 
+    def retrieve_marketing_image_object_range(self, file_name: str, start: int, end: Optional[int] = None) -> Optional[bytes]:
+        """
+        Retrieves a byte range of a marketing image object's data from Google Cloud Storage with a single ranged download.
+
+        Args:
+            file_name: The file name of the image in GCS.
+            start: The offset of the first byte to retrieve.
+            end: The offset of the last byte to retrieve (inclusive), or None to read to the end of the object.
+
+        Returns:
+            The bytes in the range, or None if not found.
+        """
+        try:
+            blob = self.bucket.blob(file_name)
+            return blob.download_as_bytes(start=start, end=end)
+        except Exception as e:
+            print(f"Error retrieving bytes {start}-{end if end is not None else ''} of {file_name} from Google Cloud Storage: {e}")
+            return None
+
+    def _read_chunks(self, reader: BinaryIO, chunk_size: int, start: int, end: Optional[int]) -> Iterator[bytes]:
+        with reader:
+            if start:
+                reader.seek(start)
+            remaining = (end - start + 1) if end is not None else None
+            while remaining is None or remaining > 0:
+                chunk = reader.read(chunk_size if remaining is None else min(chunk_size, remaining))
+                if not chunk:
+                    break
+                if remaining is not None:
+                    remaining -= len(chunk)
+                yield chunk
+
+    def retrieve_marketing_image_object_chunks(self, file_name: str, chunk_size: int = MarketingImageObjectStorageOutputPort.DEFAULT_CHUNK_SIZE, start: int = 0, end: Optional[int] = None) -> Optional[Iterator[bytes]]:
+        """
+        Retrieves a marketing image object's data from Google Cloud Storage as an iterator of chunks.
+
+        The object's metadata is fetched up front, so that a missing object returns None rather than failing
+        mid-iteration, and the reads are pinned to that generation of the object, so that an overwrite while
+        iterating cannot mix the bytes of two versions.
+
+        Args:
+            file_name: The file name of the image in GCS.
+            chunk_size: The maximum size of each chunk in bytes - each chunk is one ranged download.
+            start: The offset of the first byte to retrieve.
+            end: The offset of the last byte to retrieve (inclusive), or None to read to the end of the object.
+
+        Returns:
+            An iterator of chunks, or None if not found.
+        """
+        reader = self.open_marketing_image_object(file_name, chunk_size=chunk_size)
+        if reader is None:
+            return None
+        return self._read_chunks(reader, chunk_size, start, end)
+
+    def open_marketing_image_object(self, file_name: str, chunk_size: int = MarketingImageObjectStorageOutputPort.DEFAULT_CHUNK_SIZE) -> Optional[BinaryIO]:
+        """
+        Opens a marketing image object in Google Cloud Storage as a read-only, seekable file-like object,
+        which downloads the object chunk_size bytes at a time as it is read. Reads are pinned to the
+        generation of the object at the time it was opened.
+
+        Args:
+            file_name: The file name of the image in GCS.
+            chunk_size: The size of each ranged download in bytes (a multiple of 256 KiB).
+
+        Returns:
+            A file-like object, or None if not found.
+        """
+        try:
+            blob = self.bucket.get_blob(file_name)
+            if blob is None:
+                return None
+            return blob.open("rb", chunk_size=chunk_size)
+        except Exception as e:
+            print(f"Error opening {file_name} in Google Cloud Storage: {e}")
+            return None
+
     def remove_marketing_image_object(self, file_name: str) -> bool:
         """
         Removes a marketing image from Google Cloud Storage.
@@ -179,10 +486,67 @@ class MarketingImageGoogleCloudStorageObjectStorageAdapter(MarketingImageObjectS
         Args:
             file_name: The file name of the image to remove.
         """
+        self._invalidate_metadata(file_name)
         try:
             blob = self.bucket.blob(file_name)
             blob.delete()
             return True
         except Exception as e:
             print(f"Error removing {file_name} from Google Cloud Storage: {e}")
-            return False
\ No newline at end of file
+            return False
+
+    def remove_marketing_image_objects(self, file_names: List[str]) -> Dict[str, str]:
+        """
+        Removes several marketing images from Google Cloud Storage, sending up to 16 deletions at a time.
+
+        Args:
+            file_names: The file names of the images to remove.
+
+        Returns:
+            A dictionary mapping each file name to REMOVED, NOT_FOUND, or FAILED.
+        """
+        return self._call_per_object(file_names, lambda file_name: self.bucket.blob(file_name).delete(), self.REMOVED, "removing")
+
+    def update_marketing_image_objects_metadata(self, file_names: List[str], fixed_key_metadata: Mapping[str, str]) -> Dict[str, str]:
+        """
+        Updates the fixed-key metadata of several marketing images in Google Cloud Storage, sending up to 16 metadata
+        patches at a time. Only the given fields are sent, so the objects are not re-uploaded.
+
+        Args:
+            file_names: The file names of the images to update.
+            fixed_key_metadata: The fixed-key metadata to set, with snake_case keys - e.g. {"cache_control": "no-store"}.
+
+        Returns:
+            A dictionary mapping each file name to UPDATED, NOT_FOUND, or FAILED.
+        """
+        fields = {key.lower().replace("-", "_"): value for key, value in fixed_key_metadata.items()}
+        unsupported_fields = [field for field in fields if field not in self.FIXED_METADATA_KEYS]
+        if unsupported_fields:
+            raise ValueError(f"Unsupported fixed-key metadata: {', '.join(unsupported_fields)}")
+
+        def patch(file_name: str) -> None:
+            blob = self.bucket.blob(file_name)
+            for field, value in fields.items():
+                setattr(blob, field, value)
+            blob.patch()
+
+        return self._call_per_object(file_names, patch, self.UPDATED, "updating the metadata of")
+
+    def get_metrics(self) -> dict:
+        """
+        Returns the number of uploads made with each strategy, the number of composite parts uploaded, the number of
+        uploads that found the object already stored (with the same content, or overwritten), and the
+        metadata cache's counters and hit rate (lookups answered without transferring metadata, including revalidations).
+        """
+        counters = dict(self.metadata_cache_counters)
+        lookups = counters["hits"] + counters["revalidated"] + counters["refreshed"] + counters["misses"]
+        return {
+            "uploads_by_strategy": dict(self.uploads_by_strategy),
+            "composite_parts_uploaded": self.composite_parts_uploaded,
+            "existing_objects": dict(self.existing_object_counters),
+            "metadata_cache": {
+                **counters,
+                "entries": len(self._metadata_cache),
+                "hit_rate": ((counters["hits"] + counters["revalidated"]) / lookups) if lookups else 0.0,
+            },
+        }
@@ -0,0 +1,157 @@
+import base64
+import hashlib
+import io
+import threading
+from datetime import datetime, timezone
+from typing import BinaryIO, Dict, Iterator, List, Mapping, Optional, Tuple
+
+from ....shared.utils import DataManipulationUtils
+from ....application.ports.marketing_image_object_storage_output_port import MarketingImageObjectStorageOutputPort
+
+
+class MarketingImageInMemoryObjectStorageAdapter(MarketingImageObjectStorageOutputPort):
+    """
+    An in-memory implementation of MarketingImageObjectStorageOutputPort, for load testing and local development.
+
+    Objects and their metadata are held in a dictionary for the lifetime of the process. URLs use a memory:// scheme
+    and checksums are base64-encoded MD5 hashes, in the same form as Google Cloud Storage returns them. As with the
+    Google Cloud Storage adapter, saving an object that is already stored with the same content is a no-op.
+    """
+
+    def __init__(self, bucket_name: str = None):
+        self.bucket_name = bucket_name or "marketing-images"
+        self._objects: Dict[str, bytes] = {}
+        self._metadata: Dict[str, dict] = {}
+        self._lock = threading.Lock() # Called from the object storage thread pool
+
+    def save_marketing_image_object(self, image_data: bytes, file_name: str, content_type: str, fixed_key_metadata: Optional[Mapping[str, str]] = None, custom_metadata: Optional[Mapping[str, str]] = None) -> Tuple[str, str]:
+        """
+        Saves image data and its metadata in memory.
+
+        Returns:
+            A tuple containing the memory:// URL and the base64-encoded MD5 checksum of the saved image.
+        """
+        fixed_meta = {DataManipulationUtils.snake_case_to_hyphenated_compounds(k): v for k, v in (fixed_key_metadata or {}).items()}
+        custom_meta = {DataManipulationUtils.snake_case_to_hyphenated_compounds(k): v for k, v in (custom_metadata or {}).items()}
+        image_bytes = bytes(image_data)
+        checksum = base64.b64encode(hashlib.md5(image_bytes).digest()).decode("utf-8")
+        now = datetime.now(timezone.utc).isoformat()
+
+        url = f"memory://{self.bucket_name}/{file_name}"
+        with self._lock:
+            previous_metadata = self._metadata.get(file_name)
+            if previous_metadata and previous_metadata["md5_hash"] == checksum:
+                print(f"{file_name} is already stored in memory with the same content - skipping the save")
+                return url, checksum
+            self._objects[file_name] = image_bytes
+            self._metadata[file_name] = {
+                "cache_control": fixed_meta.get("Cache-Control", self.DEFAULT_CACHE_CONTROL),
+                "content_disposition": fixed_meta.get("Content-Disposition"),
+                "content_encoding": fixed_meta.get("Content-Encoding"),
+                "content_language": fixed_meta.get("Content-Language", "en"),
+                "content_type": fixed_meta.get("Content-Type", content_type),
+                "custom_time": fixed_meta.get("Custom-Time"),
+                "generation": (previous_metadata["generation"] + 1) if previous_metadata else 1,
+                "md5_hash": checksum,
+                "metadata": custom_meta,
+                "metageneration": 1,
+                "name": file_name,
+                "size": len(image_bytes),
+                "time_created": now,
+                "updated": now,
+            }
+
+        print(f"Saved {file_name} in memory at URL: {url}")
+        return url, checksum
+
+    def retrieve_marketing_image_metadata(self, file_name: str) -> Optional[Mapping[str, str]]:
+        """
+        Retrieves marketing image metadata, or None if the object does not exist.
+        """
+        with self._lock:
+            metadata = self._metadata.get(file_name)
+            return dict(metadata) if metadata else None
+
+    def retrieve_marketing_image_object(self, file_name: str) -> Optional[bytes]:
+        """
+        Retrieves a marketing image object's data, or None if the object does not exist.
+        """
+        with self._lock:
+            return self._objects.get(file_name)
+
+    def retrieve_marketing_image_object_range(self, file_name: str, start: int, end: Optional[int] = None) -> Optional[bytes]:
+        """
+        Retrieves a byte range of a marketing image object's data (end inclusive), or None if the object does not exist.
+        """
+        with self._lock:
+            image_bytes = self._objects.get(file_name)
+        if image_bytes is None:
+            return None
+        return image_bytes[start:(end + 1) if end is not None else None]
+
+    def _read_chunks(self, image_bytes: bytes, chunk_size: int, start: int, end: Optional[int]) -> Iterator[bytes]:
+        stop = min(end + 1, len(image_bytes)) if end is not None else len(image_bytes)
+        view = memoryview(image_bytes)
+        for offset in range(start, stop, chunk_size):
+            yield bytes(view[offset:min(offset + chunk_size, stop)])
+
+    def retrieve_marketing_image_object_chunks(self, file_name: str, chunk_size: int = MarketingImageObjectStorageOutputPort.DEFAULT_CHUNK_SIZE, start: int = 0, end: Optional[int] = None) -> Optional[Iterator[bytes]]:
+        """
+        Retrieves a marketing image object's data as an iterator of chunks, or None if the object does not exist.
+        The iterator reads the object as it was when this was called, even if it is overwritten while iterating.
+        """
+        with self._lock:
+            image_bytes = self._objects.get(file_name)
+        if image_bytes is None:
+            return None
+        return self._read_chunks(image_bytes, chunk_size, start, end)
+
+    def open_marketing_image_object(self, file_name: str, chunk_size: int = MarketingImageObjectStorageOutputPort.DEFAULT_CHUNK_SIZE) -> Optional[BinaryIO]:
+        """
+        Opens a marketing image object as a read-only, seekable file-like object, or returns None if the object does not exist.
+        """
+        with self._lock:
+            image_bytes = self._objects.get(file_name)
+        return io.BytesIO(image_bytes) if image_bytes is not None else None
+
+    def remove_marketing_image_object(self, file_name: str) -> bool:
+        """
+        Removes a marketing image object. Returns False if the object does not exist.
+        """
+        with self._lock:
+            self._metadata.pop(file_name, None)
+            return self._objects.pop(file_name, None) is not None
+
+    def remove_marketing_image_objects(self, file_names: List[str]) -> Dict[str, str]:
+        """
+        Removes several marketing image objects, returning REMOVED or NOT_FOUND for each.
+        """
+        with self._lock:
+            results = {}
+            for file_name in file_names:
+                self._metadata.pop(file_name, None)
+                results[file_name] = self.REMOVED if self._objects.pop(file_name, None) is not None else self.NOT_FOUND
+        return results
+
+    def update_marketing_image_objects_metadata(self, file_names: List[str], fixed_key_metadata: Mapping[str, str]) -> Dict[str, str]:
+        """
+        Updates the fixed-key metadata of several marketing image objects, returning UPDATED or NOT_FOUND for each.
+        """
+        fields = {key.lower().replace("-", "_"): value for key, value in fixed_key_metadata.items()}
+        unsupported_fields = [field for field in fields if field not in self.FIXED_METADATA_KEYS]
+        if unsupported_fields:
+            raise ValueError(f"Unsupported fixed-key metadata: {', '.join(unsupported_fields)}")
+
+        now = datetime.now(timezone.utc).isoformat()
+        with self._lock:
+            results = {}
+            for file_name in file_names:
+                metadata = self._metadata.get(file_name)
+                if metadata is None:
+                    results[file_name] = self.NOT_FOUND
+                    continue
+                metadata.update(fields)
+                metadata["metageneration"] += 1
+                metadata["updated"] = now
+                results[file_name] = self.UPDATED
+        return results
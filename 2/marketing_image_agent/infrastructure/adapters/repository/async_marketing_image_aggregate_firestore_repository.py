@@ -0,0 +1,154 @@
+import uuid
+from datetime import datetime
+from typing import Optional, List, Tuple, Union
+
+from google.cloud import firestore
+
+from ....application.ports.async_marketing_image_repository_output_port import AsyncMarketingImageRepositoryOutputPort
+from ....domain.entities.marketing_image_aggregate import MarketingImage
+from .marketing_image_aggregate_firestore_document_mixin import MarketingImageAggregateFirestoreDocumentMixin
+from .marketing_image_aggregate_repository_caching_adapter import MarketingImageAggregateRepositoryCachingAdapter
+
+
+class AsyncMarketingImageAggregateFirestoreRepository(MarketingImageAggregateFirestoreDocumentMixin, AsyncMarketingImageRepositoryOutputPort):
+    """
+    Native asynchronous Firestore implementation of the AsyncMarketingImageRepositoryOutputPort, built on
+    firestore.AsyncClient, so that reads and writes are awaited on the event loop rather than blocking it or
+    being run on a worker thread.
+
+    Documents are stored exactly as MarketingImageAggregateFirestoreRepository stores them - the two share their
+    serialisation, version check, and query building through MarketingImageAggregateFirestoreDocumentMixin, and can be
+    used on the same collections - and saves are version-checked in a transaction in the same way, raising a
+    MarketingImageConcurrencyConflictError if an aggregate changed since it was retrieved.
+
+    The synchronous repository that serves the command handlers may sit behind a MarketingImageAggregateRepositoryCachingAdapter.
+    Pass it as aggregate_cache, and every save, save_all, and remove here evicts the aggregates it wrote from that cache,
+    so the command handlers never read an aggregate older than a write made on the event loop.
+    """
+
+    def __init__(self, google_cloud_project: str = None, db_location: str = None, db_name: str = None, aggregate_collection_name: str = None, domain_event_collection_name: str = None, aggregate_cache: MarketingImageAggregateRepositoryCachingAdapter = None):
+        self._configure(google_cloud_project, db_location, db_name, aggregate_collection_name, domain_event_collection_name)
+        self.aggregate_cache = aggregate_cache # None if the synchronous repository is not cached
+        self._db = None
+
+    @property
+    def db(self) -> firestore.AsyncClient:
+        # Created lazily so the client's gRPC channel binds to the event loop that first uses it
+        if self._db is None:
+            self._db = firestore.AsyncClient(project=self.google_cloud_project, database=self.db_name)
+        return self._db
+
+    async def _commit_if_versions_unchanged(self, marketing_images: List[MarketingImage]) -> tuple[int, List[str]]:
+        """
+        Reads the stored versions of the aggregates and writes the aggregates and their domain events in one transaction,
+        if none of them has changed since it was retrieved. Returns (number_of_writes, log_messages).
+        """
+        aggregate_refs = self._aggregate_refs(marketing_images)
+
+        @firestore.async_transactional
+        async def check_versions_and_write(transaction: firestore.AsyncTransaction) -> tuple[int, List[str]]:
+            stored_versions = {}
+            async for doc in self.db.get_all(aggregate_refs, field_paths=["version"], transaction=transaction):
+                if doc.exists:
+                    stored_versions[doc.id] = self._stored_version(doc)
+            return self._check_versions_and_add_writes(transaction, marketing_images, stored_versions)
+
+        return await check_versions_and_write(self.db.transaction())
+
+    def _invalidate_cached(self, aggregate_ids: List[uuid.UUID]) -> None:
+        if self.aggregate_cache is not None:
+            self.aggregate_cache.invalidate(aggregate_ids)
+
+    async def save(self, marketing_image: MarketingImage) -> None:
+        """
+        Saves a marketing image aggregate and its domain events to Firestore in a version-checked transaction.
+        """
+        try:
+            _, log_messages = await self._commit_if_versions_unchanged([marketing_image])
+        finally:
+            self._invalidate_cached([marketing_image.id])
+        self._mark_saved([marketing_image])
+        print(log_messages[0])
+
+        return marketing_image
+
+    async def save_all(self, marketing_images: List[MarketingImage]) -> None:
+        """
+        Saves several marketing image aggregates and their domain events to Firestore in a single version-checked
+        transaction, so either all of them are persisted or none are.
+        """
+        try:
+            number_of_writes, log_messages = await self._commit_if_versions_unchanged(marketing_images)
+        finally:
+            self._invalidate_cached([marketing_image.id for marketing_image in marketing_images])
+        self._mark_saved(marketing_images)
+        for log_message in log_messages:
+            print(log_message)
+        print(f"Committed {number_of_writes} writes for {len(marketing_images)} marketing image aggregates in a single transaction")
+
+        return marketing_images
+
+    async def retrieve_by_id(self, id: uuid.UUID) -> Optional[MarketingImage]:
+        """
+        Retrieves a marketing image aggregate from Firestore by its ID.
+        """
+        doc = await self.db.collection(self.aggregate_collection_name).document(str(id)).get()
+        if doc.exists:
+            return self._from_document(doc.to_dict())
+        return None
+
+    async def retrieve_by_ids(self, ids: List[uuid.UUID]) -> Tuple[List[MarketingImage], List[str]]:
+        """
+        Retrieves several marketing image aggregates from Firestore with batched gets of up to 100 documents,
+        in the order the IDs were given.
+        """
+        requested_ids, doc_ref_batches = self._get_all_batches(ids)
+        found_data = {}
+        for doc_refs in doc_ref_batches:
+            async for doc in self.db.get_all(doc_refs):
+                if doc.exists:
+                    found_data[doc.id] = doc.to_dict()
+        return self._order_found(requested_ids, found_data)
+
+    async def retrieve_all(self) -> List[MarketingImage]:
+        """
+        Retrieves all marketing image aggregates from Firestore, holding them all in memory.
+        Prefer query, which reads one page at a time, for large collections.
+        """
+        return [self._from_document(doc.to_dict()) async for doc in self.db.collection(self.aggregate_collection_name).stream()]
+
+    async def query_page(
+        self,
+        status: Optional[str] = None,
+        created_by: Optional[str] = None,
+        created_from: Optional[datetime] = None,
+        created_before: Optional[datetime] = None,
+        mime_type: Optional[str] = None,
+        order_by: str = "created_at",
+        descending: bool = True,
+        page_size: int = AsyncMarketingImageRepositoryOutputPort.DEFAULT_QUERY_PAGE_SIZE,
+        cursor: Optional[str] = None,
+        fields: Optional[List[str]] = None,
+    ) -> Tuple[List[Union[MarketingImage, dict]], Optional[str]]:
+        """
+        Retrieves one page of the marketing image aggregates in Firestore that match the filters, with the same
+        composite indexes, cursors, and projections as the synchronous repository, so cursors work with either.
+        """
+        query, order_field, page_size = self._build_page_query(status, created_by, created_from, created_before, mime_type, order_by, descending, page_size, cursor, fields)
+        return self._build_page([doc async for doc in query.stream()], order_field, page_size, fields)
+
+    async def retrieve_ids_by_url(self, url: str) -> List[str]:
+        """
+        Retrieves the IDs of the marketing image aggregates in Firestore that reference an image object URL.
+        Only document IDs are selected, so no aggregate data is transferred.
+        """
+        return [doc.id async for doc in self._ids_by_url_query(url).stream()]
+
+    async def remove(self, image_id: uuid.UUID) -> None:
+        """
+        Performs a hard delete of a marketing image aggregate from Firestore.
+        """
+        try:
+            await self.db.collection(self.aggregate_collection_name).document(str(image_id)).delete()
+        finally:
+            self._invalidate_cached([image_id])
@@ -0,0 +1,91 @@
+import asyncio
+import functools
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Any, Optional, List, Tuple, Union
+
+from ....application.ports.async_marketing_image_repository_output_port import AsyncMarketingImageRepositoryOutputPort
+from ....application.ports.marketing_image_repository_output_port import MarketingImageRepositoryOutputPort
+from ....domain.entities.marketing_image_aggregate import MarketingImage
+
+
+class AsyncMarketingImageAggregateRepositoryThreadOffloadAdapter(AsyncMarketingImageRepositoryOutputPort):
+    """
+    Asynchronous implementation of AsyncMarketingImageRepositoryOutputPort that wraps a synchronous
+    MarketingImageRepositoryOutputPort implementation - e.g. the Firestore repository - and runs its
+    blocking calls on a dedicated thread pool so that they never block the event loop.
+    """
+
+    def __init__(self, marketing_image_repository: MarketingImageRepositoryOutputPort, max_workers: int = 32):
+        self.repository = marketing_image_repository
+        self.max_workers = int(max_workers) if max_workers else 32
+        self.executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="repository")
+
+    async def _run(self, func, *args, **kwargs) -> Any:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, functools.partial(func, *args, **kwargs))
+
+    async def save(self, marketing_image: MarketingImage) -> None:
+        """
+        Saves a marketing image aggregate and its domain events without blocking the event loop.
+        """
+        return await self._run(self.repository.save, marketing_image)
+
+    async def save_all(self, marketing_images: List[MarketingImage]) -> None:
+        """
+        Saves several marketing image aggregates atomically without blocking the event loop.
+        """
+        return await self._run(self.repository.save_all, marketing_images)
+
+    async def retrieve_by_id(self, id: uuid.UUID) -> Optional[MarketingImage]:
+        """
+        Retrieves a marketing image aggregate by its ID without blocking the event loop.
+        """
+        return await self._run(self.repository.retrieve_by_id, id)
+
+    async def retrieve_by_ids(self, ids: List[uuid.UUID]) -> Tuple[List[MarketingImage], List[str]]:
+        """
+        Retrieves several marketing image aggregates by their IDs without blocking the event loop.
+        """
+        return await self._run(self.repository.retrieve_by_ids, ids)
+
+    async def retrieve_all(self) -> List[MarketingImage]:
+        """
+        Retrieves all marketing image aggregates without blocking the event loop.
+        """
+        return await self._run(self.repository.retrieve_all)
+
+    async def remove(self, id: uuid.UUID) -> None:
+        """
+        Removes a marketing image aggregate by its ID without blocking the event loop.
+        """
+        return await self._run(self.repository.remove, id)
+
+    async def retrieve_ids_by_url(self, url: str) -> List[str]:
+        """
+        Retrieves the IDs of the marketing image aggregates that reference an image object URL without blocking the event loop.
+        """
+        return await self._run(self.repository.retrieve_ids_by_url, url)
+
+    async def query_page(
+        self,
+        status: Optional[str] = None,
+        created_by: Optional[str] = None,
+        created_from: Optional[datetime] = None,
+        created_before: Optional[datetime] = None,
+        mime_type: Optional[str] = None,
+        order_by: str = "created_at",
+        descending: bool = True,
+        page_size: int = MarketingImageRepositoryOutputPort.DEFAULT_QUERY_PAGE_SIZE,
+        cursor: Optional[str] = None,
+        fields: Optional[List[str]] = None,
+    ) -> Tuple[List[Union[MarketingImage, dict]], Optional[str]]:
+        """
+        Retrieves one page of the marketing image aggregates that match the filters without blocking the event loop.
+        """
+        return await self._run(
+            self.repository.query_page,
+            status=status, created_by=created_by, created_from=created_from, created_before=created_before,
+            mime_type=mime_type, order_by=order_by, descending=descending, page_size=page_size, cursor=cursor, fields=fields,
+        )
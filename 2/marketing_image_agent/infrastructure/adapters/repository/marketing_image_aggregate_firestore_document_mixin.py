@@ -0,0 +1,214 @@
+import os
+from datetime import datetime
+from typing import Any, List, Optional, Tuple, Union
+
+from google.cloud import firestore
+
+from ....shared.utils import DataManipulationUtils
+from ....shared.query_cursor_utils import QueryCursorUtils
+
+from ....domain.entities.marketing_image_aggregate import MarketingImage
+from ....domain.factories.marketing_image_aggregate_factory import MarketingImageAggregateFactory
+
+
+class MarketingImageAggregateFirestoreDocumentMixin:
+    """
+    The document handling shared by the synchronous and the native async Firestore repositories: configuration,
+    serialisation, the writes of a save, the version check, and query building and paging. Only the calls to Firestore
+    differ between the two - Client and AsyncClient build references, transactions, and queries in the same way, and
+    only fetching them is awaited - so the two store documents identically and their cursors work with either.
+    """
+
+    MAX_WRITES_PER_TRANSACTION = 500
+    MAX_DOCUMENTS_PER_GET_ALL = 100
+
+    def _configure(self, google_cloud_project: str = None, db_location: str = None, db_name: str = None, aggregate_collection_name: str = None, domain_event_collection_name: str = None) -> None:
+        self.google_cloud_project = google_cloud_project or os.getenv("GOOGLE_CLOUD_REPOSITORY_ADAPTER_PROJECT", "rbal-assisted-prj1")
+        self.db_location = db_location or os.getenv("GOOGLE_CLOUD_REPOSITORY_ADAPTER_LOCATION", "europe-west4")
+        self.db_name = db_name or os.getenv("GOOGLE_CLOUD_FIRESTORE_REPOSITORY_ADAPTER_DATABASE", "claim-check-ew4-1")
+        self.aggregate_collection_name = aggregate_collection_name or os.getenv("GOOGLE_CLOUD_FIRESTORE_REPOSITORY_ADAPTER_COLLECTION_MARKETING_IMAGES", "marketing-image-aggregates")
+        self.domain_event_collection_name = domain_event_collection_name or os.getenv("GOOGLE_CLOUD_FIRESTORE_REPOSITORY_ADAPTER_COLLECTION_MARKETING_IMAGE_EVENTS", "marketing-image-domain-events")
+        self.aggregate_factory = MarketingImageAggregateFactory()
+
+    def _convert_keys_snake_to_camel_case(self, data: dict) -> dict:
+        return DataManipulationUtils.convert_keys_snake_to_camel_case(data)
+
+    def _convert_keys_camel_to_snake_case(self, data: dict) -> dict:
+        snake_case_data = {DataManipulationUtils.camel_to_snake_case(k): v for k, v in data.items()}
+        if snake_case_data.get("renditions"):
+            # Rendition keys are converted to camel case along with the rest of the document, so convert them back
+            snake_case_data["renditions"] = [{DataManipulationUtils.camel_to_snake_case(k): v for k, v in rendition.items()} for rendition in snake_case_data["renditions"]]
+        return snake_case_data
+
+    def _pre_persist_processing(self, data: dict) -> dict:
+        """
+        Processes the data to convert datetime objects to ISO format strings
+        and handles timestamp strings by parsing them into datetime objects.
+        """
+        processed_data = data.copy()
+        for k, v in processed_data.items():
+            if isinstance(v, datetime):
+                processed_data[k] = v.isoformat()  # Convert datetime to ISO format string
+            elif isinstance(v, str):
+                try:
+                    processed_data[k] = datetime.fromisoformat(v)  # Attempt to parse timestamp strings
+                except ValueError:
+                    pass  # If parsing fails, assume it's not a timestamp and leave it as is
+        return processed_data
+
+    def _to_document(self, data: dict) -> dict:
+        return self._pre_persist_processing(self._convert_keys_snake_to_camel_case(data))
+
+    def _from_document(self, document_data: dict) -> MarketingImage:
+        return self.aggregate_factory.from_dict(self._convert_keys_camel_to_snake_case(document_data))  # type: ignore
+
+    def _add_aggregate_writes(self, transaction: Any, marketing_image: MarketingImage) -> Tuple[int, str]:
+        """
+        Adds the writes needed to persist a marketing image aggregate and its domain events to a transaction
+        (or batch) - synchronous or async, as adding writes is not awaited.
+        If a 'removed' event is present, the aggregate is deleted and only that event is saved.
+        Returns (number_of_writes, log_message).
+        """
+        aggregate_doc_id = str(marketing_image.id)
+        aggregate_type = marketing_image.__class__.__name__
+        aggregate_data = self.aggregate_factory.to_dict(marketing_image)
+        aggregate_data["version"] = marketing_image.version + 1
+        domain_events = aggregate_data.pop("events_list", [])
+        aggregate_ref = self.db.collection(self.aggregate_collection_name).document(aggregate_doc_id)
+
+        removed_event = next((event for event in domain_events if "removed" in event.get("type", "").lower()), None)
+        if removed_event:
+            # If a 'removed' event exists, delete the aggregate and save only that event.
+            print(f"Processing removal for marketing image aggregate with ID {aggregate_doc_id}")
+            transaction.delete(aggregate_ref)
+            event_doc_id = str(removed_event["id"])
+            print(f"Saving {removed_event['type']} event with ID {event_doc_id}")
+            transaction.set(self.db.collection(self.domain_event_collection_name).document(event_doc_id), self._to_document(removed_event))
+            return 2, f"Removed {aggregate_type} {aggregate_doc_id} and saved its domain event (ID: {event_doc_id})"
+
+        print(f"Saving marketing image aggregate with ID {aggregate_doc_id}")
+        transaction.set(aggregate_ref, self._to_document(aggregate_data))
+        event_id_list = []
+        for event in domain_events:
+            event_doc_id = str(event["id"])
+            print(f"Saving {event['type']} event with ID {event_doc_id}")
+            event_id_list.append(event_doc_id)
+            transaction.set(self.db.collection(self.domain_event_collection_name).document(event_doc_id), self._to_document(event))
+
+        return 1 + len(event_id_list), f"Saved {aggregate_type} {aggregate_doc_id} and its {len(event_id_list)} domain events (IDs: {', '.join(event_id_list)})"
+
+    def _aggregate_refs(self, marketing_images: List[MarketingImage]) -> list:
+        return [self.db.collection(self.aggregate_collection_name).document(str(marketing_image.id)) for marketing_image in marketing_images]
+
+    @staticmethod
+    def _stored_version(doc) -> int:
+        return int((doc.to_dict() or {}).get("version") or 0)
+
+    def _check_versions_and_add_writes(self, transaction: Any, marketing_images: List[MarketingImage], stored_versions: dict) -> Tuple[int, List[str]]:
+        """
+        Raises a MarketingImageConcurrencyConflictError if any aggregate's stored version - stored_versions maps the IDs
+        of the stored aggregates to their versions - has changed since it was retrieved, and otherwise adds the writes of
+        all the aggregates to the transaction. Returns (number_of_writes, log_messages).
+        """
+        for marketing_image in marketing_images:
+            self._check_version(marketing_image, stored_versions.get(str(marketing_image.id)))
+
+        number_of_writes = 0
+        log_messages = []
+        for marketing_image in marketing_images:
+            aggregate_number_of_writes, log_message = self._add_aggregate_writes(transaction, marketing_image)
+            number_of_writes += aggregate_number_of_writes
+            log_messages.append(log_message)
+        if number_of_writes > self.MAX_WRITES_PER_TRANSACTION:
+            raise ValueError(f"Cannot save {len(marketing_images)} marketing images atomically: {number_of_writes} writes exceeds the Firestore limit of {self.MAX_WRITES_PER_TRANSACTION} per transaction.")
+        return number_of_writes, log_messages
+
+    @staticmethod
+    def _mark_saved(marketing_images: List[MarketingImage]) -> None:
+        for marketing_image in marketing_images:
+            marketing_image.version += 1
+            marketing_image.clear_domain_events()
+
+    def _get_all_batches(self, ids: List[Any]) -> Tuple[List[str], List[list]]:
+        """
+        Returns the requested IDs, without duplicates and in order, and the document references to fetch for them
+        in batched gets of up to 100 documents.
+        """
+        requested_ids = list(dict.fromkeys(str(id) for id in ids))
+        collection = self.db.collection(self.aggregate_collection_name)
+        doc_ref_batches = [
+            [collection.document(requested_id) for requested_id in requested_ids[index:index + self.MAX_DOCUMENTS_PER_GET_ALL]]
+            for index in range(0, len(requested_ids), self.MAX_DOCUMENTS_PER_GET_ALL)
+        ]
+        return requested_ids, doc_ref_batches
+
+    def _order_found(self, requested_ids: List[str], found_data: dict) -> Tuple[List[MarketingImage], List[str]]:
+        # Firestore returns the documents in any order, so they are put back into the order the IDs were given
+        marketing_images = [self._from_document(found_data[requested_id]) for requested_id in requested_ids if requested_id in found_data]
+        not_found_ids = [requested_id for requested_id in requested_ids if requested_id not in found_data]
+        return marketing_images, not_found_ids
+
+    def _build_page_query(
+        self,
+        status: Optional[str],
+        created_by: Optional[str],
+        created_from: Optional[datetime],
+        created_before: Optional[datetime],
+        mime_type: Optional[str],
+        order_by: str,
+        descending: bool,
+        page_size: int,
+        cursor: Optional[str],
+        fields: Optional[List[str]],
+    ) -> Tuple[Any, str, int]:
+        """
+        Validates query_page's arguments and builds its query, which reads one more document than the page size so that
+        the last page is known without reading an empty one. The equality filters combined with the ordering field are
+        served by the composite indexes in firestore.indexes.json. With fields, only those fields are selected (plus the
+        ordering field, for the cursor). Returns (query, order_field, page_size).
+        """
+        status = self._validate_query(status, created_from, created_before, order_by, page_size, fields)
+        page_size = int(page_size)
+        order_field = DataManipulationUtils.snake_to_camel_case(order_by)
+        direction = firestore.Query.DESCENDING if descending else firestore.Query.ASCENDING
+        collection = self.db.collection(self.aggregate_collection_name)
+
+        query = collection
+        for field, value in (("status", status), ("createdBy", created_by), ("mimeType", mime_type)):
+            if value is not None:
+                query = query.where(filter=firestore.FieldFilter(field, "==", value))
+        if created_from is not None:
+            query = query.where(filter=firestore.FieldFilter("createdAt", ">=", QueryCursorUtils.to_comparable_datetime(created_from)))
+        if created_before is not None:
+            query = query.where(filter=firestore.FieldFilter("createdAt", "<", QueryCursorUtils.to_comparable_datetime(created_before)))
+        query = query.order_by(order_field, direction=direction).order_by(firestore.FieldPath.document_id(), direction=direction)
+        if fields is not None:
+            query = query.select(list(dict.fromkeys([DataManipulationUtils.snake_to_camel_case(field) for field in fields] + [order_field])))
+        if cursor:
+            order_value, document_id = QueryCursorUtils.decode_cursor(cursor)
+            query = query.start_after({order_field: order_value, firestore.FieldPath.document_id(): collection.document(document_id)})
+        return query.limit(page_size + 1), order_field, page_size
+
+    def _build_page(self, docs: list, order_field: str, page_size: int, fields: Optional[List[str]]) -> Tuple[List[Union[MarketingImage, dict]], Optional[str]]:
+        """
+        Turns the documents read by a page query into the page's items - aggregates, or rows of the given fields -
+        and the cursor of the next page (None on the last page).
+        """
+        page_docs = docs[:page_size]
+        next_cursor = None
+        if len(docs) > page_size:
+            # Read from the snapshot's data, so a document without the ordering field does not raise
+            next_cursor = QueryCursorUtils.encode_cursor((page_docs[-1].to_dict() or {}).get(order_field), page_docs[-1].id)
+
+        items = []
+        for doc in page_docs:
+            data = self._convert_keys_camel_to_snake_case(doc.to_dict())
+            if fields is not None:
+                items.append({"id": doc.id, **{field: data.get(field) for field in fields}})
+            else:
+                items.append(self.aggregate_factory.from_dict(data))
+        return items, next_cursor
+
+    def _ids_by_url_query(self, url: str) -> Any:
+        # Only document IDs are selected, so no aggregate data is transferred
+        return self.db.collection(self.aggregate_collection_name).where(filter=firestore.FieldFilter("url", "==", url)).select([])
@@ -1,171 +1,139 @@
-import os
 import uuid
 from datetime import datetime
-from typing import Optional, List
+from typing import Optional, List, Tuple, Union
 
 from google.cloud import firestore
 
-from ....shared.utils import DataManipulationUtils
-
 from ....application.ports.marketing_image_repository_output_port import MarketingImageRepositoryOutputPort
 from ....domain.entities.marketing_image_aggregate import MarketingImage
-from ....domain.factories.marketing_image_aggregate_factory import MarketingImageAggregateFactory
 from ....domain.factories.marketing_image_domain_events_factory import MarketingImageDomainEventsFactory
+from .marketing_image_aggregate_firestore_document_mixin import MarketingImageAggregateFirestoreDocumentMixin
 
 
-data_manipulation_utils = DataManipulationUtils()
-
-
-class MarketingImageAggregateFirestoreRepository(MarketingImageRepositoryOutputPort):
+class MarketingImageAggregateFirestoreRepository(MarketingImageAggregateFirestoreDocumentMixin, MarketingImageRepositoryOutputPort):
     """
     Firestore implementation of the MarketingImageRepositoryOutputPort.
     This repository relies on a factory to convert between domain aggregates
     and dictionary representations for persistence.
+
+    Saves are optimistic: each runs in a transaction that reads the stored aggregates' versions and only writes if
+    they are still the versions the aggregates were retrieved with, raising a MarketingImageConcurrencyConflictError
+    otherwise - so two commands on the same image never silently overwrite each other, without holding any lock.
+    Serialisation, the version check, and query building are shared with the async repository by
+    MarketingImageAggregateFirestoreDocumentMixin.
     """
 
     def __init__(self, google_cloud_project: str = None, db_location: str = None, db_name: str = None, aggregate_collection_name: str = None, domain_event_collection_name: str = None):
-        if not google_cloud_project:
-            self.google_cloud_project = os.getenv("GOOGLE_CLOUD_REPOSITORY_ADAPTER_PROJECT", "rbal-assisted-prj1")
-        else:
-            self.google_cloud_project = google_cloud_project
-        
-        if not db_location:
-            self.db_location = os.getenv("GOOGLE_CLOUD_REPOSITORY_ADAPTER_LOCATION", "europe-west4")
-        else:
-            self.db_location = db_location
-        
-        if not db_name:
-            self.db_name = os.getenv("GOOGLE_CLOUD_FIRESTORE_REPOSITORY_ADAPTER_DATABASE", "claim-check-ew4-1")
-        else:
-            self.db_name = db_name
-        
-        if not aggregate_collection_name:
-            self.aggregate_collection_name = os.getenv("GOOGLE_CLOUD_FIRESTORE_REPOSITORY_ADAPTER_COLLECTION_MARKETING_IMAGES", "marketing-image-aggregates")
-        else:
-            self.aggregate_collection_name = aggregate_collection_name
-        
-        if not domain_event_collection_name:
-            self.domain_event_collection_name = os.getenv("GOOGLE_CLOUD_FIRESTORE_REPOSITORY_ADAPTER_COLLECTION_MARKETING_IMAGE_EVENTS", "marketing-image-domain-events")
-        else:
-            self.domain_event_collection_name = domain_event_collection_name
-
-        self.aggregate_factory = MarketingImageAggregateFactory()
+        self._configure(google_cloud_project, db_location, db_name, aggregate_collection_name, domain_event_collection_name)
         self.domain_events_factory = MarketingImageDomainEventsFactory()
         self.db = firestore.Client(project=self.google_cloud_project, database=self.db_name)
 
-    def _convert_keys_snake_to_camel_case(self, data: dict) -> dict:
-        return DataManipulationUtils.convert_keys_snake_to_camel_case(data)
-
-    def _convert_keys_camel_to_snake_case(self, data: dict) -> dict:
-        return {DataManipulationUtils.camel_to_snake_case(k): v for k, v in data.items()}
-
-    def _pre_persist_processing(self, data: dict) -> dict:
+    def _commit_if_versions_unchanged(self, marketing_images: List[MarketingImage]) -> tuple[int, List[str]]:
         """
-        Processes the data to convert datetime objects to ISO format strings
-        and handles timestamp strings by parsing them into datetime objects.
+        Reads the stored versions of the aggregates and writes the aggregates and their domain events in one transaction,
+        if none of them has changed since it was retrieved. Only the version field is read. Firestore retries the
+        transaction if a concurrent write contends with it, re-reading the versions each time.
+        Returns (number_of_writes, log_messages).
         """
-        processed_data = data.copy()
-        for k, v in processed_data.items():
-            if isinstance(v, datetime):
-                processed_data[k] = v.isoformat()  # Convert datetime to ISO format string
-            elif isinstance(v, str):
-                try:
-                    processed_data[k] = datetime.fromisoformat(v)  # Attempt to parse timestamp strings
-                except ValueError:
-                    pass  # If parsing fails, assume it's not a timestamp and leave it as is
-        return processed_data
+        aggregate_refs = self._aggregate_refs(marketing_images)
+
+        @firestore.transactional
+        def check_versions_and_write(transaction: firestore.Transaction) -> tuple[int, List[str]]:
+            stored_versions = {
+                doc.id: self._stored_version(doc)
+                for doc in self.db.get_all(aggregate_refs, field_paths=["version"], transaction=transaction)
+                if doc.exists
+            }
+            return self._check_versions_and_add_writes(transaction, marketing_images, stored_versions)
+
+        return check_versions_and_write(self.db.transaction())
 
     def save(self, marketing_image: MarketingImage) -> None:
         """
         Saves a marketing image aggregate and its domain events to Firestore.
-        This method uses a batch write to ensure atomicity and handles both
+        This method uses a transaction to ensure atomicity and handles both
         the creation of new aggregates and the update of existing ones.
+        Raises a MarketingImageConcurrencyConflictError if the aggregate was changed since it was retrieved.
         """
-        aggregate_doc_id = str(marketing_image.id)
-        aggregate_type = marketing_image.__class__.__name__
-        aggregate_data = self.aggregate_factory.to_dict(marketing_image)
-        domain_events = aggregate_data.pop("events_list", [])
-
-        # Check if a 'removed' event is present
-        removed_event = None
-        for event in domain_events:
-            if "removed" in event.get("type", "").lower():
-                removed_event = event
-                break
-
-        batch = self.db.batch()
-
-        if removed_event:
-            # If a 'removed' event exists, delete the aggregate and save only that event.
-            print(f"Processing removal for marketing image aggregate with ID {aggregate_doc_id}")
-            aggregate_ref = self.db.collection(self.aggregate_collection_name).document(aggregate_doc_id)
-            batch.delete(aggregate_ref)
-
-            event_doc_id = str(removed_event["id"])
-            print(f"Saving {removed_event['type']} event with ID {event_doc_id}")
-            event_ref = self.db.collection(self.domain_event_collection_name).document(event_doc_id)
-            event_data = self._convert_keys_snake_to_camel_case(removed_event)
-            processed_event_data = self._pre_persist_processing(event_data)
-            batch.set(event_ref, processed_event_data)
-            
-            batch.commit()
-            marketing_image.clear_domain_events()
-            print(f"Removed {aggregate_type} {aggregate_doc_id} and saved its domain event (ID: {event_doc_id})")
-
-        else:
-            # Save/Update the aggregate and its events
-            print(f"Saving marketing image aggregate with ID {aggregate_doc_id}")
-            aggregate_ref = self.db.collection(self.aggregate_collection_name).document(aggregate_doc_id)
-            
-            if "events_list" in aggregate_data:
-                del aggregate_data["events_list"]
-            
-            aggregate_data_camel_case = self._convert_keys_snake_to_camel_case(aggregate_data)
-            processed_aggregate_data = self._pre_persist_processing(aggregate_data_camel_case)
-            batch.set(aggregate_ref, processed_aggregate_data)
-
-            event_id_list = []
-            for event in domain_events:
-                domain_event_type = event["type"]
-                event_doc_id = str(event["id"])
-                print(f"Saving {domain_event_type} event with ID {event_doc_id}")
-                event_id_list.append(event_doc_id)
-                event_ref = self.db.collection(self.domain_event_collection_name).document(event_doc_id)
-                event_data = self._convert_keys_snake_to_camel_case(event)
-                processed_event_data = self._pre_persist_processing(event_data)
-                batch.set(event_ref, processed_event_data)
-
-            batch.commit()
-            marketing_image.clear_domain_events()
-            print(f"Saved {aggregate_type} {aggregate_doc_id} and its {len(event_id_list)} domain events (IDs: {', '.join(event_id_list)})")
+        _, log_messages = self._commit_if_versions_unchanged([marketing_image])
+        self._mark_saved([marketing_image])
+        print(log_messages[0])
 
         return marketing_image
 
+    def save_all(self, marketing_images: List[MarketingImage]) -> None:
+        """
+        Saves several marketing image aggregates and their domain events to Firestore in a single transaction,
+        so either all of them are persisted or none are (including if any of them has a version conflict).
+        """
+        number_of_writes, log_messages = self._commit_if_versions_unchanged(marketing_images)
+        self._mark_saved(marketing_images)
+        for log_message in log_messages:
+            print(log_message)
+        print(f"Committed {number_of_writes} writes for {len(marketing_images)} marketing image aggregates in a single transaction")
+
+        return marketing_images
+
 
     def retrieve_by_id(self, id: uuid.UUID) -> Optional[MarketingImage]:
         """
         Retrieves a marketing image aggregate from Firestore by its ID.
         """
-        doc_ref = self.db.collection(self.aggregate_collection_name).document(str(id))
-        doc = doc_ref.get()
+        doc = self.db.collection(self.aggregate_collection_name).document(str(id)).get()
         if doc.exists:
             # Use the factory to reconstitute the aggregate from the Firestore document
-            data = self._convert_keys_camel_to_snake_case(doc.to_dict())
-
-            return self.aggregate_factory.from_dict(data)  # type: ignore
+            return self._from_document(doc.to_dict())
         return None
 
+    def retrieve_by_ids(self, ids: List[uuid.UUID]) -> Tuple[List[MarketingImage], List[str]]:
+        """
+        Retrieves several marketing image aggregates from Firestore with batched gets of up to 100 documents,
+        rather than one round trip per document. Firestore returns the documents in any order, so they are put
+        back into the order the IDs were given.
+        """
+        requested_ids, doc_ref_batches = self._get_all_batches(ids)
+        found_data = {}
+        for doc_refs in doc_ref_batches:
+            for doc in self.db.get_all(doc_refs):
+                if doc.exists:
+                    found_data[doc.id] = doc.to_dict()
+        return self._order_found(requested_ids, found_data)
+
     def retrieve_all(self) -> List[MarketingImage]:
         """
-        Retrieves all marketing image aggregates from Firestore.
+        Retrieves all marketing image aggregates from Firestore, holding them all in memory.
+        Prefer query, which reads one page at a time, for large collections.
         """
-        docs = self.db.collection(self.aggregate_collection_name).stream()
-        # Convert the Firestore document to a dictionary and then to snake_case
-        marketing_images = []
-        for doc in docs:
-            data = self._convert_keys_camel_to_snake_case(doc.to_dict())
-            marketing_images.append(self.aggregate_factory.from_dict(data)) # type: ignore
-        return marketing_images
+        return [self._from_document(doc.to_dict()) for doc in self.db.collection(self.aggregate_collection_name).stream()]
+
+    def query_page(
+        self,
+        status: Optional[str] = None,
+        created_by: Optional[str] = None,
+        created_from: Optional[datetime] = None,
+        created_before: Optional[datetime] = None,
+        mime_type: Optional[str] = None,
+        order_by: str = "created_at",
+        descending: bool = True,
+        page_size: int = MarketingImageRepositoryOutputPort.DEFAULT_QUERY_PAGE_SIZE,
+        cursor: Optional[str] = None,
+        fields: Optional[List[str]] = None,
+    ) -> Tuple[List[Union[MarketingImage, dict]], Optional[str]]:
+        """
+        Retrieves one page of the marketing image aggregates in Firestore that match the filters.
+        The equality filters combined with the ordering field are served by the composite indexes in firestore.indexes.json.
+        One more document than the page size is read, so that the last page is known without reading an empty one.
+        With fields, only those fields are transferred (plus the ordering field, for the cursor).
+        """
+        query, order_field, page_size = self._build_page_query(status, created_by, created_from, created_before, mime_type, order_by, descending, page_size, cursor, fields)
+        return self._build_page(list(query.stream()), order_field, page_size, fields)
+
+    def retrieve_ids_by_url(self, url: str) -> List[str]:
+        """
+        Retrieves the IDs of the marketing image aggregates in Firestore that reference an image object URL.
+        Only document IDs are selected, so no aggregate data is transferred.
+        """
+        return [doc.id for doc in self._ids_by_url_query(url).stream()]
 
     def remove(self, image_id: uuid.UUID) -> None:
         """
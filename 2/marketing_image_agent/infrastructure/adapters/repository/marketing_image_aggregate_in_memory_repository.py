@@ -0,0 +1,172 @@
+import copy
+import threading
+import uuid
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple, Union
+
+from ....shared.query_cursor_utils import QueryCursorUtils
+from ....application.ports.marketing_image_repository_output_port import MarketingImageRepositoryOutputPort
+from ....domain.entities.marketing_image_aggregate import MarketingImage
+from ....domain.factories.marketing_image_aggregate_factory import MarketingImageAggregateFactory
+
+
+class MarketingImageAggregateInMemoryRepository(MarketingImageRepositoryOutputPort):
+    """
+    In-memory implementation of the MarketingImageRepositoryOutputPort, for load testing and local development.
+
+    Aggregates are serialised with the aggregate factory on save and reconstituted on retrieval, as the Firestore
+    repository does, so callers never share state with the stored copy. Domain events are kept in an in-memory list.
+    Saves are version-checked under the lock, so concurrent commands conflict as they would with Firestore.
+    """
+
+    def __init__(self):
+        self.aggregate_factory = MarketingImageAggregateFactory()
+        self._aggregates: Dict[str, dict] = {}
+        self.domain_events: List[dict] = []
+        self._lock = threading.Lock() # Called from the repository thread pool
+
+    def _check_stored_version(self, marketing_image: MarketingImage) -> None:
+        """
+        Raises a MarketingImageConcurrencyConflictError if the stored aggregate is not at the version the aggregate was
+        retrieved with. Must be called holding the lock.
+        """
+        stored_data = self._aggregates.get(str(marketing_image.id))
+        self._check_version(marketing_image, int(stored_data.get("version") or 0) if stored_data is not None else None)
+
+    def _apply_aggregate_writes(self, marketing_image: MarketingImage) -> str:
+        """
+        Applies the writes needed to persist a marketing image aggregate and its domain events.
+        If a 'removed' event is present, the aggregate is deleted and only that event is saved.
+        Returns a log message.
+        """
+        aggregate_id = str(marketing_image.id)
+        aggregate_data = copy.deepcopy(self.aggregate_factory.to_dict(marketing_image))
+        aggregate_data["version"] = marketing_image.version + 1
+        domain_events = aggregate_data.pop("events_list", [])
+
+        removed_event = next((event for event in domain_events if "removed" in event.get("type", "").lower()), None)
+        if removed_event:
+            self._aggregates.pop(aggregate_id, None)
+            self.domain_events.append(removed_event)
+            return f"Removed {marketing_image.__class__.__name__} {aggregate_id} and saved its domain event (ID: {removed_event['id']})"
+
+        self._aggregates[aggregate_id] = aggregate_data
+        self.domain_events.extend(domain_events)
+        return f"Saved {marketing_image.__class__.__name__} {aggregate_id} and its {len(domain_events)} domain events in memory"
+
+    def save(self, marketing_image: MarketingImage) -> None:
+        """
+        Saves a marketing image aggregate and its domain events in memory.
+        """
+        with self._lock:
+            self._check_stored_version(marketing_image)
+            log_message = self._apply_aggregate_writes(marketing_image)
+        marketing_image.version += 1
+        marketing_image.clear_domain_events()
+        print(log_message)
+
+        return marketing_image
+
+    def save_all(self, marketing_images: List[MarketingImage]) -> None:
+        """
+        Saves several marketing image aggregates and their domain events in memory, under a single lock so that
+        no reader observes some of them without the others.
+        """
+        with self._lock:
+            for marketing_image in marketing_images:
+                self._check_stored_version(marketing_image) # All are checked before any is written, so a conflict saves none
+            log_messages = [self._apply_aggregate_writes(marketing_image) for marketing_image in marketing_images]
+        for marketing_image in marketing_images:
+            marketing_image.version += 1
+            marketing_image.clear_domain_events()
+        for log_message in log_messages:
+            print(log_message)
+
+        return marketing_images
+
+    def retrieve_by_id(self, id: uuid.UUID) -> Optional[MarketingImage]:
+        """
+        Retrieves a marketing image aggregate by its ID.
+        """
+        with self._lock:
+            data = copy.deepcopy(self._aggregates.get(str(id)))
+        return self.aggregate_factory.from_dict(data) if data else None
+
+    def retrieve_by_ids(self, ids: List[uuid.UUID]) -> Tuple[List[MarketingImage], List[str]]:
+        """
+        Retrieves several marketing image aggregates by their IDs, in the order the IDs were given.
+        """
+        requested_ids = list(dict.fromkeys(str(id) for id in ids))
+        with self._lock:
+            found_data = {requested_id: copy.deepcopy(self._aggregates[requested_id]) for requested_id in requested_ids if requested_id in self._aggregates}
+        marketing_images = [self.aggregate_factory.from_dict(found_data[requested_id]) for requested_id in requested_ids if requested_id in found_data]
+        return marketing_images, [requested_id for requested_id in requested_ids if requested_id not in found_data]
+
+    def retrieve_all(self) -> List[MarketingImage]:
+        """
+        Retrieves all marketing image aggregates.
+        """
+        with self._lock:
+            aggregates_data = copy.deepcopy(list(self._aggregates.values()))
+        return [self.aggregate_factory.from_dict(data) for data in aggregates_data]
+
+    def query_page(
+        self,
+        status: Optional[str] = None,
+        created_by: Optional[str] = None,
+        created_from: Optional[datetime] = None,
+        created_before: Optional[datetime] = None,
+        mime_type: Optional[str] = None,
+        order_by: str = "created_at",
+        descending: bool = True,
+        page_size: int = MarketingImageRepositoryOutputPort.DEFAULT_QUERY_PAGE_SIZE,
+        cursor: Optional[str] = None,
+        fields: Optional[List[str]] = None,
+    ) -> Tuple[List[Union[MarketingImage, dict]], Optional[str]]:
+        """
+        Retrieves one page of the marketing image aggregates that match the filters, ordered as Firestore orders them.
+        """
+        status = self._validate_query(status, created_from, created_before, order_by, page_size, fields)
+        page_size = int(page_size)
+        created_from = QueryCursorUtils.to_comparable_datetime(created_from)
+        created_before = QueryCursorUtils.to_comparable_datetime(created_before)
+
+        def _sort_key(data: dict) -> tuple:
+            order_value = QueryCursorUtils.to_comparable_datetime(data.get(order_by))
+            return (order_value is not None, order_value or datetime.min, data["id"]) # Nulls first, as in Firestore
+
+        with self._lock:
+            matching_data = [
+                data for data in self._aggregates.values()
+                if (status is None or data.get("status") == status)
+                and (created_by is None or data.get("created_by") == created_by)
+                and (mime_type is None or data.get("mime_type") == mime_type)
+                and (created_from is None or (data.get("created_at") is not None and QueryCursorUtils.to_comparable_datetime(data["created_at"]) >= created_from))
+                and (created_before is None or (data.get("created_at") is not None and QueryCursorUtils.to_comparable_datetime(data["created_at"]) < created_before))
+            ]
+            matching_data.sort(key=_sort_key, reverse=descending)
+            if cursor:
+                order_value, document_id = QueryCursorUtils.decode_cursor(cursor)
+                cursor_key = _sort_key({order_by: order_value, "id": document_id})
+                matching_data = [data for data in matching_data if (_sort_key(data) < cursor_key if descending else _sort_key(data) > cursor_key)]
+            page_data = copy.deepcopy(matching_data[:page_size])
+            has_more = len(matching_data) > page_size
+
+        next_cursor = QueryCursorUtils.encode_cursor(QueryCursorUtils.to_comparable_datetime(page_data[-1].get(order_by)), page_data[-1]["id"]) if has_more else None
+        if fields is not None:
+            return [{"id": data["id"], **{field: data.get(field) for field in fields}} for data in page_data], next_cursor
+        return [self.aggregate_factory.from_dict(data) for data in page_data], next_cursor
+
+    def retrieve_ids_by_url(self, url: str) -> List[str]:
+        """
+        Retrieves the IDs of the marketing image aggregates that reference an image object URL.
+        """
+        with self._lock:
+            return [aggregate_id for aggregate_id, data in self._aggregates.items() if data.get("url") == url]
+
+    def remove(self, image_id: uuid.UUID) -> None:
+        """
+        Performs a hard delete of a marketing image aggregate.
+        """
+        with self._lock:
+            self._aggregates.pop(str(image_id), None)
@@ -0,0 +1,224 @@
+import copy
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from datetime import datetime
+from typing import List, Optional, Tuple, Union
+
+from ....application.ports.marketing_image_repository_output_port import MarketingImageRepositoryOutputPort
+from ....domain.entities.marketing_image_aggregate import MarketingImage
+from ....domain.factories.marketing_image_aggregate_factory import MarketingImageAggregateFactory
+from ....domain.value_objects.status import StatusEnum
+
+
+class MarketingImageAggregateRepositoryCachingAdapter(MarketingImageRepositoryOutputPort):
+    """
+    Implementation of the MarketingImageRepositoryOutputPort that puts a read-through cache in front of another
+    repository - e.g. the Firestore repository - so that the commands of a conversation that touch the same image
+    several times in a row read its document once.
+
+    Aggregates are cached as the serialised dictionaries the aggregate factory produces, in a bounded least-recently-used
+    map, and are reconstituted on every hit, so callers never share state with the cached copy. Saves write through:
+    once the wrapped repository has committed, the saved aggregate replaces the cached one. A removal - by a save of a
+    removed aggregate, or by remove - evicts it.
+
+    The cache is local to the process. Another instance's writes are only seen once an entry is older than ttl_seconds
+    (0 disables expiry, which suits a single instance), so keep the TTL short when several instances share a repository.
+    A stale entry never causes a lost update, though: it carries the version it was read at, so saving a change made to
+    it raises a MarketingImageConcurrencyConflictError, which evicts the entry so that a retry reads the current version.
+    """
+
+    def __init__(self, marketing_image_repository: MarketingImageRepositoryOutputPort, max_entries: int = 1024, ttl_seconds: float = 30.0):
+        self.repository = marketing_image_repository
+        self.aggregate_factory = MarketingImageAggregateFactory()
+        self.max_entries = int(max_entries) if max_entries else 1024
+        self.ttl_seconds = float(ttl_seconds) if ttl_seconds is not None else 30.0
+        self._entries: "OrderedDict[str, tuple[float, dict]]" = OrderedDict() # Aggregate ID -> (time cached, serialised aggregate)
+        self._lock = threading.Lock() # Called from command handler threads and the repository thread pool
+        self._writes = 0 # Incremented by every write and invalidation, so a slow read never caches data older than a write
+        self.counters = {"hits": 0, "misses": 0, "evictions": 0, "expirations": 0, "invalidations": 0, "write_throughs": 0}
+
+    def _serialise(self, marketing_image: MarketingImage) -> dict:
+        data = copy.deepcopy(self.aggregate_factory.to_dict(marketing_image))
+        data.pop("events_list", None) # Domain events are persisted by the wrapped repository, never read back from the cache
+        return data
+
+    def _put(self, aggregate_id: str, data: dict) -> None:
+        self._entries[aggregate_id] = (time.monotonic(), data)
+        self._entries.move_to_end(aggregate_id)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.counters["evictions"] += 1
+
+    def _invalidate(self, aggregate_id: str) -> None:
+        self._writes += 1
+        if self._entries.pop(aggregate_id, None) is not None:
+            self.counters["invalidations"] += 1
+
+    def _write_through(self, marketing_images: List[MarketingImage]) -> None:
+        with self._lock:
+            for marketing_image in marketing_images:
+                aggregate_id = str(marketing_image.id)
+                if marketing_image.status.status == StatusEnum.REMOVED:
+                    self._invalidate(aggregate_id)
+                else:
+                    self._writes += 1
+                    self._put(aggregate_id, self._serialise(marketing_image))
+                    self.counters["write_throughs"] += 1
+
+    def save(self, marketing_image: MarketingImage) -> None:
+        """
+        Saves a marketing image aggregate with the wrapped repository, then caches it (or evicts it, if it was removed).
+        If the save fails - e.g. with a version conflict - the cached aggregate is evicted, as it may no longer match
+        the repository.
+        """
+        try:
+            result = self.repository.save(marketing_image)
+        except Exception:
+            with self._lock:
+                self._invalidate(str(marketing_image.id))
+            raise
+        self._write_through([marketing_image])
+        return result
+
+    def save_all(self, marketing_images: List[MarketingImage]) -> None:
+        """
+        Saves several marketing image aggregates atomically with the wrapped repository, then caches them.
+        """
+        try:
+            result = self.repository.save_all(marketing_images)
+        except Exception:
+            with self._lock:
+                for marketing_image in marketing_images:
+                    self._invalidate(str(marketing_image.id))
+            raise
+        self._write_through(marketing_images)
+        return result
+
+    def _get_cached(self, aggregate_id: str) -> Optional[dict]:
+        """
+        Returns a copy of a cached, unexpired serialised aggregate, or None. Must be called holding the lock.
+        """
+        cached = self._entries.get(aggregate_id)
+        if cached is not None and self.ttl_seconds > 0 and time.monotonic() - cached[0] > self.ttl_seconds:
+            del self._entries[aggregate_id]
+            self.counters["expirations"] += 1
+            cached = None
+        if cached is None:
+            self.counters["misses"] += 1
+            return None
+        self._entries.move_to_end(aggregate_id)
+        self.counters["hits"] += 1
+        return copy.deepcopy(cached[1])
+
+    def _cache_retrieved(self, marketing_images: List[MarketingImage], writes_before_read: int) -> None:
+        serialised_images = [(str(marketing_image.id), self._serialise(marketing_image)) for marketing_image in marketing_images]
+        with self._lock:
+            if self._writes == writes_before_read:
+                for aggregate_id, data in serialised_images:
+                    self._put(aggregate_id, data)
+
+    def retrieve_by_id(self, id: uuid.UUID) -> Optional[MarketingImage]:
+        """
+        Retrieves a marketing image aggregate from the cache, or from the wrapped repository on a miss (caching the result).
+        """
+        with self._lock:
+            data = self._get_cached(str(id))
+            writes_before_read = self._writes
+        if data is not None:
+            return self.aggregate_factory.from_dict(data)
+
+        marketing_image = self.repository.retrieve_by_id(id)
+        if marketing_image is not None:
+            self._cache_retrieved([marketing_image], writes_before_read)
+        return marketing_image
+
+    def retrieve_by_ids(self, ids: List[uuid.UUID]) -> Tuple[List[MarketingImage], List[str]]:
+        """
+        Retrieves several marketing image aggregates, taking those that are cached from the cache and the rest from
+        the wrapped repository in one multi-get (caching them), in the order the IDs were given.
+        """
+        requested_ids = list(dict.fromkeys(str(id) for id in ids))
+        with self._lock:
+            cached_data = {requested_id: self._get_cached(requested_id) for requested_id in requested_ids}
+            writes_before_read = self._writes
+        marketing_images_by_id = {requested_id: self.aggregate_factory.from_dict(data) for requested_id, data in cached_data.items() if data is not None}
+
+        missed_ids = [requested_id for requested_id in requested_ids if requested_id not in marketing_images_by_id]
+        not_found_ids = []
+        if missed_ids:
+            retrieved_images, not_found_ids = self.repository.retrieve_by_ids(missed_ids)
+            self._cache_retrieved(retrieved_images, writes_before_read)
+            marketing_images_by_id.update((str(marketing_image.id), marketing_image) for marketing_image in retrieved_images)
+
+        return [marketing_images_by_id[requested_id] for requested_id in requested_ids if requested_id in marketing_images_by_id], not_found_ids
+
+    def retrieve_all(self) -> List[MarketingImage]:
+        """
+        Retrieves all marketing image aggregates from the wrapped repository. The result is not cached, so that a full
+        scan does not evict the images that are in use.
+        """
+        return self.repository.retrieve_all()
+
+    def query_page(
+        self,
+        status: Optional[str] = None,
+        created_by: Optional[str] = None,
+        created_from: Optional[datetime] = None,
+        created_before: Optional[datetime] = None,
+        mime_type: Optional[str] = None,
+        order_by: str = "created_at",
+        descending: bool = True,
+        page_size: int = MarketingImageRepositoryOutputPort.DEFAULT_QUERY_PAGE_SIZE,
+        cursor: Optional[str] = None,
+        fields: Optional[List[str]] = None,
+    ) -> Tuple[List[Union[MarketingImage, dict]], Optional[str]]:
+        """
+        Retrieves one page of the marketing image aggregates that match the filters, from the wrapped repository.
+        Like retrieve_all, the result is not cached.
+        """
+        return self.repository.query_page(
+            status=status, created_by=created_by, created_from=created_from, created_before=created_before,
+            mime_type=mime_type, order_by=order_by, descending=descending, page_size=page_size, cursor=cursor, fields=fields,
+        )
+
+    def retrieve_ids_by_url(self, url: str) -> List[str]:
+        """
+        Retrieves the IDs of the marketing image aggregates that reference an image object URL, from the wrapped repository.
+        """
+        return self.repository.retrieve_ids_by_url(url)
+
+    def remove(self, image_id: uuid.UUID) -> None:
+        """
+        Removes a marketing image aggregate with the wrapped repository and evicts it from the cache.
+        """
+        try:
+            return self.repository.remove(image_id)
+        finally:
+            with self._lock:
+                self._invalidate(str(image_id))
+
+    def invalidate(self, aggregate_ids: List[uuid.UUID]) -> None:
+        """
+        Evicts marketing image aggregates that were written without going through this cache - e.g. by the native async
+        Firestore repository - so that the next read takes them from the wrapped repository.
+        """
+        with self._lock:
+            for aggregate_id in aggregate_ids:
+                self._invalidate(str(aggregate_id))
+
+    def get_metrics(self) -> dict:
+        """
+        Returns the cache's hit, miss, eviction, expiration, invalidation, and write-through counters, its size, and its hit rate.
+        """
+        with self._lock:
+            counters = dict(self.counters)
+            entries = len(self._entries)
+        lookups = counters["hits"] + counters["misses"]
+        return {
+            **counters,
+            "entries": entries,
+            "max_entries": self.max_entries,
+            "hit_rate": (counters["hits"] / lookups) if lookups else 0.0,
+        }
@@ -0,0 +1,35 @@
+import hashlib
+import json
+import re
+import unicodedata
+from typing import Any, Dict
+
+
+class GenerationKeyUtils:
+    @staticmethod
+    def normalise_prompt(prompt: str) -> str:
+        """
+        Normalises a prompt so that trivially different spellings of the same request share a key -
+        i.e. Unicode NFKC, case-folded, whitespace collapsed, and trailing full stops removed.
+        """
+        normalised_prompt = unicodedata.normalize("NFKC", prompt or "").casefold()
+        normalised_prompt = re.sub(r"\s+", " ", normalised_prompt).strip()
+        return normalised_prompt.rstrip(". ")
+
+    @staticmethod
+    def build_generation_key(generation_model: str, prompt: str, generation_parameters: Dict[str, Any]) -> str:
+        """
+        Builds a content-addressed key (SHA-256 hex digest) from the model name, the normalised prompt,
+        and the generation parameters - e.g. aspect ratio, MIME type, and image size.
+        """
+        key_material = json.dumps(
+            {
+                "generation_model": generation_model,
+                "prompt": GenerationKeyUtils.normalise_prompt(prompt),
+                "generation_parameters": generation_parameters or {},
+            },
+            sort_keys=True,
+            separators=(",", ":"),
+            default=str,
+        )
+        return hashlib.sha256(key_material.encode("utf-8")).hexdigest()
@@ -0,0 +1,92 @@
+import struct
+from typing import Optional, Tuple
+
+
+class ImageHeaderUtils:
+    """
+    Reads image dimensions and MIME type directly from PNG, JPEG, and WebP headers, without decoding any pixel data.
+    """
+
+    PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+    JPEG_SOI_MARKER = b"\xff\xd8"
+    # Start of Frame markers that carry the frame dimensions (0xC4 DHT, 0xC8 JPG, and 0xCC DAC are not frames)
+    JPEG_SOF_MARKERS = {0xC0, 0xC1, 0xC2, 0xC3, 0xC5, 0xC6, 0xC7, 0xC9, 0xCA, 0xCB, 0xCD, 0xCE, 0xCF}
+    # Markers without a length field
+    JPEG_STANDALONE_MARKERS = {0x01, 0xD0, 0xD1, 0xD2, 0xD3, 0xD4, 0xD5, 0xD6, 0xD7, 0xD8}
+
+    @staticmethod
+    def probe_image(image_data: bytes) -> Optional[Tuple[int, int, str]]:
+        """
+        Determines the (width, height, mime_type) of an image from its header.
+        Returns None if the format is not recognised or the header is truncated or malformed.
+        """
+        if not image_data:
+            return None
+        view = memoryview(image_data)
+        if image_data[:8] == ImageHeaderUtils.PNG_SIGNATURE:
+            return ImageHeaderUtils._probe_png(view)
+        if image_data[:2] == ImageHeaderUtils.JPEG_SOI_MARKER:
+            return ImageHeaderUtils._probe_jpeg(view)
+        if image_data[:4] == b"RIFF" and image_data[8:12] == b"WEBP":
+            return ImageHeaderUtils._probe_webp(view)
+        return None
+
+    @staticmethod
+    def _probe_png(view: memoryview) -> Optional[Tuple[int, int, str]]:
+        # The IHDR chunk must come first: 4-byte length, b"IHDR", 4-byte width, 4-byte height
+        if len(view) < 24 or bytes(view[12:16]) != b"IHDR":
+            return None
+        width, height = struct.unpack(">II", view[16:24])
+        return width, height, "image/png"
+
+    @staticmethod
+    def _probe_jpeg(view: memoryview) -> Optional[Tuple[int, int, str]]:
+        offset = 2
+        length = len(view)
+        while offset + 4 <= length:
+            if view[offset] != 0xFF:
+                return None
+            marker = view[offset + 1]
+            if marker == 0xFF:
+                # Fill byte
+                offset += 1
+                continue
+            if marker in ImageHeaderUtils.JPEG_STANDALONE_MARKERS:
+                offset += 2
+                continue
+            if marker == 0xD9 or marker == 0xDA:
+                # End of image or start of scan reached before a frame header
+                return None
+            segment_length = struct.unpack(">H", view[offset + 2:offset + 4])[0]
+            if marker in ImageHeaderUtils.JPEG_SOF_MARKERS:
+                # Segment: length (2), precision (1), height (2), width (2)
+                if offset + 9 > length:
+                    return None
+                height, width = struct.unpack(">HH", view[offset + 5:offset + 9])
+                return width, height, "image/jpeg"
+            offset += 2 + segment_length
+        return None
+
+    @staticmethod
+    def _probe_webp(view: memoryview) -> Optional[Tuple[int, int, str]]:
+        if len(view) < 30:
+            return None
+        chunk_type = bytes(view[12:16])
+        if chunk_type == b"VP8 ":
+            # Lossy: frame tag (3), start code (3), then 14-bit width and height
+            if bytes(view[23:26]) != b"\x9d\x01\x2a":
+                return None
+            width, height = struct.unpack("<HH", view[26:30])
+            return width & 0x3FFF, height & 0x3FFF, "image/webp"
+        if chunk_type == b"VP8L":
+            # Lossless: signature byte 0x2f, then 14-bit (width - 1) and (height - 1) packed little-endian
+            if view[20] != 0x2F:
+                return None
+            bits = int.from_bytes(view[21:25], "little")
+            return (bits & 0x3FFF) + 1, ((bits >> 14) & 0x3FFF) + 1, "image/webp"
+        if chunk_type == b"VP8X":
+            # Extended: flags (4), then 24-bit (canvas width - 1) and (canvas height - 1)
+            width = int.from_bytes(view[24:27], "little") + 1
+            height = int.from_bytes(view[27:30], "little") + 1
+            return width, height, "image/webp"
+        return None
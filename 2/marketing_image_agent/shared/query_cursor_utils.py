@@ -0,0 +1,45 @@
+import base64
+import json
+from datetime import datetime, timezone
+from typing import Any, Optional, Tuple
+
+
+class QueryCursorUtils:
+    @staticmethod
+    def encode_cursor(order_value: Any, document_id: str) -> str:
+        """
+        Encodes the position of the last row of a page - its ordering field's value and its ID - as an opaque,
+        URL-safe cursor. Datetimes are tagged so that they are decoded as datetimes rather than strings.
+        """
+        if isinstance(order_value, datetime):
+            order_value = {"$datetime": order_value.isoformat()}
+        cursor_data = json.dumps({"value": order_value, "id": document_id}, separators=(",", ":"))
+        return base64.urlsafe_b64encode(cursor_data.encode("utf-8")).decode("ascii")
+
+    @staticmethod
+    def decode_cursor(cursor: str) -> Tuple[Any, str]:
+        """
+        Decodes a cursor created by encode_cursor into the ordering field's value and the document ID.
+        """
+        try:
+            cursor_data = json.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))
+            order_value, document_id = cursor_data["value"], cursor_data["id"]
+        except (ValueError, KeyError, TypeError):
+            raise ValueError(f"Invalid query cursor: {cursor}")
+        if isinstance(order_value, dict) and "$datetime" in order_value:
+            order_value = datetime.fromisoformat(order_value["$datetime"])
+        return order_value, document_id
+
+    @staticmethod
+    def to_comparable_datetime(value: Any) -> Optional[datetime]:
+        """
+        Converts a datetime or ISO 8601 string to a naive UTC datetime, as Firestore treats naive datetimes as UTC,
+        so that timestamps stored with and without a time zone can be compared.
+        """
+        if value is None:
+            return None
+        if isinstance(value, str):
+            value = datetime.fromisoformat(value)
+        if value.tzinfo is not None:
+            value = value.astimezone(timezone.utc).replace(tzinfo=None)
+        return value
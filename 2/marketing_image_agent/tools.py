@@ -11,7 +11,7 @@ class InputDataBaseClass(BaseModel):
     The 'request_type' field is used to discriminate between different input request types.
     """
     request_id: str
-    request_type: Literal["generate", "change_metadata", "approval_status_change_request", "remove"]
+    request_type: Literal["generate", "generate_batch", "change_metadata", "approval_status_change_request", "remove", "remove_batch"]
     requestor: str
     request_time: Optional[str] = None
     traceparent: Optional[str] = None
@@ -23,6 +23,16 @@ class GenerateMarketingImageInputData(InputDataBaseClass):
     image_min_dimensions: Optional[Dict[str, int]] = None
     image_max_dimensions: Optional[Dict[str, int]] = None
     mime_type: Optional[str] = None
+    use_generation_cache: Optional[bool] = None
+    latency_budget_ms: Optional[int] = None
+
+class GenerateMarketingImageBatchInputData(InputDataBaseClass):
+    request_type: Literal["generate_batch"] = "generate_batch"
+    request_text: str
+    number_of_images: int
+    image_min_dimensions: Optional[Dict[str, int]] = None
+    image_max_dimensions: Optional[Dict[str, int]] = None
+    mime_type: Optional[str] = None
 
 class ChangeMarketingImageAttributesInputData(InputDataBaseClass):
     request_type: Literal["change_attributes"] = "change_attributes"
@@ -42,6 +52,10 @@ class RemoveMarketingImageInputData(InputDataBaseClass):
     request_type: Literal["remove"] = "remove"
     image_id: str
 
+class RemoveMarketingImageBatchInputData(InputDataBaseClass):
+    request_type: Literal["remove_batch"] = "remove_batch"
+    image_ids: List[str]
+
 
 class MarketingImageTools:
     """A tool for handling all marketing image-related operations."""
@@ -65,9 +79,11 @@ class MarketingImageTools:
 
         # Eagerly instantiate handlers to register them
         self.container.generate_marketing_image_command_handler()
+        self.container.generate_marketing_image_batch_command_handler()
         self.container.approve_marketing_image_command_handler()
         self.container.reject_marketing_image_command_handler()
         self.container.remove_marketing_image_command_handler()
+        self.container.remove_marketing_image_batch_command_handler()
         self.container.change_marketing_image_metadata_command_handler()
         self.container.marketing_image_generated_domain_event_handler()
         self.container.marketing_image_approved_domain_event_handler()
@@ -79,7 +95,7 @@ class MarketingImageTools:
         self.remove_marketing_image_driving_service = self.container.remove_marketing_image_driving_service()
         self.change_marketing_image_metadata_driving_service = self.container.change_marketing_image_metadata_driving_service()
 
-    def generate_image(self, prompt: str) -> dict:
+    async def generate_image(self, prompt: str, use_generation_cache: bool = True, latency_budget_ms: Optional[int] = None) -> dict:
         """Generates a marketing image based on a text prompt."""
         input_data_dict = {
             "request_id": str(uuid.uuid4()),
@@ -90,16 +106,39 @@ class MarketingImageTools:
             "image_min_dimensions": {"width": 1024, "height": 1024},
             "image_max_dimensions": {"width": 2048, "height": 2048},
             "mime_type": "image/png",
+            "use_generation_cache": use_generation_cache,
+            "latency_budget_ms": latency_budget_ms,
         }
         generate_marketing_image_input_data = GenerateMarketingImageInputData(**input_data_dict)
 
-        result = self.generate_marketing_image_driving_service.handle(
+        result = await self.generate_marketing_image_driving_service.handle(
             generate_marketing_image_input_data.model_dump()
         )
         print(result)
         return result
 
-    def change_image_approval_status_request(self, image_id: str, status: Literal["approve", "reject"]) -> dict:
+    async def generate_images(self, prompt: str, number_of_images: int) -> dict:
+        """Generates several variants of a marketing image based on a text prompt."""
+        input_data_dict = {
+            "request_id": str(uuid.uuid4()),
+            "request_time": str(datetime.now().isoformat()),
+            "request_type": "generate_batch",
+            "requestor": str(uuid.uuid4()),
+            "request_text": prompt,
+            "number_of_images": number_of_images,
+            "image_min_dimensions": {"width": 1024, "height": 1024},
+            "image_max_dimensions": {"width": 2048, "height": 2048},
+            "mime_type": "image/png",
+        }
+        generate_marketing_image_batch_input_data = GenerateMarketingImageBatchInputData(**input_data_dict)
+
+        result = await self.generate_marketing_image_driving_service.handle(
+            generate_marketing_image_batch_input_data.model_dump()
+        )
+        print(result)
+        return result
+
+    async def change_image_approval_status_request(self, image_id: str, status: Literal["approve", "reject"]) -> dict:
         """Requests an approval status change for a marketing image."""
         input_data_dict = {
             "request_id": str(uuid.uuid4()),
@@ -113,10 +152,10 @@ class MarketingImageTools:
         if status not in ["approve", "reject"]:
             raise ValueError("Invalid status. Must be 'approve' or 'reject'.")
         
-        result = self.change_marketing_image_approval_status_driving_service.handle(approval_status_change_request_input_data.model_dump())
+        result = await self.change_marketing_image_approval_status_driving_service.handle(approval_status_change_request_input_data.model_dump())
         return result
 
-    def remove_image(self, image_id: str) -> dict:
+    async def remove_image(self, image_id: str) -> dict:
         """Removes a marketing image."""
         input_data_dict = {
             "request_id": str(uuid.uuid4()),
@@ -126,10 +165,23 @@ class MarketingImageTools:
             "image_id": image_id,
         }
         remove_image_input_data = RemoveMarketingImageInputData(**input_data_dict)
-        result = self.remove_marketing_image_driving_service.handle(remove_image_input_data.model_dump())
+        result = await self.remove_marketing_image_driving_service.handle(remove_image_input_data.model_dump())
+        return result
+
+    async def remove_images(self, image_ids: List[str]) -> dict:
+        """Removes several marketing images."""
+        input_data_dict = {
+            "request_id": str(uuid.uuid4()),
+            "request_time": str(datetime.now().isoformat()),
+            "request_type": "remove_batch",
+            "requestor": str(uuid.uuid4()),
+            "image_ids": image_ids,
+        }
+        remove_images_input_data = RemoveMarketingImageBatchInputData(**input_data_dict)
+        result = await self.remove_marketing_image_driving_service.handle(remove_images_input_data.model_dump())
         return result
 
-    def change_image_attributes(
+    async def change_image_attributes(
         self,
         image_id: str,
         new_description: Optional[str] = None,
@@ -154,5 +206,5 @@ class MarketingImageTools:
         # Filter out None values for optional fields before creating the Pydantic model
         filtered_input_data = {k: v for k, v in input_data_dict.items() if v is not None}
         change_attributes_input_data = ChangeMarketingImageAttributesInputData(**filtered_input_data)
-        result = self.change_marketing_image_metadata_driving_service.handle(change_attributes_input_data.model_dump())
+        result = await self.change_marketing_image_metadata_driving_service.handle(change_attributes_input_data.model_dump())
         return result
\ No newline at end of file
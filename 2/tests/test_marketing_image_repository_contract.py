@@ -0,0 +1,269 @@
+"""
+Contract tests that the synchronous and the native async Firestore repositories - and the synchronous one behind the
+read-through cache - behave the same way, run against the Firestore emulator. Start it with `gcloud emulators firestore start --host-port=localhost:8080`, then run
+`FIRESTORE_EMULATOR_HOST=localhost:8080 uv run --with pytest pytest tests` from this directory.
+The tests are skipped when FIRESTORE_EMULATOR_HOST is not set.
+"""
+
+import asyncio
+import os
+import uuid
+
+import pytest
+
+if not os.getenv("FIRESTORE_EMULATOR_HOST"):
+    pytest.skip("FIRESTORE_EMULATOR_HOST is not set", allow_module_level=True)
+pytest.importorskip("google.cloud.firestore")
+
+from marketing_image_agent.application.exceptions.marketing_image_concurrency_conflict_error import MarketingImageConcurrencyConflictError
+from marketing_image_agent.domain.entities.marketing_image_aggregate import MarketingImage
+from marketing_image_agent.domain.factories.marketing_image_aggregate_factory import MarketingImageAggregateFactory
+from marketing_image_agent.infrastructure.adapters.repository.marketing_image_aggregate_firestore_repository import MarketingImageAggregateFirestoreRepository
+from marketing_image_agent.infrastructure.adapters.repository.async_marketing_image_aggregate_firestore_repository import AsyncMarketingImageAggregateFirestoreRepository
+from marketing_image_agent.infrastructure.adapters.repository.marketing_image_aggregate_repository_caching_adapter import MarketingImageAggregateRepositoryCachingAdapter
+
+
+class BlockingAsyncRepository:
+    """
+    Runs an async repository's methods to completion on one event loop, so that the same tests drive both adapters.
+    The loop is kept for the whole test, as an AsyncClient's channel is bound to the loop it was first used on.
+    """
+
+    def __init__(self, async_repository: AsyncMarketingImageAggregateFirestoreRepository):
+        self.async_repository = async_repository
+        self.loop = asyncio.new_event_loop()
+
+    def __getattr__(self, name):
+        method = getattr(self.async_repository, name)
+        return lambda *args, **kwargs: self.loop.run_until_complete(method(*args, **kwargs))
+
+    def query(self, **kwargs):
+        # An async generator, so it is driven one item at a time rather than run to completion
+        async_iterator = self.async_repository.query(**kwargs)
+        while True:
+            try:
+                yield self.loop.run_until_complete(async_iterator.__anext__())
+            except StopAsyncIteration:
+                return
+
+    def close(self) -> None:
+        self.loop.close()
+
+
+@pytest.fixture
+def repository_args():
+    collection_suffix = uuid.uuid4().hex # A fresh collection per test, so tests never see each other's documents
+    return {
+        "google_cloud_project": os.getenv("GOOGLE_CLOUD_PROJECT", "demo-marketing-image"),
+        "db_location": "europe-west4",
+        "db_name": "(default)",
+        "aggregate_collection_name": f"marketing-image-aggregates-{collection_suffix}",
+        "domain_event_collection_name": f"marketing-image-domain-events-{collection_suffix}",
+    }
+
+
+@pytest.fixture(params=["sync", "cached", "async"])
+def repository(request, repository_args):
+    if request.param == "sync":
+        yield MarketingImageAggregateFirestoreRepository(**repository_args)
+    elif request.param == "cached":
+        yield MarketingImageAggregateRepositoryCachingAdapter(MarketingImageAggregateFirestoreRepository(**repository_args), ttl_seconds=0)
+    else:
+        blocking_repository = BlockingAsyncRepository(AsyncMarketingImageAggregateFirestoreRepository(**repository_args))
+        yield blocking_repository
+        blocking_repository.close()
+
+
+def create_marketing_image(index: int = 0, created_by: str = None, url: str = None) -> MarketingImage:
+    marketing_image = MarketingImageAggregateFactory().from_dict({
+        "id": str(uuid.uuid4()),
+        "url": url or f"https://storage.googleapis.com/bucket/marketing-image-{uuid.uuid4().hex}.png",
+        "description": f"Marketing image {index}",
+        "keywords": ["contract", "test"],
+        "generation_model": "imagen",
+        "generation_parameters": {"seed": index},
+        "dimensions": {"width": 1024, "height": 1024},
+        "status": "GENERATED",
+        "size": 1024,
+        "mime_type": "image/png",
+        "checksum": "checksum",
+        "perceptual_hash": "dhash:0123456789abcdef",
+        "created_by": created_by or str(uuid.uuid4()),
+        "created_at": f"2026-01-01T00:00:{index:02d}+00:00",
+    })
+    marketing_image.clear_domain_events()
+    return marketing_image
+
+
+def test_save_increments_version_and_round_trips(repository):
+    marketing_image = create_marketing_image()
+    repository.save(marketing_image)
+
+    retrieved_image = repository.retrieve_by_id(marketing_image.id)
+    assert retrieved_image.version == marketing_image.version == 1
+    assert retrieved_image.description.description == marketing_image.description.description
+
+
+def test_save_of_stale_aggregate_raises_conflict(repository):
+    marketing_image = create_marketing_image()
+    repository.save(marketing_image)
+    first_copy = repository.retrieve_by_id(marketing_image.id)
+    second_copy = repository.retrieve_by_id(marketing_image.id)
+
+    first_copy.approve()
+    repository.save(first_copy)
+    second_copy.reject()
+    with pytest.raises(MarketingImageConcurrencyConflictError) as conflict:
+        repository.save(second_copy)
+
+    assert conflict.value.expected_version == 1
+    assert conflict.value.actual_version == 2
+    assert repository.retrieve_by_id(marketing_image.id).status.status.value == "APPROVED"
+
+
+def test_save_of_new_aggregate_with_existing_id_raises_conflict(repository):
+    marketing_image = create_marketing_image()
+    repository.save(marketing_image)
+    duplicate_image = MarketingImageAggregateFactory().from_dict({**MarketingImageAggregateFactory().to_dict_without_events(marketing_image), "version": 0})
+
+    with pytest.raises(MarketingImageConcurrencyConflictError):
+        repository.save(duplicate_image)
+
+
+def test_save_all_writes_nothing_if_any_aggregate_conflicts(repository):
+    marketing_images = [create_marketing_image(index) for index in range(2)]
+    repository.save_all(marketing_images)
+    assert [marketing_image.version for marketing_image in marketing_images] == [1, 1]
+
+    stale_image = repository.retrieve_by_id(marketing_images[1].id)
+    current_image = repository.retrieve_by_id(marketing_images[1].id)
+    current_image.approve()
+    repository.save(current_image)
+
+    fresh_image = repository.retrieve_by_id(marketing_images[0].id)
+    fresh_image.approve()
+    stale_image.reject()
+    with pytest.raises(MarketingImageConcurrencyConflictError):
+        repository.save_all([fresh_image, stale_image])
+
+    assert repository.retrieve_by_id(marketing_images[0].id).status.status.value == "GENERATED"
+    assert repository.retrieve_by_id(marketing_images[0].id).version == 1
+
+
+def test_retrieve_by_ids_keeps_order_and_reports_missing_ids(repository):
+    marketing_images = [create_marketing_image(index) for index in range(3)]
+    repository.save_all(marketing_images)
+    missing_id = str(uuid.uuid4())
+    requested_ids = [marketing_images[2].id, missing_id, marketing_images[0].id, marketing_images[2].id]
+
+    retrieved_images, not_found_ids = repository.retrieve_by_ids(requested_ids)
+
+    assert [str(marketing_image.id) for marketing_image in retrieved_images] == [str(marketing_images[2].id), str(marketing_images[0].id)]
+    assert not_found_ids == [missing_id]
+
+
+def test_query_page_cursors_visit_every_match_once_in_order(repository):
+    created_by = str(uuid.uuid4())
+    marketing_images = [create_marketing_image(index, created_by=created_by) for index in range(5)]
+    repository.save_all(marketing_images + [create_marketing_image(5)])
+
+    retrieved_ids = []
+    cursor = None
+    pages = 0
+    while True:
+        page, cursor = repository.query_page(created_by=created_by, page_size=2, cursor=cursor)
+        retrieved_ids.extend(str(marketing_image.id) for marketing_image in page)
+        pages += 1
+        if cursor is None:
+            break
+
+    assert retrieved_ids == [str(marketing_image.id) for marketing_image in reversed(marketing_images)]
+    assert pages == 3
+
+
+def test_query_iterates_lazily_over_every_match_in_order(repository):
+    created_by = str(uuid.uuid4())
+    marketing_images = [create_marketing_image(index, created_by=created_by) for index in range(5)]
+    repository.save_all(marketing_images + [create_marketing_image(5)])
+
+    iterator = repository.query(created_by=created_by, page_size=2, descending=False)
+    first_image = next(iterator)
+
+    assert str(first_image.id) == str(marketing_images[0].id)
+    assert [str(first_image.id)] + [str(marketing_image.id) for marketing_image in iterator] == [str(marketing_image.id) for marketing_image in marketing_images]
+
+
+def test_query_page_with_fields_returns_rows(repository):
+    created_by = str(uuid.uuid4())
+    repository.save(create_marketing_image(created_by=created_by))
+
+    page, cursor = repository.query_page(created_by=created_by, fields=["perceptual_hash"])
+
+    assert cursor is None
+    assert page[0]["perceptual_hash"] == "dhash:0123456789abcdef"
+
+
+def test_remove_deletes_the_aggregate_and_its_url_reference(repository):
+    marketing_image = create_marketing_image()
+    repository.save(marketing_image)
+    assert repository.retrieve_ids_by_url(marketing_image.url.url) == [str(marketing_image.id)]
+
+    repository.remove(marketing_image.id)
+
+    assert repository.retrieve_by_id(marketing_image.id) is None
+    assert repository.retrieve_ids_by_url(marketing_image.url.url) == []
+
+
+def test_cached_reads_see_saves_made_through_the_cache(repository_args):
+    cached_repository = MarketingImageAggregateRepositoryCachingAdapter(MarketingImageAggregateFirestoreRepository(**repository_args), ttl_seconds=0)
+    marketing_image = create_marketing_image()
+    cached_repository.save(marketing_image)
+
+    retrieved_image = cached_repository.retrieve_by_id(marketing_image.id)
+    retrieved_image.approve()
+    cached_repository.save(retrieved_image)
+
+    assert cached_repository.retrieve_by_id(marketing_image.id).status.status.value == "APPROVED"
+    assert cached_repository.retrieve_by_id(marketing_image.id).version == 2
+    assert cached_repository.get_metrics()["write_throughs"] == 2
+
+
+def test_async_writes_invalidate_the_synchronous_cache(repository_args):
+    cached_repository = MarketingImageAggregateRepositoryCachingAdapter(MarketingImageAggregateFirestoreRepository(**repository_args), ttl_seconds=0)
+    async_repository = BlockingAsyncRepository(AsyncMarketingImageAggregateFirestoreRepository(**repository_args, aggregate_cache=cached_repository))
+    try:
+        marketing_images = [create_marketing_image(index) for index in range(2)]
+        cached_repository.save_all(marketing_images)
+        assert cached_repository.retrieve_by_id(marketing_images[0].id).version == 1
+
+        changed_image = async_repository.retrieve_by_id(marketing_images[0].id)
+        changed_image.approve()
+        async_repository.save(changed_image)
+
+        # Without the invalidation, the cache would serve version 1, and saving a change to it would raise a conflict
+        current_image = cached_repository.retrieve_by_id(marketing_images[0].id)
+        assert current_image.version == 2
+        assert current_image.status.status.value == "APPROVED"
+        current_image.reject()
+        cached_repository.save(current_image)
+
+        async_repository.remove(marketing_images[1].id)
+        assert cached_repository.retrieve_by_id(marketing_images[1].id) is None
+    finally:
+        async_repository.close()
+
+
+def test_invalidate_evicts_aggregates_written_around_the_cache(repository_args):
+    uncached_repository = MarketingImageAggregateFirestoreRepository(**repository_args)
+    cached_repository = MarketingImageAggregateRepositoryCachingAdapter(uncached_repository, ttl_seconds=0)
+    marketing_image = create_marketing_image()
+    cached_repository.save(marketing_image)
+
+    changed_image = uncached_repository.retrieve_by_id(marketing_image.id)
+    changed_image.approve()
+    uncached_repository.save(changed_image)
+    assert cached_repository.retrieve_by_id(marketing_image.id).status.status.value == "GENERATED" # Still the cached copy
+
+    cached_repository.invalidate([marketing_image.id])
+
+    assert cached_repository.retrieve_by_id(marketing_image.id).status.status.value == "APPROVED"